@@ -0,0 +1,86 @@
+import email.utils
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from app.models.interning import intern_author
+from app.models.unified_sbom import UnifiedAuthor
+from app.services.parse import _parse_author_pairs, parse_authors
+
+'''
+author 문자열 파싱의 캐시/빠른 경로/공유 객체 적용 전후를 비교합니다.
+- 적용 전: 컴포넌트마다 email.utils.getaddresses 호출 후 새 UnifiedAuthor 생성
+- 적용 후(cold): 빠른 경로 + 캐시 (매 반복 캐시를 비우고 측정, 통합 한 번에 해당)
+- 적용 후(warm): 캐시가 찬 상태 (서버에서 같은 관리자가 반복 등장하는 경우)
+
+실행 방법
+python -m app.benchmark.author_bench [SBOM 파일 경로] [반복 횟수]
+(기본값: data/transformers_syft_sbom.json, 200회)
+'''
+
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / "data" / "transformers_syft_sbom.json"
+
+
+def _legacy_parse(author_string: str) -> List[UnifiedAuthor]:
+    """적용 전 구현 (getaddresses + 컴포넌트마다 새 객체)"""
+    authors = []
+    for name, email_addr in email.utils.getaddresses([author_string]):
+        if not name and not email_addr:
+            continue
+        if email_addr and '@' not in email_addr:
+            if not name:
+                name = email_addr
+            email_addr = None
+        authors.append(UnifiedAuthor(name=name or None, email=email_addr or None))
+    return authors
+
+
+def _clear_caches() -> None:
+    _parse_author_pairs.cache_clear()
+    intern_author.cache_clear()
+
+
+def _best_of(func: Callable[[], object], repeat: int, setup: Callable[[], None] = lambda: None) -> float:
+    """func를 repeat번 실행하여 가장 빠른 실행 시간(초)을 반환합니다. (setup은 측정에서 제외)"""
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(path: Path, repeat: int) -> None:
+    data = json.loads(path.read_bytes())
+    strings = [c["author"] for c in data.get("components", []) if c.get("author")]
+    strings += [t["author"] for t in data.get("metadata", {}).get("tools", {}).get("components", []) if t.get("author")]
+    if not strings:
+        print(f"[BENCH] {path.name}: author 필드가 없습니다.")
+        return
+
+    legacy = [_legacy_parse(s) for s in strings]
+    _clear_caches()
+    current = [parse_authors(s) for s in strings]
+    assert [[(a.name, a.email) for a in authors] for authors in legacy] == \
+        [[(a.name, a.email) for a in authors] for authors in current], "파싱 결과가 적용 전과 다릅니다"
+
+    legacy_t = _best_of(lambda: [_legacy_parse(s) for s in strings], repeat)
+    cold_t = _best_of(lambda: [parse_authors(s) for s in strings], repeat, setup=_clear_caches)
+    warm_t = _best_of(lambda: [parse_authors(s) for s in strings], repeat)
+
+    total = sum(len(authors) for authors in current)
+    shared = len({id(a) for authors in current for a in authors})
+    print(f"[BENCH] {path.name}: author 문자열 {len(strings)}개 (고유 {len(set(strings))}개), best of {repeat}")
+    print(f"  legacy(getaddresses) : {legacy_t * 1e6:9.1f} us")
+    print(f"  cached(cold)         : {cold_t * 1e6:9.1f} us | x{legacy_t / cold_t:.2f}")
+    print(f"  cached(warm)         : {warm_t * 1e6:9.1f} us | x{legacy_t / warm_t:.2f}")
+    print(f"  UnifiedAuthor 객체   : {total}개 -> {shared}개 (공유)")
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    run(target, count)
@@ -0,0 +1,56 @@
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.services import codec
+
+'''
+codec 계층(orjson/msgspec)과 표준 json의 디코딩/인코딩 속도를 비교합니다.
+
+실행 방법
+python -m app.benchmark.codec_bench [SBOM 파일 경로] [반복 횟수]
+(기본값: data/transformers_syft_sbom.json, 50회)
+'''
+
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / "data" / "transformers_syft_sbom.json"
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    """func를 repeat번 실행하여 가장 빠른 실행 시간(초)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(path: Path, repeat: int) -> None:
+    raw = path.read_bytes()
+    data = json.loads(raw)
+
+    # 출력 호환성 확인 (indent=2, ensure_ascii=False)
+    expected = json.dumps(data, indent=2, ensure_ascii=False)
+    assert codec.dumps(data, indent=2) == expected, "codec 출력이 표준 json과 다릅니다"
+
+    results = [
+        ("decode", lambda: json.loads(raw), lambda: codec.loads(raw), codec.DECODER_BACKEND),
+        ("encode(indent=2)",
+         lambda: json.dumps(data, indent=2, ensure_ascii=False),
+         lambda: codec.dumps(data, indent=2),
+         codec.ENCODER_BACKEND),
+    ]
+
+    print(f"[BENCH] {path.name} ({len(raw) / 1024:.1f} KiB), best of {repeat}")
+    for label, baseline, candidate, backend in results:
+        base_t = _best_of(baseline, repeat)
+        cand_t = _best_of(candidate, repeat)
+        print(f"  {label:<18} json: {base_t * 1000:8.2f} ms | {backend:<7}: {cand_t * 1000:8.2f} ms | x{base_t / cand_t:.2f}")
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    run(target, count)
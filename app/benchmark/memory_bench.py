@@ -0,0 +1,121 @@
+import dataclasses
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from app.models import syft_sbom, hatbom_sbom, unified_sbom
+from app.services.integrate import SBOMIntegrator
+
+'''
+컴포넌트 1개당 메모리 사용량을 __slots__/문자열 intern 적용 전후로 비교합니다.
+- 적용 전: 같은 필드를 가진 일반 dataclass(인스턴스마다 __dict__ 보유) + intern 없는 문자열
+- 적용 후: 현재 모델(slots=True dataclass + 반복 문자열 intern)
+
+실행 방법
+python -m app.benchmark.memory_bench [복제 배수]
+(기본값: 샘플 SBOM의 components를 50배 복제하여 측정)
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+def _unslotted(cls):
+    """slots 없이 같은 필드를 가진 일반 dataclass를 생성합니다. (적용 전 기준선)"""
+    fields = [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(cls)
+    ]
+    return dataclasses.make_dataclass(cls.__name__, fields)
+
+
+LegacyProperty = _unslotted(syft_sbom.Property)
+LegacyLicense = _unslotted(syft_sbom.License)
+LegacySyftComponent = _unslotted(syft_sbom.Component)
+LegacyHash = _unslotted(hatbom_sbom.Hash)
+LegacyHatbomComponent = _unslotted(hatbom_sbom.Component)
+LegacyUnifiedAuthor = _unslotted(unified_sbom.UnifiedAuthor)
+LegacyUnifiedComponent = _unslotted(unified_sbom.UnifiedComponent)
+
+
+def _legacy_syft_component(c: Dict[str, Any]):
+    """적용 전 SyftSbom.from_json의 컴포넌트 변환 로직"""
+    return LegacySyftComponent(
+        bom_ref=c.get('bom-ref'), type=c.get('type'), name=c.get('name'), version=c.get('version'),
+        cpe=c.get('cpe'), purl=c.get('purl'), author=c.get('author'),
+        licenses=[LegacyLicense(id=l.get('license', {}).get('id'), name=l.get('license', {}).get('name'))
+                  for l in c.get('licenses', [])],
+        properties=[LegacyProperty(name=p['name'], value=p['value']) for p in c.get('properties', [])],
+    )
+
+
+def _legacy_hatbom_component(c: Dict[str, Any]):
+    """적용 전 HatbomSbom.from_json의 컴포넌트 변환 로직"""
+    return LegacyHatbomComponent(
+        group=c.get('group', ""), name=c.get('name'), version=c.get('version'), type=c.get('type'),
+        bom_ref=c.get('bom-ref'), purl=c.get('purl'),
+        hashes=[LegacyHash(alg=h['alg'], content=h['content']) for h in c.get('hashes', [])],
+    )
+
+
+def _to_legacy_unified(comp) -> Any:
+    """통합 컴포넌트를 적용 전 클래스(일반 dataclass)로 복제합니다."""
+    values = {f.name: getattr(comp, f.name) for f in dataclasses.fields(comp)}
+    values["authors"] = [LegacyUnifiedAuthor(name=a.name, email=a.email) for a in comp.authors]
+    return LegacyUnifiedComponent(**values)
+
+
+def _footprint(build: Callable[[], List[Any]]) -> int:
+    """build()가 만든 객체들이 유지하는 메모리(바이트)를 측정합니다."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def _decoded(path: Path, key: str, factor: int) -> List[Dict[str, Any]]:
+    """원본 JSON을 factor번 디코딩하여 (서로 다른 문자열 객체를 가진) 컴포넌트 dict 목록을 만듭니다."""
+    raw = path.read_bytes()
+    items: List[Dict[str, Any]] = []
+    for _ in range(factor):
+        items.extend(json.loads(raw)[key])
+    return items
+
+
+def _report(label: str, count: int, before: int, after: int) -> None:
+    print(f"  {label:<18} {before / count:8.1f} B -> {after / count:8.1f} B per component "
+          f"({(1 - after / before) * 100:5.1f}% less, n={count})")
+
+
+def run(factor: int) -> None:
+    syft_raw = _decoded(DATA_DIR / "transformers_syft_sbom.json", "components", factor)
+    hatbom_raw = _decoded(DATA_DIR / "transformers_hatbom_sbom.json", "components", factor)
+
+    print(f"[BENCH] per-component footprint (x{factor} sample components)")
+
+    before = _footprint(lambda: [_legacy_syft_component(c) for c in syft_raw])
+    after = _footprint(lambda: [syft_sbom.Component.from_json(c) for c in syft_raw])
+    _report("Syft Component", len(syft_raw), before, after)
+
+    before = _footprint(lambda: [_legacy_hatbom_component(c) for c in hatbom_raw])
+    after = _footprint(lambda: [hatbom_sbom.Component.from_json(c) for c in hatbom_raw])
+    _report("Hatbom Component", len(hatbom_raw), before, after)
+
+    syft = syft_sbom.SyftSbom.from_json(json.loads((DATA_DIR / "transformers_syft_sbom.json").read_bytes()))
+    hatbom = hatbom_sbom.HatbomSbom.from_json(json.loads((DATA_DIR / "transformers_hatbom_sbom.json").read_bytes()))
+    unified = SBOMIntegrator().integrate(hatbom, syft).components * factor
+
+    before = _footprint(lambda: [_to_legacy_unified(c) for c in unified])
+    after = _footprint(lambda: [
+        unified_sbom.UnifiedComponent(**{f.name: getattr(c, f.name) for f in dataclasses.fields(c)})
+        for c in unified
+    ])
+    _report("UnifiedComponent", len(unified), before, after)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
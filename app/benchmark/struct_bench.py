@@ -0,0 +1,58 @@
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.models import struct_sbom
+
+'''
+json.loads + dataclass from_json 경로와 msgspec Struct 직접 디코딩 경로의
+파싱 시간과 메모리 할당량(tracemalloc peak)을 비교합니다. (msgspec 필요)
+
+실행 방법
+python -m app.benchmark.struct_bench [SBOM 파일 경로] [반복 횟수]
+(기본값: data/transformers_syft_sbom.json, 20회)
+'''
+
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / "data" / "transformers_syft_sbom.json"
+
+
+def _measure(func: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """가장 빠른 실행 시간(초)과 1회 실행 시 할당 peak(바이트)를 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def run(path: Path, repeat: int) -> None:
+    raw = path.read_bytes()
+    is_syft = "$schema" in json.loads(raw)
+    dataclass_cls = SyftSbom if is_syft else HatbomSbom
+    struct_cls = struct_sbom.SyftSbom if is_syft else struct_sbom.HatbomSbom
+
+    base_t, base_peak = _measure(lambda: dataclass_cls.from_json(json.loads(raw)), repeat)
+    cand_t, cand_peak = _measure(lambda: struct_cls.from_bytes(raw), repeat)
+
+    print(f"[BENCH] {path.name} ({len(raw) / 1024:.1f} KiB), best of {repeat}")
+    print(f"  json.loads + from_json : {base_t * 1000:8.2f} ms | peak {base_peak / 1024:9.1f} KiB")
+    print(f"  msgspec Struct decode  : {cand_t * 1000:8.2f} ms | peak {cand_peak / 1024:9.1f} KiB")
+    print(f"  speedup x{base_t / cand_t:.2f}, allocation x{base_peak / cand_peak:.2f} smaller")
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(target, count)
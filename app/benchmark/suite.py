@@ -0,0 +1,269 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.benchmark.synthetic import HATBOM, SYFT, generate_pair, parse_size
+from app.config import settings
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services import codec
+from app.services.export import SBOMExporter
+from app.services.integrate import SBOMIntegrator
+
+'''
+합성 SBOM(synthetic.py)으로 파싱/통합/내보내기/API 단계별 소요 시간과 메모리 peak를 측정하고 JSON으로 저장합니다.
+- 측정 단계: loads(원본 바이트 디코딩), from_json, integrate(SBOMIntegrator.integrate), to_dict, to_json, get_summary,
+  route_integrate / route_summary / route_upload (FastAPI TestClient, 결과 캐시를 끈 상태)
+- 시간은 repeat번 중 가장 빠른 값이며, 10만 컴포넌트를 넘는 크기는 1번만 실행합니다.
+- 메모리는 단계마다 tracemalloc으로 한 번 더 실행하여 할당 peak를 기록합니다. (시간 측정과 분리, --no-memory로 생략)
+- 결과 파일에는 커밋/파이썬/JSON 백엔드 정보가 함께 기록되며, --compare로 다른 커밋의 결과와 단계별 배율을 비교합니다.
+
+실행 방법
+python -m app.benchmark.suite --sizes 1k,10k,100k,1m --overlap 0.3 -o bench_results.json
+python -m app.benchmark.suite --sizes 10k --compare bench_before.json
+(기본값: 1k,10k,100k,1m / 중복 비율 0.3 / 3회 / 합성 파일은 임시 디렉토리, --data-dir로 재사용 가능)
+'''
+
+DEFAULT_SIZES = "1k,10k,100k,1m"
+# 이 크기를 넘으면 반복 측정하지 않음 (1회 실행도 수십 초 이상)
+SINGLE_RUN_ABOVE = 100_000
+
+
+def _quiet(func: Callable[[], Any]) -> Callable[[], Any]:
+    """통합기의 진행 로그(print)를 숨기고 실행하는 함수를 반환합니다."""
+    def run() -> Any:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+def _measure(func: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, Any]:
+    """가장 빠른 실행 시간(초)과 1회 실행 시 할당 peak(바이트)를 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    record: Dict[str, Any] = {"seconds": round(best, 6)}
+    if memory:
+        tracemalloc.start()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        record["peak_bytes"] = peak
+    return record
+
+
+def _max_rss() -> Optional[int]:
+    """프로세스 최대 상주 메모리(바이트, 지원하지 않는 플랫폼이면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KiB 단위
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _route_client():
+    """결과 캐시를 끈 FastAPI TestClient를 반환합니다. (반복 요청이 캐시 적중으로 측정되지 않도록)"""
+    from fastapi.testclient import TestClient
+    from app import main
+
+    main.result_cache = None
+    return TestClient(main.app)
+
+
+def _route_stages(client, hatbom_raw: bytes, syft_raw: bytes) -> Dict[str, Callable[[], Any]]:
+    def files() -> Dict[str, Tuple[str, bytes, str]]:
+        return {
+            "hatbom_file": ("hatbom.json", hatbom_raw, "application/json"),
+            "syft_file": ("syft.json", syft_raw, "application/json"),
+        }
+
+    def post(path: str) -> Callable[[], Any]:
+        @_quiet
+        def run() -> Any:
+            response = client.post(path, files=files())
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} 응답 오류: {response.status_code} {response.text[:200]}")
+            return response.content
+        return run
+
+    return {
+        "route_integrate": post("/integrate"),
+        "route_summary": post("/summary"),
+        "route_upload": post("/upload"),
+    }
+
+
+def bench_size(
+    paths: Dict[str, Path], repeat: int, memory: bool, routes: bool, client=None
+) -> Dict[str, Any]:
+    """합성 문서 쌍 하나에 대해 모든 단계를 측정합니다."""
+    hatbom_raw = paths[HATBOM].read_bytes()
+    syft_raw = paths[SYFT].read_bytes()
+    hatbom_data, syft_data = codec.loads(hatbom_raw), codec.loads(syft_raw)
+    hatbom, syft = HatbomSbom.from_json(hatbom_data), SyftSbom.from_json(syft_data)
+
+    integrator = SBOMIntegrator()
+    unified = _quiet(lambda: integrator.integrate(hatbom, syft))()
+    stats = integrator.stats
+
+    stages: Dict[str, Callable[[], Any]] = {
+        "loads": lambda: (codec.loads(hatbom_raw), codec.loads(syft_raw)),
+        "from_json": lambda: (HatbomSbom.from_json(hatbom_data), SyftSbom.from_json(syft_data)),
+        "integrate": _quiet(lambda: SBOMIntegrator().integrate(hatbom, syft)),
+        "to_dict": lambda: SBOMExporter(unified, stats).to_dict(),
+        "to_json": lambda: SBOMExporter(unified, stats).to_json(),
+        "get_summary": lambda: SBOMExporter(unified, stats).get_summary(),
+    }
+    if routes:
+        stages.update(_route_stages(client or _route_client(), hatbom_raw, syft_raw))
+
+    results: Dict[str, Any] = {}
+    for name, func in stages.items():
+        results[name] = _measure(func, repeat, memory)
+        print(f"  {name:<16} {results[name]['seconds'] * 1000:11.2f} ms"
+              + (f" | peak {results[name]['peak_bytes'] / 1024 / 1024:9.1f} MiB" if memory else ""))
+
+    return {
+        "input_bytes": {HATBOM: len(hatbom_raw), SYFT: len(syft_raw)},
+        "unified_components": len(unified.components),
+        "integrated_components": stats.integrated_count,
+        "repeat": repeat,
+        "stages": results,
+        "max_rss_bytes": _max_rss(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """현재 커밋 (작업 트리에 변경이 있으면 -dirty)"""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "decoder": codec.DECODER_BACKEND,
+        "encoder": codec.ENCODER_BACKEND,
+        "parse_executor": settings.parse_executor,
+    }
+
+
+def run_suite(
+    sizes: List[int],
+    overlap: float = 0.3,
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+    routes: bool = True,
+    data_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """크기별로 합성 문서를 만들고(이미 있으면 재사용) 측정 결과를 dict로 반환합니다."""
+    report: Dict[str, Any] = {
+        "environment": environment(),
+        "config": {"sizes": sizes, "overlap": overlap, "seed": seed, "repeat": repeat, "memory": memory},
+        "results": [],
+    }
+    client = _route_client() if routes else None
+    with contextlib.ExitStack() as stack:
+        if data_dir is None:
+            data_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="sbom_bench_")))
+        for size in sizes:
+            paths = generate_pair(data_dir, size, overlap, seed)
+            runs = repeat if size <= SINGLE_RUN_ABOVE else 1
+            print(f"[BENCH] {size} components/document, overlap {overlap}, best of {runs}")
+            entry = {"components": size, "overlap": overlap, "seed": seed}
+            entry.update(bench_size(paths, runs, memory, routes, client))
+            report["results"].append(entry)
+    return report
+
+
+def compare(base: Dict[str, Any], target: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    두 결과 파일에서 같은 (컴포넌트 수, 중복 비율)의 단계별 시간/메모리 배율(target / base)을 계산합니다.
+    1보다 작으면 target이 빠르거나(적게 할당하거나) 한 것입니다.
+    """
+    baseline = {(r["components"], r["overlap"]): r for r in base.get("results", [])}
+    rows: List[Dict[str, Any]] = []
+    for result in target.get("results", []):
+        before = baseline.get((result["components"], result["overlap"]))
+        if before is None:
+            continue
+        for stage, record in result["stages"].items():
+            old = before["stages"].get(stage)
+            if not old:
+                continue
+            row = {"components": result["components"], "stage": stage,
+                   "time_ratio": record["seconds"] / old["seconds"] if old["seconds"] else None}
+            if "peak_bytes" in record and old.get("peak_bytes"):
+                row["memory_ratio"] = record["peak_bytes"] / old["peak_bytes"]
+            rows.append(row)
+    return rows
+
+
+def _print_comparison(rows: List[Dict[str, Any]], base_commit: Optional[str]) -> None:
+    print(f"[COMPARE] 기준 커밋 {base_commit or '?'} 대비 배율 (1보다 작으면 개선)")
+    for row in rows:
+        memory = f" | memory x{row['memory_ratio']:.2f}" if "memory_ratio" in row else ""
+        time_ratio = f"x{row['time_ratio']:.2f}" if row["time_ratio"] is not None else "-"
+        print(f"  {row['components']:>8} {row['stage']:<16} time {time_ratio}{memory}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="합성 SBOM 파싱/통합/내보내기 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"문서당 컴포넌트 수 목록 (기본값 {DEFAULT_SIZES})")
+    parser.add_argument("--overlap", type=float, default=0.3, help="Syft와 겹치는 Hatbom 컴포넌트 비율 (기본값 0.3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (최솟값 기록)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--no-routes", action="store_true", help="FastAPI 엔드포인트 측정 생략")
+    parser.add_argument("--data-dir", help="합성 문서 보관 디렉토리 (지정하면 다음 실행에서 재사용)")
+    parser.add_argument("-o", "--output", help="결과 JSON 경로 (기본값: bench_<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        sizes=[parse_size(s) for s in args.sizes.split(",") if s.strip()],
+        overlap=args.overlap,
+        seed=args.seed,
+        repeat=max(1, args.repeat),
+        memory=not args.no_memory,
+        routes=not args.no_routes,
+        data_dir=Path(args.data_dir) if args.data_dir else None,
+    )
+
+    output = Path(args.output or f"bench_{report['environment']['commit'] or 'local'}.json")
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] 결과 저장: {output}")
+
+    if args.compare:
+        base = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        _print_comparison(compare(base, report), base.get("environment", {}).get("commit"))
+
+
+if __name__ == "__main__":
+    main()
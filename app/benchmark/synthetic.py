@@ -0,0 +1,250 @@
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+'''
+data/transformers_*_sbom.json과 같은 구조의 대용량 Hatbom/Syft SBOM을 합성합니다. (벤치마크 입력용)
+- 같은 (컴포넌트 수, 중복 비율, seed)이면 항상 같은 문서가 만들어지므로 커밋 간 결과를 비교할 수 있습니다.
+- 문서는 컴포넌트 단위로 파일에 바로 기록하므로 100만 컴포넌트도 dict 전체를 메모리에 올리지 않습니다.
+
+구성 (컴포넌트 수 n, 중복 비율 r)
+- Syft: 패키지(library/application, pkg:pypi PURL, 라이선스/CPE/properties) max(r*n, n/2)개 + 나머지는 해시가 있는 file
+- Hatbom: 앞의 r*n개는 Syft 패키지와 같은 PURL을 가진 library(통합 시 병합됨) + 나머지는 pkg:generic file(MD5)
+- dependencies: Syft 패키지마다 앞쪽 패키지 0~3개에 의존, Hatbom은 루트 -> 공유 library 일부
+
+실행 방법
+python -m app.benchmark.synthetic 10000 -o /tmp/sbom --overlap 0.3
+(/tmp/sbom/synthetic_10000_r0.30_s0_hatbom.json, ..._syft.json 생성)
+'''
+
+HATBOM = "hatbom"
+SYFT = "syft"
+
+SYFT_SCHEMA = "http://cyclonedx.org/schema/bom-1.6.schema.json"
+LICENSES = ("MIT", "Apache-2.0", "BSD-3-Clause", "ISC", "PSF-2.0", "MPL-2.0")
+FILE_SUFFIXES = (".py", ".pyi", ".json", ".txt", ".yml", ".so")
+
+
+def _hex(rng: random.Random, length: int) -> str:
+    return "%0*x" % (length, rng.getrandbits(length * 4))
+
+
+def _package(index: int) -> Tuple[str, str]:
+    """index번째 합성 패키지의 (이름, 버전)을 반환합니다. (다른 패키지와 이름 유사도 매칭되지 않도록 번호를 포함)"""
+    return f"synthpkg-{index:07d}", f"{index % 7}.{index % 13}.{index % 29}"
+
+
+def _package_ref(index: int) -> str:
+    name, version = _package(index)
+    return f"pkg:pypi/{name}@{version}?package-id={index:016x}"
+
+
+def _syft_package(index: int) -> Dict[str, Any]:
+    name, version = _package(index)
+    component_type = "application" if index % 20 == 19 else "library"
+    return {
+        "bom-ref": _package_ref(index),
+        "type": component_type,
+        "author": f"Maintainer {index % 997} <maintainer{index % 997}@example.org>",
+        "name": name,
+        "version": version,
+        "licenses": [{"license": {"id": LICENSES[index % len(LICENSES)]}}],
+        "cpe": f"cpe:2.3:a:python-{name}:python-{name}:{version}:*:*:*:*:*:*:*",
+        "purl": f"pkg:pypi/{name}@{version}",
+        "properties": [
+            {"name": "syft:package:foundBy", "value": "python-installed-package-cataloger"},
+            {"name": "syft:package:language", "value": "python"},
+            {"name": "syft:package:type", "value": "python"},
+            {"name": "syft:package:metadataType", "value": "python-package"},
+            {"name": "syft:location:0:path", "value": f"/.venv/Lib/site-packages/{name}-{version}.dist-info/METADATA"},
+        ],
+    }
+
+
+def _syft_file(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "bom-ref": _hex(rng, 16),
+        "type": "file",
+        "name": f"/src/synthetic/module_{index:07d}{FILE_SUFFIXES[index % len(FILE_SUFFIXES)]}",
+        "hashes": [
+            {"alg": "SHA-1", "content": _hex(rng, 40)},
+            {"alg": "SHA-256", "content": _hex(rng, 64)},
+        ],
+    }
+
+
+def _hatbom_library(index: int) -> Dict[str, Any]:
+    name, version = _package(index)
+    purl = f"pkg:pypi/{name}@{version}"
+    return {"group": "", "name": name, "version": version, "type": "library", "bom-ref": purl, "purl": purl}
+
+
+def _hatbom_file(rng: random.Random, index: int) -> Dict[str, Any]:
+    digest = _hex(rng, 32)
+    group, name = f"synthgroup{index % 503}", f"file_{index:07d}"
+    version = f"0.0.0-{digest[:12]}"
+    purl = f"pkg:generic/{group}/{name}@{version}#/.venv/Lib/site-packages/{group}/{name}.py"
+    return {
+        "group": group, "name": name, "version": version, "type": "file",
+        "bom-ref": purl, "purl": purl, "hashes": [{"alg": "MD5", "content": digest}],
+    }
+
+
+def shared_count(components: int, overlap: float) -> int:
+    """Hatbom 컴포넌트 중 Syft 패키지와 겹치는 개수"""
+    if not 0.0 <= overlap <= 1.0:
+        raise ValueError(f"중복 비율은 0~1 사이여야 합니다: {overlap}")
+    return int(round(components * overlap))
+
+
+def _syft_components(components: int, overlap: float, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    packages = max(shared_count(components, overlap), components // 2)
+    for index in range(components):
+        yield _syft_package(index) if index < packages else _syft_file(rng, index)
+
+
+def _syft_dependencies(components: int, overlap: float, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    packages = max(shared_count(components, overlap), components // 2)
+    for index in range(1, packages):
+        targets = sorted({rng.randrange(index) for _ in range(rng.randint(0, 3))})
+        if targets:
+            yield {"ref": _package_ref(index), "dependsOn": [_package_ref(t) for t in targets]}
+
+
+def _hatbom_components(components: int, overlap: float, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    shared = shared_count(components, overlap)
+    for index in range(components):
+        yield _hatbom_library(index) if index < shared else _hatbom_file(rng, index)
+
+
+def _hatbom_dependencies(components: int, overlap: float, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    shared = shared_count(components, overlap)
+    if shared:
+        roots = [_hatbom_library(index)["bom-ref"] for index in range(min(shared, 16))]
+        yield {"ref": "pkg:generic/synthetic", "dependsOn": roots}
+
+
+def _header(tool: str, seed: int) -> Dict[str, Any]:
+    rng = random.Random(f"{tool}:{seed}")
+    serial = f"urn:uuid:{_hex(rng, 8)}-{_hex(rng, 4)}-{_hex(rng, 4)}-{_hex(rng, 4)}-{_hex(rng, 12)}"
+    if tool == SYFT:
+        return {
+            "$schema": SYFT_SCHEMA,
+            "bomFormat": "CycloneDX",
+            "specVersion": "1.6",
+            "serialNumber": serial,
+            "version": 1,
+            "metadata": {
+                "timestamp": "2026-01-27T04:42:30Z",
+                "tools": {"components": [{"type": "application", "author": "anchore", "name": "syft", "version": "1.40.1"}]},
+                "component": {"bom-ref": "dfcd457ff0b35452", "type": "file", "name": "/src"},
+            },
+        }
+    return {
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.6",
+        "serialNumber": serial,
+        "version": 1,
+        "metadata": {
+            "timestamp": "2026-01-29T05:45:43.073084+00:00",
+            "authors": [{"name": "IoTcube - https://iotcube.net"}],
+            "component": {
+                "group": "", "name": "synthetic", "version": "", "type": "application",
+                "bom-ref": "pkg:generic/synthetic", "purl": "pkg:generic/synthetic",
+            },
+        },
+    }
+
+
+def _write_array(out: TextIO, key: str, items: Iterator[Dict[str, Any]]) -> None:
+    out.write(f',\n  "{key}": [')
+    for i, item in enumerate(items):
+        out.write(",\n    " if i else "\n    ")
+        out.write(json.dumps(item, ensure_ascii=False))
+    out.write("\n  ]")
+
+
+def write_document(out: TextIO, tool: str, components: int, overlap: float = 0.3, seed: int = 0) -> None:
+    """합성 SBOM 문서 하나를 out에 기록합니다. (tool: "hatbom" / "syft")"""
+    header = json.dumps(_header(tool, seed), ensure_ascii=False, indent=2)
+    out.write(header[:-2])  # 닫는 괄호 앞까지 기록하고 배열을 이어서 씀
+    if tool == SYFT:
+        rng = random.Random(f"{SYFT}:{seed}:{components}")
+        _write_array(out, "components", _syft_components(components, overlap, rng))
+        _write_array(out, "dependencies", _syft_dependencies(components, overlap, rng))
+    elif tool == HATBOM:
+        rng = random.Random(f"{HATBOM}:{seed}:{components}")
+        _write_array(out, "dependencies", _hatbom_dependencies(components, overlap, rng))
+        _write_array(out, "components", _hatbom_components(components, overlap, rng))
+        out.write(f',\n  "file_count": {components - shared_count(components, overlap)}')
+    else:
+        raise ValueError(f"알 수 없는 도구입니다: {tool}")
+    out.write("\n}\n")
+
+
+def generate_document(tool: str, components: int, overlap: float = 0.3, seed: int = 0) -> Dict[str, Any]:
+    """합성 SBOM 문서를 dict로 반환합니다. (작은 크기용)"""
+    rng = random.Random(f"{tool}:{seed}:{components}")
+    document = _header(tool, seed)
+    if tool == SYFT:
+        document["components"] = list(_syft_components(components, overlap, rng))
+        document["dependencies"] = list(_syft_dependencies(components, overlap, rng))
+    elif tool == HATBOM:
+        document["dependencies"] = list(_hatbom_dependencies(components, overlap, rng))
+        document["components"] = list(_hatbom_components(components, overlap, rng))
+        document["file_count"] = components - shared_count(components, overlap)
+    else:
+        raise ValueError(f"알 수 없는 도구입니다: {tool}")
+    return document
+
+
+def synthetic_path(directory: Path, tool: str, components: int, overlap: float, seed: int) -> Path:
+    return directory / f"synthetic_{components}_r{overlap:.2f}_s{seed}_{tool}.json"
+
+
+def generate_pair(
+    directory: Path, components: int, overlap: float = 0.3, seed: int = 0, force: bool = False
+) -> Dict[str, Path]:
+    """
+    (Hatbom, Syft) 합성 문서 쌍을 directory에 만들고 {"hatbom": 경로, "syft": 경로}를 반환합니다.
+    같은 이름의 파일이 이미 있으면 (결정적으로 같은 내용이므로) 다시 만들지 않습니다.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: Dict[str, Path] = {}
+    for tool in (HATBOM, SYFT):
+        path = synthetic_path(directory, tool, components, overlap, seed)
+        if force or not path.exists():
+            partial = path.with_suffix(".part")
+            with open(partial, "w", encoding="utf-8") as out:
+                write_document(out, tool, components, overlap, seed)
+            partial.replace(path)
+        paths[tool] = path
+    return paths
+
+
+def parse_size(text: str) -> int:
+    """"1k", "100K", "1m", "2500" 형태의 크기를 정수로 변환합니다."""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    number = text[:-1] if scale != 1 else text
+    return int(float(number) * scale)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 Hatbom/Syft SBOM 생성")
+    parser.add_argument("components", type=parse_size, help="문서당 컴포넌트 수 (예: 10k, 1m)")
+    parser.add_argument("-o", "--output-dir", default=".", help="출력 디렉토리")
+    parser.add_argument("--overlap", type=float, default=0.3, help="Syft와 겹치는 Hatbom 컴포넌트 비율 (기본값 0.3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="이미 있는 파일도 다시 생성")
+    args = parser.parse_args(argv)
+
+    paths = generate_pair(Path(args.output_dir), args.components, args.overlap, args.seed, args.force)
+    for tool, path in paths.items():
+        print(f"[INFO] {tool}: {path} ({path.stat().st_size / 1024 / 1024:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from typing import Literal, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+"""
+config.py
+해당 파일은 애플리케이션 실행 설정을 제공합니다.
+모든 값은 SBOM_ 접두어 환경변수(또는 .env 파일)로 변경할 수 있습니다.
+
+[설정 항목]
+SBOM_PARSE_EXECUTOR : 업로드 파싱을 실행할 작업자 풀 종류 (thread | process, 기본값 thread)
+    - thread  : 업로드 스트림을 그대로 넘겨 청크 단위로 파싱 (메모리 효율적, 디코딩 일부는 GIL 경합)
+    - process : 업로드 내용을 바이트로 읽어 별도 프로세스에서 파싱 (CPU 병렬, 결과 객체 전달 비용 있음)
+SBOM_PARSE_WORKERS  : 작업자 수 (기본값: 2, Hatbom/Syft 두 파일을 동시에 파싱)
+SBOM_CACHE_ENABLED  : 통합 결과 캐시 사용 여부 (기본값 true)
+SBOM_CACHE_MAX_BYTES: 메모리 캐시 최대 크기 (바이트, 기본값 256MB)
+SBOM_CACHE_DIR      : 디스크 캐시 디렉토리 (지정하면 재시작 후에도 캐시 유지, 기본값 없음)
+SBOM_CACHE_DISK_MAX_BYTES: 디스크 캐시 최대 크기 (바이트, 기본값 1GB)
+SBOM_JOB_BACKEND    : 백그라운드 통합 작업 저장소 (memory | file, 기본값 memory)
+    - memory : 프로세스 메모리에 보관 (재시작 시 작업 소멸)
+    - file   : SBOM_JOB_DIR에 작업 상태/입력/결과를 저장 (재시작 후 미완료 작업 재실행)
+SBOM_JOB_DIR        : file 저장소 디렉토리 (기본값 .jobs)
+SBOM_JOB_WORKERS    : 동시에 실행할 통합 작업 수 (기본값 2)
+SBOM_JOB_MAX_PENDING: 대기열 최대 작업 수 (초과 시 503 응답, 기본값 64)
+SBOM_RESULT_VIEWS_MAX_ENTRIES: 결과 화면 목록 데이터를 보관할 최대 결과 수 (기본값 32, 오래된 결과부터 제거)
+"""
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="SBOM_", env_file=".env", extra="ignore")
+
+    parse_executor: Literal["thread", "process"] = "thread"
+    parse_workers: int = 2
+
+    cache_enabled: bool = True
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_dir: Optional[str] = None
+    cache_disk_max_bytes: int = 1024 * 1024 * 1024
+
+    job_backend: Literal["memory", "file"] = "memory"
+    job_dir: str = ".jobs"
+    job_workers: int = 2
+    job_max_pending: int = 64
+
+    result_views_max_entries: int = 32
+
+
+settings = Settings()
@@ -1,25 +1,183 @@
+import asyncio
 import json
-from fastapi import FastAPI, Request, File, UploadFile, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, File, Form, Query, UploadFile, HTTPException
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from app.services.parse import SBOMParser
 from app.services.integrate import SBOMIntegrator
+from app.services.incremental import IncrementalIntegrator
 from app.services.export import SBOMExporter
 from app.models.hatbom_sbom import HatbomSbom
 from app.models.syft_sbom import SyftSbom
+from app.services import codec
+from app.services.concurrency import parse_uploads, shutdown_executor
+from app.services.cache import CachedResult, ResultCache, hash_stream, make_key
+from app.services.detect import UnsupportedFormatError
+from app.services.compression import CompressionError, compress, iter_compressed, negotiate, open_decompressed
+from app.services.concurrency import upload_encoding
+from app.services.diff import SBOMDiff
+from app.services.jobs import RESULT_BLOB, SUCCEEDED, Job, JobQueue, QueueFullError, create_store
+from app.services.statistics import analyze_stream
+from app.services.views import DEFAULT_PAGE_SIZE, ResultStore, ResultView
+from app.config import settings
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 백그라운드 통합 작업자 시작 (file 저장소면 미완료 작업을 다시 실행)
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    # 파싱 작업자 풀 정리
+    shutdown_executor()
+
+
+app = FastAPI(lifespan=lifespan)
+# 직접 압축하지 않는 응답(HTML, 요약 JSON 등)은 Accept-Encoding에 따라 gzip 압축
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 BASE_DIR = Path(__file__).resolve().parent
 
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
-cicd_keywords = ['github', 'action', 'docker', 'workflow', 'yaml', 'yml']
+# 통합 결과 캐시 (같은 Hatbom/Syft 쌍이 반복 업로드되면 파싱/통합/직렬화를 건너뜀)
+result_cache = ResultCache(
+    max_bytes=settings.cache_max_bytes,
+    cache_dir=settings.cache_dir,
+    disk_max_bytes=settings.cache_disk_max_bytes,
+) if settings.cache_enabled else None
+
+# 결과 화면 목록 데이터 (결과 id -> 페이지 단위 조회용 행/의존성 목록)
+result_views = ResultStore(max_entries=settings.result_views_max_entries)
+
+# 백그라운드 통합 작업 큐 (/jobs)
+job_queue = JobQueue(
+    create_store(settings.job_backend, settings.job_dir),
+    workers=settings.job_workers,
+    max_pending=settings.job_max_pending,
+    cache=result_cache,
+)
+
+
+class SBOMJSONResponse(JSONResponse):
+    """codec 계층(orjson 등 사용 가능 시)으로 본문을 인코딩하는 JSONResponse입니다."""
+
+    def render(self, content) -> bytes:
+        return codec.dumps_compact(content)
+
+
+async def lookup_cached(
+    hatbom_file: UploadFile, syft_file: UploadFile, integrator: SBOMIntegrator, refresh: bool = False
+) -> Tuple[Optional[str], Optional[CachedResult]]:
+    """
+    두 업로드 파일의 내용과 통합 옵션으로 (캐시 키, 캐시 항목)을 반환합니다. (캐시 미사용/미적중 시 None)
+    refresh가 True이면 캐시를 조회하지 않고 키만 계산합니다. (새로 통합한 결과로 캐시 항목을 갱신)
+    """
+    if result_cache is None:
+        return None, None
+    # 지원하지 않는 Content-Encoding은 캐시 조회 전에 거부
+    upload_encoding(hatbom_file)
+    upload_encoding(syft_file)
+    hashes = await asyncio.to_thread(lambda: [hash_stream(hatbom_file.file), hash_stream(syft_file.file)])
+    key = make_key(hashes, integrator.options())
+    if refresh:
+        return key, None
+    return key, result_cache.get(key)
+
+
+async def integrate_uploads(
+    hatbom_file: UploadFile, syft_file: UploadFile, refresh: bool = False
+) -> Tuple[CachedResult, Optional[IncrementalIntegrator], bool]:
+    """
+    두 업로드 파일을 통합하여 (캐시 항목, 통합기, 캐시 적중 여부)를 반환합니다.
+    입력 내용과 통합 옵션이 같은 결과가 캐시에 있으면 파싱/통합/직렬화를 모두 건너뛰며, 이때 통합기는 None입니다.
+    요약은 통합기가 병합 중 기록한 카운터(IntegrationStats)로 만들고, 문서는 컴포넌트 단위 compact 인코딩으로 한 번만 직렬화합니다.
+    통합기는 증분 갱신(/results/{result_id}/update)에 필요한 상태를 보관하며,
+    refresh가 True이면 캐시를 조회하지 않으므로 항상 통합기가 반환됩니다.
+    """
+    integrator = IncrementalIntegrator()
+    key, cached = await lookup_cached(hatbom_file, syft_file, integrator, refresh)
+    if cached is not None:
+        return cached, None, True
+
+    # 업로드 앞부분으로 형식을 판별하므로 두 필드에 어느 형식의 파일을 올려도 됨
+    sources = await parse_uploads((HatbomSbom, hatbom_file), (SyftSbom, syft_file), detect=True)
+    unified_sbom = integrator.integrate_many(sources)
+
+    exporter = SBOMExporter(unified_sbom, integrator.stats)
+    entry = CachedResult(
+        document="".join(exporter.iter_json(compact=True)).encode("utf-8"),
+        summary=exporter.get_summary(),
+        filename=exporter.get_filename(),
+        rows=exporter.component_rows(),
+        dependencies=unified_sbom.dependencies
+    )
+    if key is not None:
+        result_cache.put(key, entry)
+    return entry, integrator, False
+
+
+def stream_document(exporter: SBOMExporter, cache_key: Optional[str] = None) -> Iterator[str]:
+    """
+    통합 SBOM을 컴포넌트 단위 compact JSON 조각으로 내보냅니다. (StreamingResponse용)
+    cache_key가 있으면 전송한 조각을 모아 전송 완료 후 결과 캐시에 저장합니다.
+    """
+    parts: Optional[List[str]] = [] if cache_key is not None and result_cache is not None else None
+    for chunk in exporter.iter_json(compact=True):
+        if parts is not None:
+            parts.append(chunk)
+        yield chunk
+    if parts is not None:
+        result_cache.put(cache_key, CachedResult(
+            document="".join(parts).encode("utf-8"),
+            summary=exporter.get_summary(),
+            filename=exporter.get_filename(),
+            rows=exporter.component_rows(),
+            dependencies=exporter.unified_sbom.dependencies
+        ))
+
+
+def download_response(
+    request: Request,
+    body: Union[bytes, Iterator[str]],
+    filename: str,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    통합 SBOM 다운로드 응답을 만듭니다.
+    Accept-Encoding으로 협상한 형식(zstd/gzip)으로 압축하며, 조각 스트림은 조각 단위로 압축하여 전송합니다.
+    """
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    response_headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding",
+        **(headers or {})
+    }
+    if encoding is not None:
+        response_headers["Content-Encoding"] = encoding
+    if isinstance(body, bytes):
+        return Response(content=compress(body, encoding), media_type="application/json", headers=response_headers)
+    return StreamingResponse(iter_compressed(body, encoding), media_type="application/json", headers=response_headers)
+
+
+def cache_header(hit: bool) -> Dict[str, str]:
+    """캐시 적중 여부 응답 헤더"""
+    return {"X-Cache": "HIT" if hit else "MISS"}
+
+
+def find_result(result_id: str) -> ResultView:
+    view = result_views.get(result_id)
+    if view is None:
+        raise HTTPException(status_code=404, detail=f"결과를 찾을 수 없습니다. 파일을 다시 업로드해 주세요: {result_id}")
+    return view
+
 
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
@@ -33,78 +191,42 @@ async def process_sboms(
 ):
     """
     Hatbom과 Syft SBOM 파일을 업로드하여 통합된 SBOM을 생성하고 결과 페이지를 렌더링합니다.
+    캐시에서 만든 결과(X-Cache: HIT)는 증분 갱신 상태가 없으므로, 갱신할 결과가 필요하면
+    Cache-Control: no-cache 헤더로 요청하여 캐시를 조회하지 않고 새로 통합합니다.
     """
     try:
-        # 1. 파일 내용 읽기
-        hatbom_content = await hatbom_file.read()
-        syft_content = await syft_file.read()
-        
-        # 2. JSON 파싱
+        # 1~5. 업로드 스트림을 청크 단위로 읽으며 SBOM 객체로 변환 (문서 전체를 dict로 올리지 않음)
+        #      두 파일은 작업자 풀에서 동시에 파싱 (이벤트 루프를 막지 않음) 후 통합/Export
+        #      같은 입력의 결과가 캐시에 있으면 캐시된 CycloneDX JSON과 표 행/의존성 목록을 사용
+        refresh = "no-cache" in (request.headers.get("cache-control") or "").lower()
         try:
-            hatbom_data = json.loads(hatbom_content)
-            syft_data = json.loads(syft_content)
+            entry, integrator, hit = await integrate_uploads(hatbom_file, syft_file, refresh)
         except json.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+        except (CompressionError, UnsupportedFormatError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        summary = entry.summary
         
-        # 3. SBOM 객체로 변환
-        hatbom_sbom = HatbomSbom.from_json(hatbom_data)
-        syft_sbom = SyftSbom.from_json(syft_data)
-        
-        # 4. SBOM 통합
-        integrator = SBOMIntegrator()
-        unified_sbom = integrator.integrate(hatbom_sbom, syft_sbom)
-        
-        # 5. Export
-        exporter = SBOMExporter(unified_sbom)
-        summary = exporter.get_summary()
-        unified_dict = exporter.to_dict()
-        
-        # 6. 템플릿용 컴포넌트 데이터 가공
-        components_for_template = []
-        for comp in unified_dict.get("components", []):
-            # 출처 확인
-            source = "Unknown"
-            integrated = False
-            for prop in comp.get("properties", []):
-                if prop.get("name") == "source_tool":
-                    source = prop.get("value", "Unknown")
-                if prop.get("name") == "integrated_with":
-                    integrated = True
-            
-            # 라이선스 추출
-            license_name = "N/A"
-            licenses = comp.get("licenses", [])
-            if licenses:
-                lic = licenses[0].get("license", {})
-                license_name = lic.get("id") or lic.get("name") or "N/A"
-            
-            # Authors 추출
-            authors_str = ""
-            authors = comp.get("authors", [])
-            if authors:
-                author_names = [a.get("name") or a.get("email") or "" for a in authors[:2]]
-                authors_str = ", ".join(filter(None, author_names))
-                if len(authors) > 2:
-                    authors_str += f" 외 {len(authors) - 2}명"
-            
-            components_for_template.append({
-                "name": comp.get("name", "Unknown"),
-                "version": comp.get("version", "Unknown"),
-                "type": comp.get("type", "Unknown"),
-                "license": license_name,
-                "source": source,
-                "integrated": integrated,
-                "authors": authors_str
-            })
+        # 6. 화면 표/의존성 목록은 결과 id로 보관하고 페이지 단위 API(/results/...)로 제공
+        #    (화면에는 요약만 렌더링하므로 페이지 크기가 SBOM 크기와 무관)
+        #    표 행은 통합 시 모델에서 한 번 만들어 캐시 항목에 함께 보관하므로 캐시 적중 시에도 문서를 디코딩하지 않음
+        view = ResultView(
+            rows=entry.rows,
+            dependencies=entry.dependencies,
+            summary=summary,
+            document=entry.document,
+            filename=entry.filename,
+            integration=integrator
+        )
+        result_views.put(view)
         
         return templates.TemplateResponse("unified_result.html", {
             "request": request,
             "summary": summary,
-            "components": components_for_template,
-            "dependencies": unified_dict.get("dependencies", []),
-            "unified_sbom_json": json.dumps(unified_dict, indent=2, ensure_ascii=False),
-            "filename": exporter.get_filename()
-        })
+            "result_id": view.id,
+            "facets": view.facets(),
+            "filename": entry.filename
+        }, headers=cache_header(hit))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"SBOM 통합 중 오류가 발생했습니다: {str(e)}")
@@ -112,6 +234,7 @@ async def process_sboms(
 
 @app.post("/integrate")
 async def integrate_sboms(
+    request: Request,
     hatbom_file: UploadFile = File(...), 
     syft_file: UploadFile = File(...)
 ):
@@ -120,36 +243,59 @@ async def integrate_sboms(
     (다운로드용 - 순수 CycloneDX JSON)
     """
     try:
-        hatbom_content = await hatbom_file.read()
-        syft_content = await syft_file.read()
+        integrator = SBOMIntegrator()
+        key, cached = await lookup_cached(hatbom_file, syft_file, integrator)
+        if cached is not None:
+            return download_response(request, cached.document, cached.filename, cache_header(True))
         
-        hatbom_data = json.loads(hatbom_content)
-        syft_data = json.loads(syft_content)
+        sources = await parse_uploads((HatbomSbom, hatbom_file), (SyftSbom, syft_file), detect=True)
+        unified_sbom = integrator.integrate_many(sources)
         
-        hatbom_sbom = HatbomSbom.from_json(hatbom_data)
-        syft_sbom = SyftSbom.from_json(syft_data)
+        # 컴포넌트 단위로 인코딩하며 전송 (전체 dict/본문을 메모리에 만들지 않음)
+        exporter = SBOMExporter(unified_sbom, integrator.stats)
+        return download_response(request, stream_document(exporter, key), exporter.get_filename(), cache_header(False))
         
-        integrator = SBOMIntegrator()
-        unified_sbom = integrator.integrate(hatbom_sbom, syft_sbom)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+    except (CompressionError, UnsupportedFormatError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"SBOM 통합 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.post("/integrate-many")
+async def integrate_many_sboms(
+    request: Request,
+    files: List[UploadFile] = File(...),
+    precedence: Optional[str] = Form(None)
+):
+    """
+    여러 개의 SBOM 파일(Hatbom/Syft 혼합, 계층별/서비스별 SBOM)을 한 번에 통합하고 통합된 SBOM을 반환합니다.
+    precedence: 도구 우선순위 (쉼표로 구분, 예: "Syft,Hatbom")
+    """
+    try:
+        # 각 파일의 형식은 업로드 앞부분으로 판별 (일반 CycloneDX는 Hatbom 모델)
+        # 파싱은 작업자 풀에서 동시에, 통합은 스레드에서 실행하여 이벤트 루프를 막지 않음
+        sources = await parse_uploads(*((HatbomSbom, f) for f in files), detect=True)
         
-        exporter = SBOMExporter(unified_sbom)
-        filename = exporter.get_filename()
+        integrator = SBOMIntegrator()
+        order = [tool.strip() for tool in precedence.split(",") if tool.strip()] if precedence else None
+        unified_sbom = await asyncio.to_thread(integrator.integrate_many, sources, precedence=order)
         
-        return JSONResponse(
-            content=exporter.to_dict(),
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        exporter = SBOMExporter(unified_sbom, integrator.stats)
+        return download_response(request, stream_document(exporter), exporter.get_filename())
         
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+    except (CompressionError, UnsupportedFormatError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"SBOM 통합 중 오류가 발생했습니다: {str(e)}")
 
 
-@app.post("/summary")
+@app.post("/summary", response_class=SBOMJSONResponse)
 async def get_integration_summary(
+    response: Response,
     hatbom_file: UploadFile = File(...), 
     syft_file: UploadFile = File(...)
 ):
@@ -157,23 +303,12 @@ async def get_integration_summary(
     SBOM 통합 후 요약 정보만 반환합니다.
     """
     try:
-        hatbom_content = await hatbom_file.read()
-        syft_content = await syft_file.read()
-        
-        hatbom_data = json.loads(hatbom_content)
-        syft_data = json.loads(syft_content)
-        
-        hatbom_sbom = HatbomSbom.from_json(hatbom_data)
-        syft_sbom = SyftSbom.from_json(syft_data)
-        
-        integrator = SBOMIntegrator()
-        unified_sbom = integrator.integrate(hatbom_sbom, syft_sbom)
-        
-        exporter = SBOMExporter(unified_sbom)
+        entry, _, hit = await integrate_uploads(hatbom_file, syft_file)
+        response.headers.update(cache_header(hit))
         
         return {
             "status": "success",
-            "summary": exporter.get_summary(),
+            "summary": entry.summary,
             "received_files": {
                 "hatbom": hatbom_file.filename,
                 "syft": syft_file.filename
@@ -182,150 +317,275 @@ async def get_integration_summary(
         
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+    except (CompressionError, UnsupportedFormatError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"SBOM 통합 중 오류가 발생했습니다: {str(e)}")
 
+def job_links(job: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 상태 응답에 상태/결과 조회 경로를 추가합니다."""
+    return {
+        **job,
+        "status_url": f"/jobs/{job['id']}",
+        "result_url": f"/jobs/{job['id']}/result",
+    }
+
+
+def find_job(job_id: str) -> Job:
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+
+@app.post("/jobs", status_code=202, response_class=SBOMJSONResponse)
+async def submit_integration_job(
+    hatbom_file: UploadFile = File(...),
+    syft_file: UploadFile = File(...)
+):
+    """
+    Hatbom과 Syft SBOM 통합을 백그라운드 작업으로 제출하고 작업 id를 즉시 반환합니다.
+    진행 상태는 GET /jobs/{job_id}, 결과는 GET /jobs/{job_id}/result로 조회합니다.
+    """
+    try:
+        inputs = {
+            "hatbom": (await hatbom_file.read(), upload_encoding(hatbom_file)),
+            "syft": (await syft_file.read(), upload_encoding(syft_file)),
+        }
+        job = await job_queue.submit(inputs, {"hatbom": hatbom_file.filename, "syft": syft_file.filename})
+    except CompressionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+    return job_links(job.to_dict())
+
+
+@app.get("/jobs/{job_id}", response_class=SBOMJSONResponse)
+async def get_integration_job(job_id: str):
+    """백그라운드 통합 작업의 상태(status), 단계(stage), 진행률(progress)을 반환합니다."""
+    return job_links(find_job(job_id).to_dict())
+
+
+@app.get("/jobs/{job_id}/result")
+async def download_integration_job(request: Request, job_id: str):
+    """완료된 백그라운드 통합 작업의 통합 SBOM을 다운로드합니다. (완료 전이면 409)"""
+    job = find_job(job_id)
+    if job.status != SUCCEEDED:
+        detail = job.error if job.error else f"작업이 아직 완료되지 않았습니다: {job.status} ({job.stage})"
+        raise HTTPException(status_code=409, detail=detail)
+    document = await asyncio.to_thread(job_queue.store.get_blob, job_id, RESULT_BLOB)
+    if document is None:
+        raise HTTPException(status_code=404, detail=f"작업 결과를 찾을 수 없습니다: {job_id}")
+    return download_response(request, document, job.result_filename, cache_header(job.cache_hit))
+
+
+@app.delete("/jobs/{job_id}", response_class=SBOMJSONResponse)
+async def delete_integration_job(job_id: str):
+    """백그라운드 통합 작업과 결과를 삭제합니다."""
+    find_job(job_id)
+    job_queue.delete(job_id)
+    return {"id": job_id, "deleted": True}
+
+
+@app.get("/results/{result_id}/components", response_class=SBOMJSONResponse)
+async def list_result_components(
+    result_id: str,
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    q: Optional[str] = None,
+    type: Optional[List[str]] = Query(None),
+    license: Optional[List[str]] = Query(None),
+    source: Optional[List[str]] = Query(None),
+    integrated: Optional[bool] = None,
+    cicd: Optional[bool] = None
+):
+    """
+    결과 화면의 컴포넌트 목록을 페이지 단위로 반환합니다.
+    q: 이름 검색, type/license/source: 값 필터 (여러 번 지정하면 OR), integrated/cicd: 여부 필터
+    sort: name, version, type, license, source 중 하나, order: asc | desc
+    """
+    view = find_result(result_id)
+    try:
+        return view.components(
+            q=q,
+            categories={"type": type, "license": license, "source": source},
+            flags={"integrated": integrated, "is_cicd": cicd},
+            sort=sort,
+            descending=order == "desc",
+            page=page,
+            page_size=page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/results/{result_id}/dependencies", response_class=SBOMJSONResponse)
+async def list_result_dependencies(
+    result_id: str,
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    q: Optional[str] = None
+):
+    """결과 화면의 의존성 목록을 페이지 단위로 반환합니다. (q: ref 검색)"""
+    return find_result(result_id).dependency_page(q=q, page=page, page_size=page_size)
+
+
+@app.get("/results/{result_id}/graph/path", response_class=SBOMJSONResponse)
+async def shortest_dependency_path(result_id: str, source: str, target: str):
+    """source에서 target까지 dependsOn 간선을 따라가는 최단 경로를 반환합니다."""
+    view = find_result(result_id)
+    try:
+        return await asyncio.to_thread(view.path, source, target)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+
+@app.get("/results/{result_id}/graph/cycles", response_class=SBOMJSONResponse)
+async def list_dependency_cycles(result_id: str):
+    """의존성 순환(크기 2 이상 강연결요소 또는 자기 자신 의존) 목록을 반환합니다."""
+    return await asyncio.to_thread(find_result(result_id).cycles)
+
+
+@app.get("/results/{result_id}/graph/{direction}", response_class=SBOMJSONResponse)
+async def list_related_refs(
+    result_id: str,
+    direction: str,
+    ref: str,
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE
+):
+    """
+    ref가 직접/간접적으로 의존하는 ref(descendants) 또는 ref에 의존하는 ref(ancestors)를 페이지 단위로 반환합니다.
+    그래프는 결과별로 처음 질의할 때 한 번 만들고, 도달 가능 집합은 미리 계산/메모이즈된 값을 사용합니다.
+    """
+    if direction not in ("descendants", "ancestors"):
+        raise HTTPException(status_code=404, detail="지원하지 않는 그래프 질의입니다.")
+    view = find_result(result_id)
+    try:
+        return await asyncio.to_thread(view.related_page, ref, direction, page, page_size)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+
+def apply_update(integrator: IncrementalIntegrator, upload: UploadFile) -> Tuple[Dict[str, Any], ResultView]:
+    """업로드 문서를 통합기에 증분 반영하고 (변경 보고서, 새 결과 화면 데이터)를 반환합니다."""
+    source = SBOMParser().parse_stream(open_decompressed(upload.file, upload_encoding(upload)), source=upload.filename)
+    report = integrator.update(source)
+    exporter = SBOMExporter(integrator.unified_sbom, integrator.stats)
+    view = ResultView(
+        rows=exporter.component_rows(),
+        dependencies=integrator.unified_sbom.dependencies,
+        summary=exporter.get_summary(),
+        document="".join(exporter.iter_json(compact=True)).encode("utf-8"),
+        filename=exporter.get_filename(),
+        integration=integrator
+    )
+    return report.to_dict(), view
+
+
+@app.post("/results/{result_id}/update", response_class=SBOMJSONResponse)
+async def update_result(result_id: str, file: UploadFile = File(...)):
+    """
+    통합 결과에 바뀐 Syft 또는 Hatbom 문서 하나를 증분 반영하고 새 결과 id를 반환합니다.
+    바뀐 컴포넌트만 다시 통합하며, 결과는 두 문서를 처음부터 다시 통합한 것과 같습니다.
+    (증분 상태는 새 결과로 옮겨지므로 같은 결과에 다시 갱신하려면 새 결과 id를 사용)
+    """
+    view = find_result(result_id)
+    integrator = view.integration
+    if integrator is None:
+        raise HTTPException(status_code=409, detail=(
+            "증분 갱신할 수 있는 통합 상태가 없는 결과입니다. "
+            "이미 갱신한 결과이면 갱신 응답의 새 result_id를 사용하고, "
+            "캐시에서 만든 결과(X-Cache: HIT)이면 Cache-Control: no-cache 헤더로 /upload를 다시 요청하세요."
+        ))
+    # 같은 통합기를 동시에 갱신하지 않도록 소유권을 먼저 가져옴
+    view.integration = None
+    try:
+        report, updated = await asyncio.to_thread(apply_update, integrator, file)
+    except json.JSONDecodeError as e:
+        view.integration = integrator
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+    except (CompressionError, ValueError) as e:
+        view.integration = integrator
+        raise HTTPException(status_code=400, detail=str(e))
+    result_views.put(updated)
+    return {
+        "result_id": updated.id,
+        "previous_result_id": result_id,
+        "summary": updated.summary,
+        "delta": report
+    }
+
+
+@app.get("/results/{result_id}/download")
+async def download_result(request: Request, result_id: str):
+    """결과 화면의 통합 SBOM을 다운로드합니다."""
+    view = find_result(result_id)
+    if view.document is None:
+        raise HTTPException(status_code=404, detail="다운로드할 수 있는 문서가 없는 결과입니다.")
+    return download_response(request, view.document, view.filename)
+
+
+@app.post("/diff")
+async def diff_sboms(
+    request: Request,
+    base_file: UploadFile = File(...),
+    target_file: UploadFile = File(...),
+    summary_only: bool = Query(False)
+):
+    """
+    같은 제품의 두 SBOM(이전/새 릴리스)을 비교합니다.
+    추가/삭제/변경(버전, 라이선스, 해시) 컴포넌트와 의존성 간선 변경을 변경 항목 단위 JSON 조각으로 스트리밍합니다.
+    summary_only=true이면 변경 종류별 개수만 반환합니다.
+    """
+    try:
+        diff = await asyncio.to_thread(
+            SBOMDiff.from_streams,
+            open_decompressed(base_file.file, upload_encoding(base_file)),
+            open_decompressed(target_file.file, upload_encoding(target_file))
+        )
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 JSON 파일입니다: {str(e)}")
+    except CompressionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if summary_only:
+        return SBOMJSONResponse(diff.summary())
+    return download_response(request, diff.iter_json(), "sbom_diff.json")
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """통합 결과 캐시의 hit/miss 횟수와 사용량을 반환합니다."""
+    if result_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **result_cache.stats()}
+
+
 @app.post("/analyze-single", response_class=HTMLResponse)
 async def analyze_single_sbom(request: Request, file: UploadFile = File(...)):
-    content = await file.read()
+    # 1. 업로드 스트림을 청크 단위로 읽으며 모든 통계를 한 번의 순회로 계산 (statistics.py)
+    #    (문서 전체를 dict로 올리지 않으며, 분석은 작업자 스레드에서 실행하여 이벤트 루프를 막지 않음)
     try:
-        sbom_data = json.loads(content)
+        fp = open_decompressed(file.file, upload_encoding(file))
+        analysis = await asyncio.to_thread(analyze_stream, fp, file.filename)
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="유효하지 않은 JSON 파일입니다.")
+    except CompressionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # 1. 도구 이름 및 메타데이터 추출
-    metadata = sbom_data.get("metadata", {})
-    tools = metadata.get("tools", {})
-    tool_name = "Unknown"
-    tool_version = "Unknown"
-    if isinstance(tools, dict):
-        tool_components = tools.get("components", [])
-        if tool_components:
-            tool_name = tool_components[0].get("name", "Unknown")
-            tool_version = tool_components[0].get("version", "Unknown")
-    elif isinstance(tools, list) and len(tools) > 0:
-        tool_name = tools[0].get("name", "Unknown")
-        tool_version = tools[0].get("version", "Unknown")
-    
-    # 생성 시간 추출
-    timestamp = metadata.get("timestamp", "Unknown")
-    
-    # 주체 정보 추출
-    component_info = metadata.get("component", {})
-    target_name = component_info.get("name", "Unknown")
-    target_type = component_info.get("type", "Unknown")
-
-    # 2. 패키지 분석 및 통계 수집
-    cicd_keywords = ['github', 'action', 'docker', 'workflow', 'yaml', 'yml', '.github/']
-    components = sbom_data.get("components", [])
-    package_list = []
-    license_stats = {}
-    type_stats = {}
-    cicd_count = 0
-    
-    for c in components:
-        name = c.get("name", "Unknown")
-        version = c.get("version", "Unknown")
-        pkg_type = c.get("type", "library")
-        
-        # CI/CD 태그 확인
-        is_cicd = any(key in name.lower() for key in cicd_keywords)
-        if is_cicd:
-            cicd_count += 1
-        
-        # 라이선스 추출
-        licenses = c.get("licenses", [])
-        lic_name = "N/A"
-        if licenses:
-            lic_item = licenses[0]
-            if "license" in lic_item:
-                lic_name = lic_item["license"].get("id") or lic_item["license"].get("name", "N/A")
-            elif "expression" in lic_item:
-                lic_name = lic_item["expression"]
-        
-        # 통계 업데이트
-        license_stats[lic_name] = license_stats.get(lic_name, 0) + 1
-        type_stats[pkg_type] = type_stats.get(pkg_type, 0) + 1
-        
-        # PURL 정보 추출
-        purl = c.get("purl", "")
-        
-        # 해시 정보 추출
-        hashes = c.get("hashes", [])
-        has_hash = len(hashes) > 0
-        
-        # 외부 참조 추출
-        external_refs = c.get("externalReferences", [])
-        has_homepage = any(ref.get("type") == "website" for ref in external_refs)
-        has_vcs = any(ref.get("type") == "vcs" for ref in external_refs)
-        
-        # CPE 정보 추출
-        cpe = c.get("cpe", "")
-        
-        package_list.append({
-            "name": name,
-            "version": version,
-            "license": lic_name,
-            "type": pkg_type,
-            "is_cicd": is_cicd,
-            "purl": purl,
-            "has_hash": has_hash,
-            "has_homepage": has_homepage,
-            "has_vcs": has_vcs,
-            "cpe": cpe,
-            "hash_count": len(hashes),
-            "external_ref_count": len(external_refs)
-        })
-
-    # 3. 의존성 분석
-    dependencies = sbom_data.get("dependencies", [])
-    total_dependencies = len(dependencies)
-    
-    # 의존성 관계 통계
-    dependency_stats = {
-        "has_dependencies": 0,
-        "isolated_packages": 0,
-        "max_dependencies": 0
-    }
-    
-    for dep in dependencies:
-        depends_on = dep.get("dependsOn", [])
-        if depends_on:
-            dependency_stats["has_dependencies"] += 1
-            dependency_stats["max_dependencies"] = max(dependency_stats["max_dependencies"], len(depends_on))
-        else:
-            dependency_stats["isolated_packages"] += 1
-
-    # 4. 라이선스별 통계 정렬 (상위 10개)
-    top_licenses = sorted(license_stats.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    # 5. 패키지 타입별 통계 정렬
-    sorted_types = sorted(type_stats.items(), key=lambda x: x[1], reverse=True)
-
-    analysis_result = {
-        "filename": file.filename,
-        "total_packages": len(components),
-        "tool_name": tool_name,
-        "tool_version": tool_version,
-        "timestamp": timestamp,
-        "target_name": target_name,
-        "target_type": target_type,
-        "cicd_count": cicd_count,
-        "total_dependencies": total_dependencies,
-        "package_list": package_list,
-        "license_stats": top_licenses,
-        "type_stats": sorted_types,
-        "dependency_stats": dependency_stats,
-        "packages_with_hash": sum(1 for p in package_list if p["has_hash"]),
-        "packages_with_homepage": sum(1 for p in package_list if p["has_homepage"]),
-        "packages_with_vcs": sum(1 for p in package_list if p["has_vcs"]),
-        "unique_licenses": len(license_stats),
-        "unique_types": len(type_stats)
-    }
+    # 2. 패키지 목록은 결과 id로 보관하고 페이지 단위 API(/results/...)로 제공
+    view = ResultView(
+        rows=analysis.packages, dependencies=analysis.dependencies, summary=analysis.result, filename=file.filename
+    )
+    result_views.put(view)
 
-    return templates.TemplateResponse("analysis.html", {"request": request, "result": analysis_result})
\ No newline at end of file
+    return templates.TemplateResponse("analysis.html", {"request": request, "result": analysis.result, "result_id": view.id})
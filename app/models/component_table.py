@@ -0,0 +1,192 @@
+'''
+- 통합 SBOM 컴포넌트를 열(column) 단위 배열로 보관하는 컬럼형 테이블
+- UnifiedSbom.components(UnifiedComponent 리스트)를 한 번만 순회하여 열별 병렬 배열을 만들고,
+  이후의 요약/필터/카운트는 객체별 파이썬 루프 대신 배열 단위 연산(C 구현)으로 수행합니다.
+- 범주형 열(type, source, license)은 사전 인코딩(dictionary encoding)합니다.
+  값 목록(dictionary)은 한 번만 저장하고 행마다 정수 코드만 보관합니다.
+- 필터 결과는 행마다 0/1 바이트를 가지는 마스크(bytes)이며, mask_and / mask_or / mask_not으로 조합합니다.
+
+[열 구성]
+name, version, purl : 문자열 리스트 (고유값이 많아 사전 인코딩하지 않음)
+type               : 사전 인코딩 (library, file, application ...)
+source             : 사전 인코딩, 컴포넌트의 source_tool 값 튜플 (예: ("Syft",), ("Syft", "Hatbom"))
+license            : 사전 인코딩, 첫 번째 라이선스 id 또는 name ("N/A" 기본값)
+integrated         : 0/1 바이트 배열 (integrated_with property 존재 여부)
+
+[사용 예시]
+table = unified_sbom.to_table()
+print(table.type.value_counts())                      # {"library": 168, "file": 252, ...}
+mask = mask_and(table.mask(source="Syft"), table.integrated)
+print(table.count(mask), [table.name[i] for i in table.rows(mask)][:5])
+'''
+
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 0 <-> 1 반전용 변환 테이블
+_NOT_TABLE = bytes([1, 0]) + bytes(254)
+
+
+def mask_and(a: bytes, b: bytes) -> bytes:
+    """두 마스크의 행별 AND (정수 비트 연산으로 한 번에 계산)"""
+    return (int.from_bytes(a, "little") & int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def mask_or(a: bytes, b: bytes) -> bytes:
+    """두 마스크의 행별 OR"""
+    return (int.from_bytes(a, "little") | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def mask_not(a: bytes) -> bytes:
+    """마스크의 행별 NOT"""
+    return a.translate(_NOT_TABLE)
+
+
+class DictionaryColumn:
+    """
+    사전 인코딩된 범주형 열입니다.
+    dictionary[code] = 값, codes[row] = code 형태로 저장합니다.
+    고유값이 256개 이하인 동안은 codes를 bytearray로 유지하여 bytes.translate 기반 마스크 연산을 사용합니다.
+    """
+    __slots__ = ("dictionary", "codes", "_lookup")
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.dictionary: List[Any] = []
+        self.codes = bytearray()
+        self._lookup: Dict[Any, int] = {}
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Any) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.dictionary)
+            if code == 256 and isinstance(self.codes, bytearray):
+                self.codes = array("I", iter(self.codes))
+            self._lookup[value] = code
+            self.dictionary.append(value)
+        self.codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.dictionary[self.codes[row]]
+
+    def __iter__(self):
+        dictionary = self.dictionary
+        return (dictionary[code] for code in self.codes)
+
+    def value_counts(self) -> Dict[Any, int]:
+        """값별 행 수를 반환합니다. (코드 배열을 한 번에 집계)"""
+        dictionary = self.dictionary
+        return {dictionary[code]: count for code, count in Counter(self.codes).items()}
+
+    def mask_where(self, predicate: Callable[[Any], bool]) -> bytes:
+        """
+        predicate(값)이 참인 행을 1로 표시한 마스크를 반환합니다.
+        predicate는 행이 아니라 고유값마다 한 번씩만 호출됩니다.
+        """
+        wanted = [1 if predicate(value) else 0 for value in self.dictionary]
+        if isinstance(self.codes, bytearray):
+            return bytes(self.codes.translate(bytes(wanted) + bytes(256 - len(wanted))))
+        return bytes(wanted[code] for code in self.codes)
+
+    def mask(self, *values: Any) -> bytes:
+        """값이 values 중 하나인 행을 1로 표시한 마스크를 반환합니다."""
+        targets = set(values)
+        return self.mask_where(lambda value: value in targets)
+
+
+class ComponentTable:
+    """통합 SBOM 컴포넌트의 컬럼형(struct-of-arrays) 표현입니다."""
+
+    def __init__(self):
+        self.name: List[Optional[str]] = []
+        self.version: List[Optional[str]] = []
+        self.purl: List[Optional[str]] = []
+        self.type = DictionaryColumn()
+        self.source = DictionaryColumn()
+        self.license = DictionaryColumn()
+        self.integrated = bytearray()
+
+    @classmethod
+    def from_components(cls, components: Iterable[Any]) -> "ComponentTable":
+        """UnifiedComponent 목록을 한 번 순회하여 테이블을 구성합니다."""
+        table = cls()
+        for comp in components:
+            table.append(comp)
+        return table
+
+    def append(self, comp: Any) -> None:
+        """UnifiedComponent 하나를 테이블의 마지막 행으로 추가합니다."""
+        sources: Tuple[str, ...] = ()
+        integrated = 0
+        for prop in comp.properties:
+            prop_name = prop.get("name")
+            if prop_name == "source_tool":
+                sources += (prop.get("value"),)
+            elif prop_name == "integrated_with":
+                integrated = 1
+
+        license_name = "N/A"
+        if comp.licenses:
+            lic = comp.licenses[0].get("license", {})
+            license_name = lic.get("id") or lic.get("name") or "N/A"
+
+        self.name.append(comp.name)
+        self.version.append(comp.version)
+        self.purl.append(comp.purl)
+        self.type.append(comp.type)
+        self.source.append(sources)
+        self.license.append(license_name)
+        self.integrated.append(integrated)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    # --- 필터 / 카운트 ---
+
+    def mask(
+        self,
+        type: Optional[str] = None,
+        source: Optional[str] = None,
+        license: Optional[str] = None,
+        integrated: Optional[bool] = None,
+        name_contains: Optional[str] = None,
+    ) -> bytes:
+        """주어진 조건을 모두 만족하는 행을 1로 표시한 마스크를 반환합니다. (조건이 없으면 전체 선택)"""
+        result = bytes([1]) * len(self)
+        if type is not None:
+            result = mask_and(result, self.type.mask(type))
+        if source is not None:
+            result = mask_and(result, self.source.mask_where(lambda sources: source in sources))
+        if license is not None:
+            result = mask_and(result, self.license.mask(license))
+        if integrated is not None:
+            flags = bytes(self.integrated)
+            result = mask_and(result, flags if integrated else mask_not(flags))
+        if name_contains is not None:
+            needle = name_contains.lower()
+            result = mask_and(result, bytes(1 if name and needle in name.lower() else 0 for name in self.name))
+        return result
+
+    def count(self, mask: Optional[bytes] = None) -> int:
+        """마스크에서 선택된 행 수를 반환합니다."""
+        if mask is None:
+            return len(self)
+        return mask.count(1)
+
+    def rows(self, mask: bytes) -> List[int]:
+        """마스크에서 선택된 행 번호 목록을 반환합니다."""
+        return list(compress(range(len(self)), mask))
+
+    def source_counts(self) -> Dict[str, int]:
+        """source_tool 값별 컴포넌트 수를 반환합니다. (한 컴포넌트가 여러 도구에 포함될 수 있음)"""
+        counts: Dict[str, int] = {}
+        for sources, count in self.source.value_counts().items():
+            for tool in set(sources):
+                counts[tool] = counts.get(tool, 0) + count
+        return counts
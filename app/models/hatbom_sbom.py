@@ -32,17 +32,30 @@ print(f"Total Components: {len(sbom_obj.components)}")
 for comp in sbom_obj.components:
     if comp.name == "tpu":
         print(f"TPU File MD5: {comp.hashes[0].content}")
+
+# 대용량 파일은 스트리밍으로 파싱 (문서 전체를 dict로 올리지 않음)
+with open("transformers_hatbom_sbom.json", "rb") as f:
+    sbom_obj = HatbomSbom.from_stream(f)
+
+# 컴포넌트를 하나씩만 처리하고 버릴 경우
+with open("transformers_hatbom_sbom.json", "rb") as f:
+    for item in HatbomSbom.iter_stream(f):
+        if isinstance(item, Component):
+            print(item.name)
 '''
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Any, BinaryIO, ClassVar, Iterable, Iterator, List, Optional, Dict, Union
+
+from app.models.interning import intern_str
+from app.services.stream import ITEM, JSONEvent, iter_json_events
 
-@dataclass
+@dataclass(slots=True)
 class Hash:
     alg: str
     content: str
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     name: str
     version: str
@@ -52,19 +65,44 @@ class Component:
     group: str = ""
     hashes: List[Hash] = field(default_factory=list)
 
-@dataclass
+    @classmethod
+    def from_json(cls, c: Dict):
+        """components[] 원소 하나를 Component 객체로 변환합니다. (반복되는 group/type/alg 문자열은 intern)"""
+        hashes = [Hash(alg=intern_str(h['alg']), content=h['content']) for h in c.get('hashes', [])]
+        return cls(
+            group=intern_str(c.get('group', "")),
+            name=c.get('name'),
+            version=c.get('version'),
+            type=intern_str(c.get('type')),
+            bom_ref=c.get('bom-ref'),
+            purl=c.get('purl'),
+            hashes=hashes
+        )
+
+@dataclass(slots=True)
 class Dependency:
     ref: str
     depends_on: List[str] = field(default_factory=list)
 
-@dataclass
+    @classmethod
+    def from_json(cls, d: Dict):
+        """dependencies[] 원소 하나를 Dependency 객체로 변환합니다."""
+        return cls(
+            ref=d.get('ref'),
+            depends_on=d.get('dependsOn', [])
+        )
+
+@dataclass(slots=True)
 class Metadata:
     timestamp: str
     authors: List[Dict[str, str]]
     component: Dict[str, str]  # 메인 컴포넌트 정보
 
-@dataclass
+@dataclass(slots=True)
 class HatbomSbom:
+    # 통합기가 문서의 도구를 구분하는 이름 (struct_sbom 모델도 같은 속성 제공)
+    tool: ClassVar[str] = "Hatbom"
+
     bom_format: str
     spec_version: str
     serial_number: str
@@ -86,26 +124,10 @@ class HatbomSbom:
         )
 
         # 2. Components 파싱
-        components = []
-        for c in data.get('components', []):
-            hashes = [Hash(alg=h['alg'], content=h['content']) for h in c.get('hashes', [])]
-            components.append(Component(
-                group=c.get('group', ""),
-                name=c.get('name'),
-                version=c.get('version'),
-                type=c.get('type'),
-                bom_ref=c.get('bom-ref'),
-                purl=c.get('purl'),
-                hashes=hashes
-            ))
+        components = [Component.from_json(c) for c in data.get('components', [])]
 
         # 3. Dependencies 파싱
-        dependencies = []
-        for d in data.get('dependencies', []):
-            dependencies.append(Dependency(
-                ref=d.get('ref'),
-                depends_on=d.get('dependsOn', [])
-            ))
+        dependencies = [Dependency.from_json(d) for d in data.get('dependencies', [])]
 
         return cls(
             bom_format=data.get('bomFormat'),
@@ -116,4 +138,45 @@ class HatbomSbom:
             components=components,
             dependencies=dependencies,
             file_count=data.get('file_count', 0)
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_events(cls, events: Iterable[JSONEvent]):
+        """
+        stream.iter_json_events()가 생성한 이벤트로부터 객체를 구성합니다.
+        components/dependencies 원소는 도착하는 즉시 객체로 변환하므로 원본 dict 트리가 쌓이지 않습니다.
+        """
+        header: Dict[str, Any] = {}
+        components: List[Component] = []
+        dependencies: List[Dependency] = []
+        for item in _iter_items(events, header):
+            if isinstance(item, Component):
+                components.append(item)
+            else:
+                dependencies.append(item)
+
+        sbom = cls.from_json(header)
+        sbom.components = components
+        sbom.dependencies = dependencies
+        return sbom
+
+    @classmethod
+    def from_stream(cls, fp: BinaryIO):
+        """파일 객체를 청크 단위로 읽어 HatbomSbom 객체로 변환합니다."""
+        return cls.from_events(iter_json_events(fp))
+
+    @staticmethod
+    def iter_stream(fp: BinaryIO) -> Iterator[Union[Component, Dependency]]:
+        """파일 객체를 청크 단위로 읽으며 Component / Dependency 객체를 하나씩 생성합니다."""
+        return _iter_items(iter_json_events(fp), {})
+
+
+def _iter_items(events: Iterable[JSONEvent], header: Dict[str, Any]) -> Iterator[Union[Component, Dependency]]:
+    """배열 원소 이벤트는 모델 객체로 변환해 내보내고, 나머지 최상위 필드는 header에 채웁니다."""
+    for kind, key, value in events:
+        if kind != ITEM:
+            header[key] = value
+        elif key == 'components':
+            yield Component.from_json(value)
+        elif key == 'dependencies':
+            yield Dependency.from_json(value)
@@ -0,0 +1,49 @@
+'''
+- SBOM 모델에서 반복적으로 등장하는 문자열을 sys.intern으로 공유하기 위한 도구
+- json.loads는 dict의 키만 재사용하고 값은 매번 새 문자열로 만들기 때문에,
+  "syft:package:foundBy" 같은 property 이름이나 "library", "MD5" 같은 값이
+  컴포넌트 수만큼 중복 할당됩니다. 이를 하나의 객체로 공유하여 메모리를 줄입니다.
+- 경로, 해시값처럼 거의 반복되지 않는 값은 intern 테이블만 키우므로 대상에서 제외합니다.
+- 같은 저자(name, email)는 하나의 UnifiedAuthor 객체를 공유합니다. (크기 제한이 있는 LRU 풀)
+'''
+
+import sys
+from functools import lru_cache
+from typing import Optional
+
+from app.models.unified_sbom import UnifiedAuthor
+
+# 값의 종류가 적어 반복 빈도가 높은 Syft property 이름 (값까지 intern)
+CATEGORICAL_PROPERTY_NAMES = frozenset({
+    "syft:package:foundBy",
+    "syft:package:type",
+    "syft:package:language",
+    "syft:package:metadataType",
+    "source_tool",
+    "integrated_with",
+})
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """문자열이면 intern된 객체를, 아니면(None 등) 그대로 반환합니다."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def intern_property(name: str, value: str):
+    """property (name, value) 쌍을 intern합니다. 값은 범주형 property인 경우에만 intern합니다."""
+    name = sys.intern(name)
+    if name in CATEGORICAL_PROPERTY_NAMES and type(value) is str:
+        value = sys.intern(value)
+    return name, value
+
+
+# 공유 UnifiedAuthor 풀 크기
+AUTHOR_POOL_SIZE = 8192
+
+
+@lru_cache(maxsize=AUTHOR_POOL_SIZE)
+def intern_author(name: Optional[str], email: Optional[str]) -> UnifiedAuthor:
+    """(name, email)이 같은 저자는 같은 UnifiedAuthor 객체를 반환합니다. (공유 객체이므로 수정하지 말 것)"""
+    return UnifiedAuthor(name=name, email=email)
@@ -0,0 +1,228 @@
+'''
+- msgspec Struct 기반의 대체 SBOM 모델 정의 파일
+- hatbom_sbom.py / syft_sbom.py / unified_sbom.py의 dataclass 모델과 같은 속성 이름을 제공하므로
+  SBOMIntegrator, SBOMExporter에 그대로 전달할 수 있습니다.
+- dict 트리를 만든 뒤 dataclass로 복사하는 대신, 원본 JSON 바이트를 한 번에 타입 객체로 디코딩합니다.
+- CycloneDX 키 이름(bom-ref, dependsOn, bomFormat, $schema 등)은 field(name=...)로 디코더 안에서 변환됩니다.
+- msgspec은 선택 의존성입니다. 설치되어 있지 않으면 이 모듈을 import할 때 ImportError가 발생합니다.
+
+[사용 예시]
+with open('transformers_syft_sbom.json', 'rb') as f:
+    syft_sbom = SyftSbom.from_bytes(f.read())
+
+print(syft_sbom.components[0].bom_ref)
+for lic in syft_sbom.components[0].licenses:
+    print(lic.id, lic.name)
+'''
+
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional
+
+import msgspec
+from msgspec import Struct, field
+
+
+class _Base(Struct, kw_only=True):
+    """공통 기능: 원본 JSON 바이트를 한 번에 타입 객체로 디코딩"""
+
+    @classmethod
+    def from_bytes(cls, raw: bytes):
+        """
+        JSON 바이트를 받아 클래스 객체로 변환합니다.
+
+        Raises:
+            msgspec.DecodeError: 유효하지 않은 JSON이거나 스키마와 타입이 맞지 않는 경우
+        """
+        return _decoder(cls).decode(raw)
+
+
+@lru_cache(maxsize=None)
+def _decoder(cls) -> msgspec.json.Decoder:
+    """클래스별 디코더를 한 번만 생성하여 재사용합니다."""
+    return msgspec.json.Decoder(cls)
+
+
+# ---------------------------------------------------------------------------
+# Hatbom
+# ---------------------------------------------------------------------------
+
+class Hash(_Base, gc=False):
+    alg: str
+    content: str
+
+
+class HatbomComponent(_Base, gc=False):
+    name: Optional[str] = None
+    version: Optional[str] = None
+    type: Optional[str] = None
+    bom_ref: Optional[str] = field(default=None, name="bom-ref")
+    purl: Optional[str] = None
+    group: str = ""
+    hashes: List[Hash] = []
+
+
+class HatbomDependency(_Base, gc=False):
+    ref: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list, name="dependsOn")
+
+
+class HatbomMetadata(_Base, gc=False):
+    timestamp: Optional[str] = None
+    authors: List[Dict[str, Any]] = []
+    component: Dict[str, Any] = {}  # 메인 컴포넌트 정보
+
+
+class HatbomSbom(_Base, gc=False):
+    tool: ClassVar[str] = "Hatbom"  # dataclass 모델과 같은 도구 이름
+    bom_format: Optional[str] = field(default=None, name="bomFormat")
+    spec_version: Optional[str] = field(default=None, name="specVersion")
+    serial_number: Optional[str] = field(default=None, name="serialNumber")
+    version: Optional[int] = None
+    metadata: HatbomMetadata = field(default_factory=HatbomMetadata)
+    components: List[HatbomComponent] = []
+    dependencies: List[HatbomDependency] = []
+    file_count: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Syft
+# ---------------------------------------------------------------------------
+
+class Property(_Base, gc=False):
+    name: str
+    value: str
+
+
+class _LicenseNode(_Base, gc=False):
+    id: Optional[str] = None
+    name: Optional[str] = None
+
+
+class License(_Base, gc=False):
+    """
+    CycloneDX의 licenses[] 원소({"license": {...}} 또는 {"expression": "..."})를 그대로 디코딩하고,
+    dataclass 모델과 같은 id / name 속성을 제공합니다.
+    """
+    license: Optional[_LicenseNode] = None
+    expression: Optional[str] = None
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.license.id if self.license else None
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.license.name if self.license else None
+
+
+class SyftComponent(_Base, gc=False):
+    bom_ref: Optional[str] = field(default=None, name="bom-ref")
+    type: Optional[str] = None
+    name: Optional[str] = None
+    version: Optional[str] = None
+    cpe: Optional[str] = None
+    purl: Optional[str] = None
+    author: Optional[str] = None
+    licenses: List[License] = []
+    properties: List[Property] = []
+
+
+class SyftMetadata(_Base, gc=False):
+    """
+    metadata.tools는 CycloneDX 1.5+에서 {"components": [...]}, 이전 버전에서는 배열이므로
+    원본을 tool_set에 보관하고 dataclass 모델과 같은 tools(list) 속성으로 노출합니다.
+    """
+    timestamp: Optional[str] = None
+    tool_set: Any = field(default_factory=dict, name="tools")
+    main_component: Dict[str, Any] = field(default_factory=dict, name="component")
+
+    @property
+    def tools(self) -> List[Dict[str, Any]]:
+        if isinstance(self.tool_set, dict):
+            return self.tool_set.get("components", [])
+        return self.tool_set or []
+
+
+class SyftSbom(_Base, gc=False):
+    tool: ClassVar[str] = "Syft"  # dataclass 모델과 같은 도구 이름
+    schema: Optional[str] = field(default=None, name="$schema")
+    bom_format: Optional[str] = field(default=None, name="bomFormat")
+    spec_version: Optional[str] = field(default=None, name="specVersion")
+    serial_number: Optional[str] = field(default=None, name="serialNumber")
+    version: Optional[int] = None
+    metadata: SyftMetadata = field(default_factory=SyftMetadata)
+    components: List[SyftComponent] = []
+    dependencies: List[Dict[str, Any]] = []
+
+
+# ---------------------------------------------------------------------------
+# Unified (SBOMExporter가 생성한 CycloneDX 통합본)
+# ---------------------------------------------------------------------------
+
+class UnifiedAuthor(_Base):
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+
+class UnifiedMetadataComponent(_Base):
+    name: str = ""
+    type: str = "application"
+    bom_ref: str = field(default="", name="bom-ref")
+    version: Optional[str] = ""
+    group: Optional[str] = ""
+    purl: Optional[str] = None
+
+
+class UnifiedMetadata(_Base):
+    timestamp: Optional[str] = None
+    authors: List[UnifiedAuthor] = []
+    tools: Dict[str, Any] = {}
+    component: Optional[UnifiedMetadataComponent] = None
+
+
+class UnifiedComponent(_Base):
+    name: Optional[str] = ""
+    version: Optional[str] = ""
+    type: Optional[str] = ""
+    bom_ref: Optional[str] = field(default="", name="bom-ref")
+    purl: Optional[str] = None
+    group: Optional[str] = ""
+    cpe: Optional[str] = None
+    description: Optional[str] = ""
+    hashes: List[Dict[str, str]] = []
+    licenses: List[Dict[str, Any]] = []
+    properties: List[Dict[str, str]] = []
+    authors: List[UnifiedAuthor] = []
+
+
+class UnifiedSbom(_Base):
+    bom_format: str = field(default="CycloneDX", name="bomFormat")
+    spec_version: str = field(default="1.6", name="specVersion")
+    serial_number: str = field(default="", name="serialNumber")
+    version: int = 1
+    metadata: Optional[UnifiedMetadata] = None
+    components: List[UnifiedComponent] = []
+    dependencies: List[Dict[str, Any]] = []
+
+
+# ---------------------------------------------------------------------------
+# 형식 판별용 헤더
+# ---------------------------------------------------------------------------
+
+class _HeaderMetadata(_Base, gc=False):
+    tools: Any = None
+
+
+class FormatHeader(_Base, gc=False):
+    """형식 판별에 필요한 필드만 디코딩하기 위한 헤더 (나머지 필드는 객체를 만들지 않고 건너뜀)"""
+    schema: Optional[str] = field(default=None, name="$schema")
+    metadata: Optional[_HeaderMetadata] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """SBOMParser._is_syft()에 전달할 수 있는 dict 형태로 변환합니다."""
+        data: Dict[str, Any] = {}
+        if self.schema is not None:
+            data["$schema"] = self.schema
+        if self.metadata is not None and self.metadata.tools is not None:
+            data["metadata"] = {"tools": self.metadata.tools}
+        return data
@@ -16,6 +16,10 @@ for comp in syft_sbom.components:
         print(f"Package: {comp.name}, Version: {comp.version}")
         print(f"Locations: {paths}")
 
+# 대용량 파일은 스트리밍으로 파싱 (문서 전체를 dict로 올리지 않음)
+with open('transformers_syft_sbom.json', 'rb') as f:
+    syft_sbom = SyftSbom.from_stream(f)
+
 # components.author을 components.authors[] 리스트로 변환하기
 - 기존의 components.author 필드의 경우 이름과 이메일 혹은 이름만 있는 경우가 있다. 이를 parsing해야 한다.
 - 아래는 python3에서 제공하는 email.utils 모듈을 활용한 예시이다.
@@ -122,19 +126,22 @@ if __name__ == "__main__":
 '''
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, BinaryIO, ClassVar, Iterable, Iterator, Union
+
+from app.models.interning import intern_property, intern_str
+from app.services.stream import ITEM, JSONEvent, iter_json_events
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     name: str
     value: str
 
-@dataclass
+@dataclass(slots=True)
 class License:
     id: Optional[str] = None
     name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     bom_ref: str
     type: str
@@ -146,14 +153,47 @@ class Component:
     licenses: List[License] = field(default_factory=list)
     properties: List[Property] = field(default_factory=list)
 
-@dataclass
+    @classmethod
+    def from_json(cls, c: Dict[str, Any]):
+        """
+        components[] 원소 하나를 Component 객체로 변환합니다.
+        property 이름, 범주형 property 값, 라이선스, type처럼 반복되는 문자열은 intern하여 공유합니다.
+        """
+        # 라이선스 추출
+        licenses = []
+        for l in c.get('licenses', []):
+            lic_node = l.get('license', {})
+            licenses.append(License(
+                id=intern_str(lic_node.get('id')),
+                name=intern_str(lic_node.get('name'))
+            ))
+
+        # 속성(properties) 추출
+        props = [Property(*intern_property(p['name'], p['value'])) for p in c.get('properties', [])]
+
+        return cls(
+            bom_ref=c.get('bom-ref'),
+            type=intern_str(c.get('type')),
+            name=c.get('name'),
+            version=c.get('version'),
+            cpe=c.get('cpe'),
+            purl=c.get('purl'),
+            author=c.get('author'),
+            licenses=licenses,
+            properties=props
+        )
+
+@dataclass(slots=True)
 class Metadata:
     timestamp: str
     tools: List[Dict[str, str]]
     main_component: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class SyftSbom:
+    # 통합기가 문서의 도구를 구분하는 이름 (struct_sbom 모델도 같은 속성 제공)
+    tool: ClassVar[str] = "Syft"
+
     schema: str
     bom_format: str
     spec_version: str
@@ -177,31 +217,7 @@ class SyftSbom:
         )
 
         # 2. Components 파싱
-        components_list = []
-        for c in data.get('components', []):
-            # 라이선스 추출
-            licenses = []
-            for l in c.get('licenses', []):
-                lic_node = l.get('license', {})
-                licenses.append(License(
-                    id=lic_node.get('id'),
-                    name=lic_node.get('name')
-                ))
-            
-            # 속성(properties) 추출
-            props = [Property(name=p['name'], value=p['value']) for p in c.get('properties', [])]
-            
-            components_list.append(Component(
-                bom_ref=c.get('bom-ref'),
-                type=c.get('type'),
-                name=c.get('name'),
-                version=c.get('version'),
-                cpe=c.get('cpe'),
-                purl=c.get('purl'),
-                author=c.get('author'),
-                licenses=licenses,
-                properties=props
-            ))
+        components_list = [Component.from_json(c) for c in data.get('components', [])]
 
         return cls(
             schema=data.get('$schema'),
@@ -212,4 +228,48 @@ class SyftSbom:
             metadata=metadata_obj,
             components=components_list,
             dependencies=data.get('dependencies', [])
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_events(cls, events: Iterable[JSONEvent]):
+        """
+        stream.iter_json_events()가 생성한 이벤트로부터 객체를 구성합니다.
+        components 원소는 도착하는 즉시 Component로 변환하므로 원본 dict 트리가 쌓이지 않습니다.
+        """
+        header: Dict[str, Any] = {}
+        components: List[Component] = []
+        dependencies: List[Dict[str, Any]] = []
+        for item in _iter_items(events, header):
+            if isinstance(item, Component):
+                components.append(item)
+            else:
+                dependencies.append(item)
+
+        sbom = cls.from_json(header)
+        sbom.components = components
+        sbom.dependencies = dependencies
+        return sbom
+
+    @classmethod
+    def from_stream(cls, fp: BinaryIO):
+        """파일 객체를 청크 단위로 읽어 SyftSbom 객체로 변환합니다."""
+        return cls.from_events(iter_json_events(fp))
+
+    @staticmethod
+    def iter_stream(fp: BinaryIO) -> Iterator[Union[Component, Dict[str, Any]]]:
+        """
+        파일 객체를 청크 단위로 읽으며 Component 객체와 dependency(dict)를 하나씩 생성합니다.
+        (Syft의 dependencies는 from_json과 동일하게 원본 dict 형태를 유지합니다.)
+        """
+        return _iter_items(iter_json_events(fp), {})
+
+
+def _iter_items(events: Iterable[JSONEvent], header: Dict[str, Any]) -> Iterator[Union[Component, Dict[str, Any]]]:
+    """배열 원소 이벤트는 모델 객체로 변환해 내보내고, 나머지 최상위 필드는 header에 채웁니다."""
+    for kind, key, value in events:
+        if kind != ITEM:
+            header[key] = value
+        elif key == 'components':
+            yield Component.from_json(value)
+        elif key == 'dependencies':
+            yield value
@@ -3,8 +3,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from app.models.component_table import ComponentTable
 
-@dataclass
+
+@dataclass(slots=True)
 class UnifiedAuthor:
     """
     저자 정보를 저장하는 클래스입니다.
@@ -15,7 +17,7 @@ class UnifiedAuthor:
     email: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedMetadataComponent:
     """
     SBOM 메타데이터의 메인 컴포넌트 정보를 저장하는 클래스입니다.
@@ -29,7 +31,7 @@ class UnifiedMetadataComponent:
     purl: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedMetadata:
     """
     SBOM 메타데이터를 저장하는 클래스입니다.
@@ -41,7 +43,7 @@ class UnifiedMetadata:
     component: Optional[UnifiedMetadataComponent] = None  # 메인 컴포넌트 정보
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedComponent:
     """
     Syft의 패키지 정보와 Hatbom의 파일 정보를 통합하여 저장하는 클래스입니다.
@@ -60,7 +62,7 @@ class UnifiedComponent:
     cpe: Optional[str] = None  # Syft에서 제공하는 CPE
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedSbom:
     """
     최종 통합본 SBOM을 정의하는 클래스입니다.
@@ -100,4 +102,11 @@ class UnifiedSbom:
     def set_metadata_component(self, component: UnifiedMetadataComponent):
         """메타데이터의 메인 컴포넌트를 설정합니다."""
         if self.metadata is not None:
-            self.metadata.component = component
\ No newline at end of file
+            self.metadata.component = component
+
+    def to_table(self) -> ComponentTable:
+        """
+        컴포넌트 목록을 컬럼형 테이블(ComponentTable)로 변환합니다.
+        components 리스트는 그대로 유지되며, 테이블은 호출 시점의 스냅샷입니다.
+        """
+        return ComponentTable.from_components(self.components)
\ No newline at end of file
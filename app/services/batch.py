@@ -0,0 +1,344 @@
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.services import codec
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.detect import HATBOM, SYFT, classify_header
+from app.services.export import SBOMExporter
+from app.services.integrate import SBOMIntegrator
+from app.services.parse import SBOMParser
+from app.services.stream import ITEM, iter_json_events
+
+"""
+batch.py
+해당 파일은 많은 Hatbom/Syft SBOM 쌍을 한 번에 통합하는 배치 CLI를 제공합니다. (레지스트리 전체 백필 등)
+
+주요기능:
+1. 디렉토리(하위 폴더 포함 *.json / *.json.gz / *.json.zst) 또는 매니페스트 파일에서 입력을 모읍니다.
+    - 디렉토리: 파일마다 첫 번째 components 원소 전까지의 헤더만 읽어 도구 형식과 main component 이름을 구합니다.
+      (형식은 detect.classify_header로 판별하며, Hatbom/Syft가 아닌 파일(SPDX, 통합 결과 등 일반 CycloneDX)은 짝이 없는 파일로 보고)
+    - main component 이름이 같은 Hatbom/Syft 파일끼리 짝을 짓습니다.
+      (Syft는 스캔 경로("/src")를 이름으로 쓰는 경우가 있어, 남은 파일은 도구명/sbom을 뺀 파일명으로 한 번 더 짝을 지음)
+    - 매니페스트: JSON 배열 또는 JSON Lines, 항목마다 {"hatbom": 경로, "syft": 경로, "name": 선택}
+2. 파싱 -> 통합 -> 내보내기를 프로세스 풀에서 실행합니다. (작업자 수, 작업 묶음 크기 chunksize 설정 가능)
+3. 완료된 쌍은 출력 디렉토리의 진행 기록(batch_progress.jsonl)에 한 줄씩 추가합니다.
+    - 다시 실행하면 입력 파일(크기, 수정 시각)이 같고 출력 파일이 남아 있는 성공 쌍은 건너뜁니다.
+4. 마지막에 처리량 보고서(쌍/파일 수, files/s, MB/s)를 JSON으로 출력합니다.
+
+[CLI]
+python -m app.services.batch registry/ -o unified/ --workers 8 --chunksize 4
+python -m app.services.batch pairs.jsonl -o unified/ --compress gz
+"""
+
+PROGRESS_FILE = "batch_progress.jsonl"
+
+SBOM_SUFFIXES = (".json", ".json.gz", ".json.zst")
+
+# 파일명 짝짓기에서 제거할 단어 (transformers_syft_sbom.json -> transformers)
+_FILENAME_NOISE = re.compile(r"(?:^|[-_.])(?:hatbom|syft|sbom|cyclonedx|cdx|bom)(?=$|[-_.])", re.IGNORECASE)
+_UNSAFE_FILENAME = re.compile(r"[^\w.@+-]+")
+
+
+@dataclass(slots=True)
+class BatchTask:
+    """통합할 SBOM 쌍 하나 (작업자 프로세스로 전달)"""
+    name: str
+    hatbom: str
+    syft: str
+    output: str
+    indent: Optional[int] = 2
+
+    def signature(self) -> List[List[int]]:
+        """입력 파일의 (크기, 수정 시각) 목록 (재실행 시 변경 여부 판단)"""
+        return [[stat.st_size, stat.st_mtime_ns] for stat in (os.stat(self.hatbom), os.stat(self.syft))]
+
+
+@dataclass(slots=True)
+class BatchReport:
+    """배치 실행 결과 (처리량 보고서)"""
+    pairs: int = 0
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    unpaired: List[str] = field(default_factory=list)
+    input_bytes: int = 0
+    components: int = 0
+    seconds: float = 0.0
+    failures: List[Dict[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        seconds = self.seconds or float("inf")
+        result["files_per_second"] = round(self.completed * 2 / seconds, 2)
+        result["mb_per_second"] = round(self.input_bytes / 1_000_000 / seconds, 2)
+        result["seconds"] = round(self.seconds, 3)
+        return result
+
+
+# --- 입력 수집 ---
+
+def read_header(path: Path) -> Dict[str, Any]:
+    """첫 번째 배열 원소가 나오기 전까지의 최상위 필드($schema, metadata 등)만 읽습니다."""
+    header: Dict[str, Any] = {}
+    with open(path, "rb") as f:
+        for kind, key, value in iter_json_events(open_decompressed(f, encoding_hint(str(path)))):
+            if kind == ITEM:
+                break
+            header[key] = value
+    return header
+
+
+def _component_name(header: Dict[str, Any]) -> Optional[str]:
+    """헤더의 main component 이름을 짝짓기 키로 정규화합니다. (경로이면 마지막 부분, 소문자)"""
+    metadata = header.get("metadata")
+    component = metadata.get("component") if isinstance(metadata, dict) else None
+    name = component.get("name") if isinstance(component, dict) else None
+    if not name:
+        return None
+    return name.rstrip("/").rsplit("/", 1)[-1].lower() or None
+
+
+def _filename_key(path: Path) -> str:
+    """도구명/sbom 단어와 확장자를 뺀 파일명 (transformers_syft_sbom.json.gz -> transformers)"""
+    name = path.name
+    for suffix in SBOM_SUFFIXES[::-1]:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return _FILENAME_NOISE.sub("", name).strip("-_.").lower()
+
+
+def _safe_filename(name: str) -> str:
+    return _UNSAFE_FILENAME.sub("_", name).strip("_") or "unified"
+
+
+def scan_directory(directory: Path) -> Tuple[List[Tuple[str, Path, Path]], List[str]]:
+    """
+    디렉토리의 SBOM 파일을 main component 이름으로 짝지어 ([(이름, Hatbom 경로, Syft 경로)], 짝이 없는 파일)을 반환합니다.
+    같은 이름의 Hatbom/Syft가 각각 하나일 때만 짝을 짓고, Hatbom/Syft로 판별되지 않은 파일은 짝이 없는 파일에 넣습니다.
+    """
+    files: List[Tuple[str, Path, Optional[str]]] = []
+    unpaired: List[str] = []
+    for path in sorted(p for p in directory.rglob("*") if p.is_file() and p.name.endswith(SBOM_SUFFIXES)):
+        try:
+            header = read_header(path)
+        except (ValueError, OSError):
+            unpaired.append(str(path))
+            continue
+        tool = classify_header(header)
+        if tool not in (HATBOM, SYFT):
+            unpaired.append(str(path))
+            continue
+        files.append((tool, path, _component_name(header)))
+
+    pairs: List[Tuple[str, Path, Path]] = []
+    remaining = files
+    # 1차: main component 이름, 2차: 도구명/sbom을 뺀 파일명
+    for key_of in (lambda path, name: name, lambda path, name: _filename_key(path)):
+        groups: Dict[Optional[str], Dict[str, list]] = defaultdict(lambda: {HATBOM: [], SYFT: []})
+        for entry in remaining:
+            tool, path, name = entry
+            groups[key_of(path, name)][tool].append(entry)
+        remaining = []
+        for key, group in groups.items():
+            if key and len(group[HATBOM]) == 1 and len(group[SYFT]) == 1:
+                pairs.append((key, group[HATBOM][0][1], group[SYFT][0][1]))
+            else:
+                remaining.extend(group[HATBOM] + group[SYFT])
+    unpaired.extend(sorted(str(path) for _, path, _ in remaining))
+    pairs.sort(key=lambda pair: pair[0])
+    return pairs, unpaired
+
+
+def read_manifest(path: Path) -> List[Tuple[str, Path, Path]]:
+    """매니페스트(JSON 배열 또는 JSON Lines)를 읽습니다. 상대 경로는 매니페스트 위치 기준입니다."""
+    raw = path.read_bytes()
+    if raw.lstrip().startswith(b"["):
+        entries = codec.loads(raw)
+    else:
+        entries = [codec.loads(line) for line in raw.splitlines() if line.strip()]
+    base = path.parent
+    pairs = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("hatbom") or not entry.get("syft"):
+            raise ValueError(f"매니페스트 항목에는 hatbom, syft 경로가 필요합니다: {entry}")
+        hatbom = base / entry["hatbom"]
+        syft = base / entry["syft"]
+        pairs.append((entry.get("name") or _filename_key(hatbom), hatbom, syft))
+    return pairs
+
+
+def build_tasks(
+    pairs: Iterable[Tuple[str, Path, Path]],
+    output_dir: Path,
+    compress: Optional[str] = None,
+    indent: Optional[int] = 2,
+) -> List[BatchTask]:
+    """쌍마다 출력 경로를 정해 작업 목록을 만듭니다. (같은 이름이 여러 번이면 번호를 붙임)"""
+    extension = {None: "", "gz": ".gz", "zst": ".zst"}[compress]
+    used: Dict[str, int] = defaultdict(int)
+    tasks = []
+    for name, hatbom, syft in pairs:
+        stem = _safe_filename(name)
+        used[stem] += 1
+        if used[stem] > 1:
+            stem = f"{stem}-{used[stem]}"
+        output = output_dir / f"{stem}_unified_sbom.json{extension}"
+        tasks.append(BatchTask(name=name, hatbom=str(hatbom), syft=str(syft), output=str(output), indent=indent))
+    return tasks
+
+
+# --- 실행 ---
+
+def integrate_pair(task: BatchTask) -> Dict[str, Any]:
+    """
+    작업자에서 실행되는 함수입니다. 쌍 하나를 파싱/통합/저장하고 진행 기록 한 줄을 반환합니다.
+    예외는 기록(status=failed)으로 바꾸어 반환하므로 한 쌍의 실패가 배치를 멈추지 않습니다.
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"name": task.name, "hatbom": task.hatbom, "syft": task.syft, "output": task.output}
+    try:
+        record["signature"] = task.signature()
+        # 파싱/통합 로그는 쌍마다 출력되므로 배치에서는 숨김
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser = SBOMParser()
+            hatbom = parser.parse(task.hatbom, streaming=True)
+            syft = parser.parse(task.syft, streaming=True)
+            integrator = SBOMIntegrator()
+            unified = integrator.integrate(hatbom, syft)
+            SBOMExporter(unified, integrator.stats).save_to_file(task.output, indent=task.indent)
+        record.update(
+            status="ok",
+            components=len(unified.components),
+            bytes=sum(size for size, _ in record["signature"]),
+        )
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+def load_progress(output_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """진행 기록에서 출력 경로별 마지막 기록을 읽습니다. (중간에 끊긴 마지막 줄은 무시)"""
+    path = output_dir / PROGRESS_FILE
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                record = codec.loads(line)
+            except ValueError:
+                continue
+            records[record.get("output")] = record
+    return records
+
+
+def _is_done(task: BatchTask, record: Optional[Dict[str, Any]]) -> bool:
+    if record is None or record.get("status") != "ok" or not os.path.exists(task.output):
+        return False
+    if (record.get("hatbom"), record.get("syft")) != (task.hatbom, task.syft):
+        return False
+    try:
+        return record.get("signature") == task.signature()
+    except OSError:
+        return False
+
+
+def run_batch(
+    tasks: List[BatchTask],
+    output_dir: Path,
+    workers: int = 1,
+    chunksize: int = 1,
+    resume: bool = True,
+    on_record=None,
+) -> BatchReport:
+    """
+    작업 목록을 실행하고 처리량 보고서를 반환합니다.
+
+    Args:
+        tasks: build_tasks()로 만든 작업 목록
+        output_dir: 출력/진행 기록 디렉토리
+        workers: 작업자 프로세스 수 (1이면 현재 프로세스에서 순서대로 실행)
+        chunksize: 작업자에 한 번에 넘길 작업 수 (작은 SBOM이 많으면 키워서 전달 비용을 줄임)
+        resume: 진행 기록의 성공 쌍을 건너뛸지 여부
+        on_record: 쌍 하나가 끝날 때마다 기록 dict로 호출할 함수 (진행 표시용)
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report = BatchReport(pairs=len(tasks))
+    done = load_progress(output_dir) if resume else {}
+    pending = [task for task in tasks if not _is_done(task, done.get(task.output))]
+    report.skipped = len(tasks) - len(pending)
+
+    started = time.perf_counter()
+    with open(output_dir / PROGRESS_FILE, "a" if resume else "w", encoding="utf-8") as progress:
+        for record in _execute(pending, workers, chunksize):
+            progress.write(codec.dumps_compact(record).decode("utf-8") + "\n")
+            progress.flush()
+            if record["status"] == "ok":
+                report.completed += 1
+                report.input_bytes += record["bytes"]
+                report.components += record["components"]
+            else:
+                report.failed += 1
+                report.failures.append({"name": record["name"], "error": record["error"]})
+            if on_record is not None:
+                on_record(record)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _execute(tasks: List[BatchTask], workers: int, chunksize: int) -> Iterator[Dict[str, Any]]:
+    if workers <= 1 or len(tasks) <= 1:
+        yield from map(integrate_pair, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(integrate_pair, tasks, chunksize=max(1, chunksize))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hatbom/Syft SBOM 쌍을 프로세스 풀에서 한 번에 통합합니다.")
+    parser.add_argument("source", help="SBOM 디렉토리 또는 매니페스트 파일(.json / .jsonl)")
+    parser.add_argument("-o", "--output", required=True, help="통합 SBOM과 진행 기록을 저장할 디렉토리")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="작업자 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--chunksize", type=int, default=1, help="작업자에 한 번에 넘길 쌍 수 (기본값 1)")
+    parser.add_argument("--compress", choices=["gz", "zst"], help="출력 파일 압축 형식")
+    parser.add_argument("--compact", action="store_true", help="들여쓰기 없이 저장")
+    parser.add_argument("--restart", action="store_true", help="진행 기록을 무시하고 처음부터 다시 실행")
+    args = parser.parse_args(argv)
+
+    source = Path(args.source)
+    output_dir = Path(args.output)
+    if source.is_dir():
+        pairs, unpaired = scan_directory(source)
+    else:
+        pairs, unpaired = read_manifest(source), []
+    tasks = build_tasks(pairs, output_dir, args.compress, indent=None if args.compact else 2)
+
+    total = len(tasks)
+    finished = 0
+
+    def show(record: Dict[str, Any]) -> None:
+        nonlocal finished
+        finished += 1
+        status = "OK" if record["status"] == "ok" else "FAIL"
+        sys.stderr.write(f"[{finished}/{total}] {status} {record['name']} ({record['seconds']:.2f}s)\n")
+
+    report = run_batch(tasks, output_dir, args.workers, args.chunksize, resume=not args.restart, on_record=show)
+    report.unpaired = unpaired
+    sys.stdout.write(codec.dumps(report.to_dict(), indent=2) + "\n")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Mapping, Optional
+
+from app.services import codec
+
+"""
+cache.py
+해당 파일은 통합 요청 결과를 입력 내용 기준으로 재사용하는 콘텐츠 주소 기반(content-addressed) 캐시를 제공합니다.
+주요기능:
+1. 입력 SBOM 바이트들의 sha256과 통합 옵션으로 캐시 키를 만듭니다. (같은 입력이면 파일명과 무관하게 같은 키)
+2. 메모리 계층: 내보낸 CycloneDX JSON 바이트와 요약(summary)을 LRU 방식으로 보관하며, 전체 크기(바이트)로 상한을 둡니다.
+   - 결과 화면 표 행/의존성 목록도 함께 보관하므로 캐시 적중 시 문서를 다시 디코딩하지 않습니다.
+3. 디스크 계층(선택): cache_dir이 지정되면 결과를 파일로도 저장하여 재시작 후에도 재사용합니다.
+   - 디스크에서 찾은 결과는 메모리 계층으로 올립니다.
+   - 디스크 사용량이 상한을 넘으면 가장 오래 사용하지 않은(mtime 기준) 항목부터 삭제합니다.
+4. 계층별 hit/miss/eviction 횟수를 집계합니다. (stats())
+
+캐시 적중 시에는 입력 파싱, 통합, 직렬화를 모두 건너뜁니다.
+
+[사용 예시]
+cache = ResultCache(max_bytes=256 * 1024 * 1024, cache_dir=".cache/sbom")
+key = make_key([hash_stream(hatbom_fp), hash_stream(syft_fp)], integrator.options())
+entry = cache.get(key)
+if entry is None:
+    entry = CachedResult(document=..., summary=..., filename=...)
+    cache.put(key, entry)
+"""
+
+# 해시 계산 시 한 번에 읽는 크기
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# 캐시 형식이 바뀌면 올려서 이전 디스크 항목을 무효화
+CACHE_FORMAT_VERSION = 2
+
+
+@dataclass(slots=True)
+class CachedResult:
+    """통합 결과 캐시 항목 (CycloneDX JSON 바이트 + 요약 정보 + 결과 화면 표 행/의존성 목록)"""
+    document: bytes
+    summary: Dict[str, Any] = field(default_factory=dict)
+    filename: str = ""
+    rows: Optional[List[Dict[str, Any]]] = None
+    dependencies: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def size(self) -> int:
+        """캐시 크기 계산에 사용하는 대략적인 항목 크기(바이트)"""
+        size = len(self.document) + len(self.filename) + 1024
+        if self.rows is not None:
+            # 표 행/의존성은 문서 내용의 일부이므로 문서 크기만큼으로 어림
+            size += len(self.document)
+        return size
+
+
+def hash_stream(fp: BinaryIO) -> str:
+    """
+    파일 객체 전체의 sha256을 청크 단위로 계산합니다.
+    계산 후에는 이어서 파싱할 수 있도록 읽기 위치를 처음으로 되돌립니다.
+    """
+    digest = hashlib.sha256()
+    fp.seek(0)
+    while True:
+        chunk = fp.read(_HASH_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+    fp.seek(0)
+    return digest.hexdigest()
+
+
+def make_key(payload_hashes: Iterable[str], options: Optional[Mapping[str, Any]] = None) -> str:
+    """입력별 해시와 통합 옵션으로 캐시 키를 생성합니다. (입력 순서 구분)"""
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode())
+    for payload_hash in payload_hashes:
+        digest.update(b"\0")
+        digest.update(payload_hash.encode())
+    for name, value in sorted((options or {}).items()):
+        digest.update(f"\0{name}={value!r}".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    크기 상한이 있는 LRU 메모리 캐시 + 선택적 디스크 캐시입니다.
+
+    Args:
+        max_bytes: 메모리 계층 최대 크기 (바이트, 0이면 메모리 계층 비활성화)
+        cache_dir: 디스크 계층 디렉토리 (None이면 디스크 계층 비활성화)
+        disk_max_bytes: 디스크 계층 최대 크기 (바이트)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        cache_dir: Optional[str] = None,
+        disk_max_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+
+        self._disk_bytes = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """캐시 항목을 반환합니다. 메모리 -> 디스크 순으로 찾고, 없으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry
+
+        entry = self._load_from_disk(key)
+        with self._lock:
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._store(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResult) -> None:
+        """캐시 항목을 저장합니다. (메모리 + 디스크)"""
+        with self._lock:
+            self._store(key, entry)
+        self._save_to_disk(key, entry)
+
+    def clear(self) -> None:
+        """메모리 계층을 비웁니다. (디스크 항목은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """hit/miss/eviction 횟수와 현재 사용량을 반환합니다."""
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    # --- 메모리 계층 ---
+
+    def _store(self, key: str, entry: CachedResult) -> None:
+        """메모리 계층에 저장하고 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다. (lock 보유 상태에서 호출)"""
+        if entry.size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._counters["evictions"] += 1
+
+    # --- 디스크 계층 ---
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.meta.json"
+
+    def _load_from_disk(self, key: str) -> Optional[CachedResult]:
+        if self.cache_dir is None:
+            return None
+        document_path, meta_path = self._paths(key)
+        try:
+            document = document_path.read_bytes()
+            meta = codec.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        # 최근 사용 시각 갱신 (디스크 LRU 기준)
+        for path in (document_path, meta_path):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return CachedResult(
+            document=document,
+            summary=meta.get("summary", {}),
+            filename=meta.get("filename", ""),
+            rows=meta.get("rows"),
+            dependencies=meta.get("dependencies"),
+        )
+
+    def _save_to_disk(self, key: str, entry: CachedResult) -> None:
+        if self.cache_dir is None:
+            return
+        fields: Dict[str, Any] = {"summary": entry.summary, "filename": entry.filename}
+        if entry.rows is not None:
+            fields["rows"] = entry.rows
+            fields["dependencies"] = entry.dependencies
+        meta = codec.dumps_bytes(fields)
+        written = 0
+        for path, data in zip(self._paths(key), (entry.document, meta)):
+            # 쓰는 도중 종료되어도 불완전한 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                if path.exists():
+                    written -= path.stat().st_size
+                os.replace(tmp_path, path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                return
+            written += len(data)
+        with self._lock:
+            self._disk_bytes += written
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """디스크 사용량이 상한 이하가 될 때까지 오래된 항목을 삭제합니다. (lock 보유 상태에서 호출)"""
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            if self._disk_bytes <= self.disk_max_bytes:
+                break
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            if not path.name.endswith(".meta.json"):
+                self._counters["disk_evictions"] += 1
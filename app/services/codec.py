@@ -0,0 +1,146 @@
+import json
+import math
+import os
+from typing import Any, Optional, TextIO, Union
+
+"""
+codec.py
+해당 파일은 파싱/내보내기 서비스가 공통으로 사용하는 JSON 인코딩/디코딩 계층을 제공합니다.
+주요기능:
+1. orjson 또는 msgspec이 설치되어 있으면 자동으로 사용하고, 없으면 표준 라이브러리 json으로 동작합니다.
+2. 출력은 json.dumps(..., ensure_ascii=False, indent=indent)와 바이트 단위로 동일하게 유지합니다.
+   - orjson은 indent=2(OPT_INDENT_2)와 compact 출력만 지원하므로 그 외 indent는 표준 json을 사용합니다.
+   - msgspec은 실수 지수 표기(1e100 vs 1e+100)가 표준 json과 달라 디코딩에만 사용합니다.
+   - orjson도 지수 표기 실수(1.5e-7 vs 1.5e-07)와 NaN/Infinity(null) 표기가 다르므로,
+     이런 실수가 들어 있는 객체는 표준 json으로 인코딩합니다. (그 외 실수 표기는 표준 json과 같음)
+   - 64비트 범위를 넘는 정수처럼 빠른 백엔드가 거부하는 값은 표준 json으로 재시도합니다.
+3. 디코딩 오류는 백엔드와 관계없이 json.JSONDecodeError로 보고합니다.
+
+[백엔드 강제 지정]
+환경변수 SBOM_JSON_BACKEND=orjson|msgspec|json 으로 선택할 수 있습니다. (벤치마크/디버깅용)
+
+[사용 예시]
+from app.services import codec
+
+data = codec.loads(raw_bytes)
+text = codec.dumps(data, indent=2)
+print(codec.DECODER_BACKEND, codec.ENCODER_BACKEND)
+"""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgspec = None
+
+_FORCED_BACKEND = os.environ.get("SBOM_JSON_BACKEND", "").strip().lower()
+
+
+def _select_decoder() -> str:
+    """사용할 디코딩 백엔드 이름을 결정합니다. (orjson > msgspec > json)"""
+    if _FORCED_BACKEND == "json":
+        return "json"
+    if orjson is not None and _FORCED_BACKEND in ("", "orjson"):
+        return "orjson"
+    if msgspec is not None and _FORCED_BACKEND in ("", "msgspec", "orjson"):
+        return "msgspec"
+    return "json"
+
+
+def _select_encoder() -> str:
+    """사용할 인코딩 백엔드 이름을 결정합니다. (orjson > json)"""
+    if orjson is not None and _FORCED_BACKEND in ("", "orjson"):
+        return "orjson"
+    return "json"
+
+
+DECODER_BACKEND = _select_decoder()
+ENCODER_BACKEND = _select_encoder()
+
+if DECODER_BACKEND == "msgspec":
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    JSON 바이트(또는 문자열)를 파이썬 객체로 디코딩합니다.
+
+    Raises:
+        json.JSONDecodeError: 유효하지 않은 JSON인 경우
+    """
+    if DECODER_BACKEND == "orjson":
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+        return orjson.loads(data)
+    if DECODER_BACKEND == "msgspec":
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+    return json.loads(data)
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """orjson 출력이 표준 json과 같은 객체인지 확인합니다. (지수 표기/NaN/Infinity 실수가 없으면 True)"""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list or kind is tuple:
+            stack.extend(value)
+        elif kind is float and (not math.isfinite(value) or "e" in repr(value)):
+            return False
+    return True
+
+
+def dumps_bytes(obj: Any, indent: Optional[int] = None) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 인코딩합니다.
+    json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")와 동일한 결과를 반환합니다.
+    """
+    if ENCODER_BACKEND == "orjson" and indent == 2 and _orjson_compatible(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    객체를 JSON 문자열로 인코딩합니다.
+    json.dumps(obj, indent=indent, ensure_ascii=False)와 동일한 결과를 반환합니다.
+    """
+    if ENCODER_BACKEND == "orjson" and indent == 2 and _orjson_compatible(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """
+    공백 없는 compact JSON 바이트로 인코딩합니다. (HTTP 응답 본문용)
+    FastAPI/Starlette JSONResponse의 기본 렌더링 결과와 동일합니다.
+    """
+    if ENCODER_BACKEND == "orjson" and _orjson_compatible(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def dump(obj: Any, fp: TextIO, indent: Optional[int] = None) -> None:
+    """객체를 JSON으로 인코딩하여 텍스트 파일 객체에 기록합니다."""
+    if ENCODER_BACKEND == "orjson" and indent == 2:
+        # dumps()에서 표준 json과 다르게 표기되는 실수가 있으면 표준 json으로 인코딩
+        fp.write(dumps(obj, indent=indent))
+        return
+    json.dump(obj, fp, indent=indent, ensure_ascii=False)
@@ -0,0 +1,182 @@
+import gzip
+import io
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, TextIO, Union
+
+"""
+compression.py
+해당 파일은 SBOM 업로드/다운로드/저장 시 사용하는 gzip, zstd 압축 계층을 제공합니다.
+주요기능:
+1. 압축된 입력을 스트리밍으로 해제하는 파일 객체를 반환합니다. (전체를 메모리에 풀지 않음)
+   - 압축 형식 판별 순서: Content-Encoding 헤더 -> 파일 확장자(.gz, .zst) -> 매직 바이트
+2. Accept-Encoding 헤더로 응답 압축 형식을 협상합니다. (zstd > gzip)
+3. JSON 조각 스트림을 조각 단위로 압축합니다. (StreamingResponse용)
+4. 저장 경로 확장자(.gz, .zst)에 맞는 텍스트 쓰기 파일 객체를 반환합니다. (save_to_file용)
+
+zstd는 선택 의존성(zstandard)이 설치된 경우에만 사용할 수 있습니다. (uv pip install ".[zstd]")
+
+[사용 예시]
+fp = open_decompressed(upload.file, encoding_hint(upload.filename, upload.headers.get("content-encoding")))
+sbom = SyftSbom.from_stream(fp)
+
+encoding = negotiate(request.headers.get("accept-encoding", ""))
+body = iter_compressed(exporter.iter_json(compact=True), encoding)
+"""
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+GZIP = "gzip"
+ZSTD = "zstd"
+IDENTITY = "identity"
+
+_MAGIC = {
+    b"\x1f\x8b": GZIP,
+    b"\x28\xb5\x2f\xfd": ZSTD,
+}
+_SUFFIXES = {
+    ".gz": GZIP,
+    ".gzip": GZIP,
+    ".zst": ZSTD,
+    ".zstd": ZSTD,
+}
+_HEADER_ALIASES = {
+    "gzip": GZIP,
+    "x-gzip": GZIP,
+    "zstd": ZSTD,
+    "identity": IDENTITY,
+}
+
+# 응답 압축 수준 (속도 우선)
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+class CompressionError(ValueError):
+    """지원하지 않는 압축 형식이거나 해당 형식의 라이브러리가 없는 경우 발생합니다."""
+
+
+def available_encodings() -> tuple:
+    """현재 환경에서 사용할 수 있는 압축 형식 목록 (선호 순서)"""
+    return (ZSTD, GZIP) if zstandard is not None else (GZIP,)
+
+
+def encoding_hint(filename: Optional[str] = None, content_encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Content-Encoding 헤더나 파일 확장자로 압축 형식을 추정합니다.
+    알 수 없으면 None을 반환합니다. (이후 매직 바이트로 판별)
+    """
+    if content_encoding:
+        value = content_encoding.split(",")[-1].strip().lower()
+        if value not in _HEADER_ALIASES:
+            raise CompressionError(f"지원하지 않는 Content-Encoding입니다: {content_encoding}")
+        return _HEADER_ALIASES[value]
+    if filename:
+        return _SUFFIXES.get(Path(filename).suffix.lower())
+    return None
+
+
+def detect_encoding(head: bytes) -> Optional[str]:
+    """파일 앞부분의 매직 바이트로 압축 형식을 판별합니다."""
+    for magic, encoding in _MAGIC.items():
+        if head.startswith(magic):
+            return encoding
+    return None
+
+
+def open_decompressed(fp: BinaryIO, encoding: Optional[str] = None) -> BinaryIO:
+    """
+    압축 해제된 내용을 읽는 파일 객체를 반환합니다. (압축되지 않은 입력은 그대로 반환)
+    encoding이 None이면 매직 바이트로 판별합니다. (fp가 seek 가능한 경우)
+    """
+    if encoding is None and fp.seekable():
+        position = fp.tell()
+        encoding = detect_encoding(fp.read(4))
+        fp.seek(position)
+    if encoding in (None, IDENTITY):
+        return fp
+    if encoding == GZIP:
+        return gzip.GzipFile(fileobj=fp, mode="rb")
+    if encoding == ZSTD:
+        if zstandard is None:
+            raise CompressionError("zstd 입력을 처리하려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().stream_reader(fp, read_across_frames=True)
+    raise CompressionError(f"지원하지 않는 압축 형식입니다: {encoding}")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 응답 압축 형식을 고릅니다. (q 값 우선, 같으면 zstd > gzip)
+    압축하지 않아야 하면 None을 반환합니다.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in available_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compressor(encoding: str):
+    if encoding == GZIP:
+        # wbits=31: gzip 헤더/트레일러 포함
+        return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    if encoding == ZSTD:
+        if zstandard is None:
+            raise CompressionError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    raise CompressionError(f"지원하지 않는 압축 형식입니다: {encoding}")
+
+
+def iter_compressed(chunks: Iterable[Union[str, bytes]], encoding: Optional[str]) -> Iterator[bytes]:
+    """조각 스트림을 조각 단위로 압축하여 생성합니다. (encoding이 None이면 UTF-8 바이트로만 변환)"""
+    if encoding is None:
+        for chunk in chunks:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        return
+    compressor = _compressor(encoding)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def compress(data: bytes, encoding: Optional[str]) -> bytes:
+    """바이트 전체를 압축합니다."""
+    return b"".join(iter_compressed((data,), encoding))
+
+
+def open_text_writer(path: Union[str, Path]) -> TextIO:
+    """
+    경로 확장자에 맞게 압축하며 쓰는 텍스트 파일 객체를 반환합니다.
+    (.gz -> gzip, .zst -> zstd, 그 외 -> 일반 파일)
+    """
+    encoding = _SUFFIXES.get(Path(path).suffix.lower())
+    if encoding == GZIP:
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    if encoding == ZSTD:
+        if zstandard is None:
+            raise CompressionError("zstd로 저장하려면 zstandard 패키지가 필요합니다.")
+        raw = open(path, "wb")
+        writer = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
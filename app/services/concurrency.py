@@ -0,0 +1,105 @@
+import asyncio
+import io
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, BinaryIO, List, Optional, Tuple, Type
+
+from fastapi import UploadFile
+
+from app.config import settings
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.detect import model_for, sniff
+
+"""
+concurrency.py
+해당 파일은 업로드된 SBOM 파싱을 이벤트 루프 밖의 작업자 풀에서 실행하는 기능을 제공합니다.
+주요기능:
+1. 설정(SBOM_PARSE_EXECUTOR)에 따라 스레드 풀 또는 프로세스 풀을 한 번만 생성하여 재사용합니다.
+2. 여러 업로드 파일의 디코딩 + 모델 변환(from_stream)을 동시에 실행합니다.
+   - 이벤트 루프는 파싱 중에도 다른 요청을 처리할 수 있습니다.
+   - 전체 소요 시간은 두 파일 파싱 시간의 합이 아니라 더 오래 걸리는 쪽에 가깝습니다.
+3. 작업자에서 발생한 예외(json.JSONDecodeError 등)는 await 지점에서 그대로 다시 발생합니다.
+4. gzip/zstd로 압축된 업로드는 작업자에서 스트리밍으로 압축을 풀며 파싱합니다.
+5. detect=True이면 업로드 앞부분만 읽어 형식을 판별합니다. (detect.py, 업로드 필드와 형식이 달라도 됨)
+
+[사용 예시]
+hatbom_sbom, syft_sbom = await parse_uploads(
+    (HatbomSbom, hatbom_file),
+    (SyftSbom, syft_file),
+)
+"""
+
+_executor: Optional[Executor] = None
+
+
+def get_executor() -> Executor:
+    """설정에 맞는 작업자 풀을 반환합니다. (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        if settings.parse_executor == "process":
+            _executor = ProcessPoolExecutor(max_workers=settings.parse_workers)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=settings.parse_workers, thread_name_prefix="sbom-parse")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """작업자 풀을 종료합니다. (애플리케이션 종료 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def _parse_payload(model_cls: Type[Any], payload: Any, encoding: Optional[str] = None, detect: bool = False) -> Any:
+    """
+    작업자에서 실행되는 파싱 함수입니다.
+    payload는 파일 객체(스레드 풀) 또는 업로드 바이트(프로세스 풀)입니다.
+    encoding은 압축 형식 힌트이며, None이면 매직 바이트로 판별합니다.
+    detect가 True이면 스트림 앞부분으로 형식(Syft/Hatbom)을 판별하여 모델을 고르고,
+    판별이 애매한 일반 CycloneDX이면 model_cls를 사용합니다.
+    """
+    fp: BinaryIO = io.BytesIO(payload) if isinstance(payload, bytes) else payload
+    fp = open_decompressed(fp, encoding)
+    if detect:
+        fmt, fp = sniff(fp)
+        model_cls = model_for(fmt, default=model_cls)
+    return model_cls.from_stream(fp)
+
+
+def upload_encoding(upload: UploadFile) -> Optional[str]:
+    """업로드 파트의 Content-Encoding 헤더 또는 파일 확장자로 압축 형식을 추정합니다."""
+    content_encoding = upload.headers.get("content-encoding") if upload.headers else None
+    return encoding_hint(upload.filename, content_encoding)
+
+
+async def parse_payloads(*jobs: Tuple[Type[Any], bytes, Optional[str]], detect: bool = False) -> List[Any]:
+    """
+    (모델 클래스, 입력 바이트, 압축 형식) 묶음들을 작업자 풀에서 동시에 파싱하고, 입력 순서대로 결과를 반환합니다.
+    (업로드 파일 객체가 아니라 보관해 둔 입력을 파싱하는 백그라운드 작업용)
+    """
+    executor = get_executor()
+    loop = asyncio.get_running_loop()
+    futures = [
+        loop.run_in_executor(executor, _parse_payload, model_cls, payload, encoding, detect)
+        for model_cls, payload, encoding in jobs
+    ]
+    return list(await asyncio.gather(*futures))
+
+
+async def parse_uploads(*jobs: Tuple[Type[Any], UploadFile], detect: bool = False) -> List[Any]:
+    """
+    (모델 클래스, 업로드 파일) 쌍들을 작업자 풀에서 동시에 파싱하고, 입력 순서대로 결과를 반환합니다.
+    detect가 True이면 모델 클래스는 기본값이며, 업로드 앞부분으로 판별한 형식을 우선합니다.
+    """
+    executor = get_executor()
+    loop = asyncio.get_running_loop()
+    futures = []
+    for model_cls, upload in jobs:
+        encoding = upload_encoding(upload)
+        if isinstance(executor, ProcessPoolExecutor):
+            # 파일 객체는 다른 프로세스로 전달할 수 없으므로 내용을 바이트로 읽어 넘김
+            payload = await upload.read()
+        else:
+            payload = upload.file
+        futures.append(loop.run_in_executor(executor, _parse_payload, model_cls, payload, encoding, detect))
+    return list(await asyncio.gather(*futures))
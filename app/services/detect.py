@@ -0,0 +1,191 @@
+import io
+import json
+import re
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Type, Union
+
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.stream import ITEM, iter_json_events
+
+"""
+detect.py
+해당 파일은 문서 전체를 디코딩하지 않고 SBOM 형식을 판별하는 기능을 제공합니다.
+
+주요기능:
+1. 파일/업로드 스트림의 앞부분(기본 4KB, 헤더가 잘리면 최대 64KB)만 읽어 최상위 필드($schema, bomFormat, metadata)를 구합니다.
+    - 첫 번째 components/dependencies 원소가 나오기 전까지만 해석하며, 앞부분이 잘려 끝난 경우에도 그때까지의 필드로 판별합니다.
+2. Syft, Hatbom, 일반 CycloneDX, SPDX 중 하나로 분류하고 알맞은 모델(파서)을 고릅니다.
+    - Syft: CycloneDX $schema + metadata.tools에 syft
+    - Hatbom: metadata는 있지만 metadata.tools가 없는 CycloneDX (Hatbom은 authors/component만 기록)
+    - 일반 CycloneDX: 그 외 CycloneDX (통합 결과, 앞부분에 metadata가 없는 문서 등, 기대한 모델 또는 Hatbom 모델로 파싱)
+    - SPDX: spdxVersion/SPDXID 필드 또는 tag-value 형식 (아직 파서가 없어 UnsupportedFormatError)
+3. 읽은 앞부분은 다시 돌려주는 스트림(SniffedStream)으로 감싸므로 본문 파싱은 처음부터 그대로 진행합니다.
+
+[사용 예시]
+with open("unknown.json", "rb") as f:
+    fmt, fp = sniff(f)
+    sbom = model_for(fmt).from_stream(fp)
+"""
+
+SYFT = "Syft"
+HATBOM = "Hatbom"
+CYCLONEDX = "CycloneDX"
+SPDX = "SPDX"
+UNKNOWN = "Unknown"
+
+# 처음 읽을 앞부분 크기, 헤더가 잘리면 두 배씩 늘려 최대 크기까지 읽음
+SNIFF_SIZE = 4 * 1024
+MAX_SNIFF_SIZE = 64 * 1024
+
+_SPDX_KEY = re.compile(r'"(?:spdxVersion|SPDXID)"\s*:')
+_SYFT_TOOL = re.compile(r'"name"\s*:\s*"syft"')
+
+
+class UnsupportedFormatError(ValueError):
+    """파서가 없는 SBOM 형식 (SPDX 등)"""
+
+
+class SniffedStream:
+    """앞에서 읽은 바이트를 먼저 돌려준 뒤 원래 스트림을 이어서 읽는 파일 객체입니다."""
+
+    def __init__(self, head: bytes, fp: BinaryIO):
+        self._head = head
+        self._fp = fp
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._fp.read(size)
+        if size is None or size < 0:
+            data, self._head = self._head + self._fp.read(), b""
+            return data
+        data, self._head = self._head[:size], self._head[size:]
+        return data
+
+    def close(self) -> None:
+        self._fp.close()
+
+
+def _tools_include_syft(metadata: Any) -> bool:
+    if not isinstance(metadata, dict):
+        return False
+    tools = metadata.get("tools", {})
+    # CycloneDX 1.5+ (Syft 1.40+) 구조
+    if isinstance(tools, dict) and "components" in tools:
+        return any(isinstance(tool, dict) and tool.get("name") == "syft" for tool in tools["components"])
+    return False
+
+
+def classify_header(header: Dict[str, Any]) -> str:
+    """최상위 필드(dict, 문서 전체 또는 헤더)로 형식을 분류합니다."""
+    if "spdxVersion" in header or "SPDXID" in header:
+        return SPDX
+    schema = header.get("$schema")
+    is_cyclonedx = header.get("bomFormat") == "CycloneDX" or (isinstance(schema, str) and "cyclonedx" in schema.lower())
+    if not is_cyclonedx:
+        return UNKNOWN
+    if "metadata" not in header:
+        # metadata가 없거나 (키가 정렬된 문서처럼) 헤더가 components보다 뒤에 있으면 도구를 알 수 없음
+        return CYCLONEDX
+    metadata = header["metadata"]
+    if isinstance(schema, str) and "cyclonedx" in schema.lower() and _tools_include_syft(metadata):
+        return SYFT
+    if not isinstance(metadata, dict) or not metadata.get("tools"):
+        return HATBOM
+    return CYCLONEDX
+
+
+def _read_header(head: bytes) -> Tuple[Dict[str, Any], bool]:
+    """앞부분에서 최상위 필드를 읽어 (필드, 헤더를 끝까지 읽었는지)를 반환합니다."""
+    header: Dict[str, Any] = {}
+    try:
+        for kind, key, value in iter_json_events(io.BytesIO(head)):
+            if kind == ITEM:
+                return header, True
+            header[key] = value
+    except json.JSONDecodeError:
+        # 앞부분이 값 중간에서 잘림
+        return header, False
+    return header, True
+
+
+def detect_format(head: bytes, complete: bool = False) -> str:
+    """
+    문서 앞부분으로 형식을 판별합니다.
+
+    Args:
+        head: 문서 앞부분 (압축 해제된 바이트)
+        complete: head가 문서 전체인지 여부 (잘린 헤더의 추정 판별을 하지 않음)
+    """
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if not text.startswith(b"{"):
+        return SPDX if text.startswith(b"SPDXVersion:") else UNKNOWN
+
+    header, finished = _read_header(head)
+    fmt = classify_header(header)
+    if finished or complete or "metadata" in header:
+        return fmt
+    # 헤더가 잘린 경우: 남은 앞부분에서 키를 찾아 추정
+    decoded = head.decode("utf-8", errors="ignore")
+    if fmt == UNKNOWN and _SPDX_KEY.search(decoded):
+        return SPDX
+    if fmt in (HATBOM, CYCLONEDX) and "$schema" in header and _SYFT_TOOL.search(decoded):
+        return SYFT
+    return fmt
+
+
+def _read_exact(fp: BinaryIO, size: int) -> bytes:
+    """size 바이트를 읽습니다. (압축 해제 스트림은 한 번에 덜 돌려줄 수 있으므로 끝까지 반복, 문서 끝이면 더 짧음)"""
+    parts = []
+    remaining = size
+    while remaining > 0:
+        chunk = fp.read(remaining)
+        if not chunk:
+            break
+        parts.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(parts)
+
+
+def sniff(fp: BinaryIO, size: int = SNIFF_SIZE, limit: int = MAX_SNIFF_SIZE) -> Tuple[str, SniffedStream]:
+    """
+    스트림 앞부분만 읽어 (형식, 처음부터 다시 읽을 수 있는 스트림)을 반환합니다.
+    헤더(metadata)가 앞부분에서 끝나지 않으면 limit까지 두 배씩 더 읽습니다.
+    """
+    head = _read_exact(fp, size)
+    eof = len(head) < size
+    while not eof and size < limit:
+        header, finished = _read_header(head)
+        if finished or "metadata" in header:
+            break
+        more = _read_exact(fp, size)
+        head += more
+        eof = len(more) < size
+        size *= 2
+    return detect_format(head, complete=eof), SniffedStream(head, fp)
+
+
+def check_supported(fmt: str) -> None:
+    """파서가 없는 형식(SPDX)이면 UnsupportedFormatError를 발생시킵니다."""
+    if fmt == SPDX:
+        raise UnsupportedFormatError("SPDX 형식의 SBOM은 아직 지원하지 않습니다. CycloneDX JSON 파일을 사용해 주세요.")
+
+
+def model_for(fmt: str, default: Optional[Type[Any]] = None) -> Union[Type[HatbomSbom], Type[SyftSbom]]:
+    """
+    형식에 맞는 모델 클래스를 반환합니다.
+    일반 CycloneDX/알 수 없는 형식은 default(업로드 필드 등으로 기대한 모델)를, 없으면 Hatbom 모델을 사용합니다.
+    """
+    if fmt == SYFT:
+        return SyftSbom
+    if fmt == HATBOM:
+        return HatbomSbom
+    check_supported(fmt)
+    return default or HatbomSbom
+
+
+def sniff_path(path: str, encoding: Optional[str] = None) -> str:
+    """파일의 앞부분만 읽어 형식을 판별합니다. (압축 파일은 스트리밍으로 앞부분만 해제)"""
+    with open(path, "rb") as f:
+        fmt, _ = sniff(open_decompressed(f, encoding or encoding_hint(path)))
+    return fmt
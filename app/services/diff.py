@@ -0,0 +1,349 @@
+import argparse
+import sys
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.services import codec
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.export import STREAM_CHUNK_SIZE, buffer_chunks
+from app.services.purl import parse_purl
+from app.services.stream import ITEM, iter_json_events
+
+"""
+diff.py
+해당 파일은 같은 제품의 두 SBOM(주로 릴리스별 통합 SBOM)을 비교하는 기능을 제공합니다.
+
+주요기능:
+1. 두 CycloneDX JSON 스트림을 components/dependencies 원소 단위로 읽어 비교에 필요한 값만 보관합니다. (문서 전체를 dict로 올리지 않음)
+2. 컴포넌트를 정규 키(정규화 PURL, 없으면 name@version, 없으면 해시)로 해시 색인하여 맞춥니다.
+    - 정규 키가 같은 컴포넌트끼리 먼저 맞추고, 남은 컴포넌트는 버전을 뺀 식별자(PURL 좌표 또는 이름)로 맞춰 버전 변경을 찾습니다.
+    - 같은 키가 여러 번 나오면 문서 내 순서대로 짝을 짓습니다.
+3. 추가/삭제/버전 변경/라이선스 변경/해시 변경 컴포넌트와 의존성 간선 추가/삭제를 구합니다.
+    - 간선은 ref를 짝지어진 컴포넌트 기준으로 바꾸어 비교하므로, 두 문서의 bom-ref가 달라도 같은 간선으로 판단합니다.
+    - 모든 단계가 해시 조회만 하므로 전체 비용은 컴포넌트 수 + 간선 수에 비례합니다.
+4. 비교 결과를 변경 항목 단위 JSON 조각으로 내보냅니다. (iter_json, StreamingResponse/CLI 출력용)
+
+[사용 예시]
+with open("v1.json", "rb") as base, open("v2.json", "rb") as target:
+    diff = SBOMDiff.from_streams(base, target)
+print(diff.summary())
+for change in diff.iter_changes():
+    print(change["change"], change["name"])
+
+[CLI]
+python -m app.services.diff v1.json v2.json > diff.json
+"""
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+EDGE_ADDED = "edge_added"
+EDGE_REMOVED = "edge_removed"
+
+# 메타데이터 대상 컴포넌트(root)는 릴리스마다 버전이 바뀌어도 같은 노드로 취급
+_ROOT = "\0root"
+
+
+def _license_labels(licenses: Optional[List[Dict[str, Any]]]) -> Tuple[str, ...]:
+    """라이선스 목록을 비교용 정렬 튜플(id, name 또는 expression)로 바꿉니다."""
+    labels = set()
+    for item in licenses or ():
+        lic = item.get("license")
+        if lic:
+            label = lic.get("id") or lic.get("name")
+        else:
+            label = item.get("expression")
+        if label:
+            labels.add(label)
+    return tuple(sorted(labels))
+
+
+def _hash_pairs(hashes: Optional[List[Dict[str, Any]]]) -> Tuple[Tuple[str, str], ...]:
+    """해시 목록을 비교용 정렬 튜플((alg, content), ...)로 바꿉니다."""
+    return tuple(sorted({(h.get("alg", ""), h.get("content", "")) for h in hashes or () if h.get("content")}))
+
+
+def component_key(name: Optional[str], version: Optional[str], purl: Optional[str], hashes=()) -> str:
+    """비교용 정규 키 (정규화 PURL, 없으면 name@version, 없으면 첫 번째 해시)"""
+    return _keys(name, version, purl, hashes)[0]
+
+
+def _keys(name: Optional[str], version: Optional[str], purl: Optional[str], hashes=()) -> Tuple[str, Optional[str]]:
+    """
+    (정규 키, 버전을 뺀 식별자)를 반환합니다. PURL은 한 번만 파싱합니다.
+    식별자는 버전 변경 짝짓기에 사용하며, PURL 좌표(type/namespace/name) 또는 소문자 이름입니다.
+    """
+    parsed = parse_purl(purl) if purl else None
+    if parsed is not None:
+        return parsed.to_string(), f"pkg:{parsed.type}/{parsed.namespace or ''}/{parsed.name}"
+    identity = name.lower() if name else None
+    if purl:
+        return purl, identity  # 파싱할 수 없는 PURL은 원본 문자열을 키로 사용 (canonical_purl과 같은 규칙)
+    if name:
+        return f"{name}@{version}", identity
+    if hashes:
+        alg, content = hashes[0]
+        return f"hash:{alg}:{content}", identity
+    return "@", identity
+
+
+@dataclass(slots=True)
+class DiffComponent:
+    """비교에 필요한 컴포넌트 값"""
+    key: str
+    identity: Optional[str]
+    name: Optional[str]
+    version: Optional[str]
+    bom_ref: Optional[str]
+    licenses: Tuple[str, ...]
+    hashes: Tuple[Tuple[str, str], ...]
+
+    @classmethod
+    def from_dict(cls, component: Dict[str, Any]) -> "DiffComponent":
+        name = component.get("name")
+        version = component.get("version")
+        hashes = _hash_pairs(component.get("hashes"))
+        key, identity = _keys(name, version, component.get("purl"), hashes)
+        return cls(
+            key=key,
+            identity=identity,
+            name=name,
+            version=version,
+            bom_ref=component.get("bom-ref"),
+            licenses=_license_labels(component.get("licenses")),
+            hashes=hashes,
+        )
+
+    def to_dict(self, change: str) -> Dict[str, Any]:
+        return {"change": change, "key": self.key, "name": self.name, "version": self.version, "bom-ref": self.bom_ref}
+
+
+@dataclass(slots=True)
+class SBOMSide:
+    """한 문서에서 읽은 비교용 값 (컴포넌트, 의존성 간선, root ref)"""
+    components: List[DiffComponent]
+    edges: List[Tuple[str, str]]
+    root_ref: Optional[str] = None
+
+    @classmethod
+    def from_stream(cls, fp: BinaryIO) -> "SBOMSide":
+        """
+        CycloneDX JSON 스트림을 원소 단위로 읽습니다.
+        유효하지 않은 JSON이면 json.JSONDecodeError가 발생합니다.
+        """
+        side = cls([], [])
+        for kind, key, value in iter_json_events(fp):
+            if kind != ITEM:
+                if key == "metadata" and isinstance(value, dict):
+                    side.root_ref = (value.get("component") or {}).get("bom-ref")
+            elif key == "components":
+                side.components.append(DiffComponent.from_dict(value))
+            elif key == "dependencies":
+                ref = value.get("ref")
+                if ref is not None:
+                    side.edges.extend((ref, target) for target in value.get("dependsOn") or ())
+        return side
+
+
+class SBOMDiff:
+    """
+    두 SBOM(base -> target)의 비교 결과입니다.
+
+    Args:
+        base: 이전 문서
+        target: 새 문서
+    """
+
+    def __init__(self, base: SBOMSide, target: SBOMSide):
+        self.base = base
+        self.target = target
+        # 변경 항목 (직렬화는 iter_changes에서 항목마다 지연 수행)
+        self.added: List[DiffComponent] = []
+        self.removed: List[DiffComponent] = []
+        self.changed: List[Tuple[DiffComponent, DiffComponent]] = []
+        self.edges_added: List[Tuple[str, str]] = []
+        self.edges_removed: List[Tuple[str, str]] = []
+        self._compare()
+
+    @classmethod
+    def from_streams(cls, base_fp: BinaryIO, target_fp: BinaryIO) -> "SBOMDiff":
+        return cls(SBOMSide.from_stream(base_fp), SBOMSide.from_stream(target_fp))
+
+    def _compare(self) -> None:
+        base = self.base.components
+        target = self.target.components
+
+        # 1. 정규 키 + 등장 순번으로 맞춤
+        base_index: Dict[Tuple[str, int], int] = {}
+        occurrences = Counter()
+        for i, component in enumerate(base):
+            occurrences[component.key] += 1
+            base_index[(component.key, occurrences[component.key])] = i
+
+        partner: List[Optional[int]] = [None] * len(target)   # target 위치 -> base 위치
+        matched = bytearray(len(base))
+        occurrences.clear()
+        for j, component in enumerate(target):
+            occurrences[component.key] += 1
+            i = base_index.get((component.key, occurrences[component.key]))
+            if i is not None:
+                partner[j] = i
+                matched[i] = 1
+
+        # 2. 남은 컴포넌트를 버전을 뺀 식별자로 맞춤 (버전 변경)
+        leftovers: Dict[str, deque] = defaultdict(deque)
+        for i, component in enumerate(base):
+            if not matched[i] and component.identity is not None:
+                leftovers[component.identity].append(i)
+        for j, component in enumerate(target):
+            if partner[j] is None and component.identity is not None:
+                candidates = leftovers.get(component.identity)
+                if candidates:
+                    i = candidates.popleft()
+                    partner[j] = i
+                    matched[i] = 1
+
+        for j, component in enumerate(target):
+            i = partner[j]
+            if i is None:
+                self.added.append(component)
+            elif self.fields(base[i], component):
+                self.changed.append((base[i], component))
+        self.removed = [component for i, component in enumerate(base) if not matched[i]]
+
+        # 3. 의존성 간선 (ref -> 짝지어진 base 컴포넌트 위치 기준 노드)
+        base_nodes: Dict[str, Any] = {component.bom_ref: i for i, component in enumerate(base) if component.bom_ref}
+        target_nodes: Dict[str, Any] = {}
+        for j, component in enumerate(target):
+            if component.bom_ref:
+                i = partner[j]
+                target_nodes[component.bom_ref] = i if i is not None else ("+", j)
+        for side, nodes in ((self.base, base_nodes), (self.target, target_nodes)):
+            if side.root_ref:
+                nodes[side.root_ref] = _ROOT
+
+        def node(nodes: Dict[str, Any], ref: str) -> Any:
+            return nodes.get(ref, ref)
+
+        base_edges = {(node(base_nodes, a), node(base_nodes, b)): (a, b) for a, b in self.base.edges}
+        target_edges: Set[Any] = set()
+        for a, b in self.target.edges:
+            edge = (node(target_nodes, a), node(target_nodes, b))
+            if edge not in target_edges:
+                target_edges.add(edge)
+                if edge not in base_edges:
+                    self.edges_added.append((a, b))
+        self.edges_removed = [pair for edge, pair in base_edges.items() if edge not in target_edges]
+
+    @staticmethod
+    def fields(before: DiffComponent, after: DiffComponent) -> List[str]:
+        """짝지어진 두 컴포넌트에서 바뀐 항목 (version, license, hash)"""
+        fields = []
+        if before.version != after.version:
+            fields.append("version")
+        if before.licenses != after.licenses:
+            fields.append("license")
+        if before.hashes != after.hashes:
+            fields.append("hash")
+        return fields
+
+    def summary(self) -> Dict[str, int]:
+        """변경 종류별 개수"""
+        counts = Counter()
+        for before, after in self.changed:
+            counts.update(self.fields(before, after))
+        return {
+            "base_components": len(self.base.components),
+            "target_components": len(self.target.components),
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+            "version_changed": counts["version"],
+            "license_changed": counts["license"],
+            "hash_changed": counts["hash"],
+            "unchanged": len(self.target.components) - len(self.added) - len(self.changed),
+            "edges_added": len(self.edges_added),
+            "edges_removed": len(self.edges_removed)
+        }
+
+    def iter_changes(self) -> Iterator[Dict[str, Any]]:
+        """
+        변경 항목을 dict로 하나씩 생성합니다.
+        순서: 새 문서 순서의 추가/변경 컴포넌트, 이전 문서 순서의 삭제 컴포넌트, 추가 간선, 삭제 간선
+        """
+        changed = {id(after): before for before, after in self.changed}
+        added = {id(component) for component in self.added}
+        for component in self.target.components:
+            if id(component) in added:
+                yield component.to_dict(ADDED)
+            elif id(component) in changed:
+                yield self._changed_entry(changed[id(component)], component)
+        for component in self.removed:
+            yield component.to_dict(REMOVED)
+        for ref, target in self.edges_added:
+            yield {"change": EDGE_ADDED, "ref": ref, "dependsOn": target}
+        for ref, target in self.edges_removed:
+            yield {"change": EDGE_REMOVED, "ref": ref, "dependsOn": target}
+
+    def _changed_entry(self, before: DiffComponent, after: DiffComponent) -> Dict[str, Any]:
+        entry = after.to_dict(CHANGED)
+        entry["previous_key"] = before.key
+        entry["fields"] = fields = self.fields(before, after)
+        if "version" in fields:
+            entry["previous_version"] = before.version
+        if "license" in fields:
+            entry["licenses"] = {"before": list(before.licenses), "after": list(after.licenses)}
+        if "hash" in fields:
+            before_hashes = set(before.hashes)
+            after_hashes = set(after.hashes)
+            entry["hashes"] = {
+                "added": [{"alg": alg, "content": content} for alg, content in after.hashes if (alg, content) not in before_hashes],
+                "removed": [{"alg": alg, "content": content} for alg, content in before.hashes if (alg, content) not in after_hashes]
+            }
+        return entry
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"summary": self.summary(), "changes": list(self.iter_changes())}
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        {"summary": ..., "changes": [...]} 문서를 변경 항목 단위 compact JSON 조각으로 생성합니다.
+        (codec.dumps_compact(to_dict())와 같은 결과)
+        """
+        dump = lambda obj: codec.dumps_compact(obj).decode("utf-8")
+
+        def chunks() -> Iterator[str]:
+            yield '{"summary":' + dump(self.summary()) + ',"changes":['
+            separator = ""
+            for change in self.iter_changes():
+                yield separator + dump(change)
+                separator = ","
+            yield "]}"
+
+        return buffer_chunks(chunks(), STREAM_CHUNK_SIZE)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="두 SBOM의 차이를 JSON으로 출력합니다.")
+    parser.add_argument("base", help="이전 SBOM 파일 경로 (.json / .json.gz / .json.zst)")
+    parser.add_argument("target", help="새 SBOM 파일 경로")
+    parser.add_argument("--summary", action="store_true", help="변경 종류별 개수만 출력")
+    args = parser.parse_args(argv)
+
+    with open(args.base, "rb") as base, open(args.target, "rb") as target:
+        diff = SBOMDiff.from_streams(
+            open_decompressed(base, encoding_hint(args.base)),
+            open_decompressed(target, encoding_hint(args.target))
+        )
+    if args.summary:
+        sys.stdout.write(codec.dumps(diff.summary(), indent=2) + "\n")
+    else:
+        for chunk in diff.iter_json():
+            sys.stdout.write(chunk)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,12 @@
-import json
-from dataclasses import asdict
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
 from pathlib import Path
 
+from app.models.component_table import ComponentTable
 from app.models.unified_sbom import UnifiedSbom, UnifiedAuthor, UnifiedMetadataComponent
+from app.services import codec
+from app.services.compression import open_text_writer
+from app.services.integrate import IntegrationStats
+from app.services.packed import save_packed
 
 """
 export.py
@@ -12,11 +15,53 @@ export.py
 1. UnifiedSbom 객체를 JSON 형식으로 변환합니다.
 2. 변환된 데이터를 파일로 저장하거나 딕셔너리로 반환합니다.
 3. CycloneDX 표준 형식에 맞게 필드명을 변환합니다.
+4. 전체 dict를 만들지 않고 컴포넌트 단위로 JSON 조각을 생성합니다. (iter_json)
+    - 출력은 to_json() / codec.dumps_compact(to_dict())와 바이트 단위로 동일합니다.
+    - StreamingResponse와 파일 저장에 사용하여, 마지막 컴포넌트 변환 전에 첫 바이트를 내보내고 메모리 사용량을 일정하게 유지합니다.
+5. 통합기가 기록한 IntegrationStats가 있으면 요약과 화면 표 행을 properties 재탐색 없이 만듭니다.
+    - 요약은 카운터를 그대로 사용하고, 표 행은 UnifiedComponent 모델을 한 번 순회하여 만듭니다. (to_dict 불필요)
 """
 
+# iter_json이 한 번에 내보내는 조각의 최소 크기 (너무 잘게 쪼개진 write/전송 방지)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def license_label(licenses: List[Dict[str, Any]]) -> str:
+    """첫 번째 라이선스의 id 또는 name을 반환합니다. (없으면 "N/A")"""
+    if not licenses:
+        return "N/A"
+    lic = licenses[0].get("license", {})
+    return lic.get("id") or lic.get("name") or "N/A"
+
+
+def authors_label(names: List[str]) -> str:
+    """저자 표시 이름 목록을 "A, B 외 N명" 형식으로 줄입니다."""
+    if not names:
+        return ""
+    label = ", ".join(filter(None, names[:2]))
+    if len(names) > 2:
+        label += f" 외 {len(names) - 2}명"
+    return label
+
+
 class SBOMExporter:
-    def __init__(self, unified_sbom: UnifiedSbom):
+    def __init__(self, unified_sbom: UnifiedSbom, stats: Optional[IntegrationStats] = None):
+        """
+        Args:
+            unified_sbom: 내보낼 통합 SBOM
+            stats: 통합기가 병합 중 기록한 출처/카운터 (SBOMIntegrator.stats, 없으면 properties에서 계산)
+        """
         self.unified_sbom = unified_sbom
+        self.stats = stats
+        self._table: Optional[ComponentTable] = None
+
+    def get_table(self) -> ComponentTable:
+        """
+        컴포넌트의 컬럼형 테이블을 반환합니다. (최초 호출 시 한 번만 생성하여 재사용)
+        요약/필터/카운트는 이 테이블의 배열 단위 연산으로 계산합니다.
+        """
+        if self._table is None or len(self._table) != len(self.unified_sbom.components):
+            self._table = ComponentTable.from_components(self.unified_sbom.components)
+        return self._table
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -83,7 +128,10 @@ class SBOMExporter:
 
     def _convert_components(self) -> list:
         """컴포넌트 목록을 CycloneDX 형식으로 변환합니다."""
-        components = []
+        return list(self.iter_components())
+
+    def iter_components(self) -> Iterator[Dict[str, Any]]:
+        """컴포넌트를 하나씩 CycloneDX 형식 딕셔너리로 변환하여 생성합니다."""
         for comp in self.unified_sbom.components:
             comp_dict = {
                 "name": comp.name,
@@ -114,8 +162,7 @@ class SBOMExporter:
                     self._convert_author(author) for author in comp.authors
                 ]
 
-            components.append(comp_dict)
-        return components
+            yield comp_dict
 
     def to_json(self, indent: int = 2) -> str:
         """
@@ -127,7 +174,67 @@ class SBOMExporter:
         Returns:
             JSON 형식의 문자열
         """
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return codec.dumps(self.to_dict(), indent=indent)
+
+    def iter_json(self, indent: Optional[int] = 2, compact: bool = False) -> Iterator[str]:
+        """
+        UnifiedSbom을 JSON 문자열 조각으로 나누어 생성합니다.
+        components/dependencies는 원소 단위로 변환/인코딩하므로 전체 dict나 전체 문자열을 만들지 않습니다.
+
+        Args:
+            indent: JSON 들여쓰기 수준 (to_json(indent)와 같은 결과)
+            compact: True이면 공백 없는 compact JSON (codec.dumps_compact(to_dict())와 같은 결과, indent 무시)
+        """
+        if compact:
+            dump = lambda obj: codec.dumps_compact(obj).decode("utf-8")
+            chunks = self._iter_encoded(dump, None, ",", ":")
+        elif indent is None:
+            chunks = self._iter_encoded(codec.dumps, None, ", ", ": ")
+        else:
+            chunks = self._iter_encoded(lambda obj: codec.dumps(obj, indent=indent), indent, ",", ": ")
+        return buffer_chunks(chunks, STREAM_CHUNK_SIZE)
+
+    def _iter_encoded(
+        self,
+        dump: Callable[[Any], str],
+        indent: Optional[int],
+        item_separator: str,
+        key_separator: str,
+    ) -> Iterator[str]:
+        """
+        최상위 필드는 to_dict()와 같은 순서로, 배열 필드는 원소별 dump 결과를 이어 붙여 json.dumps와 같은 모양을 만듭니다.
+        (JSON 문자열 안의 줄바꿈은 \\n으로 이스케이프되므로, dump 결과의 실제 줄바꿈은 모두 구조상의 줄바꿈입니다.)
+        """
+        fields = [
+            ("bomFormat", self.unified_sbom.bom_format),
+            ("specVersion", self.unified_sbom.spec_version),
+            ("serialNumber", self.unified_sbom.serial_number),
+            ("version", self.unified_sbom.version),
+            ("metadata", self._convert_metadata()),
+            ("components", self.iter_components()),
+            ("dependencies", iter(self.unified_sbom.dependencies)),
+        ]
+
+        def newline(level: int) -> str:
+            return "" if indent is None else "\n" + " " * (indent * level)
+
+        def nested(text: str, level: int) -> str:
+            # 원소를 단독으로 dump한 결과를 level 깊이에 맞게 다시 들여쓰기
+            return text if indent is None else text.replace("\n", newline(level))
+
+        yield "{"
+        for i, (key, value) in enumerate(fields):
+            head = (item_separator if i else "") + newline(1) + dump(key) + key_separator
+            if not isinstance(value, Iterator):
+                yield head + nested(dump(value), 1)
+                continue
+            # 배열 필드: 원소 단위로 내보냄
+            first = True
+            for item in value:
+                yield (head + "[" if first else item_separator) + newline(2) + nested(dump(item), 2)
+                first = False
+            yield head + "[]" if first else newline(1) + "]"
+        yield newline(0) + "}"
 
     def get_filename(self) -> str:
         """
@@ -150,7 +257,7 @@ class SBOMExporter:
         UnifiedSbom 객체를 JSON 파일로 저장합니다.
         
         Args:
-            output_path: 저장할 파일 경로
+            output_path: 저장할 파일 경로 (.gz / .zst 확장자이면 압축하여 저장)
             indent: JSON 들여쓰기 수준 (기본값: 2)
             
         Returns:
@@ -159,33 +266,44 @@ class SBOMExporter:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=indent, ensure_ascii=False)
+        # 컴포넌트 단위로 인코딩하며 바로 기록 (전체 dict/문자열을 만들지 않음)
+        with open_text_writer(path) as f:
+            for chunk in self.iter_json(indent=indent):
+                f.write(chunk)
         
         print(f"[INFO] 통합 SBOM이 저장되었습니다: {path.absolute()}")
         return str(path.absolute())
 
+    def save_packed(self, output_path: str) -> str:
+        """
+        UnifiedSbom 객체를 packed 바이너리 형식으로 저장합니다. (PackedSbom.open으로 mmap 재로딩)
+        
+        Args:
+            output_path: 저장할 파일 경로 (예: archive/transformers.usbm)
+            
+        Returns:
+            저장된 파일의 절대 경로
+        """
+        return save_packed(self.unified_sbom, output_path)
+
     def get_summary(self) -> Dict[str, Any]:
         """
         통합 SBOM의 요약 정보를 반환합니다.
         """
         metadata = self.unified_sbom.metadata
         
-        # 소스별 컴포넌트 수 계산
-        syft_count = 0
-        hatbom_count = 0
-        integrated_count = 0
-        
-        for comp in self.unified_sbom.components:
-            sources = [p.get("value") for p in comp.properties if p.get("name") == "source_tool"]
-            integrated = [p.get("value") for p in comp.properties if p.get("name") == "integrated_with"]
-            
-            if "Syft" in sources:
-                syft_count += 1
-            if "Hatbom" in sources:
-                hatbom_count += 1
-            if integrated:
-                integrated_count += 1
+        stats = self._current_stats()
+        if stats is not None:
+            # 통합 중 기록한 카운터 사용 (컴포넌트 순회 없음)
+            source_counts = stats.source_counts
+            integrated_count = stats.integrated_count
+        else:
+            # 소스별 컴포넌트 수 계산 (컬럼형 테이블의 사전 인코딩 열을 한 번에 집계)
+            table = self.get_table()
+            source_counts = table.source_counts()
+            integrated_count = table.integrated.count(1)
+        syft_count = source_counts.get("Syft", 0)
+        hatbom_count = source_counts.get("Hatbom", 0)
 
         return {
             "bom_format": self.unified_sbom.bom_format,
@@ -199,3 +317,51 @@ class SBOMExporter:
             "integrated_components": integrated_count,
             "metadata_component": metadata.component.name if metadata and metadata.component else None
         }
+
+
+    def component_rows(self) -> List[Dict[str, Any]]:
+        """
+        결과 화면 표 행(이름/버전/타입/라이선스/출처/통합 여부/저자)을 컴포넌트 모델에서 한 번에 만듭니다.
+        IntegrationStats가 있으면 출처/통합 여부를 그대로 사용하고, 없으면 컬럼형 테이블에서 가져옵니다.
+        """
+        stats = self._current_stats()
+        if stats is not None:
+            sources = stats.sources
+            integrated = stats.integrated
+        else:
+            table = self.get_table()
+            sources = [tools[-1] if tools else "Unknown" for tools in table.source]
+            integrated = table.integrated
+        return [
+            {
+                "name": comp.name,
+                "version": comp.version,
+                "type": comp.type,
+                "license": license_label(comp.licenses),
+                "source": source,
+                "integrated": bool(flag),
+                "authors": authors_label([a.name or a.email or "" for a in comp.authors])
+            }
+            for comp, source, flag in zip(self.unified_sbom.components, sources, integrated)
+        ]
+
+    def _current_stats(self) -> Optional[IntegrationStats]:
+        """통합 이후 컴포넌트 목록이 바뀌지 않았을 때만 IntegrationStats를 반환합니다."""
+        if self.stats is not None and len(self.stats) == len(self.unified_sbom.components):
+            return self.stats
+        return None
+
+
+def buffer_chunks(chunks: Iterable[str], size: int) -> Iterator[str]:
+    """작은 조각들을 모아 size 이상이 되면 한 번에 내보냅니다."""
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,430 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Container, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+"""
+graph.py
+해당 파일은 SBOM dependencies 배열을 ref 기준 인접 집합(adjacency set)으로 다루는 의존성 그래프를 제공합니다.
+주요기능:
+1. ref -> dependsOn 집합 인덱스를 유지합니다. (순서가 있는 집합으로 dict를 사용하여 출력 순서가 결정적)
+2. 같은 ref의 dependsOn이 여러 문서/항목에 나뉘어 있으면 합집합으로 병합합니다. (먼저 나온 항목이 앞)
+3. ref 재매핑 표(원래 bom-ref -> 통합 컴포넌트 bom-ref)를 적용하여 간선을 다시 씁니다.
+    - 통합 과정에서 다른 컴포넌트로 병합된 bom-ref를 가리키던 간선이 통합 컴포넌트를 가리키게 됩니다.
+    - 병합으로 같은 노드가 된 두 ref 사이의 간선(자기 자신 간선)은 추가하지 않습니다.
+4. 컴포넌트 목록에 없는 ref(dangling ref)를 찾습니다.
+모든 연산은 간선 수에 비례하는 선형 시간입니다.
+5. 영향도 분석용 GraphIndex (통합/단일 SBOM의 dependencies 배열 대상)
+    - ref를 0부터 시작하는 정수 id로 바꾸고 정수 인접 리스트(정방향/역방향)를 만듭니다.
+    - 강연결요소(SCC, 반복형 Tarjan)와 위상 순서를 처음 필요할 때 한 번 계산하여 보관합니다.
+    - 도달 가능 집합은 SCC 단위 비트셋(Python int)으로 계산합니다.
+      SCC 수가 reachability_limit 이하이면 응축 그래프를 한 번 순회하여 모든 SCC의 비트셋을 미리 계산하고,
+      더 크면 질의마다 응축 그래프를 BFS한 뒤 결과만 LRU로 메모이즈합니다.
+    - 하위 의존성(descendants), 상위 의존 컴포넌트(ancestors), 최단 경로, 순환(cycles)을 제공합니다.
+
+[사용 예시]
+graph = DependencyGraph()
+graph.merge(hatbom_dependencies, remap={"old-ref": "merged-ref"})
+graph.merge(syft_dependencies)
+dangling = graph.dangling_refs(known_refs)
+unified_sbom.dependencies = graph.to_dependencies()
+
+index = GraphIndex(unified_sbom.dependencies)
+index.ancestors("pkg:pypi/idna@3.11")      # idna를 직접/간접적으로 사용하는 ref 목록
+index.shortest_path("root", "pkg:pypi/idna@3.11")
+"""
+
+# 모든 SCC의 도달 가능 비트셋을 미리 계산할 최대 SCC 수 (비트셋 메모리는 최악의 경우 SCC 수의 제곱에 비례)
+REACHABILITY_LIMIT = 20_000
+# 미리 계산하지 않을 때 메모이즈할 질의 결과 수
+REACHABILITY_MEMO_SIZE = 1024
+
+
+class DependencyGraph:
+    """ref -> dependsOn 인접 집합으로 표현한 의존성 그래프입니다."""
+
+    def __init__(self):
+        # dependencies 배열에 ref로 등장한 노드 -> dependsOn 집합 (dict를 순서 있는 집합으로 사용)
+        self._adjacency: Dict[str, Dict[str, None]] = {}
+        self._edge_count = 0
+
+    @classmethod
+    def from_dependencies(cls, dependencies: Iterable[Dict[str, Any]]) -> "DependencyGraph":
+        """CycloneDX dependencies 배열(dict 목록)로 그래프를 만듭니다."""
+        graph = cls()
+        graph.merge((dep.get("ref", ""), dep.get("dependsOn") or []) for dep in dependencies)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._adjacency)
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self._adjacency
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    def refs(self) -> Iterator[str]:
+        """ref로 등장한 노드를 처음 등장한 순서대로 반환합니다."""
+        return iter(self._adjacency)
+
+    def depends_on(self, ref: str) -> List[str]:
+        """ref의 직접 의존 대상 목록을 반환합니다. (없는 ref이면 빈 목록)"""
+        return list(self._adjacency.get(ref, ()))
+
+    def add_node(self, ref: str) -> None:
+        """간선 없이 노드만 추가합니다. (이미 있으면 무시)"""
+        self._adjacency.setdefault(ref, {})
+
+    def add_edges(self, ref: str, depends_on: Iterable[str]) -> None:
+        """ref의 dependsOn 집합에 대상을 합집합으로 추가합니다."""
+        targets = self._adjacency.setdefault(ref, {})
+        before = len(targets)
+        for target in depends_on:
+            if target:
+                targets[target] = None
+        self._edge_count += len(targets) - before
+
+    def merge(
+        self,
+        dependencies: Iterable[tuple],
+        remap: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        (ref, dependsOn) 쌍을 그래프에 병합합니다.
+
+        Args:
+            dependencies: (ref, dependsOn 목록) 쌍
+            remap: 원래 ref -> 새 ref 표 (ref와 dependsOn 모두에 적용, 표에 없는 ref는 그대로 사용)
+        """
+        if not remap:
+            for ref, depends_on in dependencies:
+                if ref:
+                    self.add_edges(ref, depends_on)
+            return
+        for ref, depends_on in dependencies:
+            if not ref:
+                continue
+            source = remap.get(ref, ref)
+            self.add_edges(source, (
+                remap.get(target, target)
+                for target in depends_on
+                # 원래 다른 ref였지만 병합으로 같은 노드가 된 간선은 제외
+                if remap.get(target, target) != source or target == ref
+            ))
+
+    def dangling_refs(self, known: Container[str]) -> List[str]:
+        """known(컴포넌트/메타데이터 bom-ref)에 없는 ref를 처음 등장한 순서대로 반환합니다."""
+        dangling: Dict[str, None] = {}
+        for ref, targets in self._adjacency.items():
+            if ref not in known:
+                dangling[ref] = None
+            for target in targets:
+                if target not in known:
+                    dangling[target] = None
+        return list(dangling)
+
+    def to_dependencies(self) -> List[Dict[str, Any]]:
+        """CycloneDX dependencies 배열(dict 목록)로 변환합니다."""
+        return [
+            {"ref": ref, "dependsOn": list(targets)}
+            for ref, targets in self._adjacency.items()
+        ]
+
+
+def resolve_remap(remap: Dict[str, str]) -> Dict[str, str]:
+    """
+    연쇄된 재매핑(a -> b, b -> c)을 최종 ref(a -> c, b -> c)로 펼칩니다.
+    순환이 있으면 순환을 한 바퀴 돌기 직전의 ref에서 멈춥니다.
+    """
+    resolved: Dict[str, str] = {}
+    for ref, target in remap.items():
+        seen = {ref}
+        while target in remap and target not in seen:
+            seen.add(target)
+            following = remap[target]
+            if following in seen:
+                break
+            target = following
+        if target != ref:
+            resolved[ref] = target
+    return resolved
+
+
+def _bit_positions(bits: int) -> List[int]:
+    """비트셋(int)에서 1인 비트의 위치를 오름차순으로 반환합니다."""
+    text = bin(bits)[:1:-1]  # "0b" 제거 후 뒤집어 i번째 문자가 i번째 비트
+    positions = []
+    i = text.find("1")
+    while i != -1:
+        positions.append(i)
+        i = text.find("1", i + 1)
+    return positions
+
+
+class GraphIndex:
+    """
+    정수 노드 id 기반 의존성 그래프 분석 인덱스입니다. (생성 후 변경하지 않음)
+
+    Args:
+        dependencies: CycloneDX dependencies 배열 ({"ref": ..., "dependsOn": [...]})
+        reachability_limit: 도달 가능 비트셋을 모두 미리 계산할 최대 SCC 수
+        memo_size: 미리 계산하지 않을 때 메모이즈할 질의 결과 수
+    """
+
+    def __init__(
+        self,
+        dependencies: Iterable[Dict[str, Any]],
+        reachability_limit: int = REACHABILITY_LIMIT,
+        memo_size: int = REACHABILITY_MEMO_SIZE,
+    ):
+        self.refs: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._succ: List[List[int]] = []
+        self._pred: List[List[int]] = []
+        self.edge_count = 0
+        self.reachability_limit = reachability_limit
+        self.memo_size = memo_size
+
+        for dep in dependencies:
+            ref = dep.get("ref")
+            if not ref:
+                continue
+            v = self._node(ref)
+            targets = self._succ[v]
+            seen = set(targets)
+            for target in dep.get("dependsOn") or ():
+                if not target:
+                    continue
+                w = self._node(target)
+                if w not in seen:
+                    seen.add(w)
+                    targets.append(w)
+                    self._pred[w].append(v)
+                    self.edge_count += 1
+
+        self._lock = threading.RLock()
+        self._scc: Optional[Tuple[List[int], List[List[int]]]] = None
+        self._condensed: Optional[Tuple[List[List[int]], List[List[int]]]] = None
+        # 방향("descendants"/"ancestors") -> SCC별 도달 가능 비트셋 (미리 계산한 경우)
+        self._reach: Dict[str, List[int]] = {}
+        self._memo: "OrderedDict[Tuple[str, int], List[int]]" = OrderedDict()
+
+    def _node(self, ref: str) -> int:
+        node = self.ids.get(ref)
+        if node is None:
+            node = self.ids[ref] = len(self.refs)
+            self.refs.append(ref)
+            self._succ.append([])
+            self._pred.append([])
+        return node
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self.ids
+
+    def node_id(self, ref: str) -> int:
+        """ref의 정수 id를 반환합니다. (그래프에 없으면 KeyError)"""
+        try:
+            return self.ids[ref]
+        except KeyError:
+            raise KeyError(f"의존성 그래프에 없는 ref입니다: {ref}") from None
+
+    # --- 강연결요소 / 위상 순서 ---
+
+    def components(self) -> Tuple[List[int], List[List[int]]]:
+        """
+        (노드 id -> SCC id, SCC id -> 노드 id 목록)을 반환합니다. (처음 호출 시 한 번 계산)
+        SCC id는 Tarjan 알고리즘이 찾은 순서이므로, 한 SCC에서 도달할 수 있는 다른 SCC는 항상 더 작은 id를 가집니다.
+        """
+        if self._scc is None:
+            with self._lock:
+                if self._scc is None:
+                    self._scc = self._tarjan()
+        return self._scc
+
+    def _tarjan(self) -> Tuple[List[int], List[List[int]]]:
+        """반복형 Tarjan 알고리즘 (재귀 깊이 제한 없음)"""
+        succ = self._succ
+        n = len(succ)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack: List[int] = []
+        component = [-1] * n
+        members: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, 0)]
+            while work:
+                v, i = work[-1]
+                edges = succ[v]
+                if i < len(edges):
+                    work[-1] = (v, i + 1)
+                    w = edges[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, 0))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    cid = len(members)
+                    group = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = cid
+                        group.append(w)
+                        if w == v:
+                            break
+                    group.reverse()
+                    members.append(group)
+        return component, members
+
+    def _condensation(self) -> Tuple[List[List[int]], List[List[int]]]:
+        """SCC 단위 응축 그래프의 (정방향, 역방향) 인접 리스트를 반환합니다."""
+        if self._condensed is None:
+            component, members = self.components()
+            forward: List[List[int]] = [[] for _ in members]
+            backward: List[List[int]] = [[] for _ in members]
+            for c, group in enumerate(members):
+                targets = {component[w] for v in group for w in self._succ[v]}
+                targets.discard(c)
+                forward[c] = sorted(targets)
+                for d in forward[c]:
+                    backward[d].append(c)
+            self._condensed = (forward, backward)
+        return self._condensed
+
+    def topological_order(self) -> List[str]:
+        """의존하는 ref가 의존 대상보다 앞에 오는 순서로 반환합니다. (같은 순환 안에서는 임의 순서)"""
+        _, members = self.components()
+        return [self.refs[v] for group in reversed(members) for v in group]
+
+    def cycles(self) -> List[List[str]]:
+        """순환을 이루는 ref 묶음(크기 2 이상 SCC 또는 자기 자신 간선)을 반환합니다."""
+        _, members = self.components()
+        result = []
+        for group in members:
+            if len(group) > 1 or group[0] in self._succ[group[0]]:
+                result.append(sorted(group))
+        result.sort(key=lambda group: group[0])
+        return [[self.refs[v] for v in group] for group in result]
+
+    # --- 도달 가능성 ---
+
+    def _reachable_components(self, direction: str, c: int) -> List[int]:
+        """SCC c에서 direction 방향으로 도달할 수 있는 SCC id 목록 (c 포함, 오름차순)"""
+        reach = self._reach.get(direction)
+        if reach is None and len(self.components()[1]) <= self.reachability_limit:
+            with self._lock:
+                reach = self._reach.get(direction)
+                if reach is None:
+                    reach = self._reach[direction] = self._precompute(direction)
+        if reach is not None:
+            return _bit_positions(reach[c])
+
+        key = (direction, c)
+        found = self._memo.get(key)
+        if found is not None:
+            self._memo.move_to_end(key)
+            return found
+        forward, backward = self._condensation()
+        adjacency = forward if direction == "descendants" else backward
+        seen = bytearray(len(adjacency))
+        seen[c] = 1
+        queue = [c]
+        for d in queue:
+            for e in adjacency[d]:
+                if not seen[e]:
+                    seen[e] = 1
+                    queue.append(e)
+        queue.sort()
+        with self._lock:
+            self._memo[key] = queue
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return queue
+
+    def _precompute(self, direction: str) -> List[int]:
+        """
+        모든 SCC의 도달 가능 비트셋을 응축 그래프 한 번 순회로 계산합니다.
+        정방향 후속 SCC는 항상 id가 더 작으므로 id 오름차순(역방향은 내림차순)으로 처리하면 됩니다.
+        """
+        forward, backward = self._condensation()
+        count = len(forward)
+        reach = [0] * count
+        if direction == "descendants":
+            order, adjacency = range(count), forward
+        else:
+            order, adjacency = range(count - 1, -1, -1), backward
+        for c in order:
+            bits = 1 << c
+            for d in adjacency[c]:
+                bits |= reach[d]
+            reach[c] = bits
+        return reach
+
+    def _reachable(self, ref: str, direction: str) -> List[str]:
+        v = self.node_id(ref)
+        component, members = self.components()
+        nodes = [w for c in self._reachable_components(direction, component[v]) for w in members[c]]
+        nodes.sort()
+        return [self.refs[w] for w in nodes if w != v]
+
+    def descendants(self, ref: str) -> List[str]:
+        """ref가 직접/간접적으로 의존하는 ref 목록 (ref 자신 제외, 그래프 등장 순서)"""
+        return self._reachable(ref, "descendants")
+
+    def ancestors(self, ref: str) -> List[str]:
+        """ref에 직접/간접적으로 의존하는 ref 목록 (ref 자신 제외, 그래프 등장 순서)"""
+        return self._reachable(ref, "ancestors")
+
+    def depends_on(self, source: str, target: str) -> bool:
+        """source가 target에 직접/간접적으로 의존하는지 여부"""
+        component, _ = self.components()
+        c, d = component[self.node_id(source)], component[self.node_id(target)]
+        reach = self._reach.get("descendants")
+        if reach is not None:
+            return bool(reach[c] >> d & 1)
+        return d in self._reachable_components("descendants", c)
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """source에서 target까지 dependsOn 간선을 따라가는 최단 경로 (없으면 None)"""
+        start, goal = self.node_id(source), self.node_id(target)
+        if start == goal:
+            return [source]
+        if not self.depends_on(source, target):
+            return None
+        parent = {start: start}
+        queue = [start]
+        for v in queue:
+            for w in self._succ[v]:
+                if w in parent:
+                    continue
+                parent[w] = v
+                if w == goal:
+                    path = [w]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    return [self.refs[u] for u in reversed(path)]
+                queue.append(w)
+        return None
@@ -0,0 +1,497 @@
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.models.unified_sbom import UnifiedComponent
+from app.services.integrate import DEFAULT_PRECEDENCE, SBOMIntegrator, source_tool
+from app.services.matching import FuzzyNameIndex, normalize_version
+
+"""
+incremental.py
+해당 파일은 이미 통합한 결과에 바뀐 SBOM 문서 하나만 반영하는 증분 통합 기능을 제공합니다.
+(이미지 레이어 하나가 바뀌었을 때 두 문서 전체를 다시 통합하지 않음)
+
+주요기능:
+1. 통합하면서 컴포넌트별 기여 내역(어느 문서의 어느 컴포넌트가 어느 통합 컴포넌트를 만들었/병합되었는지)을 보관합니다.
+2. 새 문서가 들어오면 이전 문서와 정규 키(integrate._generate_key) 기준으로 비교하여 추가/삭제/변경을 구합니다.
+3. 바뀐 컴포넌트가 속한 통합 컴포넌트만 다시 접어(refold) 갱신하고, 추가/삭제는 해당 위치에만 반영합니다.
+    - 변경 반영 비용은 변경된 컴포넌트 수에 비례합니다. (문서 비교 자체는 키 조회만 하는 선형 시간)
+    - 메타데이터는 항상 다시 계산하고, 의존성은 간선/ref가 바뀐 경우에만 DependencyGraph로 다시 만듭니다.
+4. 결과는 전체 재통합(SBOMIntegrator.integrate_many)과 바이트 단위로 같아야 합니다.
+    - 추가/삭제가 다른 컴포넌트의 매칭 결과(완전 일치, PURL 좌표, 이름 유사도)를 바꿀 수 있는 경우에는
+      증분 반영 대신 보관한 문서로 전체 재통합합니다. (DeltaReport.patched=False, reason에 사유)
+    - 유사도 매칭은 정규화 버전이 같은 컴포넌트끼리만 일어나므로, 다른 문서에 같은 버전이 없으면 영향이 없다고 판단합니다.
+
+[사용 예시]
+integrator = IncrementalIntegrator()
+unified = integrator.integrate(hatbom, syft)
+report = integrator.update(new_syft)     # unified가 제자리에서 갱신됨
+print(report.added, report.removed, report.changed, report.patched)
+"""
+
+
+@dataclass(slots=True)
+class DeltaReport:
+    """증분 통합 결과 (문서 비교 결과와 반영 방식)"""
+    tool: str
+    added: int = 0
+    removed: int = 0
+    changed: int = 0
+    patched: bool = True  # False이면 전체 재통합으로 반영
+    reason: Optional[str] = None  # 전체 재통합한 사유
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True, eq=False)
+class _Contribution:
+    """문서 컴포넌트 하나의 기여 내역"""
+    rank: int  # 문서 처리 순서
+    ident: Tuple[str, int]  # (정규 키, 같은 키의 문서 내 등장 순번)
+    origin: Any  # 원본 컴포넌트 (SyftSbom/HatbomSbom의 Component)
+    fuzzy: bool = False
+    group: Optional["_Group"] = None
+
+    @property
+    def key(self) -> str:
+        return self.ident[0]
+
+
+@dataclass(slots=True, eq=False)
+class _Group:
+    """통합 컴포넌트 하나와 그 컴포넌트를 이루는 기여 목록 (처리 순서, 첫 번째가 베이스)"""
+    members: List[_Contribution]
+    component: UnifiedComponent
+
+    @property
+    def base(self) -> _Contribution:
+        return self.members[0]
+
+
+class _Fallback(Exception):
+    """증분 반영이 불가능하여 전체 재통합이 필요함"""
+
+
+class IncrementalIntegrator(SBOMIntegrator):
+    """
+    SBOMIntegrator와 같은 결과를 만들면서 증분 갱신에 필요한 상태를 보관하는 통합기입니다.
+    update()는 self.unified_sbom을 제자리에서 갱신합니다. (serial_number 유지)
+    """
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._sources: List[Union[HatbomSbom, SyftSbom]] = []
+        self._precedence: Optional[Sequence[str]] = None
+        self._tools: List[str] = []
+        self._rank_of: Dict[int, int] = {}
+        self._entries: List[Dict[Tuple[str, int], _Contribution]] = []
+        self._dedup_maps: List[Dict[str, str]] = []
+        self._occurrences: List[Counter] = []
+        self._groups: List[_Group] = []
+        self._group_of: Dict[int, _Group] = {}
+
+    # --- 전체 통합 (상태 기록) ---
+
+    def integrate_many(self, sources, precedence=None):
+        ordered = self._order_sources(sources, precedence or DEFAULT_PRECEDENCE) if sources else []
+        self._sources = list(sources)
+        self._precedence = precedence
+        self._tools = [tool for tool, _ in ordered]
+        self._rank_of = {id(source): rank for rank, (_, source) in enumerate(ordered)}
+        self._entries = [{} for _ in ordered]
+        self._dedup_maps = [{} for _ in ordered]
+        self._occurrences = [Counter() for _ in ordered]
+        self._groups = []
+        self._group_of = {}
+        result = super().integrate_many(sources, precedence)
+        self._group_of = {}
+        self._occurrences = []
+        self._build_indexes()
+        return result
+
+    def _source_entries(self, tool, source, ref_map):
+        rank = self._rank_of.get(id(source))
+        if rank is None:
+            return super()._source_entries(tool, source, ref_map)
+        dedup_map: Dict[str, str] = {}
+        entries = super()._source_entries(tool, source, dedup_map)
+        self._dedup_maps[rank] = dedup_map
+        ref_map.update(dedup_map)
+        return entries
+
+    def _record(self, rank, key, origin, target, merged, fuzzy):
+        entries = self._entries[rank]
+        ident = _ident(self._occurrences[rank], key)
+        contribution = _Contribution(rank, ident, origin, fuzzy)
+        if merged:
+            group = self._group_of[id(target)]
+            group.members.append(contribution)
+        else:
+            group = _Group([contribution], target)
+            self._group_of[id(target)] = group
+            self._groups.append(group)
+        contribution.group = group
+        entries[ident] = contribution
+
+    def _build_indexes(self) -> None:
+        """통합 결과로 매칭 인덱스(정규 키, PURL 좌표, 유사도)와 버전 집계를 만듭니다."""
+        last = len(self._tools) - 1
+        self._created: Dict[str, _Group] = {}
+        self._coordinate_index: Dict[Tuple, _Group] = {}
+        self._fuzzy_index: Optional[FuzzyNameIndex] = FuzzyNameIndex(
+            threshold=self.fuzzy_threshold,
+            max_postings=self.fuzzy_max_postings,
+        ) if self.fuzzy_matching else None
+        # 유사도 인덱스가 전체 재통합과 달라진 버전 (이 버전의 유사도 조회는 증분 반영하지 않음)
+        self._dirty_versions: set = set()
+        for group in self._groups:
+            base = group.base
+            self._created[base.key] = group
+            coordinates = self._coordinates(base.origin.purl)
+            if coordinates is not None:
+                self._coordinate_index.setdefault(coordinates, group)
+            if self._fuzzy_index is not None and base.rank < last:
+                self._fuzzy_index.add(base.origin.name, base.origin.version, group)
+
+        self._by_key: Dict[str, List[_Contribution]] = {}
+        self._by_coordinates: Dict[Tuple, List[_Contribution]] = {}
+        self._by_version: Dict[str, List[_Contribution]] = {}
+        for entries in self._entries:
+            for contribution in entries.values():
+                self._index_contribution(contribution)
+        self._positions = [_positions(entries) for entries in self._entries]
+        self._index_of = {id(group): i for i, group in enumerate(self._groups)}
+
+    def _index_contribution(self, contribution: _Contribution) -> None:
+        self._by_key.setdefault(contribution.key, []).append(contribution)
+        self._by_version.setdefault(normalize_version(contribution.origin.version), []).append(contribution)
+        coordinates = self._coordinates(contribution.origin.purl)
+        if coordinates is not None:
+            self._by_coordinates.setdefault(coordinates, []).append(contribution)
+
+    def _unindex_contribution(self, contribution: _Contribution) -> None:
+        _discard(self._by_key, contribution.key, contribution)
+        _discard(self._by_version, normalize_version(contribution.origin.version), contribution)
+        coordinates = self._coordinates(contribution.origin.purl)
+        if coordinates is not None:
+            _discard(self._by_coordinates, coordinates, contribution)
+
+    # --- 증분 갱신 ---
+
+    def update(self, new_source: Union[HatbomSbom, SyftSbom], index: Optional[int] = None) -> DeltaReport:
+        """
+        보관한 문서 하나를 new_source로 바꾸어 통합 결과를 갱신합니다.
+
+        Args:
+            new_source: 새 Hatbom/Syft 문서
+            index: 바꿀 문서의 위치 (integrate_many에 넘긴 목록 기준, None이면 같은 도구의 유일한 문서)
+        """
+        if not self._sources:
+            raise ValueError("증분 갱신할 통합 결과가 없습니다. 먼저 integrate()/integrate_many()를 호출하세요.")
+        tool = self._order_sources([new_source], DEFAULT_PRECEDENCE)[0][0]
+        if index is None:
+            candidates = [i for i, source in enumerate(self._sources) if source_tool(source) == tool]
+            if len(candidates) != 1:
+                raise ValueError(f"바꿀 {tool} 문서를 하나로 정할 수 없습니다. (index를 지정하세요)")
+            index = candidates[0]
+        old_source = self._sources[index]
+        if source_tool(old_source) != tool:
+            raise ValueError(f"{index}번 문서는 {tool} 문서가 아닙니다.")
+
+        rank = self._rank_of[id(old_source)]
+        sources = list(self._sources)
+        sources[index] = new_source
+
+        dedup_map: Dict[str, str] = {}
+        new_entries: Dict[Tuple[str, int], Any] = {}
+        occurrences = Counter()
+        for key, origin in SBOMIntegrator._source_entries(self, tool, new_source, dedup_map):
+            new_entries[_ident(occurrences, key)] = origin
+        old_entries = self._entries[rank]
+
+        removed = [c for ident, c in old_entries.items() if ident not in new_entries]
+        added = [ident for ident in new_entries if ident not in old_entries]
+        changed = [
+            (old_entries[ident], origin) for ident, origin in new_entries.items()
+            if ident in old_entries and old_entries[ident].origin != origin
+        ]
+        report = DeltaReport(tool, added=len(added), removed=len(removed), changed=len(changed))
+
+        try:
+            self._patch(rank, old_source, new_source, sources, new_entries, dedup_map, removed, added, changed)
+        except _Fallback as e:
+            report.patched = False
+            report.reason = str(e)
+            self.integrate_many(sources, self._precedence)
+        return report
+
+    def _patch(self, rank, old_source, new_source, sources, new_entries, dedup_map, removed, added, changed) -> None:
+        """
+        변경분을 반영합니다. 반영 계획을 모두 검사한 뒤에 상태를 바꾸므로, _Fallback이 발생하면 상태는 그대로입니다.
+        """
+        tool = self._tools[rank]
+        last = len(self._tools) - 1
+        old_entries = self._entries[rank]
+        old_positions = self._positions[rank]
+        new_positions = {ident: i for i, ident in enumerate(new_entries)}
+
+        # 0. 남아 있는 컴포넌트의 문서 내 상대 순서가 같아야 함 (통합 결과의 컴포넌트 순서가 처리 순서를 따름)
+        previous = -1
+        for ident in new_entries:
+            position = old_positions.get(ident)
+            if position is not None:
+                if position < previous:
+                    raise _Fallback("문서 내 컴포넌트 순서가 바뀌었습니다.")
+                previous = position
+
+        # 매칭에 쓰는 값(이름, 버전, PURL)이 바뀐 변경은 삭제 + 추가로 처리
+        refold: List[Tuple[_Contribution, Any]] = []
+        for contribution, origin in changed:
+            before = contribution.origin
+            if (before.name, before.version, before.purl) == (origin.name, origin.version, origin.purl):
+                refold.append((contribution, origin))
+            else:
+                removed.append(contribution)
+                added.append(contribution.ident)
+        removed_set = {id(c) for c in removed}
+
+        def order(contribution: _Contribution) -> Tuple[int, int]:
+            positions = new_positions if contribution.rank == rank else self._positions[contribution.rank]
+            return contribution.rank, positions[contribution.ident]
+
+        def fuzzy_sensitive(version: str, ranks, created_only: bool = False) -> bool:
+            """
+            ranks 문서에 유사도 인덱스 변경의 영향을 받을 수 있는 같은 버전의 기여가 있는지 확인합니다.
+            (유사도로 병합되었거나 새 컴포넌트가 된 기여만 해당, 완전 일치/좌표로 병합된 기여는 유사도 조회를 하지 않음)
+            """
+            if not self.fuzzy_matching:
+                return False
+            for c in self._by_version.get(version, ()):
+                if c.rank in ranks and id(c) not in removed_set:
+                    if c.group.base is c or (c.fuzzy and not created_only):
+                        return True
+            return False
+
+        later = range(rank + 1, len(self._tools))
+        earlier = range(rank)
+
+        # 1. 삭제 계획
+        dropped_groups: List[_Group] = []
+        for contribution in removed:
+            group = contribution.group
+            if group.base is not contribution:
+                continue  # 병합된 기여만 빠지면 다른 컴포넌트의 매칭에는 영향 없음
+            if any(id(m) not in removed_set for m in group.members[1:]):
+                raise _Fallback("다른 컴포넌트가 병합된 기준 컴포넌트가 삭제되었습니다.")
+            if fuzzy_sensitive(normalize_version(contribution.origin.version), later):
+                raise _Fallback("삭제된 컴포넌트와 같은 버전의 컴포넌트가 이후 문서에 있습니다.")
+            dropped_groups.append(group)
+        dropped = {id(group) for group in dropped_groups}
+
+        # 2. 추가 계획 (처리 순서대로, 이번 변경분끼리 키/좌표가 겹치면 전체 재통합)
+        seen_keys = set()
+        seen_coordinates = set()
+        plans: List[Tuple[_Contribution, Optional[_Group]]] = []
+        for ident in added:
+            origin = new_entries[ident]
+            contribution = _Contribution(rank, ident, origin)
+            key = ident[0]
+            coordinates = self._coordinates(origin.purl)
+            if key in seen_keys or (coordinates is not None and coordinates in seen_coordinates):
+                raise _Fallback("추가된 컴포넌트끼리 같은 키/좌표를 가집니다.")
+            seen_keys.add(key)
+            if coordinates is not None:
+                seen_coordinates.add(coordinates)
+            position = (rank, new_positions[ident])
+
+            target = self._created.get(key)
+            if target is None and coordinates is not None:
+                target = self._coordinate_index.get(coordinates)
+                # 좌표 매칭은 다른 문서의 컴포넌트만 대상 (같은 문서에서 qualifier만 다른 컴포넌트는 병합하지 않음)
+                if target is not None and target.base.rank == rank:
+                    target = None
+            if target is not None:
+                if id(target) in dropped or order(target.base) >= position:
+                    raise _Fallback("추가된 컴포넌트가 이후 컴포넌트의 매칭 기준이 됩니다.")
+            elif fuzzy_sensitive(normalize_version(origin.version), earlier, created_only=True):
+                version = normalize_version(origin.version)
+                if rank != last or version in self._dirty_versions:
+                    raise _Fallback("추가된 컴포넌트의 유사도 매칭을 증분으로 판단할 수 없습니다.")
+                target = self._fuzzy_index.find(origin.name, origin.version)
+                if target is not None and id(target) in dropped:
+                    raise _Fallback("추가된 컴포넌트가 삭제된 컴포넌트와 유사도 매칭됩니다.")
+                contribution.fuzzy = target is not None
+
+            if target is None:
+                # 새 통합 컴포넌트가 되는 경우, 이후에 처리되는 같은 키/좌표의 컴포넌트가 이 컴포넌트에 병합되어야 함
+                others = self._by_key.get(key, []) + (self._by_coordinates.get(coordinates, []) if coordinates else [])
+                if any(id(c) not in removed_set and order(c) > position for c in others):
+                    raise _Fallback("추가된 컴포넌트와 같은 키/좌표의 컴포넌트가 이후에 있습니다.")
+                if fuzzy_sensitive(normalize_version(origin.version), later):
+                    raise _Fallback("추가된 컴포넌트와 같은 버전의 컴포넌트가 이후 문서에 있습니다.")
+            plans.append((contribution, target))
+
+        # --- 여기부터 상태 변경 ---
+        structural = bool(dropped_groups) or any(target is None for _, target in plans)
+        touched: Dict[int, _Group] = {}
+        refs_changed = dedup_map != self._dedup_maps[rank]
+
+        for contribution in removed:
+            self._unindex_contribution(contribution)
+            group = contribution.group
+            if id(group) in dropped:
+                continue
+            group.members.remove(contribution)
+            self.stats.fuzzy_matches -= contribution.fuzzy
+            touched[id(group)] = group
+            refs_changed = True
+        for group in dropped_groups:
+            base = group.base
+            if self._created.get(base.key) is group:
+                del self._created[base.key]
+            coordinates = self._coordinates(base.origin.purl)
+            if coordinates is not None and self._coordinate_index.get(coordinates) is group:
+                del self._coordinate_index[coordinates]
+            if self._fuzzy_index is not None and base.rank < last:
+                self._dirty_versions.add(normalize_version(base.origin.version))
+            refs_changed = True
+
+        for contribution, origin in refold:
+            if contribution.origin.bom_ref != origin.bom_ref:
+                refs_changed = True
+            self._unindex_contribution(contribution)
+            contribution.origin = origin
+            self._index_contribution(contribution)
+            touched[id(contribution.group)] = contribution.group
+
+        groups = [group for group in self._groups if id(group) not in dropped] if dropped_groups else self._groups
+        for contribution, target in plans:
+            self._index_contribution(contribution)
+            if target is None:
+                group = _Group([contribution], self._convert(tool, contribution.origin))
+                contribution.group = group
+                groups.append(group)
+                self._created[contribution.key] = group
+                coordinates = self._coordinates(contribution.origin.purl)
+                if coordinates is not None:
+                    self._coordinate_index.setdefault(coordinates, group)
+                if self._fuzzy_index is not None and rank < last:
+                    self._fuzzy_index.add(contribution.origin.name, contribution.origin.version, group)
+                    self._dirty_versions.add(normalize_version(contribution.origin.version))
+            else:
+                contribution.group = target
+                target.members.append(contribution)
+                target.members.sort(key=order)
+                self.stats.fuzzy_matches += contribution.fuzzy
+                touched[id(target)] = target
+            refs_changed = True
+
+        # 문서 항목/위치/버전 집계 갱신
+        entries: Dict[Tuple[str, int], _Contribution] = {}
+        added_by_ident = {c.ident: c for c, _ in plans}
+        for ident in new_entries:
+            contribution = added_by_ident.get(ident) or old_entries[ident]
+            entries[ident] = contribution
+        self._entries[rank] = entries
+        self._positions[rank] = new_positions
+        self._dedup_maps[rank] = dedup_map
+        self._tools[rank] = tool
+        del self._rank_of[id(old_source)]
+        self._rank_of[id(new_source)] = rank
+        self._sources = sources
+
+        # 3. 바뀐 통합 컴포넌트만 다시 접기
+        for group in touched.values():
+            self._refold(group)
+
+        unified = self.unified_sbom
+        if structural:
+            groups.sort(key=lambda group: order(group.base))
+            self._groups = groups
+            self._index_of = {id(group): i for i, group in enumerate(groups)}
+            unified.components = [group.component for group in groups]
+            self._rebuild_stats()
+        else:
+            for group in touched.values():
+                unified.components[self._index_of[id(group)]] = group.component
+            self._update_stats(touched.values())
+
+        # 4. 메타데이터/의존성
+        self._integrate_metadata(
+            [s for s in sources if source_tool(s) == "Hatbom"],
+            [s for s in sources if source_tool(s) == "Syft"],
+        )
+        if refs_changed or old_source.dependencies != new_source.dependencies:
+            self._integrate_dependencies(sources, self._ref_maps())
+
+    def _refold(self, group: _Group) -> None:
+        """기여 목록으로 통합 컴포넌트를 처음부터 다시 만듭니다. (전체 통합과 같은 순서로 병합)"""
+        base = group.base
+        component = self._convert(self._tools[base.rank], base.origin)
+        for member in group.members[1:]:
+            tool = self._tools[member.rank]
+            self._merge_component(component, self._convert(tool, member.origin), tool, member.fuzzy)
+        group.component = component
+
+    def _rebuild_stats(self) -> None:
+        stats = self.stats
+        stats.sources = []
+        stats.integrated = bytearray()
+        stats.source_counts = {}
+        stats.integrated_count = 0
+        stats.fuzzy_matches = 0
+        for i, group in enumerate(self._groups):
+            stats.add(self._tools[group.base.rank])
+            for member in group.members[1:]:
+                stats.mark_integrated(i, member.fuzzy)
+
+    def _update_stats(self, groups) -> None:
+        """구성 기여가 바뀐 통합 컴포넌트의 통합 여부를 갱신합니다. (fuzzy_matches는 반영 중에 갱신)"""
+        stats = self.stats
+        for group in groups:
+            i = self._index_of[id(group)]
+            integrated = 1 if len(group.members) > 1 else 0
+            stats.integrated_count += integrated - stats.integrated[i]
+            stats.integrated[i] = integrated
+
+    def _ref_maps(self) -> Dict[int, Dict[str, str]]:
+        """문서별 bom-ref 재매핑 표를 기여 내역으로 다시 만듭니다. (integrate_many와 같은 기록 순서)"""
+        ref_maps: Dict[int, Dict[str, str]] = {}
+        ordered = sorted(self._sources, key=lambda source: self._rank_of[id(source)])
+        for rank, source in enumerate(ordered):
+            ref_map = dict(self._dedup_maps[rank])
+            for contribution in self._entries[rank].values():
+                group = contribution.group
+                if group.base is contribution:
+                    continue
+                ref, merged_ref = contribution.origin.bom_ref, group.base.origin.bom_ref
+                if ref and merged_ref and ref != merged_ref:
+                    ref_map[ref] = merged_ref
+            ref_maps[id(source)] = ref_map
+        return ref_maps
+
+
+def _ident(occurrences: Counter, key: str) -> Tuple[str, int]:
+    """문서 안에서 같은 키가 몇 번째로 등장했는지를 포함한 식별자를 만듭니다."""
+    occurrence = occurrences[key]
+    occurrences[key] = occurrence + 1
+    return key, occurrence
+
+
+def _positions(entries: Dict[Tuple[str, int], Any]) -> Dict[Tuple[str, int], int]:
+    return {ident: i for i, ident in enumerate(entries)}
+
+
+def _discard(index: Dict[Any, List[_Contribution]], key: Any, contribution: _Contribution) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    for i, item in enumerate(bucket):
+        if item is contribution:
+            del bucket[i]
+            break
+    if not bucket:
+        del index[key]
@@ -1,15 +1,19 @@
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from app.models.hatbom_sbom import HatbomSbom
 from app.models.syft_sbom import SyftSbom
+from app.models.interning import intern_author
 from app.models.unified_sbom import (
     UnifiedSbom, 
     UnifiedComponent, 
-    UnifiedAuthor, 
     UnifiedMetadata, 
     UnifiedMetadataComponent
 )
-from app.services.parse import parse_author_string
+from app.services.graph import DependencyGraph, resolve_remap
+from app.services.parse import parse_authors
+from app.services.matching import FuzzyNameIndex
+from app.services.purl import canonical_purl, parse_purl
 
 """
 integrate.py
@@ -20,125 +24,340 @@ parse.py에서 파싱된 Hatbom과 Syft 데이터를 통합합니다.
     - 중복된 데이터를 검증하는 로직은 components에 대하여 진행합니다.
     - components 필드의 name을 통해 유사도를 측정합니다.
     - 유사도가 일정 기준 이상인 경우 중복으로 간주하고 하나의 데이터로 통합합니다. (주로 name 필드를 기준으로 하며 version까지 같은 경우 동일하다고 판단)
-2. 통합된 데이터를 JSON 형식으로 반환합니다.
+    - 유사도 비교는 matching.FuzzyNameIndex의 n-gram 역색인으로 후보를 좁혀 수행합니다. (모든 쌍 비교 없음)
+    - PURL은 purl.canonical_purl()로 정규화한 문자열을 키로 사용하며, qualifier만 다른 PURL은
+      (type, namespace, name, version) 좌표 인덱스로 O(1) 조회하여 유사도 매칭 전에 병합합니다.
+2. 여러 개의 SBOM(계층별/서비스별)을 도구 우선순위에 따라 한 번에 통합합니다. (integrate_many)
+3. 통합된 데이터를 JSON 형식으로 반환합니다.
+4. 병합하면서 컴포넌트별 출처(source_tool)/통합 여부와 요약 카운터를 기록합니다. (IntegrationStats)
+    - 요약과 화면 표 행을 만들 때 properties를 다시 훑지 않습니다.
+5. 의존성은 graph.DependencyGraph(ref -> dependsOn 인접 집합)로 통합합니다.
+    - 같은 ref의 dependsOn은 모든 문서의 합집합으로 병합합니다.
+    - 문서별로 "원래 bom-ref -> 병합된 컴포넌트의 bom-ref" 표를 기록하여 간선을 통합 컴포넌트 기준으로 다시 씁니다.
+    - 컴포넌트 목록에 없는 ref(dangling ref)는 IntegrationStats.dangling_refs로 보고합니다.
 """
 
+# 기본 도구 우선순위 (앞쪽 도구의 컴포넌트 정보가 베이스가 됨)
+DEFAULT_PRECEDENCE = ("Syft", "Hatbom")
+
+
+def source_tool(source) -> str:
+    """
+    문서의 도구 이름("Syft" / "Hatbom")을 반환합니다.
+    dataclass 모델과 msgspec Struct 모델(struct_sbom.py)이 모두 tool 클래스 속성을 제공합니다.
+    """
+    tool = getattr(source, "tool", None)
+    if tool not in ("Syft", "Hatbom"):
+        raise TypeError(f"지원하지 않는 SBOM 객체입니다: {type(source).__name__}")
+    return tool
+
+
+@dataclass(slots=True)
+class IntegrationStats:
+    """
+    통합 중에 기록한 컴포넌트별 출처 정보와 요약 카운터입니다.
+    sources/integrated는 UnifiedSbom.components와 같은 순서입니다.
+    """
+    sources: List[str] = field(default_factory=list)  # 컴포넌트를 처음 만든 도구 (source_tool)
+    integrated: bytearray = field(default_factory=bytearray)  # 다른 문서의 컴포넌트가 병합되었으면 1
+    source_counts: Dict[str, int] = field(default_factory=dict)
+    integrated_count: int = 0
+    fuzzy_matches: int = 0
+    dangling_refs: List[str] = field(default_factory=list)  # 의존성 그래프에서 컴포넌트를 찾을 수 없는 ref
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def add(self, tool: str) -> None:
+        """새 컴포넌트의 출처를 기록합니다."""
+        self.sources.append(tool)
+        self.integrated.append(0)
+        self.source_counts[tool] = self.source_counts.get(tool, 0) + 1
+
+    def mark_integrated(self, position: int, fuzzy: bool) -> None:
+        """position 위치의 컴포넌트에 다른 문서의 컴포넌트가 병합되었음을 기록합니다."""
+        if not self.integrated[position]:
+            self.integrated[position] = 1
+            self.integrated_count += 1
+        self.fuzzy_matches += fuzzy
+
+
 class SBOMIntegrator:
-    def __init__(self):
+    def __init__(
+        self,
+        fuzzy_matching: bool = True,
+        fuzzy_threshold: float = 0.85,
+        fuzzy_max_postings: int = 256,
+    ):
+        """
+        Args:
+            fuzzy_matching: PURL/name@version 완전 일치가 없을 때 이름 유사도 매칭을 수행할지 여부
+            fuzzy_threshold: 이름 유사도(n-gram Jaccard) 기준 (0~1, 버전은 항상 같아야 함)
+            fuzzy_max_postings: 후보 생성에 사용할 n-gram의 최대 등장 횟수 (흔한 n-gram 제외)
+        """
         self.unified_sbom = UnifiedSbom()
+        self.fuzzy_matching = fuzzy_matching
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_max_postings = fuzzy_max_postings
+        self.stats: Optional[IntegrationStats] = None
+        self.graph: Optional[DependencyGraph] = None
+
+    def options(self) -> Dict[str, object]:
+        """통합 결과에 영향을 주는 옵션을 반환합니다. (결과 캐시 키에 사용)"""
+        return {
+            "fuzzy_matching": self.fuzzy_matching,
+            "fuzzy_threshold": self.fuzzy_threshold,
+            "fuzzy_max_postings": self.fuzzy_max_postings,
+        }
 
     def integrate(self, hatbom: HatbomSbom, syft: SyftSbom) -> UnifiedSbom:
         """
         두 도구의 SBOM 객체를 받아 하나로 통합합니다.
         """
+        return self.integrate_many([hatbom, syft])
+
+    def integrate_many(
+        self,
+        sources: Sequence[Union[HatbomSbom, SyftSbom]],
+        precedence: Optional[Sequence[str]] = None,
+    ) -> UnifiedSbom:
+        """
+        임의 개수의 Hatbom/Syft SBOM을 하나의 공유 인덱스 위에서 한 번에 통합합니다.
+        비용은 입력 전체 컴포넌트 수에 비례합니다. (두 개씩 연쇄 통합하지 않음)
+
+        Args:
+            sources: 통합할 SBOM 객체 목록 (HatbomSbom / SyftSbom 혼합 가능)
+            precedence: 도구 이름 우선순위 (기본값: ("Syft", "Hatbom"))
+                - 우선순위가 높은 도구의 문서부터 처리하며, 같은 도구끼리는 목록 순서를 따릅니다.
+                - 먼저 처리된 컴포넌트의 값이 유지되고, 나중 문서는 해시/출처를 추가하고 빈 필드만 채웁니다.
+        """
         print("[INFO] SBOM 통합 프로세스를 시작합니다.")
-        
+        if not sources:
+            raise ValueError("통합할 SBOM이 없습니다.")
+        ordered = self._order_sources(sources, precedence or DEFAULT_PRECEDENCE)
+
         # 0. 메타데이터 통합
-        self._integrate_metadata(hatbom, syft)
+        self._integrate_metadata(
+            [s for s in sources if source_tool(s) == "Hatbom"],
+            [s for s in sources if source_tool(s) == "Syft"],
+        )
         
         # 통합 컴포넌트를 저장할 딕셔너리 (Key: 식별자)
         merged_map: Dict[str, UnifiedComponent] = {}
+        # PURL 좌표 (type, namespace, name, version) -> 컴포넌트
+        coordinate_index: Dict[Tuple, UnifiedComponent] = {}
+        # 이름 유사도 매칭용 인덱스 (이전 문서들의 컴포넌트만 포함, 같은 문서 내에서는 유사도 매칭하지 않음)
+        fuzzy_index = FuzzyNameIndex(
+            threshold=self.fuzzy_threshold,
+            max_postings=self.fuzzy_max_postings,
+        ) if self.fuzzy_matching else None
+        # 출처/통합 여부 기록 (컴포넌트 객체 id -> components 내 위치)
+        stats = IntegrationStats()
+        positions: Dict[int, int] = {}
+        # 문서별 bom-ref 재매핑 표 (문서 id -> 원래 bom-ref -> 통합 컴포넌트 bom-ref)
+        ref_maps: Dict[int, Dict[str, str]] = {}
 
-        # 1. Syft 데이터를 기본 베이스로 설정 (패키지 정보 중심)
-        for s_comp in syft.components:
-            key = self._generate_key(s_comp.name, s_comp.version, s_comp.purl)
-            
-            # Syft의 author 문자열을 UnifiedAuthor 리스트로 변환
-            authors = []
-            if s_comp.author:
-                parsed_authors = parse_author_string(s_comp.author)
-                authors = [UnifiedAuthor(name=a.get("name"), email=a.get("email")) for a in parsed_authors]
-            
-            # Syft의 기존 properties를 가져오고 source_tool 추가
-            syft_properties = [{"name": p.name, "value": p.value} for p in s_comp.properties]
-            syft_properties.append({"name": "source_tool", "value": "Syft"})
-            
-            unified_comp = UnifiedComponent(
-                name=s_comp.name,
-                version=s_comp.version,
-                type=s_comp.type,
-                bom_ref=s_comp.bom_ref,
-                purl=s_comp.purl,
-                cpe=s_comp.cpe,
-                licenses=[{"license": {"id": l.id, "name": l.name}} for l in s_comp.licenses],
-                properties=syft_properties,
-                authors=authors
-            )
-            merged_map[key] = unified_comp
-
-        # 2. Hatbom 데이터를 병합 (파일 해시 정보 보완)
-        for h_comp in hatbom.components:
-            key = self._generate_key(h_comp.name, h_comp.version, h_comp.purl)
-            
-            if key in merged_map:
-                # 이미 Syft에 존재하는 패키지라면 해시 정보만 추가
-                existing = merged_map[key]
-                existing.hashes.extend([{"alg": h.alg, "content": h.content} for h in h_comp.hashes])
-                existing.properties.append({"name": "integrated_with", "value": "Hatbom"})
-                # group 정보가 없으면 Hatbom에서 가져옴
-                if not existing.group and h_comp.group:
-                    existing.group = h_comp.group
-            else:
-                # Syft에는 없지만 Hatbom에만 있는 새로운 데이터라면 추가
-                new_comp = UnifiedComponent(
-                    name=h_comp.name,
-                    version=h_comp.version,
-                    type=h_comp.type,
-                    bom_ref=h_comp.bom_ref,
-                    purl=h_comp.purl,
-                    group=h_comp.group,
-                    hashes=[{"alg": h.alg, "content": h.content} for h in h_comp.hashes],
-                    properties=[{"name": "source_tool", "value": "Hatbom"}]
-                )
-                merged_map[key] = new_comp
-
-        # 3. 결과 객체 구성
+        # 1. 우선순위 순서대로 문서를 처리 (기본: Syft 패키지 정보가 베이스, Hatbom이 파일 해시 정보 보완)
+        for rank, (tool, source) in enumerate(ordered):
+            created: List[UnifiedComponent] = []
+            ref_map = ref_maps.setdefault(id(source), {})
+            for key, origin in self._source_entries(tool, source, ref_map):
+                comp = self._convert(tool, origin)
+                existing = merged_map.get(key)
+                if existing is None:
+                    # qualifier 등만 다른 PURL은 이전 문서의 컴포넌트에서 좌표로 찾음
+                    existing = self._lookup_coordinates(coordinate_index, comp.purl)
+                fuzzy_matched = False
+                if existing is None and fuzzy_index is not None:
+                    # 완전 일치가 없으면 정규화 이름 + 버전 유사도로 같은 패키지를 찾음
+                    existing = fuzzy_index.find(comp.name, comp.version)
+                    fuzzy_matched = existing is not None
+
+                if existing is not None:
+                    self._merge_component(existing, comp, tool, fuzzy_matched)
+                    stats.mark_integrated(positions[id(existing)], fuzzy_matched)
+                    if comp.bom_ref and existing.bom_ref and comp.bom_ref != existing.bom_ref:
+                        ref_map[comp.bom_ref] = existing.bom_ref
+                    self._record(rank, key, origin, existing, True, fuzzy_matched)
+                else:
+                    # 앞선 문서에 없던 새로운 데이터라면 추가
+                    merged_map[key] = comp
+                    positions[id(comp)] = len(positions)
+                    stats.add(tool)
+                    created.append(comp)
+                    self._record(rank, key, origin, comp, False, False)
+
+            # 좌표 인덱스에는 문서 처리가 끝난 뒤 등록 (같은 문서 안에서 qualifier만 다른 컴포넌트는 서로 다른 컴포넌트)
+            for comp in created:
+                self._index_coordinates(coordinate_index, comp)
+            # 마지막 문서의 컴포넌트는 이후에 비교할 문서가 없으므로 유사도 인덱스에 넣지 않음
+            if fuzzy_index is not None and rank < len(ordered) - 1:
+                for comp in created:
+                    fuzzy_index.add(comp.name, comp.version, comp)
+
+        # 2. 결과 객체 구성
         self.unified_sbom.components = list(merged_map.values())
+        self.stats = stats
         
-        # 4. 의존성 정보 통합 (Hatbom + Syft dependencies)
-        self._integrate_dependencies(hatbom, syft)
+        # 3. 의존성 정보 통합 (Hatbom + Syft dependencies, 병합된 bom-ref 재매핑)
+        self._integrate_dependencies(sources, ref_maps)
+        if stats.dangling_refs:
+            print(f"[WARN] 컴포넌트 목록에 없는 의존성 ref {len(stats.dangling_refs)}개가 있습니다.")
         
         print(f"[SUCCESS] 통합 완료: 총 {len(self.unified_sbom.components)} 개의 컴포넌트가 병합되었습니다.")
         return self.unified_sbom
 
-    def _integrate_metadata(self, hatbom: HatbomSbom, syft: SyftSbom):
+    @staticmethod
+    def _order_sources(sources, precedence: Sequence[str]) -> List[Tuple[str, Union[HatbomSbom, SyftSbom]]]:
+        """(도구 이름, 문서) 목록을 도구 우선순위 순으로 정렬합니다. (안정 정렬, 목록에 없는 도구는 마지막)"""
+        rank = {tool.lower(): i for i, tool in enumerate(precedence)}
+        tagged = []
+        for source in sources:
+            tagged.append((source_tool(source), source))
+        return sorted(tagged, key=lambda item: rank.get(item[0].lower(), len(rank)))
+
+    def _source_entries(self, tool: str, source, ref_map: Dict[str, str]) -> List[Tuple[str, object]]:
         """
-        Hatbom과 Syft의 메타데이터를 통합합니다.
+        문서의 컴포넌트를 처리 순서대로 (키, 원본 컴포넌트) 목록으로 반환합니다.
+        같은 Syft 문서 안에서 키가 겹치면 나중 컴포넌트로 대체하고(위치는 처음 등장 순서), 대체된 bom-ref는 ref_map에 기록합니다.
+        """
+        if tool == "Syft":
+            deduped: Dict[str, object] = {}
+            for s_comp in source.components:
+                key = self._generate_key(s_comp.name, s_comp.version, s_comp.purl)
+                replaced = deduped.get(key)
+                if replaced is not None and replaced.bom_ref and s_comp.bom_ref and replaced.bom_ref != s_comp.bom_ref:
+                    ref_map[replaced.bom_ref] = s_comp.bom_ref
+                deduped[key] = s_comp
+            return list(deduped.items())
+        return [(self._generate_key(h_comp.name, h_comp.version, h_comp.purl), h_comp) for h_comp in source.components]
+
+    def _convert(self, tool: str, origin) -> UnifiedComponent:
+        """원본 컴포넌트를 도구에 맞게 UnifiedComponent로 변환합니다."""
+        return self._from_syft(origin) if tool == "Syft" else self._from_hatbom(origin)
+
+    def _record(self, rank: int, key: str, origin, target: UnifiedComponent, merged: bool, fuzzy: bool) -> None:
+        """
+        컴포넌트 하나의 처리 결과를 받는 확장 지점입니다. (기본 구현은 아무것도 하지 않음)
+        rank: 문서 처리 순서, target: 새로 만든 컴포넌트 또는 병합된 기존 컴포넌트, merged: 기존 컴포넌트에 병합되었는지 여부
+        """
+
+    @staticmethod
+    def _from_syft(s_comp) -> UnifiedComponent:
+        """Syft 컴포넌트를 UnifiedComponent로 변환합니다. (패키지 정보 중심)"""
+        # Syft의 author 문자열을 UnifiedAuthor 리스트로 변환
+        # (같은 저자는 공유 객체, 파싱 결과는 캐시됨)
+        authors = parse_authors(s_comp.author)
+        
+        # Syft의 기존 properties를 가져오고 source_tool 추가
+        syft_properties = [{"name": p.name, "value": p.value} for p in s_comp.properties]
+        syft_properties.append({"name": "source_tool", "value": "Syft"})
+        
+        return UnifiedComponent(
+            name=s_comp.name,
+            version=s_comp.version,
+            type=s_comp.type,
+            bom_ref=s_comp.bom_ref,
+            purl=s_comp.purl,
+            cpe=s_comp.cpe,
+            licenses=[{"license": {"id": l.id, "name": l.name}} for l in s_comp.licenses],
+            properties=syft_properties,
+            authors=authors
+        )
+
+    @staticmethod
+    def _from_hatbom(h_comp) -> UnifiedComponent:
+        """Hatbom 컴포넌트를 UnifiedComponent로 변환합니다. (파일 해시 정보 중심)"""
+        return UnifiedComponent(
+            name=h_comp.name,
+            version=h_comp.version,
+            type=h_comp.type,
+            bom_ref=h_comp.bom_ref,
+            purl=h_comp.purl,
+            group=h_comp.group,
+            hashes=[{"alg": h.alg, "content": h.content} for h in h_comp.hashes],
+            properties=[{"name": "source_tool", "value": "Hatbom"}]
+        )
+
+    @staticmethod
+    def _merge_component(existing: UnifiedComponent, incoming: UnifiedComponent, tool: str, fuzzy_matched: bool):
+        """
+        이미 통합된 컴포넌트에 우선순위가 낮은 문서의 같은 컴포넌트를 병합합니다.
+        해시와 출처 정보만 추가하고, 나머지 필드는 비어 있는 경우에만 채웁니다.
+        """
+        existing.hashes.extend(incoming.hashes)
+        existing.properties.append({"name": "integrated_with", "value": tool})
+        if fuzzy_matched:
+            existing.properties.append({"name": "integration_match", "value": "fuzzy"})
+        # group 등 정보가 없으면 나중 문서에서 가져옴
+        if not existing.group and incoming.group:
+            existing.group = incoming.group
+        if not existing.cpe and incoming.cpe:
+            existing.cpe = incoming.cpe
+        if not existing.licenses and incoming.licenses:
+            existing.licenses = incoming.licenses
+        if not existing.authors and incoming.authors:
+            existing.authors = incoming.authors
+
+    @staticmethod
+    def _coordinates(purl: Optional[str]) -> Optional[Tuple]:
+        """
+        PURL의 (type, namespace, name, version) 좌표를 반환합니다.
+        subpath가 있는 PURL(패키지 내부 파일)은 패키지 자체와 구분해야 하므로 좌표 조회 대상에서 제외합니다.
+        """
+        parsed = parse_purl(purl)
+        if parsed is None or parsed.subpath:
+            return None
+        return parsed.coordinates
+
+    def _index_coordinates(self, index: Dict[Tuple, UnifiedComponent], comp: UnifiedComponent):
+        """컴포넌트를 PURL 좌표 인덱스에 등록합니다. (같은 좌표는 먼저 등록된 컴포넌트 유지)"""
+        coordinates = self._coordinates(comp.purl)
+        if coordinates is not None:
+            index.setdefault(coordinates, comp)
+
+    def _lookup_coordinates(self, index: Dict[Tuple, UnifiedComponent], purl: Optional[str]) -> Optional[UnifiedComponent]:
+        """PURL 좌표가 같은 컴포넌트를 반환합니다."""
+        coordinates = self._coordinates(purl)
+        if coordinates is None:
+            return None
+        return index.get(coordinates)
+
+    def _integrate_metadata(self, hatboms: List[HatbomSbom], syfts: List[SyftSbom]):
+        """
+        Hatbom과 Syft의 메타데이터를 통합합니다. (문서가 여러 개이면 목록 순서대로 모음)
         """
         # 1. Authors 통합 (Hatbom + Syft tools의 author 정보)
         unified_authors = []
         # Hatbom의 authors 추가
-        for author_dict in hatbom.metadata.authors:
-            unified_authors.append(UnifiedAuthor(
-                name=author_dict.get("name"),
-                email=author_dict.get("email")
-            ))
+        for hatbom in hatboms:
+            for author_dict in hatbom.metadata.authors:
+                unified_authors.append(intern_author(author_dict.get("name"), author_dict.get("email")))
         # Syft tools.components의 author 정보 추가
-        for tool in syft.metadata.tools:
-            if tool.get("author"):
-                # author 문자열을 파싱하여 추가
-                parsed_authors = parse_author_string(tool.get("author"))
-                for parsed in parsed_authors:
-                    unified_authors.append(UnifiedAuthor(
-                        name=parsed.get("name"),
-                        email=parsed.get("email")
-                    ))
+        for syft in syfts:
+            for tool in syft.metadata.tools:
+                if tool.get("author"):
+                    # author 문자열을 파싱하여 추가
+                    unified_authors.extend(parse_authors(tool.get("author")))
         
         # 2. Tools 통합 (Syft + Hatbom + Quick-BOM-Integrator)
         tools_components = []
-        # Syft 도구 정보 추가 (author 필드는 deprecated되어 제외)
-        for tool in syft.metadata.tools:
-            # author 필드를 제외한 새 딕셔너리 생성
-            tool_without_author = {k: v for k, v in tool.items() if k != "author"}
-            tools_components.append(tool_without_author)
+        # Syft 도구 정보 추가 (author 필드는 deprecated되어 제외, 여러 문서에 같은 도구가 있으면 한 번만)
+        for syft in syfts:
+            for tool in syft.metadata.tools:
+                # author 필드를 제외한 새 딕셔너리 생성
+                tool_without_author = {k: v for k, v in tool.items() if k != "author"}
+                if tool_without_author not in tools_components:
+                    tools_components.append(tool_without_author)
         # Hatbom 도구 정보 추가 (있다면)
-        tools_components.append({"name": "Hatbom", "version": "1.0.0"})
+        if hatboms:
+            tools_components.append({"name": "Hatbom", "version": "1.0.0"})
         # 통합 도구 정보 추가
         tools_components.append({"name": "Quick-BOM-Integrator", "version": "1.0.0"})
         
-        # 3. Main Component 통합 (Hatbom 기준, 더 상세한 정보 보유)
-        hatbom_comp = hatbom.metadata.component
-        syft_comp = syft.metadata.main_component
+        # 3. Main Component 통합 (첫 번째 Hatbom 기준, 더 상세한 정보 보유)
+        hatbom_comp = hatboms[0].metadata.component if hatboms else {}
+        syft_comp = syfts[0].metadata.main_component if syfts else {}
         
         unified_meta_comp = UnifiedMetadataComponent(
             name=hatbom_comp.get("name") or syft_comp.get("name", ""),
@@ -150,55 +369,64 @@ class SBOMIntegrator:
         )
         
         # 4. UnifiedMetadata 생성
+        timestamps = [h.metadata.timestamp for h in hatboms] + [s.metadata.timestamp for s in syfts]
         self.unified_sbom.metadata = UnifiedMetadata(
-            timestamp=hatbom.metadata.timestamp or syft.metadata.timestamp,
+            timestamp=next((t for t in timestamps if t), None),
             authors=unified_authors,
             tools={"components": tools_components},
             component=unified_meta_comp
         )
 
-    def _integrate_dependencies(self, hatbom: HatbomSbom, syft: SyftSbom):
+    def _integrate_dependencies(
+        self,
+        sources: Sequence[Union[HatbomSbom, SyftSbom]],
+        ref_maps: Dict[int, Dict[str, str]],
+    ):
         """
-        Hatbom과 Syft의 의존성 정보를 통합합니다.
+        Hatbom과 Syft의 의존성 정보를 하나의 DependencyGraph로 통합합니다.
+        같은 ref의 dependsOn은 합집합으로 병합하고, 문서별 재매핑 표로 병합된 컴포넌트의 ref를 다시 씁니다.
         """
-        dependencies = []
-        seen_refs = set()  # 중복 방지를 위한 집합
-        
-        # 1. Hatbom dependencies 추가
-        for dep in hatbom.dependencies:
-            ref = dep.ref
-            if ref not in seen_refs:
-                dependencies.append({
-                    "ref": ref,
-                    "dependsOn": dep.depends_on
-                })
-                seen_refs.add(ref)
-        
-        # 2. Syft dependencies 추가
-        for dep in syft.dependencies:
-            ref = dep.get("ref", "")
-            if ref and ref not in seen_refs:
-                dependencies.append({
-                    "ref": ref,
-                    "dependsOn": dep.get("dependsOn", [])
-                })
-                seen_refs.add(ref)
-        
-        self.unified_sbom.dependencies = dependencies
+        graph = DependencyGraph()
+        metadata = self.unified_sbom.metadata
+        root_ref = metadata.component.bom_ref if metadata and metadata.component else ""
+
+        # Hatbom dependencies를 먼저, Syft dependencies를 나중에 추가 (출력 순서 유지)
+        for tool in ("Hatbom", "Syft"):
+            for source in sources:
+                if source_tool(source) != tool:
+                    continue
+                remap = dict(ref_maps.get(id(source), {}))
+                # 문서의 메인 컴포넌트 ref는 통합 메타데이터 컴포넌트 ref로 연결
+                if tool == "Hatbom":
+                    source_root = source.metadata.component.get("bom-ref")
+                    pairs = ((dep.ref, dep.depends_on or []) for dep in source.dependencies)
+                else:
+                    source_root = source.metadata.main_component.get("bom-ref")
+                    pairs = ((dep.get("ref", ""), dep.get("dependsOn") or []) for dep in source.dependencies)
+                if source_root and root_ref and source_root != root_ref:
+                    remap.setdefault(source_root, root_ref)
+                graph.merge(pairs, resolve_remap(remap))
+
+        known = {comp.bom_ref for comp in self.unified_sbom.components}
+        known.add(root_ref)
+        if self.stats is not None:
+            self.stats.dangling_refs = graph.dangling_refs(known)
+        self.graph = graph
+        self.unified_sbom.dependencies = graph.to_dependencies()
 
     def _generate_key(self, name: str, version: str, purl: str = None) -> str:
-        """컴포넌트 식별을 위한 고유 키 생성 (PURL 우선)"""
+        """컴포넌트 식별을 위한 고유 키 생성 (정규화된 PURL 우선)"""
         if purl:
-            return purl
+            return canonical_purl(purl)
         return f"{name}@{version}"
 
     def save_to_json(self, output_path: str):
         """통합된 결과를 JSON 파일로 저장"""
-        import json
         from dataclasses import asdict
+        from app.services import codec
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self.unified_sbom), f, indent=2, ensure_ascii=False)
+            codec.dump(asdict(self.unified_sbom), f, indent=2)
         print(f"[INFO] 통합 SBOM이 저장되었습니다: {output_path}")
 
 # 실행 예시
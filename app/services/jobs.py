@@ -0,0 +1,469 @@
+import asyncio
+import io
+import json
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services import codec
+from app.services.cache import CachedResult, ResultCache, hash_stream, make_key
+from app.services.concurrency import parse_payloads
+from app.services.export import SBOMExporter
+from app.services.integrate import SBOMIntegrator
+
+"""
+jobs.py
+해당 파일은 SBOM 통합을 HTTP 요청 밖에서 실행하는 백그라운드 작업 큐를 제공합니다.
+대용량 SBOM 통합이 프록시 타임아웃에 걸리거나 요청 처리 작업자를 오래 점유하지 않도록,
+업로드는 즉시 작업 id를 반환하고 통합은 작업자가 진행합니다.
+
+주요기능:
+1. 작업 제출: 두 입력(Hatbom/Syft 바이트)을 저장소에 보관하고 작업 id를 반환합니다.
+    - 대기 작업 수에 상한(max_pending)이 있으며, 가득 차면 QueueFullError가 발생합니다.
+2. 작업 실행: 정해진 수(workers)의 asyncio 작업자가 큐에서 작업을 꺼내 파싱 -> 통합 -> 직렬화합니다.
+    - 단계(stage)와 진행률(progress)을 저장소에 기록하므로 상태 조회로 확인할 수 있습니다.
+    - 결과 캐시(ResultCache)가 주어지면 같은 입력의 결과를 재사용하고, 새 결과도 캐시에 저장합니다.
+3. 저장소(JobStore)는 교체할 수 있습니다.
+    - MemoryJobStore : 프로세스 메모리 (재시작 시 소멸, 로컬/테스트용)
+    - FileJobStore   : 디렉토리에 작업 상태/입력/결과를 파일로 저장 (재시작 후에도 유지)
+    - 다른 저장소(Redis 등)는 JobStore의 메서드를 구현하여 사용합니다.
+4. 재시작 시 완료되지 않은(queued/running) 작업은 보관된 입력으로 다시 대기열에 넣습니다.
+5. 실행 중인 작업을 삭제하면 작업자는 다음 단계 기록 시점에 중단하고 남은 입력/결과를 정리합니다.
+    - 상태 기록 직전에 작업이 아직 있는지 같은 스레드 호출에서 확인하므로 삭제된 작업이 다시 저장되지 않습니다.
+
+[작업 상태]
+queued -> running(parsing -> integrating -> exporting) -> succeeded | failed
+
+[사용 예시]
+queue = JobQueue(FileJobStore(".jobs"), workers=2, max_pending=64)
+await queue.start()
+job = await queue.submit({"hatbom": (hatbom_bytes, None), "syft": (syft_bytes, "gzip")})
+job = await queue.wait(job.id)
+document = queue.store.get_blob(job.id, RESULT_BLOB)
+"""
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+RESULT_BLOB = "result"
+
+# 작업 입력 이름 -> 모델 클래스 (통합 순서: Hatbom, Syft)
+_INPUT_MODELS = {
+    "hatbom": HatbomSbom,
+    "syft": SyftSbom,
+}
+
+
+class QueueFullError(RuntimeError):
+    """대기 중인 작업 수가 상한에 도달하여 새 작업을 받을 수 없는 경우 발생합니다."""
+
+
+class _JobDeleted(Exception):
+    """실행 중인 작업이 삭제되어 더 진행하지 않아야 하는 경우 (작업자 내부용)"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class Job:
+    """백그라운드 통합 작업의 상태"""
+    id: str
+    status: str = QUEUED
+    stage: str = QUEUED
+    progress: float = 0.0
+    created_at: str = field(default_factory=_now)
+    updated_at: str = field(default_factory=_now)
+    filenames: Dict[str, Optional[str]] = field(default_factory=dict)  # 입력 이름 -> 업로드 파일명
+    encodings: Dict[str, Optional[str]] = field(default_factory=dict)  # 입력 이름 -> 압축 형식
+    error: Optional[str] = None
+    result_filename: Optional[str] = None
+    summary: Dict[str, Any] = field(default_factory=dict)
+    cache_hit: bool = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        return cls(**data)
+
+
+class JobStore:
+    """
+    작업 상태와 입력/결과 바이트(blob)를 보관하는 저장소 인터페이스입니다.
+    모든 메서드는 작업자 스레드에서 호출될 수 있으므로 스레드 안전해야 합니다.
+    """
+
+    def save(self, job: Job) -> None:
+        raise NotImplementedError
+
+    def load(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    def list(self) -> List[Job]:
+        raise NotImplementedError
+
+    def delete(self, job_id: str) -> None:
+        """작업 상태와 관련 blob을 모두 삭제합니다."""
+        raise NotImplementedError
+
+    def put_blob(self, job_id: str, name: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def get_blob(self, job_id: str, name: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def delete_blob(self, job_id: str, name: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 메모리에 작업을 보관하는 저장소입니다. (재시작 시 소멸)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._blobs: Dict[Tuple[str, str], bytes] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            # 호출 측 객체와 공유하지 않도록 사본으로 보관
+            self._jobs[job.id] = job.to_dict()
+
+    def load(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            data = self._jobs.get(job_id)
+        return Job.from_dict(data) if data is not None else None
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return [Job.from_dict(data) for data in self._jobs.values()]
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            for key in [key for key in self._blobs if key[0] == job_id]:
+                del self._blobs[key]
+
+    def put_blob(self, job_id: str, name: str, data: bytes) -> None:
+        with self._lock:
+            self._blobs[(job_id, name)] = data
+
+    def get_blob(self, job_id: str, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._blobs.get((job_id, name))
+
+    def delete_blob(self, job_id: str, name: str) -> None:
+        with self._lock:
+            self._blobs.pop((job_id, name), None)
+
+
+class FileJobStore(JobStore):
+    """
+    디렉토리에 작업을 보관하는 저장소입니다. (재시작 후에도 유지)
+    <job_id>.job.json : 작업 상태, <job_id>.<name>.blob : 입력/결과 바이트
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _job_path(self, job_id: str) -> Path:
+        if not job_id.isalnum():
+            # 경로 조작 방지 (작업 id는 uuid hex)
+            raise ValueError(f"올바르지 않은 작업 id입니다: {job_id}")
+        return self.directory / f"{job_id}.job.json"
+
+    def _blob_path(self, job_id: str, name: str) -> Path:
+        return self._job_path(job_id).with_name(f"{job_id}.{name}.blob")
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        # 쓰는 도중 종료되어도 불완전한 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def save(self, job: Job) -> None:
+        self._write(self._job_path(job.id), codec.dumps_bytes(job.to_dict()))
+
+    def load(self, job_id: str) -> Optional[Job]:
+        try:
+            return Job.from_dict(codec.loads(self._job_path(job_id).read_bytes()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def list(self) -> List[Job]:
+        jobs = []
+        for path in self.directory.glob("*.job.json"):
+            job = self.load(path.name[:-len(".job.json")])
+            if job is not None:
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def delete(self, job_id: str) -> None:
+        self._job_path(job_id).unlink(missing_ok=True)
+        for path in self.directory.glob(f"{job_id}.*.blob"):
+            path.unlink(missing_ok=True)
+
+    def put_blob(self, job_id: str, name: str, data: bytes) -> None:
+        self._write(self._blob_path(job_id, name), data)
+
+    def get_blob(self, job_id: str, name: str) -> Optional[bytes]:
+        try:
+            return self._blob_path(job_id, name).read_bytes()
+        except OSError:
+            return None
+
+    def delete_blob(self, job_id: str, name: str) -> None:
+        self._blob_path(job_id, name).unlink(missing_ok=True)
+
+
+def create_store(backend: str, directory: Optional[str] = None) -> JobStore:
+    """설정 값으로 작업 저장소를 생성합니다. (memory | file)"""
+    if backend == "memory":
+        return MemoryJobStore()
+    if backend == "file":
+        return FileJobStore(directory or ".jobs")
+    raise ValueError(f"지원하지 않는 작업 저장소입니다: {backend}")
+
+
+class JobQueue:
+    """
+    크기 상한이 있는 대기열과 고정 개수의 asyncio 작업자로 통합 작업을 실행합니다.
+
+    Args:
+        store: 작업 저장소
+        workers: 동시에 실행할 작업 수
+        max_pending: 대기열에 넣을 수 있는 최대 작업 수
+        cache: 통합 결과 캐시 (None이면 사용하지 않음)
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 2,
+        max_pending: int = 64,
+        cache: Optional[ResultCache] = None,
+    ):
+        self.store = store
+        self.workers = workers
+        self.max_pending = max_pending
+        self.cache = cache
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._done: Dict[str, asyncio.Event] = {}
+        # 실행 중 삭제된 작업 id (작업자가 다음 기록 시점에 확인하고 중단)
+        self._cancelled: Set[str] = set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """작업자를 시작하고, 저장소에 남아 있는 미완료 작업을 다시 대기열에 넣습니다."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        for job in await asyncio.to_thread(self.store.list):
+            if job.finished:
+                continue
+            job.status, job.stage, job.progress, job.updated_at = QUEUED, QUEUED, 0.0, _now()
+            await asyncio.to_thread(self.store.save, job)
+            self._queue.put_nowait(job.id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """작업자를 중지합니다. 실행 중이던 작업은 저장소에 남아 다음 start()에서 다시 실행됩니다."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def pending(self) -> int:
+        """대기열에 남은 작업 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(
+        self,
+        inputs: Dict[str, Tuple[bytes, Optional[str]]],
+        filenames: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Job:
+        """
+        통합 작업을 제출하고 작업 상태를 반환합니다.
+        inputs: 입력 이름(hatbom, syft) -> (입력 바이트, 압축 형식)
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._queue.qsize() >= self.max_pending:
+            raise QueueFullError(f"대기 중인 작업이 너무 많습니다. (최대 {self.max_pending}개)")
+        missing = set(_INPUT_MODELS) - set(inputs)
+        if missing:
+            raise ValueError(f"작업 입력이 누락되었습니다: {', '.join(sorted(missing))}")
+
+        job = Job(
+            id=uuid.uuid4().hex,
+            filenames=dict(filenames or {}),
+            encodings={name: encoding for name, (_, encoding) in inputs.items()},
+        )
+
+        def persist():
+            for name, (data, _) in inputs.items():
+                self.store.put_blob(job.id, name, data)
+            self.store.save(job)
+
+        await asyncio.to_thread(persist)
+        self._queue.put_nowait(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.store.load(job_id)
+
+    def delete(self, job_id: str) -> bool:
+        """
+        작업을 삭제합니다. 작업이 없으면 False를 반환합니다.
+        대기 중인 작업은 실행되지 않고, 실행 중인 작업은 다음 단계로 넘어가기 전에 중단됩니다.
+        """
+        job = self.store.load(job_id)
+        if job is None:
+            return False
+        if not job.finished:
+            self._cancelled.add(job_id)
+        self.store.delete(job_id)
+        return True
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """작업이 끝날 때까지 기다린 뒤 상태를 반환합니다. (작업이 없으면 None)"""
+        job = self.store.load(job_id)
+        if job is None or job.finished:
+            return job
+        event = self._done.setdefault(job_id, asyncio.Event())
+        await asyncio.wait_for(event.wait(), timeout)
+        return self.store.load(job_id)
+
+    # --- 작업자 ---
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._cancelled.discard(job_id)
+                self._queue.task_done()
+                event = self._done.pop(job_id, None)
+                if event is not None:
+                    event.set()
+
+    def _check_exists(self, job_id: str) -> None:
+        """작업이 삭제되었으면 남은 blob을 정리하고 _JobDeleted를 발생시킵니다. (작업자 스레드에서 호출)"""
+        if job_id in self._cancelled or self.store.load(job_id) is None:
+            self.store.delete(job_id)
+            raise _JobDeleted(job_id)
+
+    async def _update(self, job: Job, **changes: Any) -> None:
+        """작업 상태를 기록합니다. 작업이 삭제되었으면 다시 저장하지 않고 _JobDeleted를 발생시킵니다."""
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.updated_at = _now()
+
+        def save():
+            self._check_exists(job.id)
+            self.store.save(job)
+
+        await asyncio.to_thread(save)
+
+    async def _run(self, job_id: str) -> None:
+        job = await asyncio.to_thread(self.store.load, job_id)
+        if job is None or job.finished:
+            # 삭제되었거나 이미 끝난 작업
+            return
+        try:
+            await self._update(job, status=RUNNING, stage="parsing", progress=0.1)
+            names = list(_INPUT_MODELS)
+            payloads = await asyncio.to_thread(lambda: [self.store.get_blob(job_id, name) for name in names])
+            if any(payload is None for payload in payloads):
+                raise RuntimeError("작업 입력을 찾을 수 없습니다.")
+
+            integrator = SBOMIntegrator()
+            key = None
+            entry = None
+            if self.cache is not None:
+                # 해시 계산과 디스크 캐시 조회는 파일 I/O가 있으므로 이벤트 루프 밖에서 실행
+                key = await asyncio.to_thread(
+                    lambda: make_key([hash_stream(io.BytesIO(payload)) for payload in payloads], integrator.options())
+                )
+                entry = await asyncio.to_thread(self.cache.get, key)
+
+            if entry is None:
+                models = await parse_payloads(*(
+                    (_INPUT_MODELS[name], payload, job.encodings.get(name))
+                    for name, payload in zip(names, payloads)
+                ), detect=True)
+                await self._update(job, stage="integrating", progress=0.5)
+                unified_sbom = await asyncio.to_thread(integrator.integrate_many, models)
+
+                await self._update(job, stage="exporting", progress=0.8)
+                entry = await asyncio.to_thread(_export, unified_sbom, integrator.stats)
+                if key is not None:
+                    await asyncio.to_thread(self.cache.put, key, entry)
+            else:
+                job.cache_hit = True
+
+            def finish():
+                self._check_exists(job_id)
+                self.store.put_blob(job_id, RESULT_BLOB, entry.document)
+                for name in names:
+                    self.store.delete_blob(job_id, name)
+
+            await asyncio.to_thread(finish)
+            await self._update(
+                job, status=SUCCEEDED, stage="done", progress=1.0,
+                result_filename=entry.filename, summary=entry.summary
+            )
+        except asyncio.CancelledError:
+            raise
+        except _JobDeleted:
+            # 실행 중 삭제된 작업이면 결과를 남기지 않음
+            return
+        except json.JSONDecodeError as e:
+            await self._fail(job, f"유효하지 않은 JSON 파일입니다: {str(e)}")
+        except Exception as e:
+            await self._fail(job, f"SBOM 통합 중 오류가 발생했습니다: {str(e)}")
+
+    async def _fail(self, job: Job, message: str) -> None:
+        for name in _INPUT_MODELS:
+            await asyncio.to_thread(self.store.delete_blob, job.id, name)
+        try:
+            await self._update(job, status=FAILED, stage="done", error=message)
+        except _JobDeleted:
+            pass
+
+
+def _export(unified_sbom, stats=None) -> CachedResult:
+    """통합 결과를 compact CycloneDX JSON 바이트, 요약, 결과 화면 표 행으로 변환합니다. (stats: 통합 중 기록한 카운터)"""
+    exporter = SBOMExporter(unified_sbom, stats)
+    return CachedResult(
+        document="".join(exporter.iter_json(compact=True)).encode("utf-8"),
+        summary=exporter.get_summary(),
+        filename=exporter.get_filename(),
+        rows=exporter.component_rows(),
+        dependencies=unified_sbom.dependencies
+    )
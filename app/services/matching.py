@@ -0,0 +1,159 @@
+import math
+import re
+from typing import Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+"""
+matching.py
+해당 파일은 컴포넌트 중복 제거를 위한 이름 유사도 매칭 기능을 제공합니다.
+주요기능:
+1. 컴포넌트 이름을 정규화합니다. (소문자화, 경로 접두어 제거, 구분자 통일)
+   예: "PyYAML" / "pyyaml", "typing_extensions" / "typing-extensions"
+2. 정규화된 이름과 버전으로 완전 일치 버킷을 먼저 조회합니다. (O(1))
+   - 버전이 없거나 UNKNOWN인 컴포넌트는 추가/조회하지 않습니다. (이름만 같은 다른 파일이 병합되지 않도록)
+3. 일치하는 버킷이 없으면 n-gram 역색인으로 후보를 좁힌 뒤(blocking) Jaccard 유사도를 계산합니다.
+   - 버전이 같은 컴포넌트끼리만 비교합니다.
+   - 필요한 최소 공통 n-gram 수(ceil(threshold * |A|))에 못 미치는 후보는 유사도 계산 없이 버립니다.
+   - 너무 많은 컴포넌트에 등장하는 n-gram(max_postings 초과)은 후보 생성에 사용하지 않습니다.
+   따라서 모든 쌍을 비교하는 O(n·m) 대신, 조회마다 상수 개수의 후보만 비교하여 거의 선형으로 동작합니다.
+
+[사용 예시]
+index = FuzzyNameIndex(threshold=0.8)
+index.add("PyYAML", "6.0.3", syft_component)
+match = index.find("pyyaml", "v6.0.3")   # -> syft_component
+"""
+
+T = TypeVar("T")
+
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+# 유사도 매칭에서 제외할 (의미 없는) 버전 값
+_UNKNOWN_VERSIONS = frozenset({"", "unknown", "none", "null", "*"})
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """비교용으로 컴포넌트 이름을 정규화합니다."""
+    if not name:
+        return ""
+    name = name.lower().replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+    return _SEPARATORS.sub("-", name).strip("-")
+
+
+def normalize_version(version: Optional[str]) -> str:
+    """비교용으로 버전을 정규화합니다. (앞의 v 접두어 제거, 소문자화)"""
+    if not version:
+        return ""
+    version = version.strip().lower()
+    if version[:1] == "v" and version[1:2].isdigit():
+        version = version[1:]
+    return "" if version in _UNKNOWN_VERSIONS else version
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    """경계 문자(^, $)를 붙인 문자열의 n-gram 집합을 반환합니다."""
+    padded = f"^{text}$"
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class FuzzyNameIndex(Generic[T]):
+    """
+    (정규화 이름, 버전) 완전 일치 버킷과 버전별 n-gram 역색인을 함께 유지하는 매칭 인덱스입니다.
+
+    Args:
+        threshold: 유사도 매칭으로 인정할 최소 Jaccard 유사도 (0~1)
+        ngram: n-gram 길이
+        max_postings: 이보다 많은 항목에 등장하는 n-gram은 후보 생성에서 제외 (흔한 조각으로 인한 후보 폭증 방지)
+        require_same_version: True이면 정규화된 버전이 같은 항목끼리만 유사도 매칭
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        ngram: int = 3,
+        max_postings: int = 256,
+        require_same_version: bool = True,
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold는 0보다 크고 1 이하여야 합니다: {threshold}")
+        self.threshold = threshold
+        self.ngram = ngram
+        self.max_postings = max_postings
+        self.require_same_version = require_same_version
+
+        self._exact: Dict[Tuple[str, str], T] = {}
+        self._entries: List[Tuple[Set[str], T]] = []
+        # 버전 -> n-gram -> 항목 번호 목록
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bucket_key(self, version: str) -> str:
+        """n-gram 역색인 버킷 키를 반환합니다."""
+        return version if self.require_same_version else ""
+
+    def add(self, name: Optional[str], version: Optional[str], item: T) -> None:
+        """
+        항목을 인덱스에 추가합니다. 같은 (정규화 이름, 버전)이 이미 있으면 먼저 추가된 항목을 유지합니다.
+        이름이나 버전이 없으면(UNKNOWN 포함) 추가하지 않습니다.
+        """
+        norm_name = normalize_name(name)
+        norm_version = normalize_version(version)
+        if not norm_name or not norm_version:
+            return
+        self._exact.setdefault((norm_name, norm_version), item)
+
+        bucket_key = self._bucket_key(norm_version)
+        grams = ngrams(norm_name, self.ngram)
+        entry_id = len(self._entries)
+        self._entries.append((grams, item))
+        bucket = self._postings.setdefault(bucket_key, {})
+        for gram in grams:
+            bucket.setdefault(gram, []).append(entry_id)
+
+    def find(self, name: Optional[str], version: Optional[str]) -> Optional[T]:
+        """가장 유사한 항목을 반환합니다. 기준 이상인 항목이 없거나 이름/버전이 없으면 None을 반환합니다."""
+        norm_name = normalize_name(name)
+        norm_version = normalize_version(version)
+        if not norm_name or not norm_version:
+            return None
+
+        exact = self._exact.get((norm_name, norm_version))
+        if exact is not None:
+            return exact
+
+        bucket = self._postings.get(self._bucket_key(norm_version))
+        if not bucket:
+            return None
+
+        grams = ngrams(norm_name, self.ngram)
+        # Jaccard(A, B) >= t 이면 |A ∩ B| >= t * |A ∪ B| >= t * |A|
+        min_overlap = math.ceil(self.threshold * len(grams))
+
+        overlaps: Dict[int, int] = {}
+        for gram in grams:
+            postings = bucket.get(gram)
+            if postings is None:
+                continue
+            if len(postings) > self.max_postings:
+                # 건너뛴 n-gram만큼 공통 개수를 덜 셀 수 있으므로 가지치기 기준을 낮춤
+                min_overlap -= 1
+                continue
+            for entry_id in postings:
+                overlaps[entry_id] = overlaps.get(entry_id, 0) + 1
+
+        best_id = -1
+        best_score = 0.0
+        for entry_id, overlap in overlaps.items():
+            if overlap < min_overlap:
+                continue
+            entry_grams = self._entries[entry_id][0]
+            common = len(grams & entry_grams)
+            score = common / (len(grams) + len(entry_grams) - common)
+            if score < self.threshold:
+                continue
+            # 동점이면 먼저 추가된 항목 우선
+            if score > best_score or (score == best_score and entry_id < best_id):
+                best_id, best_score = entry_id, score
+        return self._entries[best_id][1] if best_id >= 0 else None
@@ -0,0 +1,526 @@
+import dataclasses
+import mmap
+import struct
+import sys
+from array import array
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+from app.models.component_table import ComponentTable, DictionaryColumn
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.models.unified_sbom import UnifiedSbom
+from app.services import codec
+
+"""
+packed.py
+해당 파일은 파싱/통합된 SBOM 모델을 컬럼형 바이너리 파일로 저장하고, mmap으로 다시 여는 기능을 제공합니다.
+보관된 SBOM을 다시 분석할 때 JSON 전체 파싱 + from_json을 반복하지 않기 위한 형식입니다.
+
+주요기능:
+1. UnifiedSbom / SyftSbom / HatbomSbom을 컴포넌트 필드별 열(column)로 나누어 저장합니다.
+    - 문자열 필드(name, version, purl ...) : 유효 비트 + 오프셋 배열 + UTF-8 데이터
+    - 범주형 필드(type, group, 통합본의 source/license) : 사전(dictionary) + 정수 코드 배열
+    - 목록 필드(hashes, licenses, properties, authors) : 행별 compact JSON (필요할 때만 디코딩)
+    - 컴포넌트 외 필드(metadata, dependencies 등) : JSON 블록 하나
+2. 파일을 mmap으로 열고 헤더(열 위치/사전)만 읽으므로, 컴포넌트 수와 무관하게 수 ms 안에 열립니다.
+    - 목록/요약은 필요한 열만 읽습니다. (범주형 집계는 코드 배열만, 이름 목록은 name 열만)
+    - 전체 모델 객체가 필요하면 load()로 복원합니다.
+
+[파일 구조] (little-endian)
+MAGIC(8) | 헤더 길이(u64) | 헤더 JSON | 패딩 | 열 데이터 ... | 문서 JSON 블록
+
+[사용 예시]
+save_packed(unified_sbom, "archive/transformers.usbm")
+
+with PackedSbom.open("archive/transformers.usbm") as packed:
+    print(len(packed), packed.value_counts("type"))
+    names = list(packed.strings("name"))
+    print(packed.summary())            # 통합본 요약 (컴포넌트 행 디코딩 없음)
+    table = packed.to_table()          # 통합본이면 ComponentTable로 바로 변환
+    unified_sbom = packed.load()       # 전체 모델 복원
+"""
+
+MAGIC = b"USBMPK01"
+FORMAT_VERSION = 1
+
+KIND_UNIFIED = "unified"
+KIND_SYFT = "syft"
+KIND_HATBOM = "hatbom"
+
+_DOCUMENT_CLASSES = {
+    KIND_UNIFIED: UnifiedSbom,
+    KIND_SYFT: SyftSbom,
+    KIND_HATBOM: HatbomSbom,
+}
+
+# 사전 인코딩할 범주형 컴포넌트 필드 (나머지 문자열 필드는 일반 문자열 열)
+_DICTIONARY_FIELDS = {
+    KIND_UNIFIED: ("type", "group"),
+    KIND_SYFT: ("type",),
+    KIND_HATBOM: ("type", "group"),
+}
+
+# 통합본에만 저장하는 ComponentTable 파생 열 (열 이름 -> ComponentTable 속성)
+_TABLE_COLUMNS = {"table.type": "type", "table.source": "source", "table.license": "license"}
+
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGN = 8
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+# value_counts에서 코드별 bytes.count로 집계할 최대 고유값 수
+_COUNT_SCAN_LIMIT = 32
+
+
+class PackedFormatError(ValueError):
+    """packed 파일 형식이 올바르지 않거나 지원하지 않는 버전인 경우 발생합니다."""
+
+
+# --- 모델 <-> 기본 타입 변환 ---
+
+@lru_cache(maxsize=None)
+def _type_hints(cls) -> Dict[str, Any]:
+    return get_type_hints(cls)
+
+
+def _from_plain(tp: Any, value: Any) -> Any:
+    """dataclasses.asdict() 결과(기본 타입)를 타입 힌트에 맞는 모델 객체로 되돌립니다."""
+    if value is None:
+        return None
+    if dataclasses.is_dataclass(tp) and isinstance(value, dict):
+        hints = _type_hints(tp)
+        return tp(**{
+            f.name: _from_plain(hints[f.name], value[f.name])
+            for f in dataclasses.fields(tp) if f.name in value
+        })
+    origin = get_origin(tp)
+    if origin in (list, List) and isinstance(value, list):
+        (item_type,) = get_args(tp) or (Any,)
+        return [_from_plain(item_type, item) for item in value]
+    if origin is Union:
+        for arg in get_args(tp):
+            if dataclasses.is_dataclass(arg) and isinstance(value, dict):
+                return _from_plain(arg, value)
+    return value
+
+
+def _kind_of(sbom: Any) -> str:
+    for kind, cls in _DOCUMENT_CLASSES.items():
+        if isinstance(sbom, cls):
+            return kind
+    raise TypeError(f"packed 형식으로 저장할 수 없는 객체입니다: {type(sbom).__name__}")
+
+
+def _component_class(kind: str):
+    return get_args(_type_hints(_DOCUMENT_CLASSES[kind])["components"])[0]
+
+
+@lru_cache(maxsize=None)
+def _column_layout(kind: str) -> Dict[str, str]:
+    """컴포넌트 필드별 열 종류(str / dict / json)를 반환합니다."""
+    hints = _type_hints(_component_class(kind))
+    layout = {}
+    for f in dataclasses.fields(_component_class(kind)):
+        if f.name in _DICTIONARY_FIELDS[kind]:
+            layout[f.name] = "dict"
+        elif get_origin(hints[f.name]) in (list, List):
+            layout[f.name] = "json"
+        else:
+            layout[f.name] = "str"
+    return layout
+
+
+# --- 저장 ---
+
+def _codes_array(codes) -> array:
+    """사전 코드 배열 (고유값 256개 이하면 1바이트, 아니면 4바이트)"""
+    return array("B", codes) if isinstance(codes, (bytes, bytearray)) else array("I", codes)
+
+
+def _encode_strings(values: List[Optional[str]]) -> bytes:
+    """유효 비트(행당 1바이트) + 오프셋(u64) + UTF-8 데이터로 인코딩합니다."""
+    validity = bytearray(len(values))
+    offsets = array("Q", [0])
+    data = bytearray()
+    for i, value in enumerate(values):
+        if value is not None:
+            validity[i] = 1
+            data += value.encode("utf-8")
+        offsets.append(len(data))
+    return _pad(bytes(validity)) + _to_little(offsets) + bytes(data)
+
+
+def _to_little(values: array) -> bytes:
+    if not _NATIVE_LITTLE:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % _ALIGN)
+
+
+def save_packed(sbom: Union[UnifiedSbom, SyftSbom, HatbomSbom], output_path: Union[str, Path]) -> str:
+    """
+    SBOM 모델을 packed 바이너리 파일로 저장하고 절대 경로를 반환합니다.
+    """
+    kind = _kind_of(sbom)
+    components = sbom.components
+    layout = _column_layout(kind)
+
+    blocks: List[Tuple[str, bytes]] = []
+    columns: Dict[str, Dict[str, Any]] = {}
+
+    def add_block(name: str, info: Dict[str, Any], data: bytes) -> None:
+        info["length"] = len(data)
+        columns[name] = info
+        blocks.append((name, _pad(data)))
+
+    for name, column_kind in layout.items():
+        if column_kind == "dict":
+            column = DictionaryColumn(getattr(comp, name) for comp in components)
+            codes = _codes_array(column.codes)
+            add_block(name, {"kind": "dict", "dictionary": column.dictionary, "itemsize": codes.itemsize},
+                      _to_little(codes))
+        elif column_kind == "json":
+            values = [
+                codec.dumps_compact([dataclasses.asdict(v) if dataclasses.is_dataclass(v) else v
+                                     for v in getattr(comp, name)]).decode("utf-8")
+                for comp in components
+            ]
+            add_block(name, {"kind": "json"}, _encode_strings(values))
+        else:
+            add_block(name, {"kind": "str"}, _encode_strings([getattr(comp, name) for comp in components]))
+
+    if kind == KIND_UNIFIED:
+        # 요약/필터용 ComponentTable 열을 미리 계산해 둠 (재로딩 시 행 단위 계산 없이 테이블 복원)
+        table = ComponentTable.from_components(components)
+        for name, attr in _TABLE_COLUMNS.items():
+            column = getattr(table, attr)
+            codes = _codes_array(column.codes)
+            add_block(name, {"kind": "dict", "dictionary": [list(v) if isinstance(v, tuple) else v
+                                                            for v in column.dictionary],
+                             "itemsize": codes.itemsize, "tuple": attr == "source"}, _to_little(codes))
+        add_block("table.integrated", {"kind": "flags"}, bytes(table.integrated))
+
+    document = {
+        f.name: getattr(sbom, f.name) for f in dataclasses.fields(sbom) if f.name != "components"
+    }
+    document_bytes = codec.dumps_compact(_plain(document))
+
+    # 헤더 길이를 알아야 오프셋이 정해지므로, 오프셋을 상대값으로 기록
+    offset = 0
+    for name, data in blocks:
+        columns[name]["offset"] = offset
+        offset += len(data)
+    header = codec.dumps_compact({
+        "version": FORMAT_VERSION,
+        "kind": kind,
+        "rows": len(components),
+        "dependencies": len(sbom.dependencies),
+        "columns": columns,
+        "document": {"offset": offset, "length": len(document_bytes)},
+    })
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(_pad(header))
+        for _, data in blocks:
+            f.write(data)
+        f.write(document_bytes)
+
+    print(f"[INFO] packed SBOM이 저장되었습니다: {path.absolute()}")
+    return str(path.absolute())
+
+
+def _plain(value: Any) -> Any:
+    """모델 객체(dataclass)를 JSON으로 인코딩할 수 있는 기본 타입으로 변환합니다."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+# --- 읽기 ---
+
+class StringColumn:
+    """mmap 위의 문자열 열입니다. 행을 읽을 때만 해당 바이트를 디코딩합니다."""
+    __slots__ = ("_buffer", "_validity", "_offsets", "_data_start", "_rows")
+
+    def __init__(self, buffer: memoryview, rows: int):
+        self._buffer = buffer
+        self._rows = rows
+        self._validity = buffer[:rows]
+        offsets_start = rows + (-rows % _ALIGN)
+        self._offsets = _read_array(buffer[offsets_start:offsets_start + (rows + 1) * 8], "Q")
+        self._data_start = offsets_start + (rows + 1) * 8
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if not self._validity[row]:
+            return None
+        start = self._data_start + self._offsets[row]
+        end = self._data_start + self._offsets[row + 1]
+        return str(self._buffer[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[row] for row in range(self._rows))
+
+    def release(self) -> None:
+        """mmap을 참조하는 memoryview를 해제합니다. (이후 행을 읽을 수 없음)"""
+        for view in (self._offsets, self._validity, self._buffer):
+            if isinstance(view, memoryview):
+                view.release()
+
+
+class PackedDictionaryColumn:
+    """mmap 위의 사전 인코딩 열입니다. 집계/필터는 코드 배열만 사용합니다."""
+    __slots__ = ("dictionary", "codes")
+
+    def __init__(self, dictionary: List[Any], codes):
+        self.dictionary = dictionary
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.dictionary[self.codes[row]]
+
+    def __iter__(self) -> Iterator[Any]:
+        dictionary = self.dictionary
+        return (dictionary[code] for code in self.codes)
+
+    def value_counts(self) -> Dict[Any, int]:
+        dictionary = self.dictionary
+        if self.codes.itemsize == 1 and len(dictionary) <= _COUNT_SCAN_LIMIT:
+            # 고유값이 적으면 코드별 bytes.count(C 구현)가 Counter보다 빠름
+            data = self.codes.tobytes()
+            counts = ((code, data.count(code)) for code in range(len(dictionary)))
+            return {dictionary[code]: count for code, count in counts if count}
+        return {dictionary[code]: count for code, count in Counter(self.codes).items()}
+
+    def release(self) -> None:
+        """mmap을 참조하는 코드 배열(memoryview)을 해제합니다. (이후 행을 읽을 수 없음)"""
+        if isinstance(self.codes, memoryview):
+            self.codes.release()
+
+    def to_dictionary_column(self) -> DictionaryColumn:
+        """ComponentTable에서 사용하는 DictionaryColumn으로 변환합니다. (코드 배열 복사만 수행)"""
+        column = DictionaryColumn()
+        column.dictionary = list(self.dictionary)
+        column._lookup = {value: code for code, value in enumerate(column.dictionary)}
+        column.codes = bytearray(self.codes) if self.codes.itemsize == 1 else array("I", self.codes)
+        return column
+
+
+def _read_array(buffer: memoryview, typecode: str):
+    """little-endian 정수 배열을 읽습니다. (리틀 엔디언 환경에서는 복사 없이 mmap을 그대로 사용)"""
+    if _NATIVE_LITTLE:
+        return buffer.cast(typecode)
+    values = array(typecode, buffer.tobytes())
+    values.byteswap()
+    return values
+
+
+class PackedSbom:
+    """
+    packed 바이너리 SBOM 파일을 mmap으로 연 읽기 전용 뷰입니다.
+    열기 비용은 헤더 크기에만 비례하며, 열은 접근할 때 한 번만 구성합니다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # 빈 파일
+            self._file.close()
+            raise PackedFormatError(f"packed SBOM 파일이 아닙니다: {self.path}") from e
+        self._view = memoryview(self._mmap)
+        self._columns: Dict[str, Any] = {}
+        self._document: Optional[Dict[str, Any]] = None
+
+        if bytes(self._view[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise PackedFormatError(f"packed SBOM 파일이 아닙니다: {self.path}")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._view, len(MAGIC))
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        self.header = codec.loads(bytes(self._view[header_start:header_start + header_length]))
+        if self.header.get("version") != FORMAT_VERSION:
+            self.close()
+            raise PackedFormatError(f"지원하지 않는 packed 형식 버전입니다: {self.header.get('version')}")
+        self._data_start = header_start + header_length + (-header_length % _ALIGN)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "PackedSbom":
+        return cls(path)
+
+    def close(self) -> None:
+        """
+        mmap과 파일을 닫습니다. (이후 열 객체는 사용할 수 없음)
+        호출 측이 열을 아직 참조하고 있어도 닫을 수 있도록, 열이 mmap에서 만든 memoryview를 먼저 해제합니다.
+        """
+        try:
+            for column in self._columns.values():
+                column.release()
+            self._columns.clear()
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+                self._view = None
+            if getattr(self, "_mmap", None) is not None:
+                self._mmap.close()
+                self._mmap = None
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "PackedSbom":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def kind(self) -> str:
+        """저장된 모델 종류 (unified / syft / hatbom)"""
+        return self.header["kind"]
+
+    def __len__(self) -> int:
+        return self.header["rows"]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.header["columns"])
+
+    def _block(self, info: Dict[str, Any]) -> memoryview:
+        start = self._data_start + info["offset"]
+        return self._view[start:start + info["length"]]
+
+    def column(self, name: str) -> Union[StringColumn, PackedDictionaryColumn, memoryview]:
+        """열을 반환합니다. (문자열/JSON 열 -> StringColumn, 범주형 열 -> PackedDictionaryColumn)"""
+        column = self._columns.get(name)
+        if column is not None:
+            return column
+        info = self.header["columns"].get(name)
+        if info is None:
+            raise KeyError(f"packed SBOM에 없는 열입니다: {name}")
+        block = self._block(info)
+        if info["kind"] == "dict":
+            dictionary = info["dictionary"]
+            if info.get("tuple"):
+                dictionary = [tuple(v) for v in dictionary]
+            column = PackedDictionaryColumn(dictionary, _read_array(block, "B" if info["itemsize"] == 1 else "I"))
+        elif info["kind"] == "flags":
+            column = block
+        else:
+            column = StringColumn(block, len(self))
+        self._columns[name] = column
+        return column
+
+    def strings(self, name: str) -> StringColumn:
+        """문자열 열을 반환합니다. (예: strings("name"))"""
+        return self.column(name)
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """범주형 열의 값별 행 수를 반환합니다. (코드 배열만 집계)"""
+        return self.column(name).value_counts()
+
+    @property
+    def document(self) -> Dict[str, Any]:
+        """컴포넌트 외 필드(metadata, dependencies 등)를 반환합니다. (최초 접근 시 디코딩)"""
+        if self._document is None:
+            self._document = codec.loads(bytes(self._block(self.header["document"])))
+        return self._document
+
+    # --- 모델 복원 ---
+
+    def component(self, row: int):
+        """한 행을 컴포넌트 모델 객체로 복원합니다."""
+        return next(self.iter_components(row, row + 1))
+
+    def iter_components(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Any]:
+        """[start, stop) 범위의 행을 컴포넌트 모델 객체로 복원하며 생성합니다."""
+        component_cls = _component_class(self.kind)
+        hints = _type_hints(component_cls)
+        readers = []
+        for name, column_kind in _column_layout(self.kind).items():
+            column = self.column(name)
+            if column_kind == "json":
+                readers.append((name, column, hints[name]))
+            else:
+                readers.append((name, column, None))
+        loads = codec.loads
+        for row in range(start, len(self) if stop is None else stop):
+            values = {}
+            for name, column, hint in readers:
+                value = column[row]
+                values[name] = value if hint is None else _from_plain(hint, loads(value))
+            yield component_cls(**values)
+
+    def load(self) -> Union[UnifiedSbom, SyftSbom, HatbomSbom]:
+        """전체 모델(UnifiedSbom / SyftSbom / HatbomSbom)을 복원합니다."""
+        document_cls = _DOCUMENT_CLASSES[self.kind]
+        sbom = _from_plain(document_cls, {**self.document, "components": []})
+        sbom.components = list(self.iter_components())
+        return sbom
+
+    def to_table(self) -> ComponentTable:
+        """
+        통합본을 ComponentTable로 복원합니다.
+        범주형 열은 저장된 사전/코드를 그대로 사용하므로 컴포넌트별 JSON 디코딩이 없습니다.
+        """
+        if self.kind != KIND_UNIFIED:
+            raise PackedFormatError("ComponentTable은 통합본(unified) packed 파일에서만 복원할 수 있습니다.")
+        table = ComponentTable()
+        table.name = list(self.strings("name"))
+        table.version = list(self.strings("version"))
+        table.purl = list(self.strings("purl"))
+        for name, attr in _TABLE_COLUMNS.items():
+            setattr(table, attr, self.column(name).to_dictionary_column())
+        table.integrated = bytearray(self.column("table.integrated"))
+        return table
+
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        통합본의 요약 정보를 반환합니다. (SBOMExporter.get_summary()와 같은 형식)
+        사전 인코딩 열과 문서 블록만 읽으며 컴포넌트 행은 디코딩하지 않습니다.
+        """
+        if self.kind != KIND_UNIFIED:
+            raise PackedFormatError("요약 정보는 통합본(unified) packed 파일에서만 계산할 수 있습니다.")
+        source_counts: Dict[str, int] = {}
+        for sources, count in self.value_counts("table.source").items():
+            for tool in set(sources):
+                source_counts[tool] = source_counts.get(tool, 0) + count
+        document = self.document
+        metadata = document.get("metadata") or {}
+        component = metadata.get("component") or {}
+        return {
+            "bom_format": document.get("bom_format"),
+            "spec_version": document.get("spec_version"),
+            "serial_number": document.get("serial_number"),
+            "timestamp": metadata.get("timestamp") if metadata else None,
+            "total_components": len(self),
+            "total_dependencies": self.header["dependencies"],
+            "components_from_syft": source_counts.get("Syft", 0),
+            "components_from_hatbom": source_counts.get("Hatbom", 0),
+            "integrated_components": bytes(self.column("table.integrated")).count(1),
+            "metadata_component": component.get("name") if metadata and component else None,
+        }
+
+
+def load_packed(path: Union[str, Path]) -> Union[UnifiedSbom, SyftSbom, HatbomSbom]:
+    """packed 파일에서 전체 모델을 복원합니다."""
+    with PackedSbom.open(path) as packed:
+        return packed.load()
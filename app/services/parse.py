@@ -1,8 +1,18 @@
 import os
 import json
-from typing import Any, Dict, Optional, Union, List
+import re
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Optional, Union, List, Tuple
 from app.models.hatbom_sbom import HatbomSbom
+from app.models.interning import intern_author
 from app.models.syft_sbom import SyftSbom
+from app.models.unified_sbom import UnifiedAuthor
+from app.services import codec
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.detect import (
+    CYCLONEDX, HATBOM, MAX_SNIFF_SIZE, SNIFF_SIZE, SYFT, UNKNOWN,
+    check_supported, classify_header, detect_format, model_for, sniff, sniff_path,
+)
 import email.utils
 
 """
@@ -11,6 +21,15 @@ parse.py
 주요기능:
 1. Hatbom, Syft 형식으로 작성된 JSON 데이터를 파싱합니다. (SBOM이 가지는 필드에 해당 값을 객체에 저장)
 2. 파싱된 데이터를 임시 저장합니다.
+3. 대용량 파일은 스트리밍 모드로 청크 단위 파싱합니다. (stream.py 참고)
+   - 도구 형식은 본문을 디코딩하기 전에 앞부분만 읽어 판별합니다. (detect.py 참고, SPDX는 UnsupportedFormatError)
+   - .json.gz / .json.zst 처럼 압축된 파일은 스트리밍으로 압축을 풀며 파싱합니다. (compression.py 참고)
+4. msgspec이 설치되어 있으면 Struct 모델로 바이트를 한 번에 디코딩할 수 있습니다. (struct_sbom.py 참고)
+5. author 문자열을 name/email로 파싱합니다.
+   - 같은 관리자가 수백 개 패키지에 반복 등장하므로 파싱 결과를 크기 제한이 있는 LRU 캐시에 보관합니다.
+   - 흔한 "Name <email>"(쉼표로 여러 명) 형태는 정규식으로 바로 나누고, 나머지만 email.utils.getaddresses로 처리합니다.
+     (빠른 경로의 결과는 getaddresses와 같음)
+   - parse_authors()는 같은 저자에 대해 공유 UnifiedAuthor 객체를 반환합니다. (interning.intern_author)
 
 [사용 예시]
 if __name__ == "__main__":
@@ -21,6 +40,12 @@ if __name__ == "__main__":
     
     # 예: Hatbom 파일 파싱
     # hat_obj = parser.parse("hatbom_input.json")
+
+    # 예: 대용량 파일 스트리밍 파싱
+    # sy_obj = parser.parse("huge_syft_sbom.json", streaming=True)
+
+    # 예: msgspec Struct 모델로 한 번에 디코딩 (msgspec 설치 필요)
+    # sy_obj = parser.parse("transformers_syft_sbom.json", typed=True)
 """
 
 class SBOMParser:
@@ -28,47 +53,164 @@ class SBOMParser:
         # 파싱된 데이터를 임시 저장하는 공간
         self.parsed_data: Optional[Union[HatbomSbom, SyftSbom]] = None
 
-    def parse(self, file_path: str) -> Union[HatbomSbom, SyftSbom]:
+    def parse(self, file_path: str, streaming: bool = False, typed: bool = False) -> Union[HatbomSbom, SyftSbom]:
         """
         JSON 파일을 읽어 도구 형식을 판별하고 객체로 변환합니다.
+
+        Args:
+            file_path: SBOM JSON 파일 경로
+            streaming: True이면 파일 전체를 로드하지 않고 청크 단위로 파싱합니다.
+            typed: True이면 msgspec Struct 모델로 한 번에 디코딩합니다. (streaming과 함께 사용 불가)
+
+        Raises:
+            ValueError: streaming과 typed를 함께 지정한 경우
         """
+        if streaming and typed:
+            raise ValueError("streaming과 typed는 함께 사용할 수 없습니다.")
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            fp = open_decompressed(f, encoding_hint(file_path))
+            if streaming:
+                return self.parse_stream(fp, source=file_path)
+            return self.parse_bytes(fp.read(), source=file_path, typed=typed)
+
+    def parse_bytes(self, raw: bytes, source: str = "<bytes>", typed: bool = False) -> Union[HatbomSbom, SyftSbom]:
+        """
+        JSON 바이트를 도구 형식을 판별한 뒤 객체로 변환합니다.
+
+        Args:
+            raw: SBOM JSON 바이트
+            source: 로그에 표시할 출처 (파일명 등)
+            typed: True이면 msgspec Struct 모델(struct_sbom.py)로 한 번에 디코딩합니다. (msgspec 필요)
+
+        Raises:
+            json.JSONDecodeError: 유효하지 않은 JSON인 경우
+        """
+        if typed:
+            return self._parse_typed(raw, source)
 
-        # 도구 형식 판별 로직
-        if self._is_syft(data):
-            print(f"[INFO] Syft 형식의 SBOM을 파싱합니다: {file_path}")
-            self.parsed_data = SyftSbom.from_json(data)
-        else:
-            print(f"[INFO] Hatbom 형식의 SBOM을 파싱합니다: {file_path}")
-            self.parsed_data = HatbomSbom.from_json(data)
+        try:
+            data = codec.loads(raw)
+        except json.JSONDecodeError as e:
+            # JSON이 아닌 SPDX(tag-value)는 지원하지 않는 형식으로 보고
+            check_supported(detect_format(raw[:SNIFF_SIZE]))
+            raise
+
+        # 문서 전체를 디코딩했으므로 (키 순서와 무관하게) 최상위 필드 전체로 형식 판별
+        fmt = classify_header(data) if isinstance(data, dict) else UNKNOWN
+        model = model_for(fmt)
+        print(f"[INFO] {_format_label(fmt)} 형식의 SBOM을 파싱합니다: {source}")
+        self.parsed_data = model.from_json(data)
+
+        return self.parsed_data
+
+    def _parse_typed(self, raw: bytes, source: str):
+        """
+        msgspec Struct 모델로 디코딩합니다.
+        SPDX는 앞부분으로 거부하고, 도구 형식은 판별용 헤더($schema, metadata.tools)만 문서 전체에서 디코딩하여
+        (나머지는 객체 생성 없이 건너뜀) 판별한 뒤, 판별된 스키마로 원본 바이트를 한 번에 타입 객체로 변환합니다.
+        """
+        import msgspec
+        from app.models import struct_sbom
+
+        check_supported(detect_format(raw[:MAX_SNIFF_SIZE], complete=len(raw) <= MAX_SNIFF_SIZE))
+        try:
+            header = struct_sbom.FormatHeader.from_bytes(raw).to_dict()
+            fmt = SYFT if self._is_syft(header) else HATBOM
+            model = struct_sbom.SyftSbom if fmt == SYFT else struct_sbom.HatbomSbom
+            print(f"[INFO] {_format_label(fmt)} 형식의 SBOM을 파싱합니다: {source}")
+            self.parsed_data = model.from_bytes(raw)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
 
         return self.parsed_data
 
+    def parse_stream(self, fp: BinaryIO, source: str = "<stream>") -> Union[HatbomSbom, SyftSbom]:
+        """
+        파일 객체(업로드 스트림 포함)를 청크 단위로 읽어 도구 형식을 판별하고 객체로 변환합니다.
+        형식 판별은 스트림 앞부분(detect.sniff, 기본 4KB)의 최상위 필드($schema, metadata)로 수행하고,
+        읽은 앞부분은 다시 돌려주므로 본문은 처음부터 그대로 파싱합니다.
+        """
+        fmt, fp = sniff(fp)
+        model = model_for(fmt)
+        print(f"[INFO] {_format_label(fmt)} 형식의 SBOM을 스트리밍 파싱합니다: {source}")
+        self.parsed_data = model.from_stream(fp)
+
+        return self.parsed_data
+
+    def detect(self, file_path: str) -> str:
+        """파일 앞부분만 읽어 형식(Syft, Hatbom, CycloneDX, SPDX, Unknown)을 반환합니다."""
+        return sniff_path(file_path)
+
     def _is_syft(self, data: Dict[str, Any]) -> bool:
         """
         Syft으로 생성된 SBOM인지 확인합니다.
         (Syft은 보통 $schema 필드를 가지거나 metadata.tools.components에 syft 정보가 있음)
         """
-        if "$schema" in data and "cyclonedx" in data["$schema"].lower():
-            # Syft 특유의 metadata 구조 확인
-            metadata = data.get("metadata", {})
-            tools = metadata.get("tools", {})
-            # CycloneDX 1.5+ (Syft 1.40+) 구조 확인
-            if isinstance(tools, dict) and "components" in tools:
-                for tool in tools["components"]:
-                    if tool.get("name") == "syft":
-                        return True
-        return False
+        return classify_header(data) == SYFT
 
     def get_temporary_data(self) -> Optional[Union[HatbomSbom, SyftSbom]]:
         """임시 저장된 파싱 데이터를 반환합니다."""
         return self.parsed_data
 
 
+def _format_label(fmt: str) -> str:
+    """로그에 표시할 형식 이름 (Hatbom 모델로 파싱하는 형식은 함께 표시)"""
+    if fmt in (CYCLONEDX, UNKNOWN):
+        return f"{fmt}(Hatbom 모델)"
+    return fmt
+
+
+# author 문자열 파싱 결과 캐시 크기
+AUTHOR_CACHE_SIZE = 4096
+
+# 빠른 경로: 특수 문자가 없는 이름 + <local@domain> (getaddresses와 결과가 같은 형태만 허용)
+_AUTHOR_PART = re.compile(
+    r"[ \t]*(?:(\w[\w.'\- \t]*?)[ \t]*)?<([\w+\-]+(?:\.[\w+\-]+)*@[\w\-]+(?:\.[\w\-]+)*)>[ \t]*"
+)
+_WHITESPACE = re.compile(r"[ \t]+")
+
+
+def _split_addresses(author_string: str) -> Optional[List[Tuple[str, str]]]:
+    """"Name <email>, ..." 형태이면 (name, email) 목록을, 아니면 None을 반환합니다."""
+    addresses = []
+    for part in author_string.split(","):
+        match = _AUTHOR_PART.fullmatch(part)
+        if match is None:
+            return None
+        name, email_addr = match.groups()
+        addresses.append((_WHITESPACE.sub(" ", name) if name else "", email_addr))
+    return addresses
+
+
+@lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def _parse_author_pairs(author_string: str) -> Tuple[Tuple[Optional[str], Optional[str]], ...]:
+    """author 문자열을 (name, email) 튜플로 파싱합니다. (캐시된 결과를 공유하므로 불변 튜플로 반환)"""
+    parsed_addresses = _split_addresses(author_string)
+    if parsed_addresses is None:
+        # email.utils.getaddresses()는 쉼표로 구분된 여러 주소를 파싱할 수 있음
+        # 리스트로 감싸서 전달해야 함
+        parsed_addresses = email.utils.getaddresses([author_string])
+
+    authors = []
+    for name, email_addr in parsed_addresses:
+        # 이름과 이메일이 모두 비어있으면 건너뜀
+        if not name and not email_addr:
+            continue
+
+        # 이메일 주소에 @가 없으면 이름으로 처리 ("anchore" 같은 단순 문자열)
+        if email_addr and '@' not in email_addr:
+            # email_addr에 저장된 값이 실제로는 이름임
+            if not name:
+                name = email_addr
+            email_addr = None
+
+        authors.append((name if name else None, email_addr if email_addr else None))
+    return tuple(authors)
+
+
 def parse_author_string(author_string: str) -> List[Dict[str, Optional[str]]]:
     """
     단일 또는 여러 명의 저자가 포함된 author 문자열을 파싱합니다.
@@ -82,27 +224,14 @@ def parse_author_string(author_string: str) -> List[Dict[str, Optional[str]]]:
     """
     if not author_string or not author_string.strip():
         return []
-    
-    # email.utils.getaddresses()는 쉼표로 구분된 여러 주소를 파싱할 수 있음
-    # 리스트로 감싸서 전달해야 함
-    parsed_addresses = email.utils.getaddresses([author_string])
-    
-    authors = []
-    for name, email_addr in parsed_addresses:
-        # 이름과 이메일이 모두 비어있으면 건너뜀
-        if not name and not email_addr:
-            continue
-        
-        # 이메일 주소에 @가 없으면 이름으로 처리 ("anchore" 같은 단순 문자열)
-        if email_addr and '@' not in email_addr:
-            # email_addr에 저장된 값이 실제로는 이름임
-            if not name:
-                name = email_addr
-            email_addr = None
-            
-        authors.append({
-            "name": name if name else None,
-            "email": email_addr if email_addr else None
-        })
-    
-    return authors
\ No newline at end of file
+    return [{"name": name, "email": email_addr} for name, email_addr in _parse_author_pairs(author_string)]
+
+
+def parse_authors(author_string: Optional[str]) -> List[UnifiedAuthor]:
+    """
+    author 문자열을 UnifiedAuthor 목록으로 파싱합니다.
+    같은 (name, email) 저자는 같은 객체를 공유하므로 반환된 UnifiedAuthor를 수정하지 마세요. (목록은 새로 만듦)
+    """
+    if not author_string or not author_string.strip():
+        return []
+    return [intern_author(name, email_addr) for name, email_addr in _parse_author_pairs(author_string)]
@@ -0,0 +1,154 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import quote, unquote
+
+"""
+purl.py
+해당 파일은 Package URL(PURL) 파싱 및 정규화(canonicalization) 기능을 제공합니다.
+주요기능:
+1. PURL 문자열을 구성 요소(type, namespace, name, version, qualifiers, subpath)로 파싱합니다.
+2. 같은 패키지를 가리키지만 표기가 조금 다른 PURL을 하나의 정규 문자열로 맞춥니다.
+    - scheme/type 소문자화, qualifier 키 소문자화 및 키 순서 정렬, 값이 빈 qualifier 제거
+    - 퍼센트 인코딩 통일 (디코딩 후 동일한 규칙으로 다시 인코딩)
+    - 타입별 규칙: pypi 이름 소문자화 및 '_', '.' -> '-', github/bitbucket 등 namespace/name 소문자화
+    - subpath의 빈 세그먼트, '.', '..' 제거
+3. 통합 루프에서 같은 PURL이 반복 등장하므로 파싱 결과를 LRU 캐시에 보관합니다.
+
+[사용 예시]
+canonical_purl("pkg:PyPI/Typing_Extensions@4.12.2?b=2&a=1")
+# -> "pkg:pypi/typing-extensions@4.12.2?a=1&b=2"
+parse_purl("pkg:github/Actions/Checkout@v4").coordinates
+# -> ("github", "actions", "checkout", "v4")
+"""
+
+# 파싱 결과 캐시 크기 (대형 SBOM의 고유 PURL 수를 충분히 수용)
+PURL_CACHE_SIZE = 65536
+
+# namespace/name 대소문자를 구분하지 않는 타입
+_CASE_INSENSITIVE_TYPES = frozenset({"bitbucket", "composer", "github", "hex", "pypi"})
+
+_PYPI_SEPARATORS = re.compile(r"[-_.]+")
+
+# 세그먼트 인코딩 시 그대로 둘 문자 (PURL 명세의 unreserved 문자 + ':')
+_SAFE = ":"
+
+
+@dataclass(frozen=True, slots=True)
+class PackageURL:
+    type: str
+    name: str
+    namespace: Optional[str] = None
+    version: Optional[str] = None
+    qualifiers: Tuple[Tuple[str, str], ...] = ()
+    subpath: Optional[str] = None
+
+    @property
+    def coordinates(self) -> Tuple[str, Optional[str], str, Optional[str]]:
+        """(type, namespace, name, version) 조회 키를 반환합니다."""
+        return (self.type, self.namespace, self.name, self.version)
+
+    def to_string(self) -> str:
+        """정규화된 PURL 문자열을 반환합니다."""
+        parts = ["pkg:", self.type, "/"]
+        if self.namespace:
+            parts.append("/".join(quote(seg, safe=_SAFE) for seg in self.namespace.split("/")))
+            parts.append("/")
+        parts.append(quote(self.name, safe=_SAFE))
+        if self.version:
+            parts.append("@")
+            parts.append(quote(self.version, safe=_SAFE))
+        if self.qualifiers:
+            parts.append("?")
+            parts.append("&".join(f"{k}={quote(v, safe=_SAFE + '/')}" for k, v in self.qualifiers))
+        if self.subpath:
+            parts.append("#")
+            parts.append("/".join(quote(seg, safe=_SAFE) for seg in self.subpath.split("/")))
+        return "".join(parts)
+
+
+def _normalize_name(purl_type: str, namespace: Optional[str], name: str) -> Tuple[Optional[str], str]:
+    """타입별 규칙에 따라 namespace와 name을 정규화합니다."""
+    if purl_type in _CASE_INSENSITIVE_TYPES:
+        namespace = namespace.lower() if namespace else namespace
+        name = name.lower()
+    if purl_type == "pypi":
+        name = _PYPI_SEPARATORS.sub("-", name)
+    return namespace, name
+
+
+def _clean_segments(path: str, drop_dots: bool = False) -> list:
+    """'/'로 구분된 경로를 디코딩된 세그먼트 목록으로 바꾸고, 빈 세그먼트(및 '.', '..')를 제거합니다."""
+    segments = [unquote(seg) for seg in path.split("/")]
+    if drop_dots:
+        return [seg for seg in segments if seg not in ("", ".", "..")]
+    return [seg for seg in segments if seg]
+
+
+@lru_cache(maxsize=PURL_CACHE_SIZE)
+def parse_purl(purl: Optional[str]) -> Optional[PackageURL]:
+    """
+    PURL 문자열을 정규화된 PackageURL 객체로 파싱합니다.
+    PURL 형식이 아니거나 필수 요소(type, name)가 없으면 None을 반환합니다.
+    """
+    if not purl:
+        return None
+    remainder = purl.strip()
+    scheme, sep, remainder = remainder.partition(":")
+    if not sep or scheme.lower() != "pkg":
+        return None
+
+    # 1. subpath (#...)
+    remainder, _, subpath = remainder.partition("#")
+    subpath_segments = _clean_segments(subpath, drop_dots=True)
+
+    # 2. qualifiers (?k=v&...)
+    remainder, _, query = remainder.partition("?")
+    qualifiers = {}
+    for pair in query.split("&"):
+        key, eq, value = pair.partition("=")
+        value = unquote(value)
+        if eq and key and value:
+            qualifiers[key.lower()] = value
+
+    # 3. type/namespace/name@version
+    remainder = remainder.strip("/")
+    purl_type, sep, path = remainder.partition("/")
+    if not sep or not purl_type:
+        return None
+    # version은 마지막 세그먼트의 '@' 뒤 (npm scope의 '@'와 구분)
+    head, slash, last = path.rpartition("/")
+    if "@" in last:
+        last, _, version = last.rpartition("@")
+    else:
+        version = ""
+    segments = _clean_segments(head + slash + last)
+    if not segments:
+        return None
+
+    purl_type = purl_type.lower()
+    name = segments[-1]
+    namespace = "/".join(segments[:-1]) or None
+    namespace, name = _normalize_name(purl_type, namespace, name)
+
+    return PackageURL(
+        type=purl_type,
+        namespace=namespace,
+        name=name,
+        version=unquote(version) or None,
+        qualifiers=tuple(sorted(qualifiers.items())),
+        subpath="/".join(subpath_segments) or None,
+    )
+
+
+@lru_cache(maxsize=PURL_CACHE_SIZE)
+def canonical_purl(purl: Optional[str]) -> Optional[str]:
+    """
+    PURL을 정규 문자열로 변환합니다.
+    파싱할 수 없는 값은 (비교 키로 쓸 수 있도록) 원본 문자열을 그대로 반환합니다.
+    """
+    parsed = parse_purl(purl)
+    if parsed is None:
+        return purl
+    return parsed.to_string()
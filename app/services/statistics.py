@@ -0,0 +1,250 @@
+import argparse
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Pattern
+
+from app.services import codec
+from app.services.compression import encoding_hint, open_decompressed
+from app.services.stream import ITEM, iter_json_events
+
+"""
+statistics.py
+해당 파일은 단일 SBOM(Syft/Hatbom CycloneDX JSON)의 분석 통계를 계산하는 기능을 제공합니다.
+/analyze-single 화면과 CLI에서 같은 코드를 사용합니다.
+
+주요기능:
+1. 업로드 스트림을 components/dependencies 원소 단위로 읽으며 모든 지표를 한 번의 순회로 계산합니다.
+    - 패키지 목록, CI/CD 관련 여부, 해시/홈페이지/VCS 보유 수, 의존성 관계 통계
+    - 라이선스/타입 값은 열(list)로 모아 두고 마지막에 Counter로 한 번에 집계합니다.
+2. CI/CD 키워드는 하나의 정규식(alternation)으로 미리 컴파일하여 이름마다 한 번만 검색합니다.
+3. 도구 이름/버전, 생성 시간, 대상 프로젝트 등 메타데이터 정보를 추출합니다.
+
+[사용 예시]
+with open("data/transformers_syft_sbom.json", "rb") as f:
+    analysis = analyze_stream(f, "transformers_syft_sbom.json")
+print(analysis.result["total_packages"], analysis.result["license_stats"])
+
+[CLI]
+python -m app.services.statistics data/transformers_syft_sbom.json [--packages]
+"""
+
+DEFAULT_CICD_KEYWORDS = ("github", "action", "docker", "workflow", "yaml", "yml", ".github/")
+
+# 라이선스 통계에 표시할 상위 개수
+TOP_LICENSES = 10
+
+
+def compile_keywords(keywords: Iterable[str]) -> Pattern:
+    """키워드 중 하나라도 포함하는지 검사하는 정규식을 만듭니다. (소문자 문자열 대상)"""
+    # 긴 키워드를 먼저 두어 같은 위치에서 더 구체적인 키워드가 일치하도록 함
+    alternatives = sorted({keyword.lower() for keyword in keywords if keyword}, key=len, reverse=True)
+    if not alternatives:
+        return re.compile(r"(?!)")  # 아무것도 일치하지 않음
+    return re.compile("|".join(map(re.escape, alternatives)))
+
+
+_DEFAULT_CICD_PATTERN = compile_keywords(DEFAULT_CICD_KEYWORDS)
+
+
+def _license_name(licenses: List[Dict[str, Any]]) -> str:
+    """첫 번째 라이선스의 id/name(또는 expression)을 반환합니다."""
+    if not licenses:
+        return "N/A"
+    lic_item = licenses[0]
+    if "license" in lic_item:
+        return lic_item["license"].get("id") or lic_item["license"].get("name", "N/A")
+    if "expression" in lic_item:
+        return lic_item["expression"]
+    return "N/A"
+
+
+@dataclass(slots=True)
+class SBOMAnalysis:
+    """단일 SBOM 분석 결과 (화면 요약, 패키지 행 목록, 의존성 목록)"""
+    result: Dict[str, Any]
+    packages: List[Dict[str, Any]] = field(default_factory=list)
+    dependencies: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class SBOMStatistics:
+    """
+    components/dependencies 원소를 하나씩 받아 통계를 누적합니다.
+
+    Args:
+        cicd_keywords: CI/CD 관련 패키지로 판단할 이름 키워드
+        keep_packages: 패키지 행 목록을 보관할지 여부 (요약만 필요하면 False)
+        keep_dependencies: 의존성 목록을 보관할지 여부
+    """
+
+    def __init__(
+        self,
+        cicd_keywords: Optional[Iterable[str]] = None,
+        keep_packages: bool = True,
+        keep_dependencies: bool = True,
+    ):
+        self._cicd = _DEFAULT_CICD_PATTERN if cicd_keywords is None else compile_keywords(cicd_keywords)
+        self.keep_packages = keep_packages
+        self.keep_dependencies = keep_dependencies
+
+        self.document: Dict[str, Any] = {}
+        self.packages: List[Dict[str, Any]] = []
+        self.dependencies: List[Dict[str, Any]] = []
+
+        # 범주형 값 열 (마지막에 한 번에 집계)
+        self._licenses: List[str] = []
+        self._types: List[str] = []
+
+        self.cicd_count = 0
+        self.with_hash = 0
+        self.with_homepage = 0
+        self.with_vcs = 0
+        self.total_dependencies = 0
+        self.dependency_stats = {
+            "has_dependencies": 0,
+            "isolated_packages": 0,
+            "max_dependencies": 0
+        }
+
+    def feed(self, events: Iterable) -> "SBOMStatistics":
+        """iter_json_events()의 이벤트 스트림을 끝까지 소비합니다."""
+        for kind, key, value in events:
+            if kind != ITEM:
+                self.document[key] = value
+            elif key == "components":
+                self.add_component(value)
+            elif key == "dependencies":
+                self.add_dependency(value)
+        return self
+
+    def add_dependency(self, dep: Dict[str, Any]) -> None:
+        self.total_dependencies += 1
+        if self.keep_dependencies:
+            self.dependencies.append(dep)
+        depends_on = dep.get("dependsOn", [])
+        stats = self.dependency_stats
+        if depends_on:
+            stats["has_dependencies"] += 1
+            if len(depends_on) > stats["max_dependencies"]:
+                stats["max_dependencies"] = len(depends_on)
+        else:
+            stats["isolated_packages"] += 1
+
+    def add_component(self, c: Dict[str, Any]) -> None:
+        name = c.get("name", "Unknown")
+        pkg_type = c.get("type", "library")
+        lic_name = _license_name(c.get("licenses", []))
+
+        is_cicd = self._cicd.search(name.lower()) is not None
+        hashes = c.get("hashes", [])
+        external_refs = c.get("externalReferences", [])
+        has_homepage = False
+        has_vcs = False
+        for ref in external_refs:
+            ref_type = ref.get("type")
+            if ref_type == "website":
+                has_homepage = True
+            elif ref_type == "vcs":
+                has_vcs = True
+
+        self.cicd_count += is_cicd
+        self.with_hash += bool(hashes)
+        self.with_homepage += has_homepage
+        self.with_vcs += has_vcs
+        self._licenses.append(lic_name)
+        self._types.append(pkg_type)
+
+        if self.keep_packages:
+            self.packages.append({
+                "name": name,
+                "version": c.get("version", "Unknown"),
+                "license": lic_name,
+                "type": pkg_type,
+                "is_cicd": is_cicd,
+                "purl": c.get("purl", ""),
+                "has_hash": bool(hashes),
+                "has_homepage": has_homepage,
+                "has_vcs": has_vcs,
+                "cpe": c.get("cpe", ""),
+                "hash_count": len(hashes),
+                "external_ref_count": len(external_refs)
+            })
+
+    def result(self, filename: Optional[str] = None) -> Dict[str, Any]:
+        """화면 요약 정보를 반환합니다."""
+        license_stats = Counter(self._licenses)
+        type_stats = Counter(self._types)
+
+        # 도구 이름 및 메타데이터 추출
+        metadata = self.document.get("metadata", {})
+        tools = metadata.get("tools", {})
+        tool_name = "Unknown"
+        tool_version = "Unknown"
+        if isinstance(tools, dict):
+            tool_components = tools.get("components", [])
+            if tool_components:
+                tool_name = tool_components[0].get("name", "Unknown")
+                tool_version = tool_components[0].get("version", "Unknown")
+        elif isinstance(tools, list) and len(tools) > 0:
+            tool_name = tools[0].get("name", "Unknown")
+            tool_version = tools[0].get("version", "Unknown")
+        component_info = metadata.get("component", {})
+
+        return {
+            "filename": filename,
+            "total_packages": len(self._types),
+            "tool_name": tool_name,
+            "tool_version": tool_version,
+            "timestamp": metadata.get("timestamp", "Unknown"),
+            "target_name": component_info.get("name", "Unknown"),
+            "target_type": component_info.get("type", "Unknown"),
+            "cicd_count": self.cicd_count,
+            "total_dependencies": self.total_dependencies,
+            "license_stats": license_stats.most_common(TOP_LICENSES),
+            "type_stats": type_stats.most_common(),
+            "dependency_stats": dict(self.dependency_stats),
+            "packages_with_hash": self.with_hash,
+            "packages_with_homepage": self.with_homepage,
+            "packages_with_vcs": self.with_vcs,
+            "unique_licenses": len(license_stats),
+            "unique_types": len(type_stats)
+        }
+
+
+def analyze_stream(
+    fp: BinaryIO,
+    filename: Optional[str] = None,
+    cicd_keywords: Optional[Iterable[str]] = None,
+    keep_packages: bool = True,
+) -> SBOMAnalysis:
+    """
+    SBOM 스트림을 청크 단위로 읽으며 분석합니다. (문서 전체를 dict로 올리지 않음)
+    유효하지 않은 JSON이면 json.JSONDecodeError가 발생합니다.
+    """
+    stats = SBOMStatistics(cicd_keywords, keep_packages=keep_packages, keep_dependencies=keep_packages)
+    stats.feed(iter_json_events(fp))
+    return SBOMAnalysis(stats.result(filename), stats.packages, stats.dependencies)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="단일 SBOM 분석 통계를 JSON으로 출력합니다.")
+    parser.add_argument("path", help="SBOM 파일 경로 (.json / .json.gz / .json.zst)")
+    parser.add_argument("--packages", action="store_true", help="패키지 행 목록도 함께 출력")
+    parser.add_argument("--keywords", help="CI/CD 키워드 (쉼표로 구분)")
+    args = parser.parse_args(argv)
+
+    keywords = [k.strip() for k in args.keywords.split(",")] if args.keywords else None
+    with open(args.path, "rb") as f:
+        analysis = analyze_stream(
+            open_decompressed(f, encoding_hint(args.path)), args.path, keywords, keep_packages=args.packages
+        )
+    output = {"result": analysis.result}
+    if args.packages:
+        output["packages"] = analysis.packages
+    sys.stdout.write(codec.dumps(output, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
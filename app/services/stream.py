@@ -0,0 +1,167 @@
+import codecs
+import json
+from typing import Any, BinaryIO, Iterable, Iterator, Tuple, Union
+
+"""
+stream.py
+해당 파일은 대용량 SBOM JSON을 한 번에 메모리에 올리지 않고 청크 단위로 읽어들이는 기능을 제공합니다.
+주요기능:
+1. 파일(또는 업로드 스트림)을 청크 단위로 읽으면서 최상위 객체의 필드를 순서대로 내보냅니다.
+2. components[], dependencies[] 같은 배열 필드는 원소 하나씩 내보내므로,
+   피크 메모리가 문서 전체가 아니라 원소 하나 크기로 제한됩니다.
+3. 잘못된 JSON은 json.JSONDecodeError로 보고하여 기존 예외 처리와 호환됩니다.
+
+[이벤트 형식]
+- (FIELD, key, value): 스트리밍 대상이 아닌 최상위 필드 (metadata, bomFormat 등)
+- (ITEM, key, value): 스트리밍 대상 배열(key)의 원소 하나
+
+[사용 예시]
+with open("transformers_syft_sbom.json", "rb") as f:
+    for kind, key, value in iter_json_events(f):
+        if kind == ITEM and key == "components":
+            print(value["name"])
+"""
+
+FIELD = "field"
+ITEM = "item"
+
+# 원소 단위로 내보낼 최상위 배열 필드
+STREAM_KEYS = ("components", "dependencies")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+# 디코딩된 숫자 바로 뒤에 오면 숫자가 청크 경계에서 잘렸을 수 있는 문자
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+JSONEvent = Tuple[str, str, Any]
+
+
+class _ChunkBuffer:
+    """
+    스트림에서 읽은 텍스트를 보관하는 버퍼입니다.
+    이미 소비한 앞부분은 다음 청크를 읽을 때 잘라내므로 버퍼 크기는 (청크 + 현재 값) 이내로 유지됩니다.
+    """
+
+    def __init__(self, fp: Union[BinaryIO, Any], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        # utf-8-sig: 선행 BOM이 있으면 제거
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """청크를 하나 더 읽어 버퍼에 덧붙입니다. 더 읽을 데이터가 없으면 False를 반환합니다."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(max(size, self.chunk_size))
+        if isinstance(chunk, str):
+            decoded = chunk
+            self.eof = not chunk
+        else:
+            self.eof = not chunk
+            decoded = self.decoder.decode(chunk, final=self.eof)
+        self.text = self.text[self.pos:] + decoded
+        self.pos = 0
+        return bool(decoded) or not self.eof
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자를 반환합니다. 문서 끝이면 빈 문자열을 반환합니다."""
+        while True:
+            text = self.text
+            pos = self.pos
+            end = len(text)
+            while pos < end and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < end:
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """다음 문자가 chars 중 하나인지 확인하고 소비합니다."""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            expected = " 또는 ".join(repr(c) for c in chars)
+            raise json.JSONDecodeError(f"{expected}이(가) 필요합니다", self.text, self.pos)
+        self.pos += 1
+        return ch
+
+    def read_value(self, decoder: json.JSONDecoder) -> Any:
+        """
+        현재 위치의 JSON 값 하나를 디코딩합니다.
+        값이 버퍼 경계에서 잘렸으면 더 읽어서 재시도합니다. 재시도마다 읽는 양을 늘려
+        큰 값도 재파싱 비용이 로그 횟수로 제한됩니다.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(len(self.text)):
+                    raise
+                continue
+            # 숫자/리터럴은 버퍼 끝에서 잘려도 디코딩에 성공하므로 끝에 닿았으면 더 읽어서 확인
+            if end == len(self.text) and not self.eof:
+                self.fill(len(self.text))
+                continue
+            # 숫자가 정수부 뒤에서 잘린 경우("1" | ".5", "1" | "e5")에도 앞부분만 디코딩되므로
+            # 바로 뒤가 숫자를 이어가는 문자이면 더 읽어서 재시도 (문서 끝이면 이후 구분자 검사에서 오류)
+            if not self.eof and self.text[end] in _NUMBER_CHARS and type(value) in (int, float):
+                self.fill(len(self.text))
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_events(
+    fp: Union[BinaryIO, Any],
+    stream_keys: Iterable[str] = STREAM_KEYS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[JSONEvent]:
+    """
+    최상위가 객체인 JSON 문서를 청크 단위로 읽으며 이벤트를 생성합니다.
+
+    Args:
+        fp: read(size)를 지원하는 바이너리(또는 텍스트) 파일 객체
+        stream_keys: 원소 단위로 내보낼 최상위 배열 필드명
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Yields:
+        (FIELD, key, value) 또는 (ITEM, key, value) 튜플
+    """
+    stream_keys = frozenset(stream_keys)
+    decoder = json.JSONDecoder()
+    buf = _ChunkBuffer(fp, chunk_size)
+
+    buf.expect("{")
+    if buf.peek() == "}":
+        buf.pos += 1
+        return
+
+    while True:
+        if buf.peek() != '"':
+            raise json.JSONDecodeError("필드명이 필요합니다", buf.text, buf.pos)
+        key = buf.read_value(decoder)
+        buf.expect(":")
+
+        if key in stream_keys and buf.peek() == "[":
+            buf.pos += 1
+            if buf.peek() == "]":
+                buf.pos += 1
+            else:
+                while True:
+                    yield ITEM, key, buf.read_value(decoder)
+                    if buf.expect(",]") == "]":
+                        break
+        else:
+            yield FIELD, key, buf.read_value(decoder)
+
+        if buf.expect(",}") == "}":
+            break
+
+    if buf.peek():
+        raise json.JSONDecodeError("문서 끝에 불필요한 데이터가 있습니다", buf.text, buf.pos)
@@ -0,0 +1,291 @@
+import threading
+import uuid
+from collections import OrderedDict
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.models.component_table import DictionaryColumn, mask_and, mask_not
+from app.services.graph import GraphIndex
+
+"""
+views.py
+해당 파일은 결과 화면(통합 결과, 단일 SBOM 분석)의 컴포넌트/의존성 목록을 페이지 단위로 제공하는 기능을 제공합니다.
+HTML 화면에는 요약만 렌더링하고, 목록은 결과 id로 JSON API(/results/{result_id}/...)에서 필요한 페이지만 가져옵니다.
+따라서 화면 크기와 렌더링 시간이 SBOM 크기와 무관해집니다.
+
+주요기능:
+1. 결과 화면의 행(row) 목록과 의존성 목록을 결과 id로 보관합니다. (ResultStore, 개수 상한이 있는 LRU)
+2. 서버 측 필터/정렬/페이지 처리
+    - 범주형 필드(type, license, source)는 사전 인코딩 열로 만들어 두고 마스크 연산으로 필터링합니다.
+    - 불리언 필드(integrated, is_cicd)는 0/1 바이트 열로 보관합니다.
+    - 이름 검색(q)은 소문자 이름 목록에서 부분 문자열로 찾습니다.
+    - 정렬 순서는 필드별로 한 번만 계산하여 재사용합니다.
+3. 의존성 그래프 분석 (graph.GraphIndex, 결과별로 처음 질의할 때 한 번 생성)
+    - 상위/하위 의존성 ref 목록을 페이지 단위로, 최단 경로와 순환 목록을 반환합니다.
+
+[사용 예시]
+view = ResultView(rows=component_rows, dependencies=dependencies, summary=summary)
+result_views.put(view)
+page = view.components(q="torch", categories={"source": ["Syft"]}, sort="name", page=2, page_size=50)
+"""
+
+# 정렬할 수 있는 필드
+SORT_FIELDS = ("name", "version", "type", "license", "source")
+# 사전 인코딩하여 필터링하는 범주형 필드
+CATEGORY_FIELDS = ("type", "license", "source")
+# 0/1 바이트 열로 필터링하는 불리언 필드
+FLAG_FIELDS = ("integrated", "is_cicd")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _page_bounds(total: int, page: int, page_size: int):
+    """페이지 번호/크기를 보정하고 (page, page_size, 시작, 끝)을 반환합니다."""
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    page = max(1, page)
+    start = (page - 1) * page_size
+    return page, page_size, start, min(start + page_size, total)
+
+
+def _sort_key(value: Any):
+    # None은 항상 마지막, 문자열은 대소문자 구분 없이 비교
+    if value is None:
+        return (1, "")
+    return (0, value.casefold() if isinstance(value, str) else str(value))
+
+
+class ResultView:
+    """
+    결과 화면 하나의 행/의존성 목록과 필터용 열입니다.
+
+    Args:
+        rows: 화면 표 행 딕셔너리 목록 (name, version, type, license, source ... )
+        dependencies: CycloneDX 의존성 목록 ({"ref": ..., "dependsOn": [...]})
+        summary: 화면 요약 정보
+        document: 다운로드용 문서 바이트 (없으면 다운로드 불가)
+        filename: 다운로드 파일명
+        result_id: 결과 id (None이면 새로 생성)
+        integration: 증분 갱신용 통합기 (incremental.IncrementalIntegrator, 없으면 갱신 불가)
+    """
+
+    def __init__(
+        self,
+        rows: List[Dict[str, Any]],
+        dependencies: Optional[List[Dict[str, Any]]] = None,
+        summary: Optional[Dict[str, Any]] = None,
+        document: Optional[bytes] = None,
+        filename: str = "",
+        result_id: Optional[str] = None,
+        integration: Optional[Any] = None,
+    ):
+        self.id = result_id or uuid.uuid4().hex
+        self.integration = integration
+        self.rows = rows
+        self.dependencies = dependencies or []
+        self.summary = summary or {}
+        self.document = document
+        self.filename = filename
+
+        fields = rows[0].keys() if rows else ()
+        self._names = [(row.get("name") or "").lower() for row in rows]
+        self._categories = {
+            name: DictionaryColumn(row.get(name) for row in rows) for name in CATEGORY_FIELDS if name in fields
+        }
+        self._flags = {
+            name: bytes(1 if row.get(name) else 0 for row in rows) for name in FLAG_FIELDS if name in fields
+        }
+        self._orders: Dict[str, List[int]] = {}
+        self._graph: Optional[GraphIndex] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def facets(self) -> Dict[str, Dict[Any, int]]:
+        """범주형 필드별 값과 행 수 (필터 선택 목록용)"""
+        return {name: column.value_counts() for name, column in self._categories.items()}
+
+    def _order(self, field: str) -> List[int]:
+        order = self._orders.get(field)
+        if order is None:
+            rows = self.rows
+            order = sorted(range(len(rows)), key=lambda i: _sort_key(rows[i].get(field)))
+            with self._lock:
+                self._orders[field] = order
+        return order
+
+    def mask(
+        self,
+        q: Optional[str] = None,
+        categories: Optional[Dict[str, Iterable[Any]]] = None,
+        flags: Optional[Dict[str, Optional[bool]]] = None,
+    ) -> Optional[bytes]:
+        """
+        조건을 모두 만족하는 행을 1로 표시한 마스크를 반환합니다. (조건이 없으면 None)
+        categories: 필드 -> 허용 값 목록 (값 중 하나와 같으면 선택), flags: 필드 -> True/False
+        """
+        result: Optional[bytes] = None
+
+        def narrow(mask: bytes) -> None:
+            nonlocal result
+            result = mask if result is None else mask_and(result, mask)
+
+        for name, values in (categories or {}).items():
+            values = [value for value in values or () if value not in (None, "")]
+            if not values:
+                continue
+            column = self._categories.get(name)
+            if column is None:
+                raise ValueError(f"필터할 수 없는 필드입니다: {name}")
+            narrow(column.mask(*values))
+        for name, wanted in (flags or {}).items():
+            if wanted is None:
+                continue
+            column = self._flags.get(name)
+            if column is None:
+                raise ValueError(f"필터할 수 없는 필드입니다: {name}")
+            narrow(column if wanted else mask_not(column))
+        if q:
+            needle = q.lower()
+            narrow(bytes(1 if needle in name else 0 for name in self._names))
+        return result
+
+    def components(
+        self,
+        q: Optional[str] = None,
+        categories: Optional[Dict[str, Iterable[Any]]] = None,
+        flags: Optional[Dict[str, Optional[bool]]] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """필터/정렬한 행 목록에서 한 페이지를 반환합니다. (각 행에 원래 순번 index 포함)"""
+        if sort is not None and sort not in SORT_FIELDS:
+            raise ValueError(f"정렬할 수 없는 필드입니다: {sort}")
+        mask = self.mask(q, categories, flags)
+
+        order = range(len(self.rows)) if sort is None else self._order(sort)
+        if descending:
+            order = order[::-1]
+        if mask is None:
+            selected = order
+        elif sort is None and not descending:
+            selected = list(compress(order, mask))
+        else:
+            selected = [i for i in order if mask[i]]
+
+        page, page_size, start, end = _page_bounds(len(selected), page, page_size)
+        return {
+            "result_id": self.id,
+            "total": len(self.rows),
+            "filtered": len(selected),
+            "page": page,
+            "page_size": page_size,
+            "items": [{"index": i + 1, **self.rows[i]} for i in selected[start:end]],
+        }
+
+    def dependency_page(
+        self,
+        q: Optional[str] = None,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """ref 검색(q)으로 거른 의존성 목록에서 한 페이지를 반환합니다."""
+        if q:
+            needle = q.lower()
+            selected = [i for i, dep in enumerate(self.dependencies) if needle in (dep.get("ref") or "").lower()]
+        else:
+            selected = range(len(self.dependencies))
+
+        page, page_size, start, end = _page_bounds(len(selected), page, page_size)
+        return {
+            "result_id": self.id,
+            "total": len(self.dependencies),
+            "filtered": len(selected),
+            "page": page,
+            "page_size": page_size,
+            "items": [{"index": i + 1, **self.dependencies[i]} for i in selected[start:end]],
+        }
+
+    def graph(self) -> GraphIndex:
+        """의존성 목록의 GraphIndex를 반환합니다. (처음 호출 시 한 번 생성)"""
+        if self._graph is None:
+            with self._lock:
+                if self._graph is None:
+                    self._graph = GraphIndex(self.dependencies)
+        return self._graph
+
+    def related_page(
+        self,
+        ref: str,
+        direction: str,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        ref의 하위(direction="descendants") 또는 상위(direction="ancestors") 의존성 ref 목록에서 한 페이지를 반환합니다.
+        그래프에 없는 ref이면 KeyError가 발생합니다.
+        """
+        graph = self.graph()
+        if direction == "descendants":
+            refs = graph.descendants(ref)
+        elif direction == "ancestors":
+            refs = graph.ancestors(ref)
+        else:
+            raise ValueError(f"지원하지 않는 방향입니다: {direction}")
+        page, page_size, start, end = _page_bounds(len(refs), page, page_size)
+        return {
+            "result_id": self.id,
+            "ref": ref,
+            "direction": direction,
+            "total": len(refs),
+            "page": page,
+            "page_size": page_size,
+            "items": refs[start:end],
+        }
+
+    def path(self, source: str, target: str) -> Dict[str, Any]:
+        """source에서 target까지의 최단 의존 경로를 반환합니다. (경로가 없으면 path는 None)"""
+        path = self.graph().shortest_path(source, target)
+        return {
+            "result_id": self.id,
+            "source": source,
+            "target": target,
+            "path": path,
+            "length": len(path) - 1 if path else None,
+        }
+
+    def cycles(self) -> Dict[str, Any]:
+        """의존성 순환(강연결요소) 목록을 반환합니다."""
+        cycles = self.graph().cycles()
+        return {"result_id": self.id, "total": len(cycles), "items": cycles}
+
+
+class ResultStore:
+    """결과 화면 데이터를 결과 id로 보관하는 개수 상한 LRU 저장소입니다."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._views: "OrderedDict[str, ResultView]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def put(self, view: ResultView) -> str:
+        """결과를 저장하고 결과 id를 반환합니다. 상한을 넘으면 가장 오래 조회하지 않은 결과부터 제거합니다."""
+        with self._lock:
+            self._views[view.id] = view
+            self._views.move_to_end(view.id)
+            while len(self._views) > self.max_entries:
+                self._views.popitem(last=False)
+        return view.id
+
+    def get(self, result_id: str) -> Optional[ResultView]:
+        with self._lock:
+            view = self._views.get(result_id)
+            if view is not None:
+                self._views.move_to_end(result_id)
+            return view
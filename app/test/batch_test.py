@@ -0,0 +1,95 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services.batch import build_tasks, read_manifest, run_batch, scan_directory
+
+'''
+실행 방법
+python -m app.test.batch_test
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        """샘플 SBOM 쌍 두 개(이름 짝짓기 / 파일명 짝짓기)를 담은 디렉토리를 준비합니다."""
+        self.root = Path(tempfile.mkdtemp())
+        self.source = self.root / "registry"
+        (self.source / "nested").mkdir(parents=True)
+        shutil.copy(DATA_DIR / "transformers_hatbom_sbom.json", self.source)
+        shutil.copy(DATA_DIR / "transformers_syft_sbom.json", self.source / "nested")
+
+        for tool in ("hatbom", "syft"):
+            document = json.loads((DATA_DIR / f"transformers_{tool}_sbom.json").read_text(encoding="utf-8"))
+            document["metadata"]["component"]["name"] = "Demo-App"
+            document["components"] = document["components"][:5]
+            (self.source / f"{tool}-{tool}.json").write_text(json.dumps(document), encoding="utf-8")
+        (self.source / "broken.json").write_text("{broken", encoding="utf-8")
+        self.output = self.root / "out"
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_scan_directory(self):
+        """main component 이름, 파일명 순서로 짝을 짓는지 테스트합니다."""
+        pairs, unpaired = scan_directory(self.source)
+
+        self.assertEqual([name for name, _, _ in pairs], ["demo-app", "transformers"])
+        self.assertEqual(pairs[1][1].name, "transformers_hatbom_sbom.json")
+        self.assertEqual(pairs[1][2].name, "transformers_syft_sbom.json")
+        self.assertEqual(unpaired, [str(self.source / "broken.json")])
+
+    def test_scan_directory_skips_other_formats(self):
+        """이전 실행의 통합 결과나 SPDX 파일은 Hatbom으로 짝짓지 않고 짝이 없는 파일로 보고하는지 테스트합니다."""
+        pairs, _ = scan_directory(self.source)
+        tasks = build_tasks(pairs, self.source / "previous", indent=None)
+        run_batch(tasks, self.source / "previous")
+        (self.source / "spdx.json").write_text(json.dumps({"spdxVersion": "SPDX-2.3", "SPDXID": "SPDXRef-DOCUMENT"}))
+
+        rescanned, unpaired = scan_directory(self.source)
+        self.assertEqual(rescanned, pairs)
+        for path in [task.output for task in tasks] + [str(self.source / "spdx.json")]:
+            self.assertIn(path, unpaired)
+
+    def test_run_and_resume(self):
+        """배치 실행, 진행 기록 기반 재실행 건너뛰기, 실패 기록을 테스트합니다."""
+        pairs, _ = scan_directory(self.source)
+        tasks = build_tasks(pairs, self.output, indent=None)
+
+        report = run_batch(tasks, self.output)
+        self.assertEqual((report.completed, report.failed, report.skipped), (2, 0, 0))
+        counts = [len(json.loads(Path(task.output).read_text(encoding="utf-8"))["components"]) for task in tasks]
+        self.assertEqual(report.components, sum(counts))
+        self.assertGreater(report.to_dict()["files_per_second"], 0)
+
+        report = run_batch(tasks, self.output)
+        self.assertEqual((report.completed, report.skipped), (0, 2))
+
+        # 출력 파일이 사라진 쌍만 다시 실행
+        Path(tasks[1].output).unlink()
+        report = run_batch(tasks, self.output)
+        self.assertEqual((report.completed, report.skipped), (1, 1))
+
+        missing = build_tasks([("missing", self.source / "none.json", self.source / "none.json")], self.output)
+        report = run_batch(missing, self.output)
+        self.assertEqual(report.failed, 1)
+        self.assertIn("FileNotFoundError", report.failures[0]["error"])
+
+    def test_read_manifest(self):
+        """JSON Lines 매니페스트의 상대 경로를 매니페스트 위치 기준으로 읽는지 테스트합니다."""
+        manifest = self.source / "pairs.jsonl"
+        manifest.write_text(
+            json.dumps({"hatbom": "transformers_hatbom_sbom.json", "syft": "nested/transformers_syft_sbom.json"}) + "\n",
+            encoding="utf-8"
+        )
+        self.assertEqual(read_manifest(manifest), [
+            ("transformers", self.source / "transformers_hatbom_sbom.json", self.source / "nested" / "transformers_syft_sbom.json")
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
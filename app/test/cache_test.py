@@ -0,0 +1,82 @@
+import io
+import tempfile
+import unittest
+
+from app.services.cache import CachedResult, ResultCache, hash_stream, make_key
+
+'''
+실행 방법
+python -m app.test.cache_test
+'''
+
+class TestResultCache(unittest.TestCase):
+    def _entry(self, size: int = 10) -> CachedResult:
+        return CachedResult(document=b"x" * size, summary={"total_components": size}, filename="unified.json")
+
+    def test_key(self):
+        """같은 내용/옵션이면 같은 키, 입력 순서나 옵션이 다르면 다른 키가 되는지 테스트합니다."""
+        a = hash_stream(io.BytesIO(b'{"a": 1}'))
+        b = hash_stream(io.BytesIO(b'{"b": 2}'))
+        self.assertEqual(make_key([a, b], {"fuzzy": True}), make_key([a, b], {"fuzzy": True}))
+        self.assertNotEqual(make_key([a, b]), make_key([b, a]))
+        self.assertNotEqual(make_key([a, b], {"fuzzy": True}), make_key([a, b], {"fuzzy": False}))
+
+    def test_hash_stream_rewinds(self):
+        """해시 계산 후 파일 위치가 처음으로 돌아가는지 테스트합니다."""
+        fp = io.BytesIO(b"payload")
+        fp.read(3)
+        hash_stream(fp)
+        self.assertEqual(fp.read(), b"payload")
+
+    def test_lru_eviction(self):
+        """크기 상한을 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트합니다."""
+        cache = ResultCache(max_bytes=3 * self._entry().size)
+        for key in ("a", "b", "c"):
+            cache.put(key, self._entry())
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.put("d", self._entry())
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 3)
+
+    def test_disk_tier_survives_restart(self):
+        """디스크 계층에 저장된 결과를 새 캐시 인스턴스에서 재사용하는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ResultCache(cache_dir=cache_dir).put("key", self._entry())
+
+            restarted = ResultCache(cache_dir=cache_dir)
+            entry = restarted.get("key")
+            self.assertEqual(entry, self._entry())
+            self.assertEqual(restarted.stats()["disk_hits"], 1)
+            # 디스크에서 읽은 항목은 메모리 계층으로 올라감
+            restarted.get("key")
+            self.assertEqual(restarted.stats()["hits"], 1)
+
+    def test_disk_tier_keeps_rows(self):
+        """결과 화면 표 행/의존성 목록도 디스크 계층에 저장되어 복원되는지 테스트합니다."""
+        entry = CachedResult(
+            document=b"{}", summary={"total_components": 1}, filename="unified.json",
+            rows=[{"name": "numpy", "version": "1.24.0", "integrated": True}],
+            dependencies=[{"ref": "a", "dependsOn": ["b"]}],
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ResultCache(cache_dir=cache_dir).put("key", entry)
+            self.assertEqual(ResultCache(cache_dir=cache_dir).get("key"), entry)
+
+    def test_disk_eviction(self):
+        """디스크 사용량이 상한을 넘으면 오래된 항목이 삭제되는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ResultCache(max_bytes=0, cache_dir=cache_dir, disk_max_bytes=150)
+            cache.put("old", self._entry(60))
+            cache.put("new", self._entry(60))
+            self.assertLessEqual(cache.stats()["disk_bytes"], 150)
+            self.assertIsNotNone(cache.get("new"))
+            self.assertIsNone(cache.get("old"))
+
+if __name__ == "__main__":
+    unittest.main()
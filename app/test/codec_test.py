@@ -0,0 +1,60 @@
+import unittest
+import json
+from app.services import codec
+
+'''
+실행 방법
+python -m app.test.codec_test
+'''
+
+class TestJSONCodec(unittest.TestCase):
+    def setUp(self):
+        """테스트에 사용할 가상 데이터를 준비합니다."""
+        self.data = {
+            "bomFormat": "CycloneDX",
+            "components": [
+                {"name": "한글-패키지", "version": "1.0.0", "properties": []},
+                {"name": "numpy", "hashes": [{"alg": "MD5", "content": "abc123hash"}]}
+            ],
+            "dependencies": [],
+            "metadata": {},
+            "control": "\x1f \"\\/",
+            "big": 10 ** 20
+        }
+
+    def test_dumps_matches_stdlib(self):
+        """indent 설정과 관계없이 json.dumps(ensure_ascii=False)와 동일한 출력을 내는지 테스트합니다."""
+        for indent in (None, 2, 4):
+            expected = json.dumps(self.data, indent=indent, ensure_ascii=False)
+            self.assertEqual(codec.dumps(self.data, indent=indent), expected)
+            self.assertEqual(codec.dumps_bytes(self.data, indent=indent), expected.encode("utf-8"))
+
+    def test_dumps_floats_match_stdlib(self):
+        """지수 표기 실수와 NaN/Infinity도 json.dumps와 같은 표기로 인코딩하는지 테스트합니다."""
+        data = dict(self.data, score=[0.5, 1.5e-7, 1e16, float("nan"), float("inf")])
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        self.assertEqual(codec.dumps(data, indent=2), expected)
+        self.assertEqual(codec.dumps_bytes(data, indent=2), expected.encode("utf-8"))
+        self.assertEqual(
+            codec.dumps_compact({"ratio": 1.5e-7}),
+            json.dumps({"ratio": 1.5e-7}, separators=(",", ":")).encode("utf-8")
+        )
+
+    def test_dumps_compact(self):
+        """compact 출력이 공백 없는 JSON인지 테스트합니다."""
+        expected = json.dumps(self.data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.assertEqual(codec.dumps_compact(self.data), expected)
+
+    def test_loads_roundtrip(self):
+        """bytes/str 입력 모두 디코딩되는지 테스트합니다."""
+        raw = json.dumps(self.data, ensure_ascii=False)
+        self.assertEqual(codec.loads(raw.encode("utf-8")), self.data)
+        self.assertEqual(codec.loads(raw), self.data)
+
+    def test_invalid_json_raises_decode_error(self):
+        """백엔드와 관계없이 json.JSONDecodeError가 발생하는지 테스트합니다."""
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads(b"{invalid")
+
+if __name__ == "__main__":
+    unittest.main()
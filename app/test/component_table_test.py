@@ -0,0 +1,67 @@
+import unittest
+from app.models.component_table import DictionaryColumn, mask_and, mask_not
+from app.models.unified_sbom import UnifiedSbom, UnifiedComponent
+
+'''
+실행 방법
+python -m app.test.component_table_test
+'''
+
+class TestComponentTable(unittest.TestCase):
+    def setUp(self):
+        """테스트에 사용할 가상 UnifiedSbom 데이터를 준비합니다."""
+        self.unified_sbom = UnifiedSbom(components=[
+            UnifiedComponent(
+                name="numpy", version="1.24.0", type="library", bom_ref="ref-1",
+                purl="pkg:pypi/numpy@1.24.0",
+                licenses=[{"license": {"id": "BSD-3-Clause"}}],
+                properties=[
+                    {"name": "source_tool", "value": "Syft"},
+                    {"name": "integrated_with", "value": "Hatbom"}
+                ]
+            ),
+            UnifiedComponent(
+                name="requests", version="2.31.0", type="library", bom_ref="ref-2",
+                licenses=[{"license": {"name": "Apache License 2.0"}}],
+                properties=[{"name": "source_tool", "value": "Syft"}]
+            ),
+            UnifiedComponent(
+                name="__init__", version="0.0.0", type="file", bom_ref="ref-3",
+                properties=[{"name": "source_tool", "value": "Hatbom"}]
+            )
+        ])
+        self.table = self.unified_sbom.to_table()
+
+    def test_columns(self):
+        """컴포넌트 목록이 열 단위로 변환되는지 테스트합니다."""
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.name, ["numpy", "requests", "__init__"])
+        self.assertEqual(self.table.type[2], "file")
+        self.assertEqual(self.table.source[0], ("Syft",))
+        self.assertEqual(list(self.table.license), ["BSD-3-Clause", "Apache License 2.0", "N/A"])
+        self.assertEqual(list(self.table.integrated), [1, 0, 0])
+
+    def test_counts(self):
+        """범주형 열 집계가 올바른지 테스트합니다."""
+        self.assertEqual(self.table.type.value_counts(), {"library": 2, "file": 1})
+        self.assertEqual(self.table.source_counts(), {"Syft": 2, "Hatbom": 1})
+
+    def test_filters(self):
+        """조건별 마스크와 마스크 조합이 올바른지 테스트합니다."""
+        syft_mask = self.table.mask(source="Syft")
+        self.assertEqual(self.table.rows(syft_mask), [0, 1])
+        self.assertEqual(self.table.count(self.table.mask(source="Syft", integrated=False)), 1)
+        self.assertEqual(self.table.rows(self.table.mask(type="file")), [2])
+        self.assertEqual(self.table.rows(self.table.mask(name_contains="REQ")), [1])
+        self.assertEqual(self.table.rows(mask_and(syft_mask, mask_not(self.table.mask(license="N/A")))), [0, 1])
+
+    def test_dictionary_column_widening(self):
+        """고유값이 256개를 넘어도 인코딩/필터가 유지되는지 테스트합니다."""
+        column = DictionaryColumn(f"v{i}" for i in range(300))
+        column.append("v5")
+        self.assertEqual(len(column.dictionary), 300)
+        self.assertEqual(column[299], "v299")
+        self.assertEqual(column.mask("v5").count(1), 2)
+
+if __name__ == "__main__":
+    unittest.main()
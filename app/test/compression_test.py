@@ -0,0 +1,87 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from app.models.unified_sbom import UnifiedSbom, UnifiedComponent
+from app.services import compression
+from app.services.compression import (
+    GZIP, ZSTD, CompressionError, compress, encoding_hint, iter_compressed, negotiate, open_decompressed
+)
+from app.services.export import SBOMExporter
+from app.services.parse import SBOMParser
+
+'''
+실행 방법
+python -m app.test.compression_test
+'''
+
+SAMPLE = b'{"bomFormat": "CycloneDX", "components": [{"name": "numpy"}]}'
+
+
+class TestCompression(unittest.TestCase):
+    def test_encoding_hint(self):
+        """헤더가 확장자보다 우선하고, 둘 다 없으면 None인지 테스트합니다."""
+        self.assertEqual(encoding_hint("sbom.json.gz"), GZIP)
+        self.assertEqual(encoding_hint("sbom.json.zst"), ZSTD)
+        self.assertEqual(encoding_hint("sbom.json.gz", "identity"), "identity")
+        self.assertIsNone(encoding_hint("sbom.json"))
+        with self.assertRaises(CompressionError):
+            encoding_hint("sbom.json", "br")
+
+    def test_gzip_round_trip(self):
+        """gzip 입력을 확장자 없이(매직 바이트로) 스트리밍 해제하는지 테스트합니다."""
+        fp = open_decompressed(io.BytesIO(gzip.compress(SAMPLE)))
+        self.assertEqual(fp.read(), SAMPLE)
+        # 압축되지 않은 입력은 그대로
+        self.assertEqual(open_decompressed(io.BytesIO(SAMPLE)).read(), SAMPLE)
+
+    def test_iter_compressed(self):
+        """조각 단위 압축 결과가 하나의 올바른 gzip 스트림인지 테스트합니다."""
+        chunks = ['{"a": ', '[1, 2]', "}"]
+        self.assertEqual(gzip.decompress(b"".join(iter_compressed(chunks, GZIP))), b'{"a": [1, 2]}')
+        self.assertEqual(b"".join(iter_compressed(chunks, None)), b'{"a": [1, 2]}')
+
+    @unittest.skipIf(compression.zstandard is None, "zstandard가 설치되어 있지 않습니다.")
+    def test_zstd_round_trip(self):
+        """zstd 압축/해제가 왕복되는지 테스트합니다."""
+        self.assertEqual(open_decompressed(io.BytesIO(compress(SAMPLE, ZSTD))).read(), SAMPLE)
+
+    def test_negotiate(self):
+        """Accept-Encoding q 값과 선호 순서에 따라 응답 압축 형식을 고르는지 테스트합니다."""
+        self.assertIsNone(negotiate(""))
+        self.assertIsNone(negotiate("identity"))
+        self.assertEqual(negotiate("gzip, deflate"), GZIP)
+        self.assertIsNone(negotiate("gzip;q=0"))
+        self.assertEqual(negotiate("gzip;q=0.9, zstd;q=0.1"), GZIP)
+        expected = ZSTD if compression.zstandard is not None else GZIP
+        self.assertEqual(negotiate("gzip, zstd"), expected)
+        self.assertEqual(negotiate("*"), expected)
+
+    def test_parse_and_save_compressed_files(self):
+        """압축 파일 파싱과 확장자에 따른 압축 저장을 테스트합니다."""
+        exporter = SBOMExporter(UnifiedSbom(components=[
+            UnifiedComponent(name="numpy", version="1.24.0", type="library", bom_ref="ref-1")
+        ]))
+        suffixes = [".json.gz"] + ([".json.zst"] if compression.zstandard is not None else [])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for suffix in suffixes:
+                path = exporter.save_to_file(os.path.join(temp_dir, "unified" + suffix))
+                with open(path, "rb") as f:
+                    self.assertNotEqual(f.read(1), b"{")
+                    f.seek(0)
+                    self.assertEqual(json.loads(open_decompressed(f).read()), exporter.to_dict())
+
+            hatbom_path = os.path.join(temp_dir, "hatbom.json.gz")
+            with gzip.open(hatbom_path, "wb") as f:
+                f.write(json.dumps({"bomFormat": "CycloneDX", "metadata": {}, "components": [
+                    {"name": "numpy", "version": "1.24.0", "type": "file", "bom-ref": "ref-1"}
+                ]}).encode())
+            for streaming in (False, True):
+                sbom = SBOMParser().parse(hatbom_path, streaming=streaming)
+                self.assertEqual(sbom.components[0].name, "numpy")
+
+if __name__ == "__main__":
+    unittest.main()
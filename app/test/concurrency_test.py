@@ -0,0 +1,82 @@
+import io
+import json
+import unittest
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from app.config import settings
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services import concurrency
+
+'''
+실행 방법
+python -m app.test.concurrency_test
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+class TestParseUploads(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.hatbom_raw = (DATA_DIR / "transformers_hatbom_sbom.json").read_bytes()
+        self.syft_raw = (DATA_DIR / "transformers_syft_sbom.json").read_bytes()
+        self.original_executor = settings.parse_executor
+
+    def tearDown(self):
+        concurrency.shutdown_executor()
+        settings.parse_executor = self.original_executor
+
+    def _uploads(self):
+        return (
+            (HatbomSbom, UploadFile(io.BytesIO(self.hatbom_raw), filename="hatbom.json")),
+            (SyftSbom, UploadFile(io.BytesIO(self.syft_raw), filename="syft.json")),
+        )
+
+    async def _check(self, executor_kind: str):
+        settings.parse_executor = executor_kind
+        concurrency.shutdown_executor()
+        hatbom, syft = await concurrency.parse_uploads(*self._uploads())
+
+        self.assertIsInstance(hatbom, HatbomSbom)
+        self.assertIsInstance(syft, SyftSbom)
+        self.assertEqual(hatbom, HatbomSbom.from_json(json.loads(self.hatbom_raw)))
+        self.assertEqual(syft, SyftSbom.from_json(json.loads(self.syft_raw)))
+
+    async def test_thread_executor(self):
+        """스레드 풀에서 두 파일을 동시에 파싱한 결과가 순차 파싱과 같은지 테스트합니다."""
+        await self._check("thread")
+
+    async def test_process_executor(self):
+        """프로세스 풀에서 파싱한 결과가 순차 파싱과 같은지 테스트합니다."""
+        await self._check("process")
+
+    async def test_invalid_json_propagates(self):
+        """작업자에서 발생한 JSON 오류가 호출 측으로 전달되는지 테스트합니다."""
+        with self.assertRaises(json.JSONDecodeError):
+            await concurrency.parse_uploads((HatbomSbom, UploadFile(io.BytesIO(b"{bad"), filename="bad.json")))
+
+    async def test_detect_swapped_uploads(self):
+        """detect=True이면 업로드 필드가 뒤바뀌어도 앞부분으로 판별한 모델로 파싱하는지 테스트합니다."""
+        syft, hatbom = await concurrency.parse_uploads(
+            (HatbomSbom, UploadFile(io.BytesIO(self.syft_raw), filename="a.json")),
+            (SyftSbom, UploadFile(io.BytesIO(self.hatbom_raw), filename="b.json")),
+            detect=True,
+        )
+        self.assertIsInstance(syft, SyftSbom)
+        self.assertIsInstance(hatbom, HatbomSbom)
+
+    async def test_detect_keeps_field_model_for_sorted_keys(self):
+        """헤더에 metadata가 없는(키가 정렬된) 문서는 업로드 필드의 모델로 파싱하는지 테스트합니다."""
+        sorted_raw = json.dumps(json.loads(self.syft_raw), sort_keys=True).encode()
+        hatbom, syft = await concurrency.parse_uploads(
+            (HatbomSbom, UploadFile(io.BytesIO(self.hatbom_raw), filename="hatbom.json")),
+            (SyftSbom, UploadFile(io.BytesIO(sorted_raw), filename="syft.json")),
+            detect=True,
+        )
+        self.assertIsInstance(hatbom, HatbomSbom)
+        self.assertEqual(syft, SyftSbom.from_json(json.loads(self.syft_raw)))
+
+if __name__ == "__main__":
+    unittest.main()
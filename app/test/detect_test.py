@@ -0,0 +1,99 @@
+import contextlib
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services.detect import (
+    CYCLONEDX, HATBOM, SPDX, SYFT, UNKNOWN, UnsupportedFormatError,
+    detect_format, model_for, sniff, sniff_path,
+)
+from app.services.parse import SBOMParser
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+'''
+실행 방법
+python -m app.test.detect_test
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+class TestDetectFormat(unittest.TestCase):
+    def setUp(self):
+        self.hatbom_raw = (DATA_DIR / "transformers_hatbom_sbom.json").read_bytes()
+        self.syft_raw = (DATA_DIR / "transformers_syft_sbom.json").read_bytes()
+        self.unified_raw = (DATA_DIR / "transformers_unified_sbom.json").read_bytes()
+
+    def test_sample_formats(self):
+        """샘플 파일의 형식을 앞부분만으로 판별하는지 테스트합니다."""
+        self.assertEqual(sniff(io.BytesIO(self.syft_raw))[0], SYFT)
+        self.assertEqual(sniff(io.BytesIO(self.hatbom_raw))[0], HATBOM)
+        self.assertEqual(sniff(io.BytesIO(self.unified_raw))[0], CYCLONEDX)
+
+    def test_spdx_and_unknown(self):
+        """SPDX(JSON/tag-value)와 알 수 없는 문서를 구분하는지 테스트합니다."""
+        spdx = json.dumps({"spdxVersion": "SPDX-2.3", "SPDXID": "SPDXRef-DOCUMENT", "packages": []}).encode()
+        self.assertEqual(detect_format(spdx, complete=True), SPDX)
+        self.assertEqual(detect_format(b"SPDXVersion: SPDX-2.3\nDataLicense: CC0-1.0\n"), SPDX)
+        self.assertEqual(detect_format(b'{"name": "not an sbom"}', complete=True), UNKNOWN)
+        self.assertEqual(detect_format(b"<xml/>"), UNKNOWN)
+
+    def test_truncated_head(self):
+        """앞부분이 값 중간에서 잘려도 남은 키로 형식을 추정하는지 테스트합니다."""
+        head = self.syft_raw[:self.syft_raw.index(b'"syft"') + 20]
+        self.assertEqual(detect_format(head), SYFT)
+        spdx = b'{"name": "doc", "spdxVersion": "SPDX-2.3", "comment": "' + b"x" * 100
+        self.assertEqual(detect_format(spdx), SPDX)
+
+    def test_key_sorted_syft(self):
+        """키가 정렬되어 metadata가 components 뒤에 있는 Syft 문서를 Hatbom으로 판별하지 않는지 테스트합니다."""
+        raw = json.dumps(json.loads(self.syft_raw), sort_keys=True).encode()
+        fmt, _ = sniff(io.BytesIO(raw))
+        self.assertEqual(fmt, CYCLONEDX)
+        self.assertIs(model_for(fmt, default=SyftSbom), SyftSbom)
+
+        # 문서 전체를 디코딩하는 경로는 전체 필드로 판별
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsInstance(SBOMParser().parse_bytes(raw), SyftSbom)
+            if msgspec is not None:
+                self.assertEqual(SBOMParser().parse_bytes(raw, typed=True).tool, "Syft")
+
+    def test_sniff_replays_head(self):
+        """판별에 읽은 앞부분을 포함해 원본 바이트를 그대로 다시 읽을 수 있는지 테스트합니다."""
+        document = json.loads(self.syft_raw)
+        document["metadata"]["padding"] = "x" * 10000
+        raw = json.dumps(document).encode()
+
+        fmt, fp = sniff(io.BytesIO(raw), size=1024)
+        self.assertEqual(fmt, SYFT)
+        self.assertEqual(fp.read(100) + fp.read(), raw)
+        self.assertEqual(SyftSbom.from_stream(sniff(io.BytesIO(raw))[1]), SyftSbom.from_json(document))
+
+    def test_model_for(self):
+        """형식별 모델 선택과 기본 모델, SPDX 거부를 테스트합니다."""
+        self.assertIs(model_for(SYFT), SyftSbom)
+        self.assertIs(model_for(HATBOM, default=SyftSbom), HatbomSbom)
+        self.assertIs(model_for(CYCLONEDX), HatbomSbom)
+        self.assertIs(model_for(CYCLONEDX, default=SyftSbom), SyftSbom)
+        with self.assertRaises(UnsupportedFormatError):
+            model_for(SPDX)
+
+    def test_sniff_path_gzip(self):
+        """gzip 파일도 앞부분만 압축 해제하여 판별하는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sbom.json.gz"
+            path.write_bytes(gzip.compress(self.syft_raw))
+            self.assertEqual(sniff_path(str(path)), SYFT)
+
+
+if __name__ == "__main__":
+    unittest.main()
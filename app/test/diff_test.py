@@ -0,0 +1,106 @@
+import io
+import json
+import unittest
+
+from app.services import codec
+from app.services.diff import SBOMDiff, component_key
+
+'''
+실행 방법
+python -m app.test.diff_test
+'''
+
+class TestSBOMDiff(unittest.TestCase):
+    def setUp(self):
+        """이전/새 릴리스 SBOM을 준비합니다."""
+        self.base = {
+            "bomFormat": "CycloneDX",
+            "metadata": {"component": {"name": "app", "version": "1.0.0", "bom-ref": "app@1"}},
+            "components": [
+                {"name": "numpy", "version": "2.2.5", "purl": "pkg:pypi/numpy@2.2.5", "bom-ref": "n1",
+                 "licenses": [{"license": {"id": "BSD-3-Clause"}}]},
+                {"name": "requests", "version": "2.31.0", "purl": "pkg:pypi/requests@2.31.0", "bom-ref": "r1",
+                 "licenses": [{"license": {"id": "Apache-2.0"}}]},
+                {"name": "model.bin", "version": "UNKNOWN", "bom-ref": "m1",
+                 "hashes": [{"alg": "SHA-256", "content": "aaa"}]},
+                {"name": "six", "version": "1.16.0", "purl": "pkg:pypi/six@1.16.0", "bom-ref": "s1"}
+            ],
+            "dependencies": [
+                {"ref": "app@1", "dependsOn": ["n1", "r1", "s1"]},
+                {"ref": "r1", "dependsOn": ["s1"]}
+            ]
+        }
+        # bom-ref와 root 버전이 모두 바뀐 새 릴리스
+        self.target = {
+            "bomFormat": "CycloneDX",
+            "metadata": {"component": {"name": "app", "version": "1.1.0", "bom-ref": "app@2"}},
+            "components": [
+                {"name": "numpy", "version": "2.2.6", "purl": "pkg:PyPI/NumPy@2.2.6", "bom-ref": "n2",
+                 "licenses": [{"license": {"id": "BSD-3-Clause"}}]},
+                {"name": "requests", "version": "2.31.0", "purl": "pkg:pypi/requests@2.31.0", "bom-ref": "r2",
+                 "licenses": [{"expression": "Apache-2.0 OR MIT"}]},
+                {"name": "model.bin", "version": "UNKNOWN", "bom-ref": "m2",
+                 "hashes": [{"alg": "SHA-256", "content": "bbb"}]},
+                {"name": "urllib3", "version": "2.0.0", "purl": "pkg:pypi/urllib3@2.0.0", "bom-ref": "u2"}
+            ],
+            "dependencies": [
+                {"ref": "app@2", "dependsOn": ["n2", "r2"]},
+                {"ref": "r2", "dependsOn": ["u2"]}
+            ]
+        }
+
+    def diff(self) -> SBOMDiff:
+        return SBOMDiff.from_streams(
+            io.BytesIO(json.dumps(self.base).encode()), io.BytesIO(json.dumps(self.target).encode())
+        )
+
+    def test_summary(self):
+        """컴포넌트/간선 변경 종류별 개수를 테스트합니다."""
+        self.assertEqual(self.diff().summary(), {
+            "base_components": 4,
+            "target_components": 4,
+            "added": 1,
+            "removed": 1,
+            "changed": 3,
+            "version_changed": 1,
+            "license_changed": 1,
+            "hash_changed": 1,
+            "unchanged": 0,
+            "edges_added": 1,
+            "edges_removed": 2
+        })
+
+    def test_changes(self):
+        """변경 항목 내용과 순서를 테스트합니다."""
+        changes = list(self.diff().iter_changes())
+
+        self.assertEqual([c["change"] for c in changes],
+                         ["changed", "changed", "changed", "added", "removed", "edge_added", "edge_removed", "edge_removed"])
+        numpy, requests, model = changes[:3]
+        self.assertEqual((numpy["fields"], numpy["previous_version"]), (["version"], "2.2.5"))
+        self.assertEqual(numpy["key"], "pkg:pypi/numpy@2.2.6")
+        self.assertEqual(requests["licenses"], {"before": ["Apache-2.0"], "after": ["Apache-2.0 OR MIT"]})
+        self.assertEqual(model["hashes"], {
+            "added": [{"alg": "SHA-256", "content": "bbb"}],
+            "removed": [{"alg": "SHA-256", "content": "aaa"}]
+        })
+        self.assertEqual(changes[3]["name"], "urllib3")
+        self.assertEqual(changes[4]["name"], "six")
+        # bom-ref가 달라도 짝지어진 컴포넌트 기준으로 간선을 비교 (app -> numpy, app -> requests는 그대로)
+        self.assertEqual(changes[5], {"change": "edge_added", "ref": "r2", "dependsOn": "u2"})
+        self.assertEqual({(c["ref"], c["dependsOn"]) for c in changes[6:]}, {("app@1", "s1"), ("r1", "s1")})
+
+    def test_iter_json(self):
+        """스트리밍 출력이 to_dict() 직렬화 결과와 같은지 테스트합니다."""
+        diff = self.diff()
+        self.assertEqual("".join(diff.iter_json()), codec.dumps_compact(diff.to_dict()).decode("utf-8"))
+
+    def test_component_key(self):
+        """정규 키 우선순위(PURL -> name@version -> 해시)를 테스트합니다."""
+        self.assertEqual(component_key("x", "1", "pkg:PyPI/Typing_Extensions@4.12.2"), "pkg:pypi/typing-extensions@4.12.2")
+        self.assertEqual(component_key("x", "1", None), "x@1")
+        self.assertEqual(component_key(None, None, None, (("MD5", "abc"),)), "hash:MD5:abc")
+
+
+if __name__ == '__main__':
+    unittest.main()
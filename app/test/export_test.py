@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock
 import json
 import tempfile
 import os
@@ -162,6 +163,34 @@ class TestSBOMExporter(unittest.TestCase):
         json_str_indent4 = self.exporter.to_json(indent=4)
         self.assertNotEqual(json_str, json_str_indent4)  # 들여쓰기가 다르면 내용이 달라야 함
 
+    def test_iter_json_matches_to_json(self):
+        """iter_json()의 조각을 이어 붙인 결과가 to_json()/compact 출력과 같은지 테스트합니다."""
+        for indent in (2, 4, None):
+            self.assertEqual("".join(self.exporter.iter_json(indent=indent)), self.exporter.to_json(indent=indent))
+
+        compact = "".join(self.exporter.iter_json(compact=True))
+        self.assertEqual(compact, json.dumps(self.exporter.to_dict(), ensure_ascii=False, separators=(",", ":")))
+
+        # 컴포넌트가 없는 경우
+        self.unified_sbom.components = []
+        self.assertEqual("".join(self.exporter.iter_json()), self.exporter.to_json())
+
+    def test_iter_json_is_lazy(self):
+        """컴포넌트를 모두 변환하기 전에 첫 조각을 내보내는지 테스트합니다."""
+        converted = []
+        original = self.exporter.iter_components
+
+        def tracking():
+            for comp in original():
+                converted.append(comp)
+                yield comp
+
+        self.exporter.iter_components = tracking
+        with unittest.mock.patch("app.services.export.STREAM_CHUNK_SIZE", 1):
+            chunks = self.exporter.iter_json()
+            next(chunks)
+        self.assertLess(len(converted), len(self.unified_sbom.components))
+
     def test_get_filename_with_component(self):
         """컴포넌트 이름이 있을 때 올바른 파일명을 생성하는지 테스트합니다."""
         filename = self.exporter.get_filename()
@@ -0,0 +1,97 @@
+import unittest
+
+from app.services.graph import DependencyGraph, GraphIndex, resolve_remap
+
+'''
+실행 방법
+python -m app.test.graph_test
+'''
+
+class TestDependencyGraph(unittest.TestCase):
+    def test_union_merge(self):
+        """같은 ref의 dependsOn이 여러 항목에 나뉘어 있으면 합집합으로 병합되는지 테스트합니다."""
+        graph = DependencyGraph.from_dependencies([
+            {"ref": "a", "dependsOn": ["b", "c"]},
+            {"ref": "b", "dependsOn": []},
+            {"ref": "a", "dependsOn": ["c", "d"]},
+        ])
+        self.assertEqual(graph.to_dependencies(), [
+            {"ref": "a", "dependsOn": ["b", "c", "d"]},
+            {"ref": "b", "dependsOn": []},
+        ])
+        self.assertEqual(graph.edge_count, 3)
+        self.assertIn("b", graph)
+        self.assertNotIn("d", graph)
+
+    def test_remap(self):
+        """재매핑 표로 ref와 dependsOn을 다시 쓰고, 병합으로 생긴 자기 자신 간선은 제외하는지 테스트합니다."""
+        graph = DependencyGraph()
+        graph.merge([("old-a", ["b", "a"]), ("b", ["old-a"])], remap={"old-a": "a"})
+        self.assertEqual(graph.depends_on("a"), ["b"])
+        self.assertEqual(graph.depends_on("b"), ["a"])
+
+    def test_dangling_refs(self):
+        """컴포넌트 목록에 없는 ref를 처음 등장한 순서대로 찾는지 테스트합니다."""
+        graph = DependencyGraph.from_dependencies([
+            {"ref": "root", "dependsOn": ["a", "missing-1"]},
+            {"ref": "missing-2", "dependsOn": ["a", "missing-1"]},
+        ])
+        self.assertEqual(graph.dangling_refs({"root", "a"}), ["missing-1", "missing-2"])
+
+    def test_resolve_remap(self):
+        """연쇄된 재매핑을 최종 ref로 펼치고, 순환에서 멈추는지 테스트합니다."""
+        self.assertEqual(resolve_remap({"a": "b", "b": "c"}), {"a": "c", "b": "c"})
+        self.assertEqual(resolve_remap({"x": "y", "y": "x"}), {"x": "y", "y": "x"})
+
+
+class TestGraphIndex(unittest.TestCase):
+    def setUp(self):
+        # root -> a -> b -> c -> a (순환), b -> d, root -> e
+        self.dependencies = [
+            {"ref": "root", "dependsOn": ["a", "e"]},
+            {"ref": "a", "dependsOn": ["b"]},
+            {"ref": "b", "dependsOn": ["c", "d"]},
+            {"ref": "c", "dependsOn": ["a"]},
+            {"ref": "d", "dependsOn": ["d"]},
+        ]
+
+    def _check(self, graph: GraphIndex):
+        self.assertEqual(graph.descendants("root"), ["a", "e", "b", "c", "d"])
+        self.assertEqual(graph.descendants("a"), ["b", "c", "d"])
+        self.assertEqual(graph.ancestors("d"), ["root", "a", "b", "c"])
+        self.assertEqual(graph.ancestors("root"), [])
+        self.assertTrue(graph.depends_on("c", "d"))
+        self.assertFalse(graph.depends_on("e", "a"))
+        self.assertEqual(graph.shortest_path("root", "d"), ["root", "a", "b", "d"])
+        self.assertIsNone(graph.shortest_path("e", "root"))
+        self.assertEqual(graph.cycles(), [["a", "b", "c"], ["d"]])
+        with self.assertRaises(KeyError):
+            graph.descendants("missing")
+
+    def test_precomputed_reachability(self):
+        """모든 SCC의 도달 가능 비트셋을 미리 계산한 경우의 질의 결과를 테스트합니다."""
+        self._check(GraphIndex(self.dependencies))
+
+    def test_memoized_reachability(self):
+        """미리 계산하지 않고 질의마다 BFS 후 메모이즈하는 경우도 같은 결과인지 테스트합니다."""
+        graph = GraphIndex(self.dependencies, reachability_limit=0, memo_size=2)
+        self._check(graph)
+        self.assertLessEqual(len(graph._memo), 2)
+
+    def test_topological_order(self):
+        """의존하는 ref가 의존 대상보다 항상 앞에 오는지 테스트합니다."""
+        graph = GraphIndex([{"ref": f"n{i}", "dependsOn": [f"n{i + 1}", f"n{i + 2}"]} for i in range(50)])
+        position = {ref: i for i, ref in enumerate(graph.topological_order())}
+        self.assertEqual(len(position), 52)
+        for i in range(50):
+            self.assertLess(position[f"n{i}"], position[f"n{i + 1}"])
+
+    def test_deep_chain(self):
+        """재귀 깊이 제한 없이 긴 의존 사슬을 처리하는지 테스트합니다."""
+        graph = GraphIndex([{"ref": f"n{i}", "dependsOn": [f"n{i + 1}"]} for i in range(5000)])
+        self.assertEqual(len(graph.descendants("n0")), 5000)
+        self.assertEqual(len(graph.shortest_path("n0", "n5000")), 5001)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import copy
+import unittest
+
+from app.models.hatbom_sbom import HatbomSbom, Component as HatComponent, Hash, Metadata as HatMetadata
+from app.models.syft_sbom import SyftSbom, Component as SyftComponent, License
+from app.services.export import SBOMExporter
+from app.services.incremental import IncrementalIntegrator
+from app.services.integrate import SBOMIntegrator
+
+'''
+실행 방법
+python -m app.test.incremental_test
+'''
+
+class TestIncrementalIntegrator(unittest.TestCase):
+    def setUp(self):
+        """테스트에 사용할 가상 데이터를 준비합니다."""
+        self.hatbom = HatbomSbom(
+            bom_format="CycloneDX",
+            spec_version="1.4",
+            serial_number="uuid-1",
+            version=1,
+            metadata=HatMetadata(
+                timestamp="2024-01-01T00:00:00Z",
+                authors=[],
+                component={"name": "test-app", "version": "1.0.0", "type": "application", "bom-ref": "root"}
+            ),
+            components=[
+                HatComponent(
+                    name="numpy", version="2.2.6", type="file",
+                    bom_ref="hat-numpy", purl="pkg:pypi/numpy@2.2.6",
+                    hashes=[Hash(alg="MD5", content="hash-numpy-123")]
+                )
+            ],
+            dependencies=[]
+        )
+        syft_metadata = type('obj', (object,), {
+            'timestamp': '2024-01-01T00:00:00Z',
+            'tools': [{'name': 'syft', 'version': '1.0.0'}],
+            'main_component': {'bom_ref': 'root', 'type': 'application', 'name': 'test-app', 'version': '1.0.0'},
+        })()
+        self.syft = SyftSbom(
+            schema={"version": "14.0.0"},
+            bom_format="CycloneDX",
+            spec_version="1.6",
+            serial_number="uuid-2",
+            version=1,
+            metadata=syft_metadata,
+            components=[
+                SyftComponent(
+                    name="numpy", version="2.2.6", type="library",
+                    bom_ref="syft-numpy", purl="pkg:pypi/numpy@2.2.6",
+                    licenses=[License(id="BSD-3-Clause", name="BSD 3-Clause License")],
+                    properties=[]
+                ),
+                SyftComponent(
+                    name="requests", version="2.31.0", type="library",
+                    bom_ref="syft-requests", purl="pkg:pypi/requests@2.31.0",
+                    licenses=[License(id="Apache-2.0", name="Apache License 2.0")],
+                    properties=[]
+                )
+            ],
+            dependencies=[]
+        )
+        self.integrator = IncrementalIntegrator()
+        self.integrator.integrate(self.hatbom, self.syft)
+
+    def assertSameAsFull(self, hatbom, syft):
+        """증분 결과가 같은 문서를 처음부터 통합한 결과와 같은지 확인합니다."""
+        full = SBOMIntegrator()
+        expected = full.integrate(hatbom, syft)
+        expected.serial_number = self.integrator.unified_sbom.serial_number
+        actual = self.integrator.unified_sbom
+        self.assertEqual(
+            "".join(SBOMExporter(actual).iter_json(compact=True)),
+            "".join(SBOMExporter(expected).iter_json(compact=True))
+        )
+        self.assertEqual(
+            SBOMExporter(actual, self.integrator.stats).get_summary(),
+            SBOMExporter(expected, full.stats).get_summary()
+        )
+
+    def test_patched_update(self):
+        """변경/추가/삭제가 다른 매칭에 영향을 주지 않으면 제자리에서 반영하는지 테스트합니다."""
+        syft = copy.deepcopy(self.syft)
+        syft.components[0].cpe = "cpe:2.3:a:numpy:numpy:2.2.6"
+        syft.components.pop(1)
+        syft.components.append(SyftComponent(
+            name="urllib3", version="2.0.0", type="library",
+            bom_ref="syft-urllib3", purl="pkg:pypi/urllib3@2.0.0", properties=[]
+        ))
+
+        report = self.integrator.update(syft)
+
+        self.assertTrue(report.patched)
+        self.assertEqual((report.added, report.removed, report.changed), (1, 1, 1))
+        self.assertEqual([c.name for c in self.integrator.unified_sbom.components], ["numpy", "urllib3"])
+        self.assertSameAsFull(self.hatbom, syft)
+
+    def test_fallback_update(self):
+        """삭제가 다른 문서의 매칭 결과를 바꾸면 전체 재통합으로 반영하는지 테스트합니다."""
+        # Syft 쪽 numpy가 사라지면 Hatbom의 numpy가 새 통합 컴포넌트가 되어야 함
+        syft = copy.deepcopy(self.syft)
+        syft.components.pop(0)
+        syft.components.append(copy.deepcopy(self.syft.components[0]))
+
+        report = self.integrator.update(syft)
+
+        self.assertFalse(report.patched)
+        self.assertIsNotNone(report.reason)
+        self.assertSameAsFull(self.hatbom, syft)
+
+    def test_update_adds_qualifier_variant(self):
+        """같은 문서에 qualifier만 다른 컴포넌트를 추가하면 기존 컴포넌트에 병합하지 않는지 테스트합니다."""
+        syft = copy.deepcopy(self.syft)
+        syft.components.append(SyftComponent(
+            name="requests", version="2.31.0", type="library",
+            bom_ref="syft-requests-whl", purl="pkg:pypi/requests@2.31.0?file_name=requests.whl", properties=[]
+        ))
+
+        self.integrator.update(syft)
+
+        self.assertEqual(len(self.integrator.unified_sbom.components), 3)
+        self.assertSameAsFull(self.hatbom, syft)
+
+    def test_update_requires_single_target(self):
+        """바꿀 문서를 정할 수 없으면 ValueError가 발생하는지 테스트합니다."""
+        integrator = IncrementalIntegrator()
+        with self.assertRaises(ValueError):
+            integrator.update(self.syft)
+
+        integrator.integrate_many([self.syft, copy.deepcopy(self.syft)])
+        with self.assertRaises(ValueError):
+            integrator.update(copy.deepcopy(self.syft))
+        self.assertTrue(integrator.update(copy.deepcopy(self.syft), index=1).patched)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,26 @@
+import contextlib
+import io
 import unittest
+from pathlib import Path
 # 실제 모델 파일 경로에 맞게 import 경로가 정확한지 확인해주세요.
 from app.models.hatbom_sbom import HatbomSbom, Component as HatComponent, Hash, Metadata as HatMetadata, Dependency as HatDependency
 from app.models.syft_sbom import SyftSbom, Component as SyftComponent, License
 from app.services.integrate import SBOMIntegrator
+from app.services.export import SBOMExporter
+from app.services.parse import SBOMParser
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 '''
 실행 방법
 python -m app.test.integrate_test
 '''
 
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
 class TestSBOMIntegrator(unittest.TestCase):
     def setUp(self):
         """테스트에 사용할 가상 데이터를 준비합니다."""
@@ -126,5 +138,156 @@ class TestSBOMIntegrator(unittest.TestCase):
         self.assertIn("Syft", sources)
         self.assertIn("Hatbom", sources)
 
+    def test_fuzzy_name_matching(self):
+        """PURL/이름이 정확히 같지 않아도 정규화 이름과 버전이 같으면 병합되는지 확인합니다."""
+        self.hatbom.components.append(HatComponent(
+            name="Requests", version="v2.31.0", type="file",
+            bom_ref="requests-file", purl=None,
+            hashes=[Hash(alg="SHA-256", content="hash-requests-456")]
+        ))
+        result = self.integrator.integrate(self.hatbom, self.syft)
+
+        self.assertEqual(len(result.components), 2)
+        requests_comp = next(c for c in result.components if c.name == "requests")
+        self.assertEqual(requests_comp.hashes[0]['content'], "hash-requests-456")
+        self.assertIn({"name": "integration_match", "value": "fuzzy"}, requests_comp.properties)
+
+    def test_purl_canonical_matching(self):
+        """표기만 다르거나 qualifier만 다른 PURL이 같은 컴포넌트로 병합되는지 확인합니다."""
+        self.hatbom.components.append(HatComponent(
+            name="requests", version="2.31.0", type="file",
+            bom_ref="requests-file", purl="pkg:PyPI/Requests@2.31.0?file_name=requests.whl",
+            hashes=[Hash(alg="SHA-256", content="hash-requests-456")]
+        ))
+        result = SBOMIntegrator(fuzzy_matching=False).integrate(self.hatbom, self.syft)
+
+        self.assertEqual(len(result.components), 2)
+        requests_comp = next(c for c in result.components if c.name == "requests")
+        self.assertEqual(requests_comp.hashes[0]['content'], "hash-requests-456")
+        self.assertNotIn({"name": "integration_match", "value": "fuzzy"}, requests_comp.properties)
+
+    def test_qualifier_variants_in_same_document(self):
+        """같은 문서 안에서 qualifier만 다른 PURL은 서로 다른 컴포넌트로 유지되는지 확인합니다."""
+        for arch in ("amd64", "arm64"):
+            self.syft.components.append(SyftComponent(
+                name="libc6", version="2.36", type="library",
+                bom_ref=f"libc6-{arch}", purl=f"pkg:deb/debian/libc6@2.36?arch={arch}", properties=[]
+            ))
+        result = self.integrator.integrate(self.hatbom, self.syft)
+
+        libc = [c for c in result.components if c.name == "libc6"]
+        self.assertEqual([c.bom_ref for c in libc], ["libc6-amd64", "libc6-arm64"])
+        self.assertEqual(self.integrator.stats.integrated_count, 1)  # numpy만 병합
+
+    @unittest.skipIf(msgspec is None, "msgspec이 설치되어 있지 않습니다")
+    def test_integrate_typed_models(self):
+        """msgspec Struct 모델(typed=True)도 dataclass 모델과 같은 통합 결과를 내는지 확인합니다."""
+        parser = SBOMParser()
+        paths = [str(DATA_DIR / f"transformers_{tool}_sbom.json") for tool in ("hatbom", "syft")]
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = SBOMIntegrator().integrate(*(parser.parse(path) for path in paths))
+            typed = SBOMIntegrator().integrate(*(parser.parse(path, typed=True) for path in paths))
+
+        typed.serial_number = expected.serial_number
+        self.assertEqual(
+            "".join(SBOMExporter(typed).iter_json(compact=True)),
+            "".join(SBOMExporter(expected).iter_json(compact=True))
+        )
+
+    def test_fuzzy_matching_disabled(self):
+        """유사도 매칭을 끄면 완전 일치하는 컴포넌트만 병합되는지 확인합니다."""
+        self.hatbom.components.append(HatComponent(
+            name="Requests", version="v2.31.0", type="file",
+            bom_ref="requests-file", purl=None, hashes=[]
+        ))
+        result = SBOMIntegrator(fuzzy_matching=False).integrate(self.hatbom, self.syft)
+        self.assertEqual(len(result.components), 3)
+
+    def test_integrate_many_matches_pairwise(self):
+        """integrate_many([hatbom, syft])가 integrate(hatbom, syft)와 같은 결과를 내는지 확인합니다."""
+        pairwise = SBOMIntegrator().integrate(self.hatbom, self.syft)
+        many = SBOMIntegrator().integrate_many([self.hatbom, self.syft])
+        self.assertEqual(pairwise.components, many.components)
+        self.assertEqual(pairwise.dependencies, many.dependencies)
+
+    def test_integrate_many_precedence(self):
+        """여러 SBOM을 한 번에 통합할 때 우선순위가 높은 문서의 정보가 베이스가 되는지 확인합니다."""
+        layer_syft = SyftSbom(
+            schema=self.syft.schema, bom_format="CycloneDX", spec_version="1.6",
+            serial_number="uuid-3", version=1, metadata=self.syft.metadata,
+            components=[
+                SyftComponent(
+                    name="numpy", version="2.2.6", type="library",
+                    bom_ref="layer-ref-1", purl="pkg:pypi/numpy@2.2.6",
+                    licenses=[], properties=[]
+                ),
+                SyftComponent(
+                    name="urllib3", version="2.2.0", type="library",
+                    bom_ref="layer-ref-2", purl="pkg:pypi/urllib3@2.2.0",
+                    licenses=[], properties=[]
+                )
+            ],
+            dependencies=[]
+        )
+        result = SBOMIntegrator().integrate_many(
+            [self.hatbom, layer_syft, self.syft], precedence=["Hatbom", "Syft"]
+        )
+
+        # numpy(3곳), requests, urllib3
+        self.assertEqual(len(result.components), 3)
+        numpy_comp = result.components[0]
+        self.assertEqual(numpy_comp.bom_ref, "pkg:pypi/numpy@2.2.6")
+        self.assertEqual(numpy_comp.type, "file")
+        # 비어 있던 라이선스는 우선순위가 낮은 문서에서 채워짐
+        self.assertEqual(numpy_comp.licenses[0]['license']['id'], "BSD-3-Clause")
+        integrated = [p['value'] for p in numpy_comp.properties if p['name'] == 'integrated_with']
+        self.assertEqual(integrated, ["Syft", "Syft"])
+
+    def test_integration_stats(self):
+        """병합 중 기록한 출처/통합 여부와 카운터가 properties 기반 계산과 같은지 확인합니다."""
+        self.hatbom.components.append(HatComponent(
+            name="Requests", version="v2.31.0", type="file",
+            bom_ref="requests-file", purl=None, hashes=[]
+        ))
+        result = self.integrator.integrate(self.hatbom, self.syft)
+        stats = self.integrator.stats
+
+        self.assertEqual(len(stats), len(result.components))
+        self.assertEqual(stats.source_counts, {"Syft": 2})
+        self.assertEqual(stats.integrated_count, 2)
+        self.assertEqual(stats.fuzzy_matches, 1)
+
+        # 카운터로 만든 요약/표 행이 properties를 다시 훑어 만든 결과와 같아야 함
+        with_stats = SBOMExporter(result, stats)
+        without_stats = SBOMExporter(result)
+        self.assertEqual(with_stats.get_summary(), without_stats.get_summary())
+        self.assertEqual(with_stats.component_rows(), without_stats.component_rows())
+        self.assertEqual([row["source"] for row in with_stats.component_rows()], ["Syft", "Syft"])
+
+        # 통합 후 컴포넌트 목록이 바뀌면 기록을 사용하지 않음
+        result.components.pop()
+        self.assertEqual(with_stats.get_summary()["total_components"], 1)
+        self.assertEqual(with_stats.get_summary()["components_from_syft"], 1)
+
+    def test_dependency_union_and_remap(self):
+        """같은 ref의 dependsOn을 합집합으로 병합하고, 병합된 컴포넌트의 ref를 통합 컴포넌트 ref로 바꾸는지 확인합니다."""
+        self.hatbom.dependencies = [
+            HatDependency(ref="pkg:maven/com.test/test-app@1.0.0", depends_on=["pkg:pypi/numpy@2.2.6"]),
+            HatDependency(ref="pkg:pypi/numpy@2.2.6", depends_on=["missing-lib"]),
+        ]
+        self.syft.dependencies = [
+            {"ref": "syft-ref-1", "dependsOn": ["syft-ref-2"]},
+            {"ref": "pkg:maven/com.test/test-app@1.0.0", "dependsOn": ["syft-ref-2"]},
+        ]
+        result = self.integrator.integrate(self.hatbom, self.syft)
+
+        # Hatbom의 numpy ref는 Syft 기준으로 병합된 numpy(syft-ref-1)를 가리킴
+        self.assertEqual(result.dependencies, [
+            {"ref": "pkg:maven/com.test/test-app@1.0.0", "dependsOn": ["syft-ref-1", "syft-ref-2"]},
+            {"ref": "syft-ref-1", "dependsOn": ["missing-lib", "syft-ref-2"]},
+        ])
+        self.assertEqual(self.integrator.stats.dangling_refs, ["missing-lib"])
+        self.assertEqual(self.integrator.graph.edge_count, 4)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,161 @@
+import asyncio
+import gzip
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from app.services import jobs
+from app.services.cache import ResultCache
+from app.services.concurrency import shutdown_executor
+from app.services.export import SBOMExporter
+from app.services.integrate import SBOMIntegrator
+from app.services.jobs import (
+    FAILED, QUEUED, RESULT_BLOB, SUCCEEDED,
+    FileJobStore, JobQueue, MemoryJobStore, QueueFullError,
+)
+from app.services.parse import SBOMParser
+
+'''
+실행 방법
+python -m app.test.jobs_test
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+class TestJobQueue(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hatbom_raw = (DATA_DIR / "transformers_hatbom_sbom.json").read_bytes()
+        cls.syft_raw = (DATA_DIR / "transformers_syft_sbom.json").read_bytes()
+        parser = SBOMParser()
+        unified = SBOMIntegrator().integrate(
+            parser.parse_bytes(cls.hatbom_raw), parser.parse_bytes(cls.syft_raw)
+        )
+        cls.expected_summary = SBOMExporter(unified).get_summary()
+
+    def tearDown(self):
+        shutdown_executor()
+
+    def _inputs(self, hatbom_raw: bytes = None):
+        return {"hatbom": (hatbom_raw or self.hatbom_raw, None), "syft": (self.syft_raw, None)}
+
+    def _check_result(self, queue: JobQueue, job):
+        self.assertEqual(job.status, SUCCEEDED)
+        self.assertEqual(job.progress, 1.0)
+        document = queue.store.get_blob(job.id, RESULT_BLOB)
+        unified = SBOMParser().parse_bytes(document)
+        self.assertEqual(len(unified.components), self.expected_summary["total_components"])
+        for name in ("total_components", "components_from_syft", "components_from_hatbom", "integrated_components"):
+            self.assertEqual(job.summary[name], self.expected_summary[name])
+        # 완료된 작업의 입력은 삭제됨
+        self.assertIsNone(queue.store.get_blob(job.id, "hatbom"))
+
+    async def test_submit_and_wait(self):
+        """제출한 작업이 백그라운드에서 완료되고 결과를 조회할 수 있는지 테스트합니다."""
+        queue = JobQueue(MemoryJobStore(), workers=1)
+        await queue.start()
+        try:
+            job = await queue.submit(self._inputs(), {"hatbom": "h.json", "syft": "s.json"})
+            self.assertEqual(job.status, QUEUED)
+            job = await queue.wait(job.id, timeout=30)
+            self._check_result(queue, job)
+            self.assertEqual(job.filenames, {"hatbom": "h.json", "syft": "s.json"})
+        finally:
+            await queue.stop()
+
+    async def test_compressed_input_and_cache(self):
+        """압축 입력을 처리하고, 같은 입력의 두 번째 작업은 결과 캐시를 사용하는지 테스트합니다."""
+        queue = JobQueue(MemoryJobStore(), workers=1, cache=ResultCache())
+        await queue.start()
+        try:
+            inputs = {"hatbom": (gzip.compress(self.hatbom_raw), "gzip"), "syft": (self.syft_raw, None)}
+            first = await queue.wait((await queue.submit(inputs)).id, timeout=30)
+            second = await queue.wait((await queue.submit(inputs)).id, timeout=30)
+            self._check_result(queue, first)
+            self.assertFalse(first.cache_hit)
+            self.assertTrue(second.cache_hit)
+            self.assertEqual(
+                queue.store.get_blob(first.id, RESULT_BLOB), queue.store.get_blob(second.id, RESULT_BLOB)
+            )
+        finally:
+            await queue.stop()
+
+    async def test_invalid_json_fails(self):
+        """잘못된 입력의 작업은 failed 상태와 오류 메시지를 남기는지 테스트합니다."""
+        queue = JobQueue(MemoryJobStore(), workers=1)
+        await queue.start()
+        try:
+            job = await queue.wait((await queue.submit(self._inputs(b"{bad"))).id, timeout=30)
+            self.assertEqual(job.status, FAILED)
+            self.assertIn("JSON", job.error)
+        finally:
+            await queue.stop()
+
+    async def test_queue_full(self):
+        """대기 작업 수가 상한에 도달하면 QueueFullError가 발생하는지 테스트합니다."""
+        queue = JobQueue(MemoryJobStore(), workers=1, max_pending=1)
+        await queue.submit(self._inputs())
+        with self.assertRaises(QueueFullError):
+            await queue.submit(self._inputs())
+
+    async def test_file_store_survives_restart(self):
+        """file 저장소에 남은 미완료 작업이 새 큐 시작 시 다시 실행되는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as job_dir:
+            # 작업자를 시작하지 않은 큐에 제출 (제출 직후 종료된 상황)
+            job = await JobQueue(FileJobStore(job_dir)).submit(self._inputs())
+
+            queue = JobQueue(FileJobStore(job_dir), workers=1)
+            self.assertEqual(queue.get(job.id).status, QUEUED)
+            await queue.start()
+            try:
+                self._check_result(queue, await queue.wait(job.id, timeout=30))
+            finally:
+                await queue.stop()
+
+    async def test_delete(self):
+        """삭제한 작업은 조회되지 않는지 테스트합니다."""
+        queue = JobQueue(MemoryJobStore())
+        job = await queue.submit(self._inputs())
+        self.assertTrue(queue.delete(job.id))
+        self.assertIsNone(queue.get(job.id))
+        self.assertFalse(queue.delete(job.id))
+
+    async def _delete_while_running(self, queue: JobQueue):
+        """파싱이 끝나기 전에 작업을 삭제하고, 작업자가 끝난 뒤의 작업 상태를 반환합니다."""
+        original = jobs.parse_payloads
+
+        async def slow_parse(*args, **kwargs):
+            await asyncio.sleep(0.3)
+            return await original(*args, **kwargs)
+
+        with unittest.mock.patch("app.services.jobs.parse_payloads", slow_parse):
+            await queue.start()
+            try:
+                job = await queue.submit(self._inputs())
+                await asyncio.sleep(0.1)
+                self.assertEqual(queue.get(job.id).status, "running")
+                self.assertTrue(queue.delete(job.id))
+                await asyncio.wait_for(queue._queue.join(), 30)
+            finally:
+                await queue.stop()
+        return job.id
+
+    async def test_delete_running_job(self):
+        """실행 중 삭제한 작업이 다음 단계 기록으로 되살아나지 않는지 테스트합니다."""
+        store = MemoryJobStore()
+        job_id = await self._delete_while_running(JobQueue(store, workers=1))
+        self.assertIsNone(store.load(job_id))
+        self.assertIsNone(store.get_blob(job_id, RESULT_BLOB))
+        self.assertIsNone(store.get_blob(job_id, "hatbom"))
+
+    async def test_delete_running_job_file_store(self):
+        """file 저장소에서 실행 중 삭제한 작업의 파일이 남지 않아 재시작 시 다시 실행되지 않는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as job_dir:
+            await self._delete_while_running(JobQueue(FileJobStore(job_dir), workers=1))
+            self.assertEqual(list(Path(job_dir).iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
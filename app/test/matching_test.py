@@ -0,0 +1,50 @@
+import unittest
+from app.services.matching import FuzzyNameIndex, normalize_name, normalize_version
+
+'''
+실행 방법
+python -m app.test.matching_test
+'''
+
+class TestFuzzyNameIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FuzzyNameIndex(threshold=0.6)
+        self.index.add("PyYAML", "6.0.3", "pyyaml")
+        self.index.add("typing_extensions", "4.12.2", "typing-extensions")
+        self.index.add("huggingface-hub", "0.30.2", "hf-hub")
+
+    def test_normalize(self):
+        """이름/버전 정규화가 올바른지 테스트합니다."""
+        self.assertEqual(normalize_name("typing_extensions"), "typing-extensions")
+        self.assertEqual(normalize_name("/usr/lib/python3/PyYAML"), "pyyaml")
+        self.assertEqual(normalize_version("v1.2.0"), "1.2.0")
+        self.assertEqual(normalize_version("UNKNOWN"), "")
+
+    def test_exact_bucket(self):
+        """정규화 후 완전 일치하는 항목을 찾는지 테스트합니다."""
+        self.assertEqual(self.index.find("pyyaml", "v6.0.3"), "pyyaml")
+        self.assertEqual(self.index.find("Typing-Extensions", "4.12.2"), "typing-extensions")
+
+    def test_similar_name(self):
+        """이름이 조금 다르더라도 버전이 같으면 유사도로 매칭되는지 테스트합니다."""
+        self.assertEqual(self.index.find("huggingface_hub-cli", "0.30.2"), "hf-hub")
+        # 버전이 다르면 매칭하지 않음
+        self.assertIsNone(self.index.find("huggingface_hub-cli", "0.31.0"))
+        # 유사도가 기준 미만이면 매칭하지 않음
+        self.assertIsNone(self.index.find("numpy", "6.0.3"))
+
+    def test_unknown_version_is_not_fuzzy_matched(self):
+        """버전 정보가 없으면 완전 일치/유사도 매칭 모두에서 제외되는지 테스트합니다."""
+        self.index.add("tokenizers", None, "tok")
+        self.assertIsNone(self.index.find("tokenizers", ""))
+        self.assertIsNone(self.index.find("tokenizer", None))
+
+    def test_versionless_files_with_same_basename(self):
+        """경로만 다르고 버전이 없는 같은 이름의 파일이 서로 매칭되지 않는지 테스트합니다."""
+        self.index.add("/etc/app/config.yaml", None, "A")
+        self.index.add("/etc/app/settings.yaml", "UNKNOWN", "B")
+        self.assertIsNone(self.index.find("/opt/other/config.yaml", None))
+        self.assertIsNone(self.index.find("/opt/other/settings.yaml", "UNKNOWN"))
+
+if __name__ == "__main__":
+    unittest.main()
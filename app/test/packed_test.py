@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services.export import SBOMExporter
+from app.services.integrate import SBOMIntegrator
+from app.services.packed import PackedFormatError, PackedSbom, load_packed, save_packed
+from app.services.parse import SBOMParser
+
+'''
+실행 방법
+python -m app.test.packed_test
+'''
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+class TestPackedSbom(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        parser = SBOMParser()
+        cls.hatbom = parser.parse(str(DATA_DIR / "transformers_hatbom_sbom.json"))
+        cls.syft = parser.parse(str(DATA_DIR / "transformers_syft_sbom.json"))
+        cls.unified = SBOMIntegrator().integrate(cls.hatbom, cls.syft)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _path(self, name: str) -> str:
+        return str(Path(self.tmp.name) / name)
+
+    def test_round_trip(self):
+        """세 가지 모델 모두 저장 후 복원하면 원본과 같은지 테스트합니다."""
+        for name, sbom in (("hatbom", self.hatbom), ("syft", self.syft), ("unified", self.unified)):
+            with self.subTest(kind=name):
+                path = self._path(f"{name}.usbm")
+                save_packed(sbom, path)
+                self.assertEqual(load_packed(path), sbom)
+
+    def test_columns_without_full_load(self):
+        """전체 복원 없이 열 단위로 이름 목록/범주 집계/단일 행을 읽을 수 있는지 테스트합니다."""
+        path = self._path("syft.usbm")
+        save_packed(self.syft, path)
+        with PackedSbom.open(path) as packed:
+            self.assertEqual(packed.kind, "syft")
+            self.assertEqual(len(packed), len(self.syft.components))
+            self.assertEqual(list(packed.strings("name")), [c.name for c in self.syft.components])
+            expected = {}
+            for comp in self.syft.components:
+                expected[comp.type] = expected.get(comp.type, 0) + 1
+            self.assertEqual(packed.value_counts("type"), expected)
+            self.assertEqual(packed.component(5), self.syft.components[5])
+
+    def test_unified_summary_and_table(self):
+        """통합본의 요약과 ComponentTable이 원본 모델에서 계산한 값과 같은지 테스트합니다."""
+        path = self._path("unified.usbm")
+        exporter = SBOMExporter(self.unified)
+        exporter.save_packed(path)
+        with PackedSbom.open(path) as packed:
+            self.assertEqual(packed.summary(), exporter.get_summary())
+            table = packed.to_table()
+            expected = exporter.get_table()
+            self.assertEqual(table.source_counts(), expected.source_counts())
+            self.assertEqual(table.license.value_counts(), expected.license.value_counts())
+            self.assertEqual(table.mask(type="library", source="Syft"), expected.mask(type="library", source="Syft"))
+
+    def test_close_while_columns_are_held(self):
+        """열을 참조한 채로 닫아도 BufferError 없이 mmap/파일이 닫히는지 테스트합니다."""
+        path = self._path("unified.usbm")
+        save_packed(self.unified, path)
+        with PackedSbom.open(path) as packed:
+            name = packed.column("name")
+            source = packed.column("table.source")
+            integrated = packed.column("table.integrated")
+            self.assertEqual(name[0], self.unified.components[0].name)
+        self.assertTrue(packed._file.closed)
+        self.assertIsNone(packed._mmap)
+        for column in (name, source, integrated):
+            with self.assertRaises(ValueError):
+                column[0]
+
+    def test_invalid_file(self):
+        """packed 형식이 아닌 파일은 PackedFormatError가 발생하는지 테스트합니다."""
+        path = self._path("plain.json")
+        Path(path).write_bytes(b'{"bomFormat": "CycloneDX"}')
+        with self.assertRaises(PackedFormatError):
+            PackedSbom.open(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,16 @@
 import unittest
+import io
+import email.utils
 import json
-from app.services.parse import SBOMParser
+from app.services.parse import SBOMParser, parse_author_string, parse_authors, _split_addresses
 from app.models.hatbom_sbom import HatbomSbom
 from app.models.syft_sbom import SyftSbom
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 class TestSBOMParser(unittest.TestCase):
     def setUp(self):
         self.parser = SBOMParser()
@@ -75,10 +82,88 @@ class TestSBOMParser(unittest.TestCase):
         # author 파싱 확인
         self.assertIn("Kenneth Reitz", syft_obj.components[0].author)
 
+    def test_components_are_compact(self):
+        """컴포넌트가 __dict__ 없이 slots로 저장되고, 반복 property 이름이 intern되는지 검증"""
+        first = SyftSbom.from_json(json.loads(json.dumps(self.syft_data))).components[0]
+        second = SyftSbom.from_json(json.loads(json.dumps(self.syft_data))).components[0]
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertFalse(hasattr(first.properties[0], "__dict__"))
+        self.assertIs(first.properties[0].name, second.properties[0].name)
+        self.assertIs(first.properties[0].value, second.properties[0].value)
+
+    def test_parse_stream_matches_from_json(self):
+        """스트리밍 파싱 결과가 from_json 결과와 동일한지 검증"""
+        syft_raw = io.BytesIO(json.dumps(self.syft_data).encode("utf-8"))
+        hatbom_raw = io.BytesIO(json.dumps(self.hatbom_data).encode("utf-8"))
+
+        self.assertEqual(self.parser.parse_stream(syft_raw), SyftSbom.from_json(self.syft_data))
+        self.assertEqual(self.parser.parse_stream(hatbom_raw), HatbomSbom.from_json(self.hatbom_data))
+
+    @unittest.skipIf(msgspec is None, "msgspec이 설치되어 있지 않습니다")
+    def test_parse_bytes_typed(self):
+        """msgspec Struct 모델 디코딩 결과가 dataclass 모델과 같은 값을 가지는지 검증"""
+        syft_obj = self.parser.parse_bytes(json.dumps(self.syft_data).encode("utf-8"), typed=True)
+        expected = SyftSbom.from_json(self.syft_data)
+
+        comp = syft_obj.components[0]
+        self.assertNotIsInstance(syft_obj, SyftSbom)
+        self.assertEqual(comp.bom_ref, expected.components[0].bom_ref)
+        self.assertEqual(comp.licenses[0].id, "Apache-2.0")
+        self.assertEqual(comp.properties[0].name, "syft:package:foundBy")
+        self.assertEqual(syft_obj.metadata.tools, expected.metadata.tools)
+        self.assertEqual(syft_obj.metadata.main_component, expected.metadata.main_component)
+
+        hatbom_obj = self.parser.parse_bytes(json.dumps(self.hatbom_data).encode("utf-8"), typed=True)
+        self.assertEqual(hatbom_obj.components[0].bom_ref, "pkg:pypi/numpy@1.24.0")
+        self.assertEqual(hatbom_obj.components[0].hashes[0].content, "abc123hash")
+        self.assertEqual(hatbom_obj.metadata.component["name"], "test-app")
+
+    @unittest.skipIf(msgspec is None, "msgspec이 설치되어 있지 않습니다")
+    def test_parse_bytes_typed_invalid_json(self):
+        """Struct 디코딩 오류도 json.JSONDecodeError로 보고되는지 검증"""
+        with self.assertRaises(json.JSONDecodeError):
+            self.parser.parse_bytes(b"{invalid", typed=True)
+
+    def test_streaming_typed_rejected(self):
+        """streaming과 typed를 함께 지정하면 ValueError가 발생하는지 검증"""
+        with self.assertRaises(ValueError):
+            self.parser.parse("data/transformers_syft_sbom.json", streaming=True, typed=True)
+
     def test_file_not_found_error(self):
         """파일이 없을 때 에러 발생 확인"""
         with self.assertRaises(FileNotFoundError):
             self.parser.parse("nonexistent_file.json")
 
+    def test_author_fast_path_matches_getaddresses(self):
+        """빠른 경로가 처리하는 author 문자열은 getaddresses와 같은 결과인지 검증"""
+        fast = [
+            "Alex Grönholm <alex.gronholm@nextday.fi>",
+            "Filipe Laíns <lains@riseup.net>, Bernát Gábor <gaborjbernat@gmail.com>",
+            "Nathaniel J. Smith <njs@pobox.com>",
+            "  Name   Two  <kim+pypi@gumleaf.org> ",
+            "<a@x.io>",
+        ]
+        for author in fast:
+            self.assertEqual(_split_addresses(author), email.utils.getaddresses([author]), author)
+        # 따옴표, 주석, 이름만 있는 경우 등은 getaddresses로 처리
+        for author in ['"Jason R. Coombs" <jaraco@jaraco.com>', "Hugging Face, Inc. <a@b.co>", "anchore", "UNKNOWN <UNKNOWN>"]:
+            self.assertIsNone(_split_addresses(author), author)
+
+    def test_parse_authors(self):
+        """author 파싱 결과와 같은 저자의 객체 공유를 검증"""
+        self.assertEqual(parse_author_string("anchore"), [{"name": "anchore", "email": None}])
+        self.assertEqual(parse_author_string("   "), [])
+        self.assertEqual(
+            parse_author_string("A <a@x.io>, B <b@x.io>"),
+            [{"name": "A", "email": "a@x.io"}, {"name": "B", "email": "b@x.io"}]
+        )
+
+        first = parse_authors("Kenneth Reitz <me@kennethreitz.org>, Nate Prewitt <nate@x.io>")
+        second = parse_authors("Kenneth Reitz <me@kennethreitz.org>")
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first, parse_authors("Kenneth Reitz <me@kennethreitz.org>, Nate Prewitt <nate@x.io>"))
+        self.assertEqual((first[1].name, first[1].email), ("Nate Prewitt", "nate@x.io"))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
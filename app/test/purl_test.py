@@ -0,0 +1,45 @@
+import unittest
+from app.services.purl import canonical_purl, parse_purl
+
+'''
+실행 방법
+python -m app.test.purl_test
+'''
+
+class TestPurl(unittest.TestCase):
+    def test_parse(self):
+        """PURL 구성 요소가 올바르게 파싱되는지 테스트합니다."""
+        purl = parse_purl("pkg:maven/org.apache/commons-lang3@3.12.0?type=jar#META-INF/MANIFEST.MF")
+        self.assertEqual(purl.type, "maven")
+        self.assertEqual(purl.namespace, "org.apache")
+        self.assertEqual(purl.name, "commons-lang3")
+        self.assertEqual(purl.version, "3.12.0")
+        self.assertEqual(purl.qualifiers, (("type", "jar"),))
+        self.assertEqual(purl.subpath, "META-INF/MANIFEST.MF")
+
+    def test_canonical_equivalents(self):
+        """표기만 다른 같은 패키지의 PURL이 같은 정규 문자열이 되는지 테스트합니다."""
+        self.assertEqual(
+            canonical_purl("pkg:PyPI/Typing_Extensions@4.12.2?b=2&a=1"),
+            canonical_purl("pkg:pypi/typing-extensions@4.12.2?a=1&b=2"),
+        )
+        self.assertEqual(
+            canonical_purl("pkg:npm/%40angular/core@1.0.0"),
+            canonical_purl("pkg:npm/@angular/core@1.0.0"),
+        )
+        self.assertEqual(canonical_purl("pkg:github/Actions/Checkout@v4"), "pkg:github/actions/checkout@v4")
+        self.assertEqual(canonical_purl("pkg:maven/org.a/b@1.0?classifier=&type=jar"), "pkg:maven/org.a/b@1.0?type=jar")
+
+    def test_case_sensitive_types(self):
+        """대소문자를 구분하는 타입의 이름과 버전은 유지되는지 테스트합니다."""
+        self.assertEqual(canonical_purl("pkg:maven/Org.A/Lib@1.0-RC"), "pkg:maven/Org.A/Lib@1.0-RC")
+
+    def test_invalid(self):
+        """PURL이 아니면 None(파싱) / 원본 문자열(정규화)을 반환하는지 테스트합니다."""
+        self.assertIsNone(parse_purl("not-a-purl"))
+        self.assertIsNone(parse_purl("pkg:pypi"))
+        self.assertEqual(canonical_purl("not-a-purl"), "not-a-purl")
+        self.assertIsNone(canonical_purl(None))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import json
+import unittest
+
+from app.services.statistics import SBOMStatistics, analyze_stream, compile_keywords
+
+'''
+실행 방법
+python -m app.test.statistics_test
+'''
+
+class TestSBOMStatistics(unittest.TestCase):
+    def setUp(self):
+        self.document = {
+            "bomFormat": "CycloneDX",
+            "metadata": {
+                "timestamp": "2024-01-01T00:00:00Z",
+                "tools": {"components": [{"name": "syft", "version": "1.0.0"}]},
+                "component": {"name": "test-app", "type": "application"}
+            },
+            "components": [
+                {"name": "actions/checkout", "version": "v4", "type": "library",
+                 "licenses": [{"license": {"id": "MIT"}}],
+                 "externalReferences": [{"type": "vcs", "url": "https://github.com/actions/checkout"}]},
+                {"name": "requests", "version": "2.32.0", "type": "library",
+                 "licenses": [{"license": {"name": "Apache 2.0"}}],
+                 "hashes": [{"alg": "SHA-256", "content": "abc"}],
+                 "externalReferences": [{"type": "website", "url": "https://requests.readthedocs.io"}]},
+                {"name": ".GitHub/workflows/ci.yml", "version": "UNKNOWN", "type": "file",
+                 "licenses": [{"expression": "MIT OR Apache-2.0"}]},
+                {"name": "urllib3", "version": "2.0.0", "type": "library", "licenses": [{"license": {"id": "MIT"}}]}
+            ],
+            "dependencies": [
+                {"ref": "a", "dependsOn": ["b", "c"]},
+                {"ref": "b", "dependsOn": []}
+            ]
+        }
+
+    def test_analyze_stream(self):
+        """모든 지표를 한 번의 순회로 계산한 결과를 테스트합니다."""
+        analysis = analyze_stream(io.BytesIO(json.dumps(self.document).encode()), "syft.json")
+        result = analysis.result
+
+        self.assertEqual(result["filename"], "syft.json")
+        self.assertEqual(result["total_packages"], 4)
+        self.assertEqual((result["tool_name"], result["tool_version"]), ("syft", "1.0.0"))
+        self.assertEqual((result["target_name"], result["target_type"]), ("test-app", "application"))
+        self.assertEqual(result["cicd_count"], 2)
+        self.assertEqual(result["license_stats"][0], ("MIT", 2))
+        self.assertEqual(result["unique_licenses"], 3)
+        self.assertEqual(result["type_stats"], [("library", 3), ("file", 1)])
+        self.assertEqual(result["packages_with_hash"], 1)
+        self.assertEqual(result["packages_with_homepage"], 1)
+        self.assertEqual(result["packages_with_vcs"], 1)
+        self.assertEqual(result["total_dependencies"], 2)
+        self.assertEqual(result["dependency_stats"], {"has_dependencies": 1, "isolated_packages": 1, "max_dependencies": 2})
+
+        self.assertEqual([p["is_cicd"] for p in analysis.packages], [True, False, True, False])
+        self.assertEqual(analysis.packages[1]["license"], "Apache 2.0")
+        self.assertEqual(analysis.packages[1]["hash_count"], 1)
+        self.assertEqual(len(analysis.dependencies), 2)
+
+    def test_summary_only(self):
+        """keep_packages=False이면 행 목록 없이 통계만 계산하는지 테스트합니다."""
+        analysis = analyze_stream(io.BytesIO(json.dumps(self.document).encode()), keep_packages=False)
+        self.assertEqual(analysis.packages, [])
+        self.assertEqual(analysis.result["total_packages"], 4)
+
+    def test_custom_keywords(self):
+        """사용자 지정 키워드로 CI/CD 여부를 판단하는지 테스트합니다."""
+        stats = SBOMStatistics(cicd_keywords=["URLLIB"])
+        for component in self.document["components"]:
+            stats.add_component(component)
+        self.assertEqual(stats.cicd_count, 1)
+        self.assertIsNone(compile_keywords([]).search("anything"))
+
+
+if __name__ == '__main__':
+    unittest.main()
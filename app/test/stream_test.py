@@ -0,0 +1,74 @@
+import unittest
+import io
+import json
+from app.services.stream import FIELD, ITEM, iter_json_events
+
+'''
+실행 방법
+python -m app.test.stream_test
+'''
+
+class TestJSONStream(unittest.TestCase):
+    def setUp(self):
+        """테스트에 사용할 가상 SBOM 문서를 준비합니다."""
+        self.document = {
+            "bomFormat": "CycloneDX",
+            "version": 12345,
+            "metadata": {"timestamp": "2024-01-01T00:00:00Z", "tools": {"components": [{"name": "syft"}]}},
+            "components": [
+                {"name": "numpy", "version": "1.24.0", "bom-ref": "pkg:pypi/numpy@1.24.0"},
+                {"name": "한글-패키지", "version": "0.1.0", "bom-ref": "ref-2"}
+            ],
+            "dependencies": [],
+            "file_count": 2
+        }
+        self.raw = json.dumps(self.document, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _rebuild(self, events):
+        """이벤트 목록을 다시 dict로 조립합니다."""
+        result = {}
+        for kind, key, value in events:
+            if kind == ITEM:
+                result.setdefault(key, []).append(value)
+            else:
+                result[key] = value
+        return result
+
+    def test_events_match_json_load(self):
+        """청크 크기와 관계없이 json.loads와 동일한 결과를 내는지 테스트합니다."""
+        for chunk_size in (1, 3, 16, 1024):
+            events = list(iter_json_events(io.BytesIO(self.raw), chunk_size=chunk_size))
+            rebuilt = self._rebuild(events)
+            rebuilt.setdefault("dependencies", [])
+            self.assertEqual(rebuilt, self.document, f"chunk_size={chunk_size}")
+
+    def test_array_items_are_streamed(self):
+        """components 원소가 하나씩 ITEM 이벤트로 나오는지 테스트합니다."""
+        events = list(iter_json_events(io.BytesIO(self.raw)))
+        items = [value for kind, key, value in events if kind == ITEM and key == "components"]
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[1]["name"], "한글-패키지")
+        self.assertIn((FIELD, "version", 12345), events)
+
+    def test_invalid_json_raises_decode_error(self):
+        """잘못된 JSON은 json.JSONDecodeError로 보고되는지 테스트합니다."""
+        for bad in (b"", b"[1, 2]", b'{"components": [1,', b'{"a": 1} trailing'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_events(io.BytesIO(bad), chunk_size=2))
+
+    def test_numbers_split_at_every_chunk_boundary(self):
+        """소수/지수 숫자가 어느 위치에서 청크가 나뉘어도 잘리지 않고 디코딩되는지 테스트합니다."""
+        raw = (
+            b'{"version": 123456789, "ratio": -0.5, "x": 1.25e10, "y": 3E-2,'
+            b' "components": [1.5, 2e5, -7, 10.0E+1, 42], "z": 1}'
+        )
+        expected = json.loads(raw)
+        for chunk_size in range(1, len(raw) + 1):
+            events = list(iter_json_events(io.BytesIO(raw), chunk_size=chunk_size))
+            self.assertEqual(self._rebuild(events), expected, f"chunk_size={chunk_size}")
+        self.assertEqual(list(iter_json_events(io.BytesIO(b'{"x": 1.5}'), chunk_size=4)), [(FIELD, "x", 1.5)])
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_events(io.BytesIO(b'{"x": 1.}'), chunk_size=4))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.benchmark.synthetic import HATBOM, SYFT, generate_document, generate_pair, shared_count
+from app.benchmark.suite import compare
+from app.models.hatbom_sbom import HatbomSbom
+from app.models.syft_sbom import SyftSbom
+from app.services.detect import sniff_path
+from app.services.integrate import SBOMIntegrator
+
+'''
+실행 방법
+python -m app.test.synthetic_test
+'''
+
+
+class TestSyntheticSbom(unittest.TestCase):
+    def test_pair_is_deterministic(self):
+        """파일로 기록한 문서가 dict 생성 결과와 같고, 형식 판별이 원본 도구와 일치하는지 테스트합니다."""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = generate_pair(Path(tmp), 200, overlap=0.4, seed=7)
+            for tool, expected in ((HATBOM, "Hatbom"), (SYFT, "Syft")):
+                document = json.loads(paths[tool].read_text(encoding="utf-8"))
+                self.assertEqual(document, generate_document(tool, 200, overlap=0.4, seed=7))
+                self.assertEqual(len(document["components"]), 200)
+                self.assertEqual(sniff_path(str(paths[tool])), expected)
+
+    def test_overlap_controls_merges(self):
+        """중복 비율만큼의 Hatbom 컴포넌트가 Syft 컴포넌트에 병합되는지 테스트합니다."""
+        for overlap in (0.0, 0.25, 1.0):
+            hatbom = HatbomSbom.from_json(generate_document(HATBOM, 120, overlap))
+            syft = SyftSbom.from_json(generate_document(SYFT, 120, overlap))
+            integrator = SBOMIntegrator()
+            with contextlib.redirect_stdout(io.StringIO()):
+                unified = integrator.integrate(hatbom, syft)
+
+            shared = shared_count(120, overlap)
+            self.assertEqual(integrator.stats.integrated_count, shared)
+            self.assertEqual(len(unified.components), 240 - shared)
+
+    def test_compare_ratios(self):
+        """같은 크기의 단계별 시간/메모리 배율을 계산하는지 테스트합니다."""
+        def report(seconds, peak):
+            return {"results": [{"components": 1000, "overlap": 0.3,
+                                 "stages": {"integrate": {"seconds": seconds, "peak_bytes": peak}}}]}
+
+        rows = compare(report(2.0, 400), report(1.0, 100))
+        self.assertEqual(rows, [{"components": 1000, "stage": "integrate", "time_ratio": 0.5, "memory_ratio": 0.25}])
+
+
+if __name__ == "__main__":
+    unittest.main()
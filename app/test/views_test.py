@@ -0,0 +1,90 @@
+import unittest
+
+from app.services.views import MAX_PAGE_SIZE, ResultStore, ResultView
+
+'''
+실행 방법
+python -m app.test.views_test
+'''
+
+class TestResultView(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            {"name": "requests", "version": "2.32.0", "type": "library", "license": "Apache-2.0", "source": "Syft", "integrated": True},
+            {"name": "Flask", "version": "3.0.0", "type": "library", "license": "BSD-3-Clause", "source": "Syft", "integrated": False},
+            {"name": "ci.yml", "version": "UNKNOWN", "type": "file", "license": "N/A", "source": "Hatbom", "integrated": False},
+            {"name": "attrs", "version": "23.1.0", "type": "library", "license": "MIT", "source": "Hatbom", "integrated": True},
+        ]
+        self.dependencies = [{"ref": f"pkg:pypi/dep-{i}", "dependsOn": []} for i in range(120)]
+        self.view = ResultView(self.rows, self.dependencies, summary={"total_components": 4})
+
+    def _names(self, page):
+        return [item["name"] for item in page["items"]]
+
+    def test_pagination(self):
+        """페이지 번호/크기에 맞는 행과 원래 순번(index)을 반환하는지 테스트합니다."""
+        page = self.view.components(page=2, page_size=3)
+        self.assertEqual(page["total"], 4)
+        self.assertEqual(page["filtered"], 4)
+        self.assertEqual(self._names(page), ["attrs"])
+        self.assertEqual(page["items"][0]["index"], 4)
+        # 페이지 크기 상한 적용
+        self.assertEqual(self.view.components(page_size=MAX_PAGE_SIZE * 10)["page_size"], MAX_PAGE_SIZE)
+
+    def test_filters(self):
+        """이름 검색, 범주형 필터(OR), 불리언 필터가 함께 적용되는지 테스트합니다."""
+        page = self.view.components(categories={"source": ["Syft"], "type": ["library"]})
+        self.assertEqual(self._names(page), ["requests", "Flask"])
+        page = self.view.components(categories={"license": ["MIT", "N/A"]}, flags={"integrated": False})
+        self.assertEqual(self._names(page), ["ci.yml"])
+        page = self.view.components(q="FLA")
+        self.assertEqual(self._names(page), ["Flask"])
+        with self.assertRaises(ValueError):
+            self.view.components(flags={"is_cicd": True})
+
+    def test_sort(self):
+        """정렬 필드와 방향에 맞게 정렬하고, 필터와 함께 사용할 수 있는지 테스트합니다."""
+        self.assertEqual(self._names(self.view.components(sort="name")), ["attrs", "ci.yml", "Flask", "requests"])
+        page = self.view.components(sort="name", descending=True, categories={"source": ["Hatbom"]})
+        self.assertEqual(self._names(page), ["ci.yml", "attrs"])
+        with self.assertRaises(ValueError):
+            self.view.components(sort="purl")
+
+    def test_dependency_page(self):
+        """의존성 목록을 ref 검색과 페이지 단위로 반환하는지 테스트합니다."""
+        page = self.view.dependency_page(page=3, page_size=50)
+        self.assertEqual(len(page["items"]), 20)
+        page = self.view.dependency_page(q="DEP-11")
+        self.assertEqual(page["filtered"], 11)  # dep-11, dep-110 ~ dep-119
+
+    def test_graph_queries(self):
+        """의존성 그래프 질의를 페이지 단위 응답으로 반환하는지 테스트합니다."""
+        view = ResultView([], dependencies=[
+            {"ref": "root", "dependsOn": ["a", "b"]},
+            {"ref": "a", "dependsOn": ["b"]},
+            {"ref": "b", "dependsOn": ["a"]},
+        ])
+        page = view.related_page("root", "descendants", page_size=1)
+        self.assertEqual((page["total"], page["items"]), (2, ["a"]))
+        self.assertEqual(view.related_page("b", "ancestors")["items"], ["root", "a"])
+        self.assertEqual(view.path("root", "b")["length"], 1)
+        self.assertEqual(view.cycles()["items"], [["a", "b"]])
+        self.assertIs(view.graph(), view.graph())
+        with self.assertRaises(KeyError):
+            view.related_page("missing", "ancestors")
+
+    def test_store_eviction(self):
+        """저장 개수 상한을 넘으면 가장 오래 조회하지 않은 결과부터 제거되는지 테스트합니다."""
+        store = ResultStore(max_entries=2)
+        first, second, third = (ResultView([]) for _ in range(3))
+        store.put(first)
+        store.put(second)
+        store.get(first.id)
+        store.put(third)
+        self.assertIsNone(store.get(second.id))
+        self.assertIs(store.get(first.id), first)
+        self.assertEqual(len(store), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()